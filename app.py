@@ -1,16 +1,27 @@
-from typing import Optional
-from flask import Flask, jsonify, send_from_directory, request
+from typing import Optional, Callable
+from flask import Flask, Response, g, jsonify, send_from_directory, request, stream_with_context
 from flask_cors import CORS
+import asyncio
+import atexit
 import os
+import threading
+import time
 import mimetypes
 import traceback
 from pathlib import Path
 import json
 from werkzeug.utils import secure_filename
 from datetime import datetime
-from pdf_processing.infrastructure.pdf_processor import MuPDFProcessor
+from pdf_processing.infrastructure.pdf_processor import MARKDOWN_MODES, MuPDFProcessor
 from pdf_processing.infrastructure.pdf_repository import FileSystemPDFRepository
 from pdf_processing.application.pdf_service import PDFService
+from pdf_processing.infrastructure.parallel_extractor import ParallelPageExtractor
+from pdf_processing.infrastructure.job_queue import JobQueue
+from pdf_processing.infrastructure.progress_bus import progress_bus, content_channel, TERMINAL_STATUSES
+from pdf_processing.infrastructure.file_system_processor import FileSystemProcessor
+from pdf_processing.infrastructure.book_catalog import BookCatalog
+from pdf_processing.infrastructure.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, metrics_registry
+from pdf_processing.domain.entities import ProcessingJob, ProcessingProgress, ProcessingStatus
 
 # Add MIME types for JavaScript and CSS
 mimetypes.add_type('application/javascript', '.js')
@@ -24,15 +35,42 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 UPLOAD_FOLDER = os.path.join(BASE_DIR, 'uploads')
 SECTIONS_FOLDER = os.path.join(BASE_DIR, 'sections')
 METADATA_FOLDER = os.path.join(BASE_DIR, 'metadata')
+JOBS_DB_PATH = os.environ.get('PDF_JOBS_DB', os.path.join(BASE_DIR, 'jobs.sqlite3'))
+CATALOG_DB_PATH = os.environ.get('BOOK_CATALOG_DB', os.path.join(METADATA_FOLDER, 'catalog.sqlite3'))
+JOB_WORKERS = int(os.environ.get('PDF_JOB_WORKERS', 2))
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(SECTIONS_FOLDER, exist_ok=True)
 os.makedirs(METADATA_FOLDER, exist_ok=True)
 
+# Indexed catalogue of book metadata; seeded from the JSON files on first start
+book_catalog = BookCatalog(CATALOG_DB_PATH)
+if book_catalog.count() == 0:
+    book_catalog.import_metadata_dir(METADATA_FOLDER)
+
 # Initialize PDF processing components
+page_extractor = ParallelPageExtractor.from_env()  # Pool partagé d'extraction des pages
+atexit.register(page_extractor.close)  # Arrête ses processus avec le serveur
 pdf_repository = FileSystemPDFRepository()  # Initialisation du dépôt
-pdf_processor = MuPDFProcessor(repository=pdf_repository)  # Passer le dépôt à MuPDFProcessor
+pdf_processor = MuPDFProcessor(repository=pdf_repository, page_extractor=page_extractor, progress_bus=progress_bus)  # Passer le dépôt à MuPDFProcessor
 pdf_service = PDFService(processor=pdf_processor, repository=pdf_repository)  # Tout connecter
 
+# Background workers each get their own service and a long-lived event loop to run
+# it on: the OpenAI client's pooled connections belong to the loop that opened them,
+# so every job a worker handles must run on that same loop. The page extraction pool
+# is shared.
+_worker_state = threading.local()
+
+def get_worker_service() -> PDFService:
+    if not hasattr(_worker_state, 'service'):
+        processor = MuPDFProcessor(repository=pdf_repository, page_extractor=page_extractor, progress_bus=progress_bus)
+        _worker_state.service = PDFService(processor=processor, repository=pdf_repository)
+    return _worker_state.service
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    if not hasattr(_worker_state, 'loop'):
+        _worker_state.loop = asyncio.new_event_loop()
+    return _worker_state.loop
+
 app = Flask(__name__, static_folder='frontend/dist')
 
 # Enable CORS
@@ -42,11 +80,13 @@ def allowed_file(filename: str) -> bool:
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 def save_metadata(filename: str, metadata: dict):
-    """Save metadata to a JSON file."""
+    """Save metadata to a JSON file, index it in the book catalogue and publish it to the book's subscribers."""
     filepath = os.path.join(METADATA_FOLDER, f"{filename}.json")
     try:
-        with open(filepath, 'w') as f:
-            json.dump(metadata, f)
+        FileSystemProcessor.write_json_atomic(filepath, metadata)
+        book_catalog.upsert(metadata)
+        # Sent once the record is stored, so clients never fetch a book older than the event
+        progress_bus.publish(FileSystemProcessor().get_pdf_folder_name(filename), "book", {"book": metadata})
         return True
     except Exception as e:
         app.logger.error(f"Failed to save metadata for {filename}: {e}")
@@ -67,7 +107,8 @@ def load_metadata(filename: str) -> Optional[dict]:
 def method_not_allowed(e):
     return jsonify({"status": "error", "message": "Method not allowed", "code": 405}), 405
 
-async def process_pdf_file(file):
+def save_uploaded_file(file) -> tuple:
+    """Validate an uploaded PDF and store it in the upload folder."""
     if not file or not file.filename:
         raise ValueError("No file selected")
 
@@ -77,10 +118,25 @@ async def process_pdf_file(file):
     filename = secure_filename(file.filename)
     file_path = os.path.join(UPLOAD_FOLDER, filename)
     file.save(file_path)
+    return filename, file_path
 
+async def process_pdf_file(filename: str, file_path: str, service: PDFService = pdf_service,
+                           progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
+                           markdown_mode: Optional[str] = None):
+    # Until this run completes, the book is listed as in progress, not with a previous run's results
+    previous = book_catalog.get(filename) or load_metadata(filename) or {}
+    save_metadata(filename, {
+        "title": os.path.splitext(filename)[0],
+        "author": previous.get("author", "Unknown"),
+        "filename": filename,
+        "id": filename,
+        "uploadDate": previous.get("uploadDate") or datetime.now().isoformat(),
+        "status": ProcessingStatus.INITIALIZING.value,
+        "job_id": previous.get("job_id"),
+    })
     try:
         # Process the PDF
-        processed_pdf = await pdf_service.process_pdf(file_path)
+        processed_pdf = await service.process_pdf(file_path, progress_callback=progress_callback, markdown_mode=markdown_mode)
 
         metadata = {
             "title": os.path.splitext(filename)[0],
@@ -112,47 +168,133 @@ async def process_pdf_file(file):
         save_metadata(filename, error_metadata)
         raise
 
+def run_pdf_job(job: ProcessingJob, report_progress: Callable[[ProcessingProgress], None]) -> dict:
+    """Job queue handler: process an uploaded PDF in a worker thread."""
+    loop = get_worker_loop()
+    metadata = loop.run_until_complete(
+        process_pdf_file(job.filename, job.file_path, get_worker_service(), report_progress, job.markdown_mode)
+    )
+    if metadata["status"] == ProcessingStatus.FAILED.value:
+        raise RuntimeError(metadata["error_message"] or "Processing failed")
+    return metadata
+
+job_queue = JobQueue(JOBS_DB_PATH, handler=run_pdf_job, workers=JOB_WORKERS)
+
+# Workers start with the app, so jobs queued before a restart resume without waiting for a request.
+# Run as a script, the debug reloader's watcher process never runs them; its child (WERKZEUG_RUN_MAIN) does.
+if __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    job_queue.start()
+
+HTTP_REQUESTS = metrics_registry.counter("http_requests_total", "HTTP requests by endpoint and status", ("method", "endpoint", "status"))
+HTTP_REQUEST_SECONDS = metrics_registry.histogram("http_request_duration_seconds", "HTTP request latency", ("method", "endpoint"))
+PDF_UPLOADS = metrics_registry.counter("pdf_uploads_total", "Uploaded files, by whether they were queued", ("result",))
+metrics_registry.gauge("job_queue_depth", "Jobs waiting for a worker").set_function(job_queue.depth)
+metrics_registry.gauge("progress_subscribers", "Open progress event streams").set_function(progress_bus.subscriber_count)
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    # Label by route pattern, not path, so book names do not explode the series count
+    endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+    HTTP_REQUESTS.labels(request.method, endpoint, str(response.status_code)).inc()
+    started = g.get("request_started")
+    if started is not None:
+        HTTP_REQUEST_SECONDS.labels(request.method, endpoint).observe(time.perf_counter() - started)
+    return response
+
+def serialize_job(job: ProcessingJob) -> dict:
+    return {
+        "id": job.id,
+        "filename": job.filename,
+        "markdown_mode": job.markdown_mode,
+        "status": job.status.value,
+        "progress": job.progress,
+        "result": job.result,
+        "error_message": job.error_message,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+
 @app.route('/api/books/upload', methods=['POST'])
-async def upload_pdfs():
+def upload_pdfs():
     try:
         uploaded_files = request.files.getlist('pdf_files')
         if not uploaded_files:
             return jsonify({"status": "error", "message": "No files selected", "code": 400}), 400
 
-        processed_files = []
+        # Optional per-upload page Markdown mode; the PAGE_MARKDOWN_MODE default applies otherwise
+        markdown_mode = request.form.get('markdown_mode') or None
+        if markdown_mode and markdown_mode not in MARKDOWN_MODES:
+            message = f"Invalid markdown_mode. Expected one of {', '.join(MARKDOWN_MODES)}"
+            return jsonify({"status": "error", "message": message, "code": 400}), 400
+
+        jobs = []
         errors = []
 
         for file in uploaded_files:
             try:
-                metadata = await process_pdf_file(file)
-                processed_files.append(metadata)
+                filename, file_path = save_uploaded_file(file)
+                job = job_queue.submit(filename, file_path, markdown_mode)
+                save_metadata(filename, {
+                    "title": os.path.splitext(filename)[0],
+                    "author": "Unknown",
+                    "filename": filename,
+                    "id": filename,
+                    "uploadDate": datetime.now().isoformat(),
+                    "status": job.status.value,
+                    "job_id": job.id,
+                })
+                jobs.append(serialize_job(job))
+                PDF_UPLOADS.labels("queued").inc()
             except ValueError as e:
                 errors.append({"filename": file.filename, "error": str(e)})
+                PDF_UPLOADS.labels("rejected").inc()
             except Exception as e:
-                errors.append({"filename": file.filename, "error": f"Processing failed: {str(e)}"})
+                errors.append({"filename": file.filename, "error": f"Upload failed: {str(e)}"})
+                PDF_UPLOADS.labels("failed").inc()
 
-        if not processed_files:
-            return jsonify({"status": "error", "message": "All files failed to process", "errors": errors, "code": 400}), 400
+        if not jobs:
+            return jsonify({"status": "error", "message": "All files failed to upload", "errors": errors, "code": 400}), 400
 
-        response_data = {"status": "success", "message": f"{len(processed_files)} files uploaded", "books": processed_files}
+        response_data = {"status": "success", "message": f"{len(jobs)} files queued for processing", "jobs": jobs}
         if errors:
             response_data["errors"] = errors
 
-        return jsonify(response_data)
+        return jsonify(response_data), 202
     except Exception as e:
         app.logger.error(f"Upload processing error: {e}")
         return jsonify({"status": "error", "message": str(e), "code": 500}), 500
 
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    try:
+        job = job_queue.get(job_id)
+        if not job:
+            return jsonify({"status": "error", "message": "Job not found", "code": 404}), 404
+        return jsonify(serialize_job(job))
+    except Exception as e:
+        app.logger.error(f"Error retrieving job {job_id}: {e}")
+        return jsonify({"status": "error", "message": str(e), "code": 500}), 500
+
 @app.route('/api/books')
 def get_books():
     try:
-        books = []
-        for metadata_file in os.listdir(METADATA_FOLDER):
-            if metadata_file.endswith('.json'):
-                metadata = load_metadata(os.path.splitext(metadata_file)[0])
-                if metadata:
-                    books.append(metadata)
-        return jsonify({"status": "success", "books": books})
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', type=int)
+        books, total = book_catalog.query(
+            page=page,
+            per_page=per_page,
+            sort=request.args.get('sort', 'uploadDate'),
+            order=request.args.get('order', 'desc'),
+            status=request.args.get('status'),
+            search=request.args.get('q'),
+        )
+        return jsonify({"status": "success", "books": books, "total": total, "page": page, "per_page": per_page})
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e), "code": 400}), 400
     except Exception as e:
         app.logger.error(f"Error retrieving books: {e}")
         return jsonify({"status": "error", "message": str(e), "code": 500}), 500
@@ -160,7 +302,7 @@ def get_books():
 @app.route('/api/books/<filename>')
 def get_book(filename):
     try:
-        metadata = load_metadata(filename)
+        metadata = book_catalog.get(filename) or load_metadata(filename)
         if not metadata:
             return jsonify({"status": "error", "message": "Book not found", "code": 404}), 404
         return jsonify(metadata)
@@ -168,6 +310,63 @@ def get_book(filename):
         app.logger.error(f"Error retrieving book metadata for {filename}: {e}")
         return jsonify({"status": "error", "message": str(e), "code": 500}), 500
 
+@app.route('/api/books/<book_id>/events')
+def book_events(book_id):
+    """Stream processing events for a book as Server-Sent Events, until its final record is saved."""
+    # Events are published under the book's folder name; accept the upload filename too
+    book_key = FileSystemProcessor().get_pdf_folder_name(book_id)
+
+    def event_stream():
+        with progress_bus.subscribe(book_key) as subscription:
+            yield "retry: 3000\n\n"
+            for event in subscription.events(timeout=15.0):
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+                if event["type"] == "book" and event["data"]["book"].get("status") in TERMINAL_STATUSES:
+                    break
+
+    return Response(
+        stream_with_context(event_stream()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+@app.route('/api/books/<book_id>/content/events')
+def book_content(book_id):
+    """Stream a book's page Markdown as it is generated, as Server-Sent Events, until its run ends."""
+    book_key = FileSystemProcessor().get_pdf_folder_name(book_id)
+    book = book_catalog.get(book_id) or load_metadata(book_id) or {}
+
+    def event_stream():
+        yield "retry: 3000\n\n"
+        if book.get("status") in TERMINAL_STATUSES:
+            # No run is in progress (the record is reset when one starts), and after a restart
+            # the retained content_end is gone: end the stream now rather than wait forever
+            event = {"id": 0, "book_id": content_channel(book_key), "type": "content_end", "timestamp": time.time(), "data": {}}
+            yield f"event: content_end\ndata: {json.dumps(event)}\n\n"
+            return
+        with progress_bus.subscribe(content_channel(book_key)) as subscription:
+            for event in subscription.events(timeout=15.0):
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+                if event["type"] == "content_end":
+                    break
+
+    return Response(
+        stream_with_context(event_stream()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+@app.route('/metrics')
+def metrics():
+    """Expose the in-process metrics in the Prometheus text format."""
+    return Response(metrics_registry.render(), content_type=METRICS_CONTENT_TYPE)
+
 # Serve static files or React app
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
@@ -0,0 +1,69 @@
+"""
+Measure how often the local chapter heuristic can skip the LLM, and how well it agrees with it.
+
+For every PDF, the pages before section 1 (the ones the ingestion classifies) are
+scored by HeuristicChapterDetector and also sent to AIProcessor.detect_chapters_batch
+(answers come from the AI response cache when the book was processed before).
+Reports pages decided locally, and the agreement with the LLM on those pages.
+
+Usage:
+    python -m benchmarks.chapter_heuristic_agreement [pdf ...] [--low 0.3] [--high 0.75]
+"""
+import argparse
+import asyncio
+import glob
+
+from pdf_processing.infrastructure.ai_processor import AIProcessor
+from pdf_processing.infrastructure.document_session import PDFDocumentSession
+from pdf_processing.infrastructure.heuristic_chapter_detector import HeuristicChapterDetector
+from pdf_processing.infrastructure.section_processor import SectionProcessor
+
+
+def _pages_to_classify(pdf_path: str):
+    with PDFDocumentSession(pdf_path) as session:
+        pages = session.pages
+    section_1_page = SectionProcessor.build_section_index(pages).page_of(1)
+    return pages, [
+        page for page in pages
+        if page["text"] and (not section_1_page or page["num"] < section_1_page)
+    ]
+
+
+async def _compare(pdf_path: str, detector: HeuristicChapterDetector, ai_processor: AIProcessor):
+    book_pages, pages = _pages_to_classify(pdf_path)
+    detector.calibrate(book_pages)
+    llm_results = await ai_processor.detect_chapters_batch(pages)
+
+    decided = agreed = 0
+    disagreements = []
+    for page in pages:
+        decision = detector.classify(page)
+        if decision is None:
+            continue
+        decided += 1
+        if decision[0] == llm_results[page["num"]][0]:
+            agreed += 1
+        else:
+            disagreements.append((page["num"], decision[0], detector.score(page)[0]))
+
+    print(f"{pdf_path}")
+    print(f"  pages classified        {len(pages):>6}")
+    print(f"  decided locally         {decided:>6}  ({decided / max(len(pages), 1):.0%} of LLM calls avoided)")
+    print(f"  agreement with the LLM  {agreed:>6}  ({agreed / max(decided, 1):.0%} of local decisions)")
+    for page_num, heuristic_says, score in disagreements:
+        print(f"    page {page_num}: heuristic={heuristic_says} (score {score:.2f}), LLM={not heuristic_says}")
+
+
+async def main(pdf_paths, low, high):
+    ai_processor = AIProcessor()
+    for pdf_path in pdf_paths:
+        await _compare(pdf_path, HeuristicChapterDetector(low_threshold=low, high_threshold=high), ai_processor)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdfs", nargs="*", help="PDF files (default: uploads/*.pdf)")
+    parser.add_argument("--low", type=float, default=0.3, help="Scores at or below are 'not a chapter'")
+    parser.add_argument("--high", type=float, default=0.75, help="Scores at or above are 'chapter'")
+    args = parser.parse_args()
+    asyncio.run(main(args.pdfs or sorted(glob.glob("uploads/*.pdf")), args.low, args.high))
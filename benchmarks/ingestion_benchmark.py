@@ -0,0 +1,94 @@
+"""
+End-to-end ingestion benchmark on generated books, fully offline.
+
+Books of each requested size are generated with create_test_pdf.create_large_test_pdf
+and run through PDFService + MuPDFProcessor with the MockLLMBackend (no API key,
+no response cache, no resume checkpoint). Reports pages/sec, peak RSS and the time
+spent in each processing stage, taken from the progress status transitions.
+Each run happens in a fresh process so peak RSS is comparable.
+
+Usage:
+    python -m benchmarks.ingestion_benchmark [--pages 10 100 1000] [--latency 0.05] [--error-rate 0.01]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+
+
+def _run_ingestion(pdf_path: str, output_dir: str, latency: float, error_rate: float, results) -> None:
+    os.environ["AI_CACHE_ENABLED"] = "0"
+    from pdf_processing.application.pdf_service import PDFService
+    from pdf_processing.infrastructure.ai_processor import AIProcessor
+    from pdf_processing.infrastructure.llm_backend import MockLLMBackend
+    from pdf_processing.infrastructure.pdf_processor import MuPDFProcessor
+    from pdf_processing.infrastructure.pdf_repository import FileSystemPDFRepository
+
+    repository = FileSystemPDFRepository()
+    ai_processor = AIProcessor(backend=MockLLMBackend(latency=latency, error_rate=error_rate, seed=0))
+    processor = MuPDFProcessor(repository=repository, resume=False, ai_processor=ai_processor)
+    service = PDFService(processor=processor, repository=repository)
+
+    stage_seconds = {}
+    current = {"status": None, "since": time.perf_counter()}
+
+    def on_progress(progress):
+        status = progress.status.value
+        if status != current["status"]:
+            now = time.perf_counter()
+            if current["status"]:
+                stage_seconds[current["status"]] = stage_seconds.get(current["status"], 0.0) + now - current["since"]
+            current["status"], current["since"] = status, now
+
+    start = time.perf_counter()
+    processed_pdf = asyncio.run(service.process_pdf(pdf_path, output_dir, on_progress))
+    elapsed = time.perf_counter() - start
+    results.put({
+        "status": processed_pdf.progress.status.value,
+        "seconds": elapsed,
+        "stages": stage_seconds,
+        "chapters": len(processed_pdf.sections),
+        "images": len(processed_pdf.images),
+        "requests": processor.ai_processor.scheduler.metrics["requests"],
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    })
+
+
+def benchmark(page_count: int, latency: float, error_rate: float, work_dir: str) -> dict:
+    from create_test_pdf import create_large_test_pdf
+
+    pdf_path = create_large_test_pdf(os.path.join(work_dir, f"book_{page_count}.pdf"), pages=page_count)
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(
+        target=_run_ingestion, args=(pdf_path, os.path.join(work_dir, "sections"), latency, error_rate, results)
+    )
+    process.start()
+    measurement = results.get()
+    process.join()
+    return measurement
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline ingestion benchmark")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 1000], help="Book sizes to generate")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per LLM request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of LLM requests failing transiently")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        print(f"{'pages':>6} {'status':>10} {'seconds':>8} {'pages/s':>8} {'peak MB':>8} {'LLM reqs':>8}  stages (s)")
+        for page_count in args.pages:
+            result = benchmark(page_count, args.latency, args.error_rate, work_dir)
+            stages = ", ".join(f"{stage} {seconds:.2f}" for stage, seconds in result["stages"].items())
+            print(
+                f"{page_count:>6} {result['status']:>10} {result['seconds']:>8.2f} "
+                f"{page_count / result['seconds']:>8.1f} {result['peak_rss_mb']:>8.1f} {result['requests']:>8}  {stages}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Compare the legacy three-parse PDF ingestion against the single-pass document session.
+
+The legacy path opens the PDF with PyMuPDF, re-parses it with PyPDF2 for page text
+and opens it a third time to walk image xrefs. The session path does all of it from
+one PDFDocumentSession, and the parallel path additionally spreads page extraction
+over a ParallelPageExtractor pool (peak RSS is the parent process only).
+Each variant runs in a fresh process so peak RSS is comparable.
+
+Usage:
+    python -m benchmarks.pdf_parsing_benchmark [pdf ...] [--repeat N]
+"""
+import argparse
+import glob
+import multiprocessing
+import resource
+import time
+
+import fitz  # PyMuPDF
+
+from pdf_processing.infrastructure.document_session import PDFDocumentSession
+from pdf_processing.infrastructure.parallel_extractor import ParallelPageExtractor
+
+
+def _legacy_parse(pdf_path: str) -> int:
+    from PyPDF2 import PdfReader
+
+    doc = fitz.open(pdf_path)
+    page_count = len(doc)
+    pages = []
+    for i, page in enumerate(PdfReader(pdf_path).pages, start=1):
+        text = page.extract_text()
+        pages.append({"num": i, "text": text.strip() if text else ""})
+
+    image_doc = fitz.open(pdf_path)
+    image_bytes = 0
+    for page in image_doc:
+        for img in page.get_images():
+            image_bytes += len(image_doc.extract_image(img[0])["image"])
+    image_doc.close()
+    doc.close()
+    return page_count
+
+
+def _session_parse(pdf_path: str) -> int:
+    with PDFDocumentSession(pdf_path) as session:
+        image_bytes = 0
+        for page in session.pages:
+            for xref in page["image_xrefs"]:
+                image_bytes += len(session.extract_image(xref)["image"])
+        return session.page_count
+
+
+def _parallel_parse(pdf_path: str) -> int:
+    extractor = ParallelPageExtractor(min_pages=0)
+    try:
+        with PDFDocumentSession(pdf_path, extractor=extractor) as session:
+            pages = list(extractor.extract_pages(pdf_path, session.page_count))
+            image_bytes = 0
+            for page in pages:
+                for xref in page["image_xrefs"]:
+                    image_bytes += len(session.extract_image(xref)["image"])
+            return session.page_count
+    finally:
+        extractor.close()
+
+
+VARIANTS = {"legacy": _legacy_parse, "session": _session_parse, "parallel": _parallel_parse}
+
+
+def _run_variant(variant: str, pdf_path: str, repeat: int, results) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pages = VARIANTS[variant](pdf_path)
+    elapsed = (time.perf_counter() - start) / repeat
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put({"pages": pages, "seconds": elapsed, "peak_rss_mb": peak_rss_kb / 1024})
+
+
+def benchmark(pdf_path: str, repeat: int) -> dict:
+    context = multiprocessing.get_context("spawn")
+    measurements = {}
+    for variant in VARIANTS:
+        results = context.Queue()
+        process = context.Process(target=_run_variant, args=(variant, pdf_path, repeat, results))
+        process.start()
+        measurements[variant] = results.get()
+        process.join()
+    return measurements
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF parsing benchmark")
+    parser.add_argument("pdfs", nargs="*", help="PDF files to benchmark (defaults to uploads/*.pdf)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant, averaged")
+    args = parser.parse_args()
+
+    pdf_paths = args.pdfs or sorted(glob.glob("uploads/*.pdf"))
+    print(f"{'pdf':<60} {'variant':>8} {'pages':>5} {'seconds':>8} {'speedup':>8} {'peak MB':>8}")
+    for pdf_path in pdf_paths:
+        result = benchmark(pdf_path, args.repeat)
+        legacy_seconds = result["legacy"]["seconds"]
+        for variant, measurement in result.items():
+            speedup = legacy_seconds / measurement["seconds"] if measurement["seconds"] else float("inf")
+            print(
+                f"{pdf_path[-60:]:<60} {variant:>8} {measurement['pages']:>5} {measurement['seconds']:>8.3f} "
+                f"{speedup:>7.1f}x {measurement['peak_rss_mb']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
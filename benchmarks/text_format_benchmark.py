@@ -0,0 +1,161 @@
+"""
+Compare the legacy per-line TextFormatProcessor path against bulk classification.
+
+The legacy path is today's code before precompiled regexes: detect_formatting
+per line with up to ten uncompiled re.match calls, and process_text_block per
+page. The bulk path is classify_lines / process_text_blocks over the whole book.
+Both must produce identical results; the benchmark checks that before timing.
+
+Usage:
+    python -m benchmarks.text_format_benchmark [pdf ...] [--repeat N] [--pre-section]
+"""
+import argparse
+import glob
+import re
+import time
+
+from pdf_processing.domain.entities import FormattedText, TextFormatting
+from pdf_processing.infrastructure.document_session import PDFDocumentSession
+from pdf_processing.infrastructure.text_format_processor import TextFormatProcessor
+
+
+class LegacyTextFormatProcessor:
+    """The per-line implementation the bulk API replaces, kept verbatim for comparison."""
+
+    header_patterns = [
+        r'^[A-Z][^a-z]{0,2}[A-Z].*$',
+        r'^[A-Z][a-zA-Z\s]{0,50}$',
+    ]
+
+    def is_centered_text(self, text, line_spacing=None):
+        text = text.strip()
+        if not text:
+            return False
+        if len(text) > 100:
+            return False
+        indicators = [
+            text.isupper(),
+            text.istitle() and len(text.split()) <= 7,
+            text.startswith('    ') or text.startswith('\t'),
+            text.startswith('*') and text.endswith('*'),
+            bool(re.match(r'^[-—=]{3,}$', text)),
+            bool(re.match(r'^[A-Z][^.!?]*(?:[.!?]|\s)*$', text) and len(text) < 60),
+            bool(re.match(r'^(?:by|written by|translated by)\s+[A-Z][a-zA-Z\s.]+$', text, re.I)),
+            bool(re.match(r'^[A-Z\s]+$', text) and len(text) < 50)
+        ]
+        return any(indicators)
+
+    def analyze_formatting(self, text):
+        metadata = {
+            "is_centered": self.is_centered_text(text),
+            "is_capitalized": text.isupper(),
+            "is_title_case": text.istitle(),
+            "indentation": len(text) - len(text.lstrip()),
+            "line_length": len(text),
+        }
+        if re.match(r'^\s*[-•*]\s+', text):
+            metadata["list_type"] = "bullet"
+        elif re.match(r'^\s*\d+\.\s+', text):
+            metadata["list_type"] = "numbered"
+        return metadata
+
+    def detect_formatting(self, text, is_pre_section=False):
+        text = text.strip()
+        if not text:
+            return TextFormatting.PARAGRAPH
+        if re.match(r'^[-—=*]{3,}$', text):
+            return TextFormatting.HEADER
+        if is_pre_section and self.is_centered_text(text):
+            if text.isupper() or (text.istitle() and len(text.split()) <= 5):
+                return TextFormatting.HEADER
+            return TextFormatting.SUBHEADER
+        if any(re.match(pattern, text) for pattern in self.header_patterns):
+            return TextFormatting.HEADER
+        if re.match(r'^\s*[-•*]\s+', text) or re.match(r'^\s*\d+\.\s+.+', text):
+            return TextFormatting.LIST_ITEM
+        if text.startswith('    ') or text.startswith('\t'):
+            return TextFormatting.CODE
+        if text.startswith('>') or (text.startswith('"') and text.endswith('"')):
+            return TextFormatting.QUOTE
+        return TextFormatting.PARAGRAPH
+
+    def process_text_block(self, text, is_pre_section=False):
+        formatted_texts = []
+        current_format = None
+        current_text = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                if current_text:
+                    formatted_texts.append(FormattedText(
+                        text="\n".join(current_text),
+                        format_type=current_format or TextFormatting.PARAGRAPH,
+                        metadata=self.analyze_formatting("\n".join(current_text))
+                    ))
+                    current_text = []
+                    current_format = None
+                continue
+            format_type = self.detect_formatting(line, is_pre_section)
+            if format_type != current_format or format_type in [TextFormatting.HEADER, TextFormatting.SUBHEADER]:
+                if current_text:
+                    formatted_texts.append(FormattedText(
+                        text="\n".join(current_text),
+                        format_type=current_format or TextFormatting.PARAGRAPH,
+                        metadata=self.analyze_formatting("\n".join(current_text))
+                    ))
+                    current_text = []
+                current_format = format_type
+            current_text.append(line)
+        if current_text:
+            formatted_texts.append(FormattedText(
+                text="\n".join(current_text),
+                format_type=current_format or TextFormatting.PARAGRAPH,
+                metadata=self.analyze_formatting("\n".join(current_text))
+            ))
+        return formatted_texts
+
+
+def _best_of(repeat: int, function) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(pdf_path: str, repeat: int, is_pre_section: bool) -> None:
+    with PDFDocumentSession(pdf_path) as session:
+        texts = [page["text"] for page in session.pages]
+    lines = [line for text in texts for line in text.splitlines()]
+    legacy, bulk = LegacyTextFormatProcessor(), TextFormatProcessor()
+
+    # Same answers before any timing
+    assert [legacy.detect_formatting(line, is_pre_section) for line in lines] == bulk.classify_lines(lines, is_pre_section)
+    assert [legacy.process_text_block(text, is_pre_section) for text in texts] == bulk.process_text_blocks(texts, is_pre_section)
+
+    print(f"{pdf_path}: {len(texts)} pages, {len(lines)} lines (pre_section={is_pre_section})")
+    rows = [
+        ("detect_formatting per line", lambda: [legacy.detect_formatting(line, is_pre_section) for line in lines], len(lines)),
+        ("classify_lines", lambda: bulk.classify_lines(lines, is_pre_section), len(lines)),
+        ("process_text_block per page", lambda: [legacy.process_text_block(text, is_pre_section) for text in texts], len(lines)),
+        ("process_text_blocks", lambda: bulk.process_text_blocks(texts, is_pre_section), len(lines)),
+    ]
+    for name, function, count in rows:
+        seconds = _best_of(repeat, function)
+        print(f"  {name:<30} {seconds * 1000:>9.2f} ms {count / seconds:>12,.0f} lines/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TextFormatProcessor micro-benchmark")
+    parser.add_argument("pdfs", nargs="*", help="PDF files (default: uploads/*.pdf)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant; the best is reported")
+    parser.add_argument("--pre-section", action="store_true", help="Use the pre-section centered text rules")
+    args = parser.parse_args()
+
+    for pdf_path in args.pdfs or sorted(glob.glob("uploads/*.pdf")):
+        benchmark(pdf_path, args.repeat, args.pre_section)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,10 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import Paragraph, Table, TableStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+from PIL import Image, ImageDraw
 import os
+import random
 
 def centered_text(c, text, y, font='Helvetica-Bold', size=16):
     c.setFont(font, size)
@@ -160,6 +163,91 @@ def create_test_pdf(filename="test_book.pdf"):
     c.save()
     return abs_path
 
+WORDS = (
+    "the fortress dark corridor torch guard door stairs iron gate shadow sword you turn "
+    "hear see find open climb descend whisper ancient cold stone silent narrow chamber"
+).split()
+
+
+def _paragraph_lines(rng, sentences, width=80):
+    words = []
+    for _ in range(sentences):
+        sentence = [rng.choice(WORDS) for _ in range(rng.randint(6, 14))]
+        sentence[0] = sentence[0].capitalize()
+        words.extend(sentence[:-1] + [sentence[-1] + "."])
+    lines, line = [], ""
+    for word in words:
+        if len(line) + len(word) + 1 > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}".strip()
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _illustration(index):
+    """A small raster illustration; only three distinct ones, so books repeat images like real ones do."""
+    image = Image.new("RGB", (240, 160), ((80 * index) % 256, 120, (200 - 60 * index) % 256))
+    draw = ImageDraw.Draw(image)
+    for step in range(0, 240, 20):
+        draw.line((step, 0, 240 - step, 160), fill=(255, 255, 255), width=2)
+    return ImageReader(image)
+
+
+def create_large_test_pdf(filename="large_test_book.pdf", pages=100, seed=0):
+    """
+    Generate a gamebook of the given page count for benchmarks.
+
+    About a tenth of the pages are pre-section chapters (a centered title and body
+    text), the rest hold two numbered sections each, with an illustration every
+    tenth section. Content is pseudo-random but fixed by `seed`.
+    """
+    abs_path = os.path.abspath(filename)
+    rng = random.Random(seed)
+    c = canvas.Canvas(abs_path, pagesize=letter)
+    width, height = letter
+    illustrations = [_illustration(index) for index in range(3)]
+
+    # Title Page
+    centered_text(c, "THE ENDLESS DUNGEON", height - 200, size=24)
+    centered_text(c, "A Benchmark Adventure", height - 250, 'Helvetica', 18)
+    c.showPage()
+
+    chapter_pages = max(2, pages // 10)
+    for chapter in range(1, chapter_pages + 1):
+        centered_text(c, f"CHAPTER {chapter}", height - 100, size=20)
+        c.setFont('Helvetica', 12)
+        y = height - 150
+        for line in _paragraph_lines(rng, 20):
+            if y < 60:
+                break
+            c.drawString(72, y, line)
+            y -= 16
+        c.showPage()
+
+    section_number = 1
+    for _ in range(max(1, pages - 1 - chapter_pages)):
+        y = height - 50
+        for _ in range(2):
+            centered_text(c, str(section_number), y, font='Helvetica-Bold', size=16)
+            y -= 30
+            c.setFont('Helvetica', 12)
+            for line in _paragraph_lines(rng, 5):
+                c.drawString(72, y, line)
+                y -= 16
+            if section_number % 10 == 0:
+                c.drawImage(illustrations[(section_number // 10) % 3], 186, y - 170, width=240, height=160)
+                y -= 180
+            c.drawString(72, y, f"Turn to {rng.randint(1, 2 * pages)}.")
+            y -= 40
+            section_number += 1
+        c.showPage()
+
+    c.save()
+    return abs_path
+
 if __name__ == "__main__":
     pdf_path = create_test_pdf()
     print(f"Test PDF created successfully at: {pdf_path}")
@@ -55,5 +55,5 @@ var Qn=Object.defineProperty;var vn=t=>{throw TypeError(t)};var Zn=(t,e,s)=>e in
 `),position:d,pageIndex:u-1,rect:D,rotation:X,id:re,deleted:!1}}const q=super.deserialize(R,I,Q);return ue(q,P,R.fontSize),ue(q,k,n.Util.makeHexColor(...R.color)),ue(q,b,R.value),q.annotationElementId=R.id||null,ue(q,x,G),q}serialize(R=!1){if(this.isEmpty())return null;if(this.deleted)return{pageIndex:this.pageIndex,id:this.annotationElementId,deleted:!0};const I=m._internalPadding*this.parentScale,Q=this.getRect(I,I),G=y.AnnotationEditor._colorManager.convert(this.isAttachedToDOM?getComputedStyle(this.editorDiv).color:i(this,k)),q={annotationType:n.AnnotationEditorType.FREETEXT,color:G,fontSize:i(this,P),value:i(this,b),pageIndex:this.pageIndex,rect:Q,rotation:this.rotation,structTreeParentId:this._structTreeParentId};return R?q:this.annotationElementId&&!ne(this,f,Fn).call(this,q)?null:(q.id=this.annotationElementId,q)}};h=new WeakMap,v=new WeakMap,a=new WeakMap,w=new WeakMap,k=new WeakMap,b=new WeakMap,A=new WeakMap,P=new WeakMap,x=new WeakMap,f=new WeakSet,Rn=function(R){const I=G=>{this.editorDiv.style.fontSize=`calc(${G}px * var(--scale-factor))`,this.translate(0,-(G-i(this,P))*this.parentScale),ue(this,P,G),ne(this,f,mt).call(this)},Q=i(this,P);this.addCommands({cmd:()=>{I(R)},undo:()=>{I(Q)},mustExec:!0,type:n.AnnotationEditorParamsType.FREETEXT_SIZE,overwriteIfSameType:!0,keepUndo:!0})},kn=function(R){const I=i(this,k);this.addCommands({cmd:()=>{ue(this,k,this.editorDiv.style.color=R)},undo:()=>{ue(this,k,this.editorDiv.style.color=I)},mustExec:!0,type:n.AnnotationEditorParamsType.FREETEXT_COLOR,overwriteIfSameType:!0,keepUndo:!0})},Mn=function(){const R=this.editorDiv.getElementsByTagName("div");if(R.length===0)return this.editorDiv.innerText;const I=[];for(const Q of R)I.push(Q.innerText.replace(/\r\n?|\n/,""));return I.join(`
 `)},mt=function(){const[R,I]=this.parentDimensions;let Q;if(this.isAttachedToDOM)Q=this.div.getBoundingClientRect();else{const{currentLayer:G,div:q}=this,V=q.style.display;q.style.display="hidden",G.div.append(this.div),Q=q.getBoundingClientRect(),q.remove(),q.style.display=V}this.rotation%180===this.parentRotation%180?(this.width=Q.width/R,this.height=Q.height/I):(this.width=Q.height/R,this.height=Q.width/I),this.fixAndSetPosition()},tn=function(){if(this.editorDiv.replaceChildren(),!!i(this,b))for(const R of i(this,b).split(`
 `)){const I=document.createElement("div");I.append(R?document.createTextNode(R):document.createElement("br")),this.editorDiv.append(I)}},Fn=function(R){const{value:I,fontSize:Q,color:G,rect:q,pageIndex:V}=i(this,x);return R.value!==I||R.fontSize!==Q||R.rect.some((se,D)=>Math.abs(se-q[D])>=1)||R.color.some((se,D)=>se!==G[D])||R.pageIndex!==V},nn=function(R=!1){if(!this.annotationElementId)return;if(ne(this,f,mt).call(this),!R&&(this.width===0||this.height===0)){setTimeout(()=>ne(this,f,nn).call(this,!0),0);return}const I=m._internalPadding*this.parentScale;i(this,x).rect=this.getRect(I,I)},Qe(m,"_freeTextDefaultContent",""),Qe(m,"_internalPadding",0),Qe(m,"_defaultColor",null),Qe(m,"_defaultFontSize",10),Qe(m,"_type","freetext");let O=m;e.FreeTextEditor=O},(t,e,s)=>{var T,U,it,On,ie,le,fe,be,me,ve,Z,ee,M,H,J,oe,ge,Ae,_e,te,Pe,Ce,Dn,wt,sn,rn,Oe,ze,Xe,Ee,ae,de,Me,on,Ge,z,ye,we,Ln,an;Object.defineProperty(e,"__esModule",{value:!0}),e.StampAnnotationElement=e.InkAnnotationElement=e.FreeTextAnnotationElement=e.AnnotationLayer=void 0;var n=s(1),r=s(6),y=s(3),C=s(30),O=s(31),h=s(32);const v=1e3,a=9,w=new WeakSet;function k(Re){return{width:Re[2]-Re[0],height:Re[3]-Re[1]}}class b{static create(W){switch(W.data.annotationType){case n.AnnotationType.LINK:return new P(W);case n.AnnotationType.TEXT:return new x(W);case n.AnnotationType.WIDGET:switch(W.data.fieldType){case"Tx":return new E(W);case"Btn":return W.data.radioButton?new o(W):W.data.checkBox?new S(W):new p(W);case"Ch":return new l(W);case"Sig":return new F(W)}return new f(W);case n.AnnotationType.POPUP:return new g(W);case n.AnnotationType.FREETEXT:return new L(W);case n.AnnotationType.LINE:return new c(W);case n.AnnotationType.SQUARE:return new R(W);case n.AnnotationType.CIRCLE:return new I(W);case n.AnnotationType.POLYLINE:return new Q(W);case n.AnnotationType.CARET:return new q(W);case n.AnnotationType.INK:return new V(W);case n.AnnotationType.POLYGON:return new G(W);case n.AnnotationType.HIGHLIGHT:return new se(W);case n.AnnotationType.UNDERLINE:return new D(W);case n.AnnotationType.SQUIGGLY:return new X(W);case n.AnnotationType.STRIKEOUT:return new re(W);case n.AnnotationType.STAMP:return new N(W);case n.AnnotationType.FILEATTACHMENT:return new d(W);default:return new A(W)}}}const $=class ${constructor(W,{isRenderable:j=!1,ignoreBorder:K=!1,createQuadrilaterals:he=!1}={}){ce(this,T,!1);this.isRenderable=j,this.data=W.data,this.layer=W.layer,this.linkService=W.linkService,this.downloadManager=W.downloadManager,this.imageResourcesPath=W.imageResourcesPath,this.renderForms=W.renderForms,this.svgFactory=W.svgFactory,this.annotationStorage=W.annotationStorage,this.enableScripting=W.enableScripting,this.hasJSActions=W.hasJSActions,this._fieldObjects=W.fieldObjects,this.parent=W.parent,j&&(this.container=this._createContainer(K)),he&&this._createQuadrilaterals()}static _hasPopupData({titleObj:W,contentsObj:j,richText:K}){return!!(W!=null&&W.str||j!=null&&j.str||K!=null&&K.str)}get hasPopupData(){return $._hasPopupData(this.data)}_createContainer(W){const{data:j,parent:{page:K,viewport:he}}=this,pe=document.createElement("section");pe.setAttribute("data-annotation-id",j.id),this instanceof f||(pe.tabIndex=v),pe.style.zIndex=this.parent.zIndex++,this.data.popupRef&&pe.setAttribute("aria-haspopup","dialog"),j.noRotate&&pe.classList.add("norotate");const{pageWidth:xe,pageHeight:Se,pageX:Fe,pageY:De}=he.rawDims;if(!j.rect||this instanceof g){const{rotation:Be}=j;return!j.hasOwnCanvas&&Be!==0&&this.setRotation(Be,pe),pe}const{width:Te,height:We}=k(j.rect),Le=n.Util.normalizeRect([j.rect[0],K.view[3]-j.rect[1]+K.view[1],j.rect[2],K.view[3]-j.rect[3]+K.view[1]]);if(!W&&j.borderStyle.width>0){pe.style.borderWidth=`${j.borderStyle.width}px`;const Be=j.borderStyle.horizontalCornerRadius,Ve=j.borderStyle.verticalCornerRadius;if(Be>0||Ve>0){const Je=`calc(${Be}px * var(--scale-factor)) / calc(${Ve}px * var(--scale-factor))`;pe.style.borderRadius=Je}else if(this instanceof o){const Je=`calc(${Te}px * var(--scale-factor)) / calc(${We}px * var(--scale-factor))`;pe.style.borderRadius=Je}switch(j.borderStyle.style){case n.AnnotationBorderStyleType.SOLID:pe.style.borderStyle="solid";break;case n.AnnotationBorderStyleType.DASHED:pe.style.borderStyle="dashed";break;case n.AnnotationBorderStyleType.BEVELED:(0,n.warn)("Unimplemented border style: beveled");break;case n.AnnotationBorderStyleType.INSET:(0,n.warn)("Unimplemented border style: inset");break;case n.AnnotationBorderStyleType.UNDERLINE:pe.style.borderBottomStyle="solid";break}const Ke=j.borderColor||null;Ke?(ue(this,T,!0),pe.style.borderColor=n.Util.makeHexColor(Ke[0]|0,Ke[1]|0,Ke[2]|0)):pe.style.borderWidth=0}pe.style.left=`${100*(Le[0]-Fe)/xe}%`,pe.style.top=`${100*(Le[1]-De)/Se}%`;const{rotation:Ne}=j;return j.hasOwnCanvas||Ne===0?(pe.style.width=`${100*Te/xe}%`,pe.style.height=`${100*We/Se}%`):this.setRotation(Ne,pe),pe}setRotation(W,j=this.container){if(!this.data.rect)return;const{pageWidth:K,pageHeight:he}=this.parent.viewport.rawDims,{width:pe,height:xe}=k(this.data.rect);let Se,Fe;W%180===0?(Se=100*pe/K,Fe=100*xe/he):(Se=100*xe/K,Fe=100*pe/he),j.style.width=`${Se}%`,j.style.height=`${Fe}%`,j.setAttribute("data-main-rotation",(360-W)%360)}get _commonActions(){const W=(j,K,he)=>{const pe=he.detail[j],xe=pe[0],Se=pe.slice(1);he.target.style[K]=C.ColorConverters[`${xe}_HTML`](Se),this.annotationStorage.setValue(this.data.id,{[K]:C.ColorConverters[`${xe}_rgb`](Se)})};return(0,n.shadow)(this,"_commonActions",{display:j=>{const{display:K}=j.detail,he=K%2===1;this.container.style.visibility=he?"hidden":"visible",this.annotationStorage.setValue(this.data.id,{noView:he,noPrint:K===1||K===2})},print:j=>{this.annotationStorage.setValue(this.data.id,{noPrint:!j.detail.print})},hidden:j=>{const{hidden:K}=j.detail;this.container.style.visibility=K?"hidden":"visible",this.annotationStorage.setValue(this.data.id,{noPrint:K,noView:K})},focus:j=>{setTimeout(()=>j.target.focus({preventScroll:!1}),0)},userName:j=>{j.target.title=j.detail.userName},readonly:j=>{j.target.disabled=j.detail.readonly},required:j=>{this._setRequired(j.target,j.detail.required)},bgColor:j=>{W("bgColor","backgroundColor",j)},fillColor:j=>{W("fillColor","backgroundColor",j)},fgColor:j=>{W("fgColor","color",j)},textColor:j=>{W("textColor","color",j)},borderColor:j=>{W("borderColor","borderColor",j)},strokeColor:j=>{W("strokeColor","borderColor",j)},rotation:j=>{const K=j.detail.rotation;this.setRotation(K),this.annotationStorage.setValue(this.data.id,{rotation:K})}})}_dispatchEventFromSandbox(W,j){const K=this._commonActions;for(const he of Object.keys(j.detail)){const pe=W[he]||K[he];pe==null||pe(j)}}_setDefaultPropertiesFromJS(W){if(!this.enableScripting)return;const j=this.annotationStorage.getRawValue(this.data.id);if(!j)return;const K=this._commonActions;for(const[he,pe]of Object.entries(j)){const xe=K[he];if(xe){const Se={detail:{[he]:pe},target:W};xe(Se),delete j[he]}}}_createQuadrilaterals(){if(!this.container)return;const{quadPoints:W}=this.data;if(!W)return;const[j,K,he,pe]=this.data.rect;if(W.length===1){const[,{x:Ve,y:Ke},{x:Je,y:tt}]=W[0];if(he===Ve&&pe===Ke&&j===Je&&K===tt)return}const{style:xe}=this.container;let Se;if(i(this,T)){const{borderColor:Ve,borderWidth:Ke}=xe;xe.borderWidth=0,Se=["url('data:image/svg+xml;utf8,",'<svg xmlns="http://www.w3.org/2000/svg"',' preserveAspectRatio="none" viewBox="0 0 1 1">',`<g fill="transparent" stroke="${Ve}" stroke-width="${Ke}">`],this.container.classList.add("hasBorder")}const Fe=he-j,De=pe-K,{svgFactory:Te}=this,We=Te.createElement("svg");We.classList.add("quadrilateralsContainer"),We.setAttribute("width",0),We.setAttribute("height",0);const Le=Te.createElement("defs");We.append(Le);const Ne=Te.createElement("clipPath"),Be=`clippath_${this.data.id}`;Ne.setAttribute("id",Be),Ne.setAttribute("clipPathUnits","objectBoundingBox"),Le.append(Ne);for(const[,{x:Ve,y:Ke},{x:Je,y:tt}]of W){const Ze=Te.createElement("rect"),Ye=(Je-j)/Fe,et=(pe-Ke)/De,rt=(Ve-Je)/Fe,mn=(Ke-tt)/De;Ze.setAttribute("x",Ye),Ze.setAttribute("y",et),Ze.setAttribute("width",rt),Ze.setAttribute("height",mn),Ne.append(Ze),Se==null||Se.push(`<rect vector-effect="non-scaling-stroke" x="${Ye}" y="${et}" width="${rt}" height="${mn}"/>`)}i(this,T)&&(Se.push("</g></svg>')"),xe.backgroundImage=Se.join("")),this.container.append(We),this.container.style.clipPath=`url(#${Be})`}_createPopup(){const{container:W,data:j}=this;W.setAttribute("aria-haspopup","dialog");const K=new g({data:{color:j.color,titleObj:j.titleObj,modificationDate:j.modificationDate,contentsObj:j.contentsObj,richText:j.richText,parentRect:j.rect,borderStyle:0,id:`popup_${j.id}`,rotation:j.rotation},parent:this.parent,elements:[this]});this.parent.div.append(K.render())}render(){(0,n.unreachable)("Abstract method `AnnotationElement.render` called")}_getElementsByName(W,j=null){const K=[];if(this._fieldObjects){const he=this._fieldObjects[W];if(he)for(const{page:pe,id:xe,exportValues:Se}of he){if(pe===-1||xe===j)continue;const Fe=typeof Se=="string"?Se:null,De=document.querySelector(`[data-element-id="${xe}"]`);if(De&&!w.has(De)){(0,n.warn)(`_getElementsByName - element not allowed: ${xe}`);continue}K.push({id:xe,exportValue:Fe,domElement:De})}return K}for(const he of document.getElementsByName(W)){const{exportValue:pe}=he,xe=he.getAttribute("data-element-id");xe!==j&&w.has(he)&&K.push({id:xe,exportValue:pe,domElement:he})}return K}show(){var W;this.container&&(this.container.hidden=!1),(W=this.popup)==null||W.maybeShow()}hide(){var W;this.container&&(this.container.hidden=!0),(W=this.popup)==null||W.forceHide()}getElementsToTriggerPopup(){return this.container}addHighlightArea(){const W=this.getElementsToTriggerPopup();if(Array.isArray(W))for(const j of W)j.classList.add("highlightArea");else W.classList.add("highlightArea")}_editOnDoubleClick(){const{annotationEditorType:W,data:{id:j}}=this;this.container.addEventListener("dblclick",()=>{var K;(K=this.linkService.eventBus)==null||K.dispatch("switchannotationeditormode",{source:this,mode:W,editId:j})})}};T=new WeakMap;let A=$;class P extends A{constructor(j,K=null){super(j,{isRenderable:!0,ignoreBorder:!!(K!=null&&K.ignoreBorder),createQuadrilaterals:!0});ce(this,U);this.isTooltipOnly=j.data.isTooltipOnly}render(){const{data:j,linkService:K}=this,he=document.createElement("a");he.setAttribute("data-element-id",j.id);let pe=!1;return j.url?(K.addLinkAttributes(he,j.url,j.newWindow),pe=!0):j.action?(this._bindNamedAction(he,j.action),pe=!0):j.attachment?(this._bindAttachment(he,j.attachment),pe=!0):j.setOCGState?(ne(this,U,On).call(this,he,j.setOCGState),pe=!0):j.dest?(this._bindLink(he,j.dest),pe=!0):(j.actions&&(j.actions.Action||j.actions["Mouse Up"]||j.actions["Mouse Down"])&&this.enableScripting&&this.hasJSActions&&(this._bindJSAction(he,j),pe=!0),j.resetForm?(this._bindResetFormAction(he,j.resetForm),pe=!0):this.isTooltipOnly&&!pe&&(this._bindLink(he,""),pe=!0)),this.container.classList.add("linkAnnotation"),pe&&this.container.append(he),this.container}_bindLink(j,K){j.href=this.linkService.getDestinationHash(K),j.onclick=()=>(K&&this.linkService.goToDestination(K),!1),(K||K==="")&&ne(this,U,it).call(this)}_bindNamedAction(j,K){j.href=this.linkService.getAnchorUrl(""),j.onclick=()=>(this.linkService.executeNamedAction(K),!1),ne(this,U,it).call(this)}_bindAttachment(j,K){j.href=this.linkService.getAnchorUrl(""),j.onclick=()=>{var he;return(he=this.downloadManager)==null||he.openOrDownloadData(this.container,K.content,K.filename),!1},ne(this,U,it).call(this)}_bindJSAction(j,K){j.href=this.linkService.getAnchorUrl("");const he=new Map([["Action","onclick"],["Mouse Up","onmouseup"],["Mouse Down","onmousedown"]]);for(const pe of Object.keys(K.actions)){const xe=he.get(pe);xe&&(j[xe]=()=>{var Se;return(Se=this.linkService.eventBus)==null||Se.dispatch("dispatcheventinsandbox",{source:this,detail:{id:K.id,name:pe}}),!1})}j.onclick||(j.onclick=()=>!1),ne(this,U,it).call(this)}_bindResetFormAction(j,K){const he=j.onclick;if(he||(j.href=this.linkService.getAnchorUrl("")),ne(this,U,it).call(this),!this._fieldObjects){(0,n.warn)('_bindResetFormAction - "resetForm" action not supported, ensure that the `fieldObjects` parameter is provided.'),he||(j.onclick=()=>!1);return}j.onclick=()=>{var We;he==null||he();const{fields:pe,refs:xe,include:Se}=K,Fe=[];if(pe.length!==0||xe.length!==0){const Le=new Set(xe);for(const Ne of pe){const Be=this._fieldObjects[Ne]||[];for(const{id:Ve}of Be)Le.add(Ve)}for(const Ne of Object.values(this._fieldObjects))for(const Be of Ne)Le.has(Be.id)===Se&&Fe.push(Be)}else for(const Le of Object.values(this._fieldObjects))Fe.push(...Le);const De=this.annotationStorage,Te=[];for(const Le of Fe){const{id:Ne}=Le;switch(Te.push(Ne),Le.type){case"text":{const Ve=Le.defaultValue||"";De.setValue(Ne,{value:Ve});break}case"checkbox":case"radiobutton":{const Ve=Le.defaultValue===Le.exportValues;De.setValue(Ne,{value:Ve});break}case"combobox":case"listbox":{const Ve=Le.defaultValue||"";De.setValue(Ne,{value:Ve});break}default:continue}const Be=document.querySelector(`[data-element-id="${Ne}"]`);if(Be){if(!w.has(Be)){(0,n.warn)(`_bindResetFormAction - element not allowed: ${Ne}`);continue}}else continue;Be.dispatchEvent(new Event("resetform"))}return this.enableScripting&&((We=this.linkService.eventBus)==null||We.dispatch("dispatcheventinsandbox",{source:this,detail:{id:"app",ids:Te,name:"ResetForm"}})),!1}}}U=new WeakSet,it=function(){this.container.setAttribute("data-internal-link","")},On=function(j,K){j.href=this.linkService.getAnchorUrl(""),j.onclick=()=>(this.linkService.executeSetOCGState(K),!1),ne(this,U,it).call(this)};class x extends A{constructor(W){super(W,{isRenderable:!0})}render(){this.container.classList.add("textAnnotation");const W=document.createElement("img");return W.src=this.imageResourcesPath+"annotation-"+this.data.name.toLowerCase()+".svg",W.alt="[{{type}} Annotation]",W.dataset.l10nId="text_annotation_type",W.dataset.l10nArgs=JSON.stringify({type:this.data.name}),!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.append(W),this.container}}class f extends A{render(){return this.data.alternativeText&&(this.container.title=this.data.alternativeText),this.container}showElementAndHideCanvas(W){var j;this.data.hasOwnCanvas&&(((j=W.previousSibling)==null?void 0:j.nodeName)==="CANVAS"&&(W.previousSibling.hidden=!0),W.hidden=!1)}_getKeyModifier(W){const{isWin:j,isMac:K}=n.FeatureTest.platform;return j&&W.ctrlKey||K&&W.metaKey}_setEventListener(W,j,K,he,pe){K.includes("mouse")?W.addEventListener(K,xe=>{var Se;(Se=this.linkService.eventBus)==null||Se.dispatch("dispatcheventinsandbox",{source:this,detail:{id:this.data.id,name:he,value:pe(xe),shift:xe.shiftKey,modifier:this._getKeyModifier(xe)}})}):W.addEventListener(K,xe=>{var Se;if(K==="blur"){if(!j.focused||!xe.relatedTarget)return;j.focused=!1}else if(K==="focus"){if(j.focused)return;j.focused=!0}pe&&((Se=this.linkService.eventBus)==null||Se.dispatch("dispatcheventinsandbox",{source:this,detail:{id:this.data.id,name:he,value:pe(xe)}}))})}_setEventListeners(W,j,K,he){var pe,xe,Se;for(const[Fe,De]of K)(De==="Action"||(pe=this.data.actions)!=null&&pe[De])&&((De==="Focus"||De==="Blur")&&(j||(j={focused:!1})),this._setEventListener(W,j,Fe,De,he),De==="Focus"&&!((xe=this.data.actions)!=null&&xe.Blur)?this._setEventListener(W,j,"blur","Blur",null):De==="Blur"&&!((Se=this.data.actions)!=null&&Se.Focus)&&this._setEventListener(W,j,"focus","Focus",null))}_setBackgroundColor(W){const j=this.data.backgroundColor||null;W.style.backgroundColor=j===null?"transparent":n.Util.makeHexColor(j[0],j[1],j[2])}_setTextStyle(W){const j=["left","center","right"],{fontColor:K}=this.data.defaultAppearanceData,he=this.data.defaultAppearanceData.fontSize||a,pe=W.style;let xe;const Se=2,Fe=De=>Math.round(10*De)/10;if(this.data.multiLine){const De=Math.abs(this.data.rect[3]-this.data.rect[1]-Se),Te=Math.round(De/(n.LINE_FACTOR*he))||1,We=De/Te;xe=Math.min(he,Fe(We/n.LINE_FACTOR))}else{const De=Math.abs(this.data.rect[3]-this.data.rect[1]-Se);xe=Math.min(he,Fe(De/n.LINE_FACTOR))}pe.fontSize=`calc(${xe}px * var(--scale-factor))`,pe.color=n.Util.makeHexColor(K[0],K[1],K[2]),this.data.textAlignment!==null&&(pe.textAlign=j[this.data.textAlignment])}_setRequired(W,j){j?W.setAttribute("required",!0):W.removeAttribute("required"),W.setAttribute("aria-required",j)}}class E extends f{constructor(W){const j=W.renderForms||!W.data.hasAppearance&&!!W.data.fieldValue;super(W,{isRenderable:j})}setPropertyOnSiblings(W,j,K,he){const pe=this.annotationStorage;for(const xe of this._getElementsByName(W.name,W.id))xe.domElement&&(xe.domElement[j]=K),pe.setValue(xe.id,{[he]:K})}render(){var he,pe;const W=this.annotationStorage,j=this.data.id;this.container.classList.add("textWidgetAnnotation");let K=null;if(this.renderForms){const xe=W.getValue(j,{value:this.data.fieldValue});let Se=xe.value||"";const Fe=W.getValue(j,{charLimit:this.data.maxLen}).charLimit;Fe&&Se.length>Fe&&(Se=Se.slice(0,Fe));let De=xe.formattedValue||((he=this.data.textContent)==null?void 0:he.join(`
-`))||null;De&&this.data.comb&&(De=De.replaceAll(/\s+/g,""));const Te={userValue:Se,formattedValue:De,lastCommittedValue:null,commitKey:1,focused:!1};this.data.multiLine?(K=document.createElement("textarea"),K.textContent=De??Se,this.data.doNotScroll&&(K.style.overflowY="hidden")):(K=document.createElement("input"),K.type="text",K.setAttribute("value",De??Se),this.data.doNotScroll&&(K.style.overflowX="hidden")),this.data.hasOwnCanvas&&(K.hidden=!0),w.add(K),K.setAttribute("data-element-id",j),K.disabled=this.data.readOnly,K.name=this.data.fieldName,K.tabIndex=v,this._setRequired(K,this.data.required),Fe&&(K.maxLength=Fe),K.addEventListener("input",Le=>{W.setValue(j,{value:Le.target.value}),this.setPropertyOnSiblings(K,"value",Le.target.value,"value"),Te.formattedValue=null}),K.addEventListener("resetform",Le=>{const Ne=this.data.defaultFieldValue??"";K.value=Te.userValue=Ne,Te.formattedValue=null});let We=Le=>{const{formattedValue:Ne}=Te;Ne!=null&&(Le.target.value=Ne),Le.target.scrollLeft=0};if(this.enableScripting&&this.hasJSActions){K.addEventListener("focus",Ne=>{if(Te.focused)return;const{target:Be}=Ne;Te.userValue&&(Be.value=Te.userValue),Te.lastCommittedValue=Be.value,Te.commitKey=1,Te.focused=!0}),K.addEventListener("updatefromsandbox",Ne=>{this.showElementAndHideCanvas(Ne.target);const Be={value(Ve){Te.userValue=Ve.detail.value??"",W.setValue(j,{value:Te.userValue.toString()}),Ve.target.value=Te.userValue},formattedValue(Ve){const{formattedValue:Ke}=Ve.detail;Te.formattedValue=Ke,Ke!=null&&Ve.target!==document.activeElement&&(Ve.target.value=Ke),W.setValue(j,{formattedValue:Ke})},selRange(Ve){Ve.target.setSelectionRange(...Ve.detail.selRange)},charLimit:Ve=>{var Ze;const{charLimit:Ke}=Ve.detail,{target:Je}=Ve;if(Ke===0){Je.removeAttribute("maxLength");return}Je.setAttribute("maxLength",Ke);let tt=Te.userValue;!tt||tt.length<=Ke||(tt=tt.slice(0,Ke),Je.value=Te.userValue=tt,W.setValue(j,{value:tt}),(Ze=this.linkService.eventBus)==null||Ze.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:tt,willCommit:!0,commitKey:1,selStart:Je.selectionStart,selEnd:Je.selectionEnd}}))}};this._dispatchEventFromSandbox(Be,Ne)}),K.addEventListener("keydown",Ne=>{var Ke;Te.commitKey=1;let Be=-1;if(Ne.key==="Escape"?Be=0:Ne.key==="Enter"&&!this.data.multiLine?Be=2:Ne.key==="Tab"&&(Te.commitKey=3),Be===-1)return;const{value:Ve}=Ne.target;Te.lastCommittedValue!==Ve&&(Te.lastCommittedValue=Ve,Te.userValue=Ve,(Ke=this.linkService.eventBus)==null||Ke.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:Ve,willCommit:!0,commitKey:Be,selStart:Ne.target.selectionStart,selEnd:Ne.target.selectionEnd}}))});const Le=We;We=null,K.addEventListener("blur",Ne=>{var Ve;if(!Te.focused||!Ne.relatedTarget)return;Te.focused=!1;const{value:Be}=Ne.target;Te.userValue=Be,Te.lastCommittedValue!==Be&&((Ve=this.linkService.eventBus)==null||Ve.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:Be,willCommit:!0,commitKey:Te.commitKey,selStart:Ne.target.selectionStart,selEnd:Ne.target.selectionEnd}})),Le(Ne)}),(pe=this.data.actions)!=null&&pe.Keystroke&&K.addEventListener("beforeinput",Ne=>{var et;Te.lastCommittedValue=null;const{data:Be,target:Ve}=Ne,{value:Ke,selectionStart:Je,selectionEnd:tt}=Ve;let Ze=Je,Ye=tt;switch(Ne.inputType){case"deleteWordBackward":{const rt=Ke.substring(0,Je).match(/\w*[^\w]*$/);rt&&(Ze-=rt[0].length);break}case"deleteWordForward":{const rt=Ke.substring(Je).match(/^[^\w]*\w*/);rt&&(Ye+=rt[0].length);break}case"deleteContentBackward":Je===tt&&(Ze-=1);break;case"deleteContentForward":Je===tt&&(Ye+=1);break}Ne.preventDefault(),(et=this.linkService.eventBus)==null||et.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:Ke,change:Be||"",willCommit:!1,selStart:Ze,selEnd:Ye}})}),this._setEventListeners(K,Te,[["focus","Focus"],["blur","Blur"],["mousedown","Mouse Down"],["mouseenter","Mouse Enter"],["mouseleave","Mouse Exit"],["mouseup","Mouse Up"]],Ne=>Ne.target.value)}if(We&&K.addEventListener("blur",We),this.data.comb){const Ne=(this.data.rect[2]-this.data.rect[0])/Fe;K.classList.add("comb"),K.style.letterSpacing=`calc(${Ne}px * var(--scale-factor) - 1ch)`}}else K=document.createElement("div"),K.textContent=this.data.fieldValue,K.style.verticalAlign="middle",K.style.display="table-cell";return this._setTextStyle(K),this._setBackgroundColor(K),this._setDefaultPropertiesFromJS(K),this.container.append(K),this.container}}class F extends f{constructor(W){super(W,{isRenderable:!!W.data.hasOwnCanvas})}}class S extends f{constructor(W){super(W,{isRenderable:W.renderForms})}render(){const W=this.annotationStorage,j=this.data,K=j.id;let he=W.getValue(K,{value:j.exportValue===j.fieldValue}).value;typeof he=="string"&&(he=he!=="Off",W.setValue(K,{value:he})),this.container.classList.add("buttonWidgetAnnotation","checkBox");const pe=document.createElement("input");return w.add(pe),pe.setAttribute("data-element-id",K),pe.disabled=j.readOnly,this._setRequired(pe,this.data.required),pe.type="checkbox",pe.name=j.fieldName,he&&pe.setAttribute("checked",!0),pe.setAttribute("exportValue",j.exportValue),pe.tabIndex=v,pe.addEventListener("change",xe=>{const{name:Se,checked:Fe}=xe.target;for(const De of this._getElementsByName(Se,K)){const Te=Fe&&De.exportValue===j.exportValue;De.domElement&&(De.domElement.checked=Te),W.setValue(De.id,{value:Te})}W.setValue(K,{value:Fe})}),pe.addEventListener("resetform",xe=>{const Se=j.defaultFieldValue||"Off";xe.target.checked=Se===j.exportValue}),this.enableScripting&&this.hasJSActions&&(pe.addEventListener("updatefromsandbox",xe=>{const Se={value(Fe){Fe.target.checked=Fe.detail.value!=="Off",W.setValue(K,{value:Fe.target.checked})}};this._dispatchEventFromSandbox(Se,xe)}),this._setEventListeners(pe,null,[["change","Validate"],["change","Action"],["focus","Focus"],["blur","Blur"],["mousedown","Mouse Down"],["mouseenter","Mouse Enter"],["mouseleave","Mouse Exit"],["mouseup","Mouse Up"]],xe=>xe.target.checked)),this._setBackgroundColor(pe),this._setDefaultPropertiesFromJS(pe),this.container.append(pe),this.container}}class o extends f{constructor(W){super(W,{isRenderable:W.renderForms})}render(){this.container.classList.add("buttonWidgetAnnotation","radioButton");const W=this.annotationStorage,j=this.data,K=j.id;let he=W.getValue(K,{value:j.fieldValue===j.buttonValue}).value;typeof he=="string"&&(he=he!==j.buttonValue,W.setValue(K,{value:he}));const pe=document.createElement("input");if(w.add(pe),pe.setAttribute("data-element-id",K),pe.disabled=j.readOnly,this._setRequired(pe,this.data.required),pe.type="radio",pe.name=j.fieldName,he&&pe.setAttribute("checked",!0),pe.tabIndex=v,pe.addEventListener("change",xe=>{const{name:Se,checked:Fe}=xe.target;for(const De of this._getElementsByName(Se,K))W.setValue(De.id,{value:!1});W.setValue(K,{value:Fe})}),pe.addEventListener("resetform",xe=>{const Se=j.defaultFieldValue;xe.target.checked=Se!=null&&Se===j.buttonValue}),this.enableScripting&&this.hasJSActions){const xe=j.buttonValue;pe.addEventListener("updatefromsandbox",Se=>{const Fe={value:De=>{const Te=xe===De.detail.value;for(const We of this._getElementsByName(De.target.name)){const Le=Te&&We.id===K;We.domElement&&(We.domElement.checked=Le),W.setValue(We.id,{value:Le})}}};this._dispatchEventFromSandbox(Fe,Se)}),this._setEventListeners(pe,null,[["change","Validate"],["change","Action"],["focus","Focus"],["blur","Blur"],["mousedown","Mouse Down"],["mouseenter","Mouse Enter"],["mouseleave","Mouse Exit"],["mouseup","Mouse Up"]],Se=>Se.target.checked)}return this._setBackgroundColor(pe),this._setDefaultPropertiesFromJS(pe),this.container.append(pe),this.container}}class p extends P{constructor(W){super(W,{ignoreBorder:W.data.hasAppearance})}render(){const W=super.render();W.classList.add("buttonWidgetAnnotation","pushButton"),this.data.alternativeText&&(W.title=this.data.alternativeText);const j=W.lastChild;return this.enableScripting&&this.hasJSActions&&j&&(this._setDefaultPropertiesFromJS(j),j.addEventListener("updatefromsandbox",K=>{this._dispatchEventFromSandbox({},K)})),W}}class l extends f{constructor(W){super(W,{isRenderable:W.renderForms})}render(){this.container.classList.add("choiceWidgetAnnotation");const W=this.annotationStorage,j=this.data.id,K=W.getValue(j,{value:this.data.fieldValue}),he=document.createElement("select");w.add(he),he.setAttribute("data-element-id",j),he.disabled=this.data.readOnly,this._setRequired(he,this.data.required),he.name=this.data.fieldName,he.tabIndex=v;let pe=this.data.combo&&this.data.options.length>0;this.data.combo||(he.size=this.data.options.length,this.data.multiSelect&&(he.multiple=!0)),he.addEventListener("resetform",Te=>{const We=this.data.defaultFieldValue;for(const Le of he.options)Le.selected=Le.value===We});for(const Te of this.data.options){const We=document.createElement("option");We.textContent=Te.displayValue,We.value=Te.exportValue,K.value.includes(Te.exportValue)&&(We.setAttribute("selected",!0),pe=!1),he.append(We)}let xe=null;if(pe){const Te=document.createElement("option");Te.value=" ",Te.setAttribute("hidden",!0),Te.setAttribute("selected",!0),he.prepend(Te),xe=()=>{Te.remove(),he.removeEventListener("input",xe),xe=null},he.addEventListener("input",xe)}const Se=Te=>{const We=Te?"value":"textContent",{options:Le,multiple:Ne}=he;return Ne?Array.prototype.filter.call(Le,Be=>Be.selected).map(Be=>Be[We]):Le.selectedIndex===-1?null:Le[Le.selectedIndex][We]};let Fe=Se(!1);const De=Te=>{const We=Te.target.options;return Array.prototype.map.call(We,Le=>({displayValue:Le.textContent,exportValue:Le.value}))};return this.enableScripting&&this.hasJSActions?(he.addEventListener("updatefromsandbox",Te=>{const We={value(Le){xe==null||xe();const Ne=Le.detail.value,Be=new Set(Array.isArray(Ne)?Ne:[Ne]);for(const Ve of he.options)Ve.selected=Be.has(Ve.value);W.setValue(j,{value:Se(!0)}),Fe=Se(!1)},multipleSelection(Le){he.multiple=!0},remove(Le){const Ne=he.options,Be=Le.detail.remove;Ne[Be].selected=!1,he.remove(Be),Ne.length>0&&Array.prototype.findIndex.call(Ne,Ke=>Ke.selected)===-1&&(Ne[0].selected=!0),W.setValue(j,{value:Se(!0),items:De(Le)}),Fe=Se(!1)},clear(Le){for(;he.length!==0;)he.remove(0);W.setValue(j,{value:null,items:[]}),Fe=Se(!1)},insert(Le){const{index:Ne,displayValue:Be,exportValue:Ve}=Le.detail.insert,Ke=he.children[Ne],Je=document.createElement("option");Je.textContent=Be,Je.value=Ve,Ke?Ke.before(Je):he.append(Je),W.setValue(j,{value:Se(!0),items:De(Le)}),Fe=Se(!1)},items(Le){const{items:Ne}=Le.detail;for(;he.length!==0;)he.remove(0);for(const Be of Ne){const{displayValue:Ve,exportValue:Ke}=Be,Je=document.createElement("option");Je.textContent=Ve,Je.value=Ke,he.append(Je)}he.options.length>0&&(he.options[0].selected=!0),W.setValue(j,{value:Se(!0),items:De(Le)}),Fe=Se(!1)},indices(Le){const Ne=new Set(Le.detail.indices);for(const Be of Le.target.options)Be.selected=Ne.has(Be.index);W.setValue(j,{value:Se(!0)}),Fe=Se(!1)},editable(Le){Le.target.disabled=!Le.detail.editable}};this._dispatchEventFromSandbox(We,Te)}),he.addEventListener("input",Te=>{var Le;const We=Se(!0);W.setValue(j,{value:We}),Te.preventDefault(),(Le=this.linkService.eventBus)==null||Le.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:Fe,changeEx:We,willCommit:!1,commitKey:1,keyDown:!1}})}),this._setEventListeners(he,null,[["focus","Focus"],["blur","Blur"],["mousedown","Mouse Down"],["mouseenter","Mouse Enter"],["mouseleave","Mouse Exit"],["mouseup","Mouse Up"],["input","Action"],["input","Validate"]],Te=>Te.target.value)):he.addEventListener("input",function(Te){W.setValue(j,{value:Se(!0)})}),this.data.combo&&this._setTextStyle(he),this._setBackgroundColor(he),this._setDefaultPropertiesFromJS(he),this.container.append(he),this.container}}class g extends A{constructor(W){const{data:j,elements:K}=W;super(W,{isRenderable:A._hasPopupData(j)}),this.elements=K}render(){this.container.classList.add("popupAnnotation");const W=new m({container:this.container,color:this.data.color,titleObj:this.data.titleObj,modificationDate:this.data.modificationDate,contentsObj:this.data.contentsObj,richText:this.data.richText,rect:this.data.rect,parentRect:this.data.parentRect||null,parent:this.parent,elements:this.elements,open:this.data.open}),j=[];for(const K of this.elements)K.popup=W,j.push(K.data.id),K.addHighlightArea();return this.container.setAttribute("aria-controls",j.map(K=>`${n.AnnotationPrefix}${K}`).join(",")),this.container}}class m{constructor({container:W,color:j,elements:K,titleObj:he,modificationDate:pe,contentsObj:xe,richText:Se,parent:Fe,rect:De,parentRect:Te,open:We}){ce(this,Ce);ce(this,ie,null);ce(this,le,ne(this,Ce,Dn).bind(this));ce(this,fe,ne(this,Ce,rn).bind(this));ce(this,be,ne(this,Ce,sn).bind(this));ce(this,me,ne(this,Ce,wt).bind(this));ce(this,ve,null);ce(this,Z,null);ce(this,ee,null);ce(this,M,null);ce(this,H,null);ce(this,J,null);ce(this,oe,!1);ce(this,ge,null);ce(this,Ae,null);ce(this,_e,null);ce(this,te,null);ce(this,Pe,!1);var Ne;ue(this,Z,W),ue(this,te,he),ue(this,ee,xe),ue(this,_e,Se),ue(this,H,Fe),ue(this,ve,j),ue(this,Ae,De),ue(this,J,Te),ue(this,M,K);const Le=r.PDFDateString.toDateObject(pe);Le&&ue(this,ie,Fe.l10n.get("annotation_date_string",{date:Le.toLocaleDateString(),time:Le.toLocaleTimeString()})),this.trigger=K.flatMap(Be=>Be.getElementsToTriggerPopup());for(const Be of this.trigger)Be.addEventListener("click",i(this,me)),Be.addEventListener("mouseenter",i(this,be)),Be.addEventListener("mouseleave",i(this,fe)),Be.classList.add("popupTriggerArea");for(const Be of K)(Ne=Be.container)==null||Ne.addEventListener("keydown",i(this,le));i(this,Z).hidden=!0,We&&ne(this,Ce,wt).call(this)}render(){if(i(this,ge))return;const{page:{view:W},viewport:{rawDims:{pageWidth:j,pageHeight:K,pageX:he,pageY:pe}}}=i(this,H),xe=ue(this,ge,document.createElement("div"));if(xe.className="popup",i(this,ve)){const Ze=xe.style.outlineColor=n.Util.makeHexColor(...i(this,ve));CSS.supports("background-color","color-mix(in srgb, red 30%, white)")?xe.style.backgroundColor=`color-mix(in srgb, ${Ze} 30%, white)`:xe.style.backgroundColor=n.Util.makeHexColor(...i(this,ve).map(et=>Math.floor(.7*(255-et)+et)))}const Se=document.createElement("span");Se.className="header";const Fe=document.createElement("h1");if(Se.append(Fe),{dir:Fe.dir,str:Fe.textContent}=i(this,te),xe.append(Se),i(this,ie)){const Ze=document.createElement("span");Ze.classList.add("popupDate"),i(this,ie).then(Ye=>{Ze.textContent=Ye}),Se.append(Ze)}const De=i(this,ee),Te=i(this,_e);if(Te!=null&&Te.str&&(!(De!=null&&De.str)||De.str===Te.str))h.XfaLayer.render({xfaHtml:Te.html,intent:"richText",div:xe}),xe.lastChild.classList.add("richText","popupContent");else{const Ze=this._formatContents(De);xe.append(Ze)}let We=!!i(this,J),Le=We?i(this,J):i(this,Ae);for(const Ze of i(this,M))if(!Le||n.Util.intersect(Ze.data.rect,Le)!==null){Le=Ze.data.rect,We=!0;break}const Ne=n.Util.normalizeRect([Le[0],W[3]-Le[1]+W[1],Le[2],W[3]-Le[3]+W[1]]),Ve=We?Le[2]-Le[0]+5:0,Ke=Ne[0]+Ve,Je=Ne[1],{style:tt}=i(this,Z);tt.left=`${100*(Ke-he)/j}%`,tt.top=`${100*(Je-pe)/K}%`,i(this,Z).append(xe)}_formatContents({str:W,dir:j}){const K=document.createElement("p");K.classList.add("popupContent"),K.dir=j;const he=W.split(/(?:\r\n?|\n)/);for(let pe=0,xe=he.length;pe<xe;++pe){const Se=he[pe];K.append(document.createTextNode(Se)),pe<xe-1&&K.append(document.createElement("br"))}return K}forceHide(){ue(this,Pe,this.isVisible),i(this,Pe)&&(i(this,Z).hidden=!0)}maybeShow(){i(this,Pe)&&(ue(this,Pe,!1),i(this,Z).hidden=!1)}get isVisible(){return i(this,Z).hidden===!1}}ie=new WeakMap,le=new WeakMap,fe=new WeakMap,be=new WeakMap,me=new WeakMap,ve=new WeakMap,Z=new WeakMap,ee=new WeakMap,M=new WeakMap,H=new WeakMap,J=new WeakMap,oe=new WeakMap,ge=new WeakMap,Ae=new WeakMap,_e=new WeakMap,te=new WeakMap,Pe=new WeakMap,Ce=new WeakSet,Dn=function(W){W.altKey||W.shiftKey||W.ctrlKey||W.metaKey||(W.key==="Enter"||W.key==="Escape"&&i(this,oe))&&ne(this,Ce,wt).call(this)},wt=function(){ue(this,oe,!i(this,oe)),i(this,oe)?(ne(this,Ce,sn).call(this),i(this,Z).addEventListener("click",i(this,me)),i(this,Z).addEventListener("keydown",i(this,le))):(ne(this,Ce,rn).call(this),i(this,Z).removeEventListener("click",i(this,me)),i(this,Z).removeEventListener("keydown",i(this,le)))},sn=function(){i(this,ge)||this.render(),this.isVisible?i(this,oe)&&i(this,Z).classList.add("focused"):(i(this,Z).hidden=!1,i(this,Z).style.zIndex=parseInt(i(this,Z).style.zIndex)+1e3)},rn=function(){i(this,Z).classList.remove("focused"),!(i(this,oe)||!this.isVisible)&&(i(this,Z).hidden=!0,i(this,Z).style.zIndex=parseInt(i(this,Z).style.zIndex)-1e3)};class L extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0}),this.textContent=W.data.textContent,this.textPosition=W.data.textPosition,this.annotationEditorType=n.AnnotationEditorType.FREETEXT}render(){if(this.container.classList.add("freeTextAnnotation"),this.textContent){const W=document.createElement("div");W.classList.add("annotationTextContent"),W.setAttribute("role","comment");for(const j of this.textContent){const K=document.createElement("span");K.textContent=j,W.append(K)}this.container.append(W)}return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this._editOnDoubleClick(),this.container}}e.FreeTextAnnotationElement=L;class c extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,Oe,null)}render(){this.container.classList.add("lineAnnotation");const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0),xe=ue(this,Oe,this.svgFactory.createElement("svg:line"));return xe.setAttribute("x1",j.rect[2]-j.lineCoordinates[0]),xe.setAttribute("y1",j.rect[3]-j.lineCoordinates[1]),xe.setAttribute("x2",j.rect[2]-j.lineCoordinates[2]),xe.setAttribute("y2",j.rect[3]-j.lineCoordinates[3]),xe.setAttribute("stroke-width",j.borderStyle.width||1),xe.setAttribute("stroke","transparent"),xe.setAttribute("fill","transparent"),pe.append(xe),this.container.append(pe),!j.popupRef&&this.hasPopupData&&this._createPopup(),this.container}getElementsToTriggerPopup(){return i(this,Oe)}addHighlightArea(){this.container.classList.add("highlightArea")}}Oe=new WeakMap;class R extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,ze,null)}render(){this.container.classList.add("squareAnnotation");const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0),xe=j.borderStyle.width,Se=ue(this,ze,this.svgFactory.createElement("svg:rect"));return Se.setAttribute("x",xe/2),Se.setAttribute("y",xe/2),Se.setAttribute("width",K-xe),Se.setAttribute("height",he-xe),Se.setAttribute("stroke-width",xe||1),Se.setAttribute("stroke","transparent"),Se.setAttribute("fill","transparent"),pe.append(Se),this.container.append(pe),!j.popupRef&&this.hasPopupData&&this._createPopup(),this.container}getElementsToTriggerPopup(){return i(this,ze)}addHighlightArea(){this.container.classList.add("highlightArea")}}ze=new WeakMap;class I extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,Xe,null)}render(){this.container.classList.add("circleAnnotation");const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0),xe=j.borderStyle.width,Se=ue(this,Xe,this.svgFactory.createElement("svg:ellipse"));return Se.setAttribute("cx",K/2),Se.setAttribute("cy",he/2),Se.setAttribute("rx",K/2-xe/2),Se.setAttribute("ry",he/2-xe/2),Se.setAttribute("stroke-width",xe||1),Se.setAttribute("stroke","transparent"),Se.setAttribute("fill","transparent"),pe.append(Se),this.container.append(pe),!j.popupRef&&this.hasPopupData&&this._createPopup(),this.container}getElementsToTriggerPopup(){return i(this,Xe)}addHighlightArea(){this.container.classList.add("highlightArea")}}Xe=new WeakMap;class Q extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,Ee,null);this.containerClassName="polylineAnnotation",this.svgElementName="svg:polyline"}render(){this.container.classList.add(this.containerClassName);const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0);let xe=[];for(const Fe of j.vertices){const De=Fe.x-j.rect[0],Te=j.rect[3]-Fe.y;xe.push(De+","+Te)}xe=xe.join(" ");const Se=ue(this,Ee,this.svgFactory.createElement(this.svgElementName));return Se.setAttribute("points",xe),Se.setAttribute("stroke-width",j.borderStyle.width||1),Se.setAttribute("stroke","transparent"),Se.setAttribute("fill","transparent"),pe.append(Se),this.container.append(pe),!j.popupRef&&this.hasPopupData&&this._createPopup(),this.container}getElementsToTriggerPopup(){return i(this,Ee)}addHighlightArea(){this.container.classList.add("highlightArea")}}Ee=new WeakMap;class G extends Q{constructor(W){super(W),this.containerClassName="polygonAnnotation",this.svgElementName="svg:polygon"}}class q extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0})}render(){return this.container.classList.add("caretAnnotation"),!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container}}class V extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,ae,[]);this.containerClassName="inkAnnotation",this.svgElementName="svg:polyline",this.annotationEditorType=n.AnnotationEditorType.INK}render(){this.container.classList.add(this.containerClassName);const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0);for(const xe of j.inkLists){let Se=[];for(const De of xe){const Te=De.x-j.rect[0],We=j.rect[3]-De.y;Se.push(`${Te},${We}`)}Se=Se.join(" ");const Fe=this.svgFactory.createElement(this.svgElementName);i(this,ae).push(Fe),Fe.setAttribute("points",Se),Fe.setAttribute("stroke-width",j.borderStyle.width||1),Fe.setAttribute("stroke","transparent"),Fe.setAttribute("fill","transparent"),!j.popupRef&&this.hasPopupData&&this._createPopup(),pe.append(Fe)}return this.container.append(pe),this.container}getElementsToTriggerPopup(){return i(this,ae)}addHighlightArea(){this.container.classList.add("highlightArea")}}ae=new WeakMap,e.InkAnnotationElement=V;class se extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0,createQuadrilaterals:!0})}render(){return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.classList.add("highlightAnnotation"),this.container}}class D extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0,createQuadrilaterals:!0})}render(){return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.classList.add("underlineAnnotation"),this.container}}class X extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0,createQuadrilaterals:!0})}render(){return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.classList.add("squigglyAnnotation"),this.container}}class re extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0,createQuadrilaterals:!0})}render(){return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.classList.add("strikeoutAnnotation"),this.container}}class N extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0})}render(){return this.container.classList.add("stampAnnotation"),!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container}}e.StampAnnotationElement=N;class d extends A{constructor(j){var pe;super(j,{isRenderable:!0});ce(this,Me);ce(this,de,null);const{filename:K,content:he}=this.data.file;this.filename=(0,r.getFilenameFromUrl)(K,!0),this.content=he,(pe=this.linkService.eventBus)==null||pe.dispatch("fileattachmentannotation",{source:this,filename:K,content:he})}render(){this.container.classList.add("fileAttachmentAnnotation");const{container:j,data:K}=this;let he;K.hasAppearance||K.fillAlpha===0?he=document.createElement("div"):(he=document.createElement("img"),he.src=`${this.imageResourcesPath}annotation-${/paperclip/i.test(K.name)?"paperclip":"pushpin"}.svg`,K.fillAlpha&&K.fillAlpha<1&&(he.style=`filter: opacity(${Math.round(K.fillAlpha*100)}%);`)),he.addEventListener("dblclick",ne(this,Me,on).bind(this)),ue(this,de,he);const{isMac:pe}=n.FeatureTest.platform;return j.addEventListener("keydown",xe=>{xe.key==="Enter"&&(pe?xe.metaKey:xe.ctrlKey)&&ne(this,Me,on).call(this)}),!K.popupRef&&this.hasPopupData?this._createPopup():he.classList.add("popupTriggerArea"),j.append(he),j}getElementsToTriggerPopup(){return i(this,de)}addHighlightArea(){this.container.classList.add("highlightArea")}}de=new WeakMap,Me=new WeakSet,on=function(){var j;(j=this.downloadManager)==null||j.openOrDownloadData(this.container,this.content,this.filename)};class u{constructor({div:W,accessibilityManager:j,annotationCanvasMap:K,l10n:he,page:pe,viewport:xe}){ce(this,we);ce(this,Ge,null);ce(this,z,null);ce(this,ye,new Map);this.div=W,ue(this,Ge,j),ue(this,z,K),this.l10n=he,this.page=pe,this.viewport=xe,this.zIndex=0,this.l10n||(this.l10n=O.NullL10n)}async render(W){const{annotations:j}=W,K=this.div;(0,r.setLayerDimensions)(K,this.viewport);const he=new Map,pe={data:null,layer:K,linkService:W.linkService,downloadManager:W.downloadManager,imageResourcesPath:W.imageResourcesPath||"",renderForms:W.renderForms!==!1,svgFactory:new r.DOMSVGFactory,annotationStorage:W.annotationStorage||new y.AnnotationStorage,enableScripting:W.enableScripting===!0,hasJSActions:W.hasJSActions,fieldObjects:W.fieldObjects,parent:this,elements:null};for(const xe of j){if(xe.noHTML)continue;const Se=xe.annotationType===n.AnnotationType.POPUP;if(Se){const Te=he.get(xe.id);if(!Te)continue;pe.elements=Te}else{const{width:Te,height:We}=k(xe.rect);if(Te<=0||We<=0)continue}pe.data=xe;const Fe=b.create(pe);if(!Fe.isRenderable)continue;if(!Se&&xe.popupRef){const Te=he.get(xe.popupRef);Te?Te.push(Fe):he.set(xe.popupRef,[Fe])}Fe.annotationEditorType>0&&i(this,ye).set(Fe.data.id,Fe);const De=Fe.render();xe.hidden&&(De.style.visibility="hidden"),ne(this,we,Ln).call(this,De,xe.id)}ne(this,we,an).call(this),await this.l10n.translate(K)}update({viewport:W}){const j=this.div;this.viewport=W,(0,r.setLayerDimensions)(j,{rotation:W.rotation}),ne(this,we,an).call(this),j.hidden=!1}getEditableAnnotations(){return Array.from(i(this,ye).values())}getEditableAnnotation(W){return i(this,ye).get(W)}}Ge=new WeakMap,z=new WeakMap,ye=new WeakMap,we=new WeakSet,Ln=function(W,j){var he;const K=W.firstChild||W;K.id=`${n.AnnotationPrefix}${j}`,this.div.append(W),(he=i(this,Ge))==null||he.moveElementInDOM(this.div,W,K,!1)},an=function(){if(!i(this,z))return;const W=this.div;for(const[j,K]of i(this,z)){const he=W.querySelector(`[data-annotation-id="${j}"]`);if(!he)continue;const{firstChild:pe}=he;pe?pe.nodeName==="CANVAS"?pe.replaceWith(K):pe.before(K):he.append(K)}i(this,z).clear()},e.AnnotationLayer=u},(t,e)=>{Object.defineProperty(e,"__esModule",{value:!0}),e.ColorConverters=void 0;function s(y){return Math.floor(Math.max(0,Math.min(1,y))*255).toString(16).padStart(2,"0")}function n(y){return Math.max(0,Math.min(255,255*y))}class r{static CMYK_G([C,O,h,v]){return["G",1-Math.min(1,.3*C+.59*h+.11*O+v)]}static G_CMYK([C]){return["CMYK",0,0,0,1-C]}static G_RGB([C]){return["RGB",C,C,C]}static G_rgb([C]){return C=n(C),[C,C,C]}static G_HTML([C]){const O=s(C);return`#${O}${O}${O}`}static RGB_G([C,O,h]){return["G",.3*C+.59*O+.11*h]}static RGB_rgb(C){return C.map(n)}static RGB_HTML(C){return`#${C.map(s).join("")}`}static T_HTML(){return"#00000000"}static T_rgb(){return[null]}static CMYK_RGB([C,O,h,v]){return["RGB",1-Math.min(1,C+v),1-Math.min(1,h+v),1-Math.min(1,O+v)]}static CMYK_rgb([C,O,h,v]){return[n(1-Math.min(1,C+v)),n(1-Math.min(1,h+v)),n(1-Math.min(1,O+v))]}static CMYK_HTML(C){const O=this.CMYK_RGB(C).slice(1);return this.RGB_HTML(O)}static RGB_CMYK([C,O,h]){const v=1-C,a=1-O,w=1-h,k=Math.min(v,a,w);return["CMYK",v,a,w,k]}}e.ColorConverters=r},(t,e)=>{Object.defineProperty(e,"__esModule",{value:!0}),e.NullL10n=void 0,e.getL10nFallback=n;const s={of_pages:"of {{pagesCount}}",page_of_pages:"({{pageNumber}} of {{pagesCount}})",document_properties_kb:"{{size_kb}} KB ({{size_b}} bytes)",document_properties_mb:"{{size_mb}} MB ({{size_b}} bytes)",document_properties_date_string:"{{date}}, {{time}}",document_properties_page_size_unit_inches:"in",document_properties_page_size_unit_millimeters:"mm",document_properties_page_size_orientation_portrait:"portrait",document_properties_page_size_orientation_landscape:"landscape",document_properties_page_size_name_a3:"A3",document_properties_page_size_name_a4:"A4",document_properties_page_size_name_letter:"Letter",document_properties_page_size_name_legal:"Legal",document_properties_page_size_dimension_string:"{{width}} × {{height}} {{unit}} ({{orientation}})",document_properties_page_size_dimension_name_string:"{{width}} × {{height}} {{unit}} ({{name}}, {{orientation}})",document_properties_linearized_yes:"Yes",document_properties_linearized_no:"No",additional_layers:"Additional Layers",page_landmark:"Page {{page}}",thumb_page_title:"Page {{page}}",thumb_page_canvas:"Thumbnail of Page {{page}}",find_reached_top:"Reached top of document, continued from bottom",find_reached_bottom:"Reached end of document, continued from top","find_match_count[one]":"{{current}} of {{total}} match","find_match_count[other]":"{{current}} of {{total}} matches","find_match_count_limit[one]":"More than {{limit}} match","find_match_count_limit[other]":"More than {{limit}} matches",find_not_found:"Phrase not found",page_scale_width:"Page Width",page_scale_fit:"Page Fit",page_scale_auto:"Automatic Zoom",page_scale_actual:"Actual Size",page_scale_percent:"{{scale}}%",loading_error:"An error occurred while loading the PDF.",invalid_file_error:"Invalid or corrupted PDF file.",missing_file_error:"Missing PDF file.",unexpected_response_error:"Unexpected server response.",rendering_error:"An error occurred while rendering the page.",annotation_date_string:"{{date}}, {{time}}",printing_not_supported:"Warning: Printing is not fully supported by this browser.",printing_not_ready:"Warning: The PDF is not fully loaded for printing.",web_fonts_disabled:"Web fonts are disabled: unable to use embedded PDF fonts.",free_text2_default_content:"Start typing…",editor_free_text2_aria_label:"Text Editor",editor_ink2_aria_label:"Draw Editor",editor_ink_canvas_aria_label:"User-created image",editor_alt_text_button_label:"Alt text",editor_alt_text_edit_button_label:"Edit alt text",editor_alt_text_decorative_tooltip:"Marked as decorative"};s.print_progress_percent="{{progress}}%";function n(C,O){switch(C){case"find_match_count":C=`find_match_count[${O.total===1?"one":"other"}]`;break;case"find_match_count_limit":C=`find_match_count_limit[${O.limit===1?"one":"other"}]`;break}return s[C]||""}function r(C,O){return O?C.replaceAll(/\{\{\s*(\w+)\s*\}\}/g,(h,v)=>v in O?O[v]:"{{"+v+"}}"):C}const y={async getLanguage(){return"en-us"},async getDirection(){return"ltr"},async get(C,O=null,h=n(C,O)){return r(h,O)},async translate(C){}};e.NullL10n=y},(t,e,s)=>{Object.defineProperty(e,"__esModule",{value:!0}),e.XfaLayer=void 0;var n=s(25);class r{static setupStorage(C,O,h,v,a){const w=v.getValue(O,{value:null});switch(h.name){case"textarea":if(w.value!==null&&(C.textContent=w.value),a==="print")break;C.addEventListener("input",k=>{v.setValue(O,{value:k.target.value})});break;case"input":if(h.attributes.type==="radio"||h.attributes.type==="checkbox"){if(w.value===h.attributes.xfaOn?C.setAttribute("checked",!0):w.value===h.attributes.xfaOff&&C.removeAttribute("checked"),a==="print")break;C.addEventListener("change",k=>{v.setValue(O,{value:k.target.checked?k.target.getAttribute("xfaOn"):k.target.getAttribute("xfaOff")})})}else{if(w.value!==null&&C.setAttribute("value",w.value),a==="print")break;C.addEventListener("input",k=>{v.setValue(O,{value:k.target.value})})}break;case"select":if(w.value!==null){C.setAttribute("value",w.value);for(const k of h.children)k.attributes.value===w.value?k.attributes.selected=!0:k.attributes.hasOwnProperty("selected")&&delete k.attributes.selected}C.addEventListener("input",k=>{const b=k.target.options,A=b.selectedIndex===-1?"":b[b.selectedIndex].value;v.setValue(O,{value:A})});break}}static setAttributes({html:C,element:O,storage:h=null,intent:v,linkService:a}){const{attributes:w}=O,k=C instanceof HTMLAnchorElement;w.type==="radio"&&(w.name=`${w.name}-${v}`);for(const[b,A]of Object.entries(w))if(A!=null)switch(b){case"class":A.length&&C.setAttribute(b,A.join(" "));break;case"dataId":break;case"id":C.setAttribute("data-element-id",A);break;case"style":Object.assign(C.style,A);break;case"textContent":C.textContent=A;break;default:(!k||b!=="href"&&b!=="newWindow")&&C.setAttribute(b,A)}k&&a.addLinkAttributes(C,w.href,w.newWindow),h&&w.dataId&&this.setupStorage(C,w.dataId,O,h)}static render(C){var P;const O=C.annotationStorage,h=C.linkService,v=C.xfaHtml,a=C.intent||"display",w=document.createElement(v.name);v.attributes&&this.setAttributes({html:w,element:v,intent:a,linkService:h});const k=[[v,-1,w]],b=C.div;if(b.append(w),C.viewport){const x=`matrix(${C.viewport.transform.join(",")})`;b.style.transform=x}a!=="richText"&&b.setAttribute("class","xfaLayer xfaFont");const A=[];for(;k.length>0;){const[x,f,E]=k.at(-1);if(f+1===x.children.length){k.pop();continue}const F=x.children[++k.at(-1)[1]];if(F===null)continue;const{name:S}=F;if(S==="#text"){const p=document.createTextNode(F.value);A.push(p),E.append(p);continue}const o=(P=F==null?void 0:F.attributes)!=null&&P.xmlns?document.createElementNS(F.attributes.xmlns,S):document.createElement(S);if(E.append(o),F.attributes&&this.setAttributes({html:o,element:F,storage:O,intent:a,linkService:h}),F.children&&F.children.length>0)k.push([F,-1,o]);else if(F.value){const p=document.createTextNode(F.value);n.XfaText.shouldBuildText(S)&&A.push(p),o.append(p)}}for(const x of b.querySelectorAll(".xfaNonInteractive input, .xfaNonInteractive textarea"))x.setAttribute("readOnly",!0);return{textDivs:A}}static update(C){const O=`matrix(${C.viewport.transform.join(",")})`;C.div.style.transform=O,C.div.hidden=!1}}e.XfaLayer=r},(t,e,s)=>{var v,a,w,k,b,A,P,x,f,E,F,S,o,p,l,In,Nn,jn,$n,ln,Bn,cn,Un,Wn,Hn,zn,Vn,st,dn,Tt,Rt,ct,un,kt,U,Gn,hn,qn,Xn,pn,Mt,dt;Object.defineProperty(e,"__esModule",{value:!0}),e.InkEditor=void 0;var n=s(1),r=s(4),y=s(29),C=s(6),O=s(5);const ve=class ve extends r.AnnotationEditor{constructor(M){super({...M,name:"inkEditor"});ce(this,l);ce(this,v,0);ce(this,a,0);ce(this,w,this.canvasPointermove.bind(this));ce(this,k,this.canvasPointerleave.bind(this));ce(this,b,this.canvasPointerup.bind(this));ce(this,A,this.canvasPointerdown.bind(this));ce(this,P,new Path2D);ce(this,x,!1);ce(this,f,!1);ce(this,E,!1);ce(this,F,null);ce(this,S,0);ce(this,o,0);ce(this,p,null);this.color=M.color||null,this.thickness=M.thickness||null,this.opacity=M.opacity||null,this.paths=[],this.bezierPath2D=[],this.allRawPaths=[],this.currentPath=[],this.scaleFactor=1,this.translationX=this.translationY=0,this.x=0,this.y=0,this._willKeepAspectRatio=!0}static initialize(M){r.AnnotationEditor.initialize(M,{strings:["editor_ink_canvas_aria_label","editor_ink2_aria_label"]})}static updateDefaultParams(M,H){switch(M){case n.AnnotationEditorParamsType.INK_THICKNESS:ve._defaultThickness=H;break;case n.AnnotationEditorParamsType.INK_COLOR:ve._defaultColor=H;break;case n.AnnotationEditorParamsType.INK_OPACITY:ve._defaultOpacity=H/100;break}}updateParams(M,H){switch(M){case n.AnnotationEditorParamsType.INK_THICKNESS:ne(this,l,In).call(this,H);break;case n.AnnotationEditorParamsType.INK_COLOR:ne(this,l,Nn).call(this,H);break;case n.AnnotationEditorParamsType.INK_OPACITY:ne(this,l,jn).call(this,H);break}}static get defaultPropertiesToUpdate(){return[[n.AnnotationEditorParamsType.INK_THICKNESS,ve._defaultThickness],[n.AnnotationEditorParamsType.INK_COLOR,ve._defaultColor||r.AnnotationEditor._defaultLineColor],[n.AnnotationEditorParamsType.INK_OPACITY,Math.round(ve._defaultOpacity*100)]]}get propertiesToUpdate(){return[[n.AnnotationEditorParamsType.INK_THICKNESS,this.thickness||ve._defaultThickness],[n.AnnotationEditorParamsType.INK_COLOR,this.color||ve._defaultColor||r.AnnotationEditor._defaultLineColor],[n.AnnotationEditorParamsType.INK_OPACITY,Math.round(100*(this.opacity??ve._defaultOpacity))]]}rebuild(){this.parent&&(super.rebuild(),this.div!==null&&(this.canvas||(ne(this,l,Tt).call(this),ne(this,l,Rt).call(this)),this.isAttachedToDOM||(this.parent.add(this),ne(this,l,ct).call(this)),ne(this,l,dt).call(this)))}remove(){this.canvas!==null&&(this.isEmpty()||this.commit(),this.canvas.width=this.canvas.height=0,this.canvas.remove(),this.canvas=null,i(this,F).disconnect(),ue(this,F,null),super.remove())}setParent(M){!this.parent&&M?this._uiManager.removeShouldRescale(this):this.parent&&M===null&&this._uiManager.addShouldRescale(this),super.setParent(M)}onScaleChanging(){const[M,H]=this.parentDimensions,J=this.width*M,oe=this.height*H;this.setDimensions(J,oe)}enableEditMode(){i(this,x)||this.canvas===null||(super.enableEditMode(),this._isDraggable=!1,this.canvas.addEventListener("pointerdown",i(this,A)))}disableEditMode(){!this.isInEditMode()||this.canvas===null||(super.disableEditMode(),this._isDraggable=!this.isEmpty(),this.div.classList.remove("editing"),this.canvas.removeEventListener("pointerdown",i(this,A)))}onceAdded(){this._isDraggable=!this.isEmpty()}isEmpty(){return this.paths.length===0||this.paths.length===1&&this.paths[0].length===0}commit(){i(this,x)||(super.commit(),this.isEditing=!1,this.disableEditMode(),this.setInForeground(),ue(this,x,!0),this.div.classList.add("disabled"),ne(this,l,dt).call(this,!0),this.makeResizable(),this.parent.addInkEditorIfNeeded(!0),this.moveInDOM(),this.div.focus({preventScroll:!0}))}focusin(M){this._focusEventsAllowed&&(super.focusin(M),this.enableEditMode())}canvasPointerdown(M){M.button!==0||!this.isInEditMode()||i(this,x)||(this.setInForeground(),M.preventDefault(),M.type!=="mouse"&&this.div.focus(),ne(this,l,Bn).call(this,M.offsetX,M.offsetY))}canvasPointermove(M){M.preventDefault(),ne(this,l,cn).call(this,M.offsetX,M.offsetY)}canvasPointerup(M){M.preventDefault(),ne(this,l,dn).call(this,M)}canvasPointerleave(M){ne(this,l,dn).call(this,M)}get isResizable(){return!this.isEmpty()&&i(this,x)}render(){if(this.div)return this.div;let M,H;this.width&&(M=this.x,H=this.y),super.render(),r.AnnotationEditor._l10nPromise.get("editor_ink2_aria_label").then(_e=>{var te;return(te=this.div)==null?void 0:te.setAttribute("aria-label",_e)});const[J,oe,ge,Ae]=ne(this,l,$n).call(this);if(this.setAt(J,oe,0,0),this.setDims(ge,Ae),ne(this,l,Tt).call(this),this.width){const[_e,te]=this.parentDimensions;this.setAspectRatio(this.width*_e,this.height*te),this.setAt(M*_e,H*te,this.width*_e,this.height*te),ue(this,E,!0),ne(this,l,ct).call(this),this.setDims(this.width*_e,this.height*te),ne(this,l,st).call(this),this.div.classList.add("disabled")}else this.div.classList.add("editing"),this.enableEditMode();return ne(this,l,Rt).call(this),this.div}setDimensions(M,H){const J=Math.round(M),oe=Math.round(H);if(i(this,S)===J&&i(this,o)===oe)return;ue(this,S,J),ue(this,o,oe),this.canvas.style.visibility="hidden";const[ge,Ae]=this.parentDimensions;this.width=M/ge,this.height=H/Ae,this.fixAndSetPosition(),i(this,x)&&ne(this,l,un).call(this,M,H),ne(this,l,ct).call(this),ne(this,l,st).call(this),this.canvas.style.visibility="visible",this.fixDims()}static deserialize(M,H,J){var Oe,ze,Xe;if(M instanceof y.InkAnnotationElement)return null;const oe=super.deserialize(M,H,J);oe.thickness=M.thickness,oe.color=n.Util.makeHexColor(...M.color),oe.opacity=M.opacity;const[ge,Ae]=oe.pageDimensions,_e=oe.width*ge,te=oe.height*Ae,Pe=oe.parentScale,Ce=M.thickness/2;ue(oe,x,!0),ue(oe,S,Math.round(_e)),ue(oe,o,Math.round(te));const{paths:Ue,rect:$e,rotation:He}=M;for(let{bezier:Ee}of Ue){Ee=ne(Oe=ve,U,qn).call(Oe,Ee,$e,He);const ae=[];oe.paths.push(ae);let de=Pe*(Ee[0]-Ce),Me=Pe*(Ee[1]-Ce);for(let Ge=2,z=Ee.length;Ge<z;Ge+=6){const ye=Pe*(Ee[Ge]-Ce),we=Pe*(Ee[Ge+1]-Ce),Ie=Pe*(Ee[Ge+2]-Ce),je=Pe*(Ee[Ge+3]-Ce),Re=Pe*(Ee[Ge+4]-Ce),W=Pe*(Ee[Ge+5]-Ce);ae.push([[de,Me],[ye,we],[Ie,je],[Re,W]]),de=Re,Me=W}const qe=ne(this,U,Gn).call(this,ae);oe.bezierPath2D.push(qe)}const ke=ne(ze=oe,l,pn).call(ze);return ue(oe,a,Math.max(r.AnnotationEditor.MIN_SIZE,ke[2]-ke[0])),ue(oe,v,Math.max(r.AnnotationEditor.MIN_SIZE,ke[3]-ke[1])),ne(Xe=oe,l,un).call(Xe,_e,te),oe}serialize(){if(this.isEmpty())return null;const M=this.getRect(0,0),H=r.AnnotationEditor._colorManager.convert(this.ctx.strokeStyle);return{annotationType:n.AnnotationEditorType.INK,color:H,thickness:this.thickness,opacity:this.opacity,paths:ne(this,l,Xn).call(this,this.scaleFactor/this.parentScale,this.translationX,this.translationY,M),pageIndex:this.pageIndex,rect:M,rotation:this.rotation,structTreeParentId:this._structTreeParentId}}};v=new WeakMap,a=new WeakMap,w=new WeakMap,k=new WeakMap,b=new WeakMap,A=new WeakMap,P=new WeakMap,x=new WeakMap,f=new WeakMap,E=new WeakMap,F=new WeakMap,S=new WeakMap,o=new WeakMap,p=new WeakMap,l=new WeakSet,In=function(M){const H=this.thickness;this.addCommands({cmd:()=>{this.thickness=M,ne(this,l,dt).call(this)},undo:()=>{this.thickness=H,ne(this,l,dt).call(this)},mustExec:!0,type:n.AnnotationEditorParamsType.INK_THICKNESS,overwriteIfSameType:!0,keepUndo:!0})},Nn=function(M){const H=this.color;this.addCommands({cmd:()=>{this.color=M,ne(this,l,st).call(this)},undo:()=>{this.color=H,ne(this,l,st).call(this)},mustExec:!0,type:n.AnnotationEditorParamsType.INK_COLOR,overwriteIfSameType:!0,keepUndo:!0})},jn=function(M){M/=100;const H=this.opacity;this.addCommands({cmd:()=>{this.opacity=M,ne(this,l,st).call(this)},undo:()=>{this.opacity=H,ne(this,l,st).call(this)},mustExec:!0,type:n.AnnotationEditorParamsType.INK_OPACITY,overwriteIfSameType:!0,keepUndo:!0})},$n=function(){const{parentRotation:M,parentDimensions:[H,J]}=this;switch(M){case 90:return[0,J,J,H];case 180:return[H,J,H,J];case 270:return[H,0,J,H];default:return[0,0,H,J]}},ln=function(){const{ctx:M,color:H,opacity:J,thickness:oe,parentScale:ge,scaleFactor:Ae}=this;M.lineWidth=oe*ge/Ae,M.lineCap="round",M.lineJoin="round",M.miterLimit=10,M.strokeStyle=`${H}${(0,O.opacityToHex)(J)}`},Bn=function(M,H){this.canvas.addEventListener("contextmenu",C.noContextMenu),this.canvas.addEventListener("pointerleave",i(this,k)),this.canvas.addEventListener("pointermove",i(this,w)),this.canvas.addEventListener("pointerup",i(this,b)),this.canvas.removeEventListener("pointerdown",i(this,A)),this.isEditing=!0,i(this,E)||(ue(this,E,!0),ne(this,l,ct).call(this),this.thickness||(this.thickness=ve._defaultThickness),this.color||(this.color=ve._defaultColor||r.AnnotationEditor._defaultLineColor),this.opacity??(this.opacity=ve._defaultOpacity)),this.currentPath.push([M,H]),ue(this,f,!1),ne(this,l,ln).call(this),ue(this,p,()=>{ne(this,l,Hn).call(this),i(this,p)&&window.requestAnimationFrame(i(this,p))}),window.requestAnimationFrame(i(this,p))},cn=function(M,H){const[J,oe]=this.currentPath.at(-1);if(this.currentPath.length>1&&M===J&&H===oe)return;const ge=this.currentPath;let Ae=i(this,P);if(ge.push([M,H]),ue(this,f,!0),ge.length<=2){Ae.moveTo(...ge[0]),Ae.lineTo(M,H);return}ge.length===3&&(ue(this,P,Ae=new Path2D),Ae.moveTo(...ge[0])),ne(this,l,zn).call(this,Ae,...ge.at(-3),...ge.at(-2),M,H)},Un=function(){if(this.currentPath.length===0)return;const M=this.currentPath.at(-1);i(this,P).lineTo(...M)},Wn=function(M,H){ue(this,p,null),M=Math.min(Math.max(M,0),this.canvas.width),H=Math.min(Math.max(H,0),this.canvas.height),ne(this,l,cn).call(this,M,H),ne(this,l,Un).call(this);let J;if(this.currentPath.length!==1)J=ne(this,l,Vn).call(this);else{const te=[M,H];J=[[te,te.slice(),te.slice(),te]]}const oe=i(this,P),ge=this.currentPath;this.currentPath=[],ue(this,P,new Path2D);const Ae=()=>{this.allRawPaths.push(ge),this.paths.push(J),this.bezierPath2D.push(oe),this.rebuild()},_e=()=>{this.allRawPaths.pop(),this.paths.pop(),this.bezierPath2D.pop(),this.paths.length===0?this.remove():(this.canvas||(ne(this,l,Tt).call(this),ne(this,l,Rt).call(this)),ne(this,l,dt).call(this))};this.addCommands({cmd:Ae,undo:_e,mustExec:!0})},Hn=function(){if(!i(this,f))return;ue(this,f,!1);const M=Math.ceil(this.thickness*this.parentScale),H=this.currentPath.slice(-3),J=H.map(Ae=>Ae[0]),oe=H.map(Ae=>Ae[1]);Math.min(...J)-M,Math.max(...J)+M,Math.min(...oe)-M,Math.max(...oe)+M;const{ctx:ge}=this;ge.save(),ge.clearRect(0,0,this.canvas.width,this.canvas.height);for(const Ae of this.bezierPath2D)ge.stroke(Ae);ge.stroke(i(this,P)),ge.restore()},zn=function(M,H,J,oe,ge,Ae,_e){const te=(H+oe)/2,Pe=(J+ge)/2,Ce=(oe+Ae)/2,Ue=(ge+_e)/2;M.bezierCurveTo(te+2*(oe-te)/3,Pe+2*(ge-Pe)/3,Ce+2*(oe-Ce)/3,Ue+2*(ge-Ue)/3,Ce,Ue)},Vn=function(){const M=this.currentPath;if(M.length<=2)return[[M[0],M[0],M.at(-1),M.at(-1)]];const H=[];let J,[oe,ge]=M[0];for(J=1;J<M.length-2;J++){const[$e,He]=M[J],[ke,Oe]=M[J+1],ze=($e+ke)/2,Xe=(He+Oe)/2,Ee=[oe+2*($e-oe)/3,ge+2*(He-ge)/3],ae=[ze+2*($e-ze)/3,Xe+2*(He-Xe)/3];H.push([[oe,ge],Ee,ae,[ze,Xe]]),[oe,ge]=[ze,Xe]}const[Ae,_e]=M[J],[te,Pe]=M[J+1],Ce=[oe+2*(Ae-oe)/3,ge+2*(_e-ge)/3],Ue=[te+2*(Ae-te)/3,Pe+2*(_e-Pe)/3];return H.push([[oe,ge],Ce,Ue,[te,Pe]]),H},st=function(){if(this.isEmpty()){ne(this,l,kt).call(this);return}ne(this,l,ln).call(this);const{canvas:M,ctx:H}=this;H.setTransform(1,0,0,1,0,0),H.clearRect(0,0,M.width,M.height),ne(this,l,kt).call(this);for(const J of this.bezierPath2D)H.stroke(J)},dn=function(M){this.canvas.removeEventListener("pointerleave",i(this,k)),this.canvas.removeEventListener("pointermove",i(this,w)),this.canvas.removeEventListener("pointerup",i(this,b)),this.canvas.addEventListener("pointerdown",i(this,A)),setTimeout(()=>{this.canvas.removeEventListener("contextmenu",C.noContextMenu)},10),ne(this,l,Wn).call(this,M.offsetX,M.offsetY),this.addToAnnotationStorage(),this.setInBackground()},Tt=function(){this.canvas=document.createElement("canvas"),this.canvas.width=this.canvas.height=0,this.canvas.className="inkEditorCanvas",r.AnnotationEditor._l10nPromise.get("editor_ink_canvas_aria_label").then(M=>{var H;return(H=this.canvas)==null?void 0:H.setAttribute("aria-label",M)}),this.div.append(this.canvas),this.ctx=this.canvas.getContext("2d")},Rt=function(){ue(this,F,new ResizeObserver(M=>{const H=M[0].contentRect;H.width&&H.height&&this.setDimensions(H.width,H.height)})),i(this,F).observe(this.div)},ct=function(){if(!i(this,E))return;const[M,H]=this.parentDimensions;this.canvas.width=Math.ceil(this.width*M),this.canvas.height=Math.ceil(this.height*H),ne(this,l,kt).call(this)},un=function(M,H){const J=ne(this,l,Mt).call(this),oe=(M-J)/i(this,a),ge=(H-J)/i(this,v);this.scaleFactor=Math.min(oe,ge)},kt=function(){const M=ne(this,l,Mt).call(this)/2;this.ctx.setTransform(this.scaleFactor,0,0,this.scaleFactor,this.translationX*this.scaleFactor+M,this.translationY*this.scaleFactor+M)},U=new WeakSet,Gn=function(M){const H=new Path2D;for(let J=0,oe=M.length;J<oe;J++){const[ge,Ae,_e,te]=M[J];J===0&&H.moveTo(...ge),H.bezierCurveTo(Ae[0],Ae[1],_e[0],_e[1],te[0],te[1])}return H},hn=function(M,H,J){const[oe,ge,Ae,_e]=H;switch(J){case 0:for(let te=0,Pe=M.length;te<Pe;te+=2)M[te]+=oe,M[te+1]=_e-M[te+1];break;case 90:for(let te=0,Pe=M.length;te<Pe;te+=2){const Ce=M[te];M[te]=M[te+1]+oe,M[te+1]=Ce+ge}break;case 180:for(let te=0,Pe=M.length;te<Pe;te+=2)M[te]=Ae-M[te],M[te+1]+=ge;break;case 270:for(let te=0,Pe=M.length;te<Pe;te+=2){const Ce=M[te];M[te]=Ae-M[te+1],M[te+1]=_e-Ce}break;default:throw new Error("Invalid rotation")}return M},qn=function(M,H,J){const[oe,ge,Ae,_e]=H;switch(J){case 0:for(let te=0,Pe=M.length;te<Pe;te+=2)M[te]-=oe,M[te+1]=_e-M[te+1];break;case 90:for(let te=0,Pe=M.length;te<Pe;te+=2){const Ce=M[te];M[te]=M[te+1]-ge,M[te+1]=Ce-oe}break;case 180:for(let te=0,Pe=M.length;te<Pe;te+=2)M[te]=Ae-M[te],M[te+1]-=ge;break;case 270:for(let te=0,Pe=M.length;te<Pe;te+=2){const Ce=M[te];M[te]=_e-M[te+1],M[te+1]=Ae-Ce}break;default:throw new Error("Invalid rotation")}return M},Xn=function(M,H,J,oe){var Pe,Ce;const ge=[],Ae=this.thickness/2,_e=M*H+Ae,te=M*J+Ae;for(const Ue of this.paths){const $e=[],He=[];for(let ke=0,Oe=Ue.length;ke<Oe;ke++){const[ze,Xe,Ee,ae]=Ue[ke],de=M*ze[0]+_e,Me=M*ze[1]+te,qe=M*Xe[0]+_e,Ge=M*Xe[1]+te,z=M*Ee[0]+_e,ye=M*Ee[1]+te,we=M*ae[0]+_e,Ie=M*ae[1]+te;ke===0&&($e.push(de,Me),He.push(de,Me)),$e.push(qe,Ge,z,ye,we,Ie),He.push(qe,Ge),ke===Oe-1&&He.push(we,Ie)}ge.push({bezier:ne(Pe=ve,U,hn).call(Pe,$e,oe,this.rotation),points:ne(Ce=ve,U,hn).call(Ce,He,oe,this.rotation)})}return ge},pn=function(){let M=1/0,H=-1/0,J=1/0,oe=-1/0;for(const ge of this.paths)for(const[Ae,_e,te,Pe]of ge){const Ce=n.Util.bezierBoundingBox(...Ae,..._e,...te,...Pe);M=Math.min(M,Ce[0]),J=Math.min(J,Ce[1]),H=Math.max(H,Ce[2]),oe=Math.max(oe,Ce[3])}return[M,J,H,oe]},Mt=function(){return i(this,x)?Math.ceil(this.thickness*this.parentScale):0},dt=function(M=!1){if(this.isEmpty())return;if(!i(this,x)){ne(this,l,st).call(this);return}const H=ne(this,l,pn).call(this),J=ne(this,l,Mt).call(this);ue(this,a,Math.max(r.AnnotationEditor.MIN_SIZE,H[2]-H[0])),ue(this,v,Math.max(r.AnnotationEditor.MIN_SIZE,H[3]-H[1]));const oe=Math.ceil(J+i(this,a)*this.scaleFactor),ge=Math.ceil(J+i(this,v)*this.scaleFactor),[Ae,_e]=this.parentDimensions;this.width=oe/Ae,this.height=ge/_e,this.setAspectRatio(oe,ge);const te=this.translationX,Pe=this.translationY;this.translationX=-H[0],this.translationY=-H[1],ne(this,l,ct).call(this),ne(this,l,st).call(this),ue(this,S,oe),ue(this,o,ge),this.setDims(oe,ge);const Ce=M?J/this.scaleFactor/2:0;this.translate(te-this.translationX-Ce,Pe-this.translationY-Ce)},ce(ve,U),Qe(ve,"_defaultColor",null),Qe(ve,"_defaultOpacity",1),Qe(ve,"_defaultThickness",1),Qe(ve,"_type","ink");let h=ve;e.InkEditor=h},(t,e,s)=>{var h,v,a,w,k,b,A,P,x,f,E,vt,yt,Ft,fn,Yn,Kn,gn,Ot,Jn;Object.defineProperty(e,"__esModule",{value:!0}),e.StampEditor=void 0;var n=s(1),r=s(4),y=s(6),C=s(29);const R=class R extends r.AnnotationEditor{constructor(G){super({...G,name:"stampEditor"});ce(this,E);ce(this,h,null);ce(this,v,null);ce(this,a,null);ce(this,w,null);ce(this,k,null);ce(this,b,null);ce(this,A,null);ce(this,P,null);ce(this,x,!1);ce(this,f,!1);ue(this,w,G.bitmapUrl),ue(this,k,G.bitmapFile)}static initialize(G){r.AnnotationEditor.initialize(G)}static get supportedTypes(){const G=["apng","avif","bmp","gif","jpeg","png","svg+xml","webp","x-icon"];return(0,n.shadow)(this,"supportedTypes",G.map(q=>`image/${q}`))}static get supportedTypesStr(){return(0,n.shadow)(this,"supportedTypesStr",this.supportedTypes.join(","))}static isHandlingMimeForPasting(G){return this.supportedTypes.includes(G)}static paste(G,q){q.pasteEditor(n.AnnotationEditorType.STAMP,{bitmapFile:G.getAsFile()})}remove(){var G,q;i(this,v)&&(ue(this,h,null),this._uiManager.imageManager.deleteId(i(this,v)),(G=i(this,b))==null||G.remove(),ue(this,b,null),(q=i(this,A))==null||q.disconnect(),ue(this,A,null)),super.remove()}rebuild(){if(!this.parent){i(this,v)&&ne(this,E,Ft).call(this);return}super.rebuild(),this.div!==null&&(i(this,v)&&ne(this,E,Ft).call(this),this.isAttachedToDOM||this.parent.add(this))}onceAdded(){this._isDraggable=!0,this.div.focus()}isEmpty(){return!(i(this,a)||i(this,h)||i(this,w)||i(this,k))}get isResizable(){return!0}render(){if(this.div)return this.div;let G,q;if(this.width&&(G=this.x,q=this.y),super.render(),this.div.hidden=!0,i(this,h)?ne(this,E,fn).call(this):ne(this,E,Ft).call(this),this.width){const[V,se]=this.parentDimensions;this.setAt(G*V,q*se,this.width*V,this.height*se)}return this.div}static deserialize(G,q,V){if(G instanceof C.StampAnnotationElement)return null;const se=super.deserialize(G,q,V),{rect:D,bitmapUrl:X,bitmapId:re,isSvg:N,accessibilityData:d}=G;re&&V.imageManager.isValidId(re)?ue(se,v,re):ue(se,w,X),ue(se,x,N);const[u,T]=se.pageDimensions;return se.width=(D[2]-D[0])/u,se.height=(D[3]-D[1])/T,d&&(se.altTextData=d),se}serialize(G=!1,q=null){if(this.isEmpty())return null;const V={annotationType:n.AnnotationEditorType.STAMP,bitmapId:i(this,v),pageIndex:this.pageIndex,rect:this.getRect(0,0),rotation:this.rotation,isSvg:i(this,x),structTreeParentId:this._structTreeParentId};if(G)return V.bitmapUrl=ne(this,E,Ot).call(this,!0),V.accessibilityData=this.altTextData,V;const{decorative:se,altText:D}=this.altTextData;if(!se&&D&&(V.accessibilityData={type:"Figure",alt:D}),q===null)return V;q.stamps||(q.stamps=new Map);const X=i(this,x)?(V.rect[2]-V.rect[0])*(V.rect[3]-V.rect[1]):null;if(!q.stamps.has(i(this,v)))q.stamps.set(i(this,v),{area:X,serialized:V}),V.bitmap=ne(this,E,Ot).call(this,!1);else if(i(this,x)){const re=q.stamps.get(i(this,v));X>re.area&&(re.area=X,re.serialized.bitmap.close(),re.serialized.bitmap=ne(this,E,Ot).call(this,!1))}return V}};h=new WeakMap,v=new WeakMap,a=new WeakMap,w=new WeakMap,k=new WeakMap,b=new WeakMap,A=new WeakMap,P=new WeakMap,x=new WeakMap,f=new WeakMap,E=new WeakSet,vt=function(G,q=!1){if(!G){this.remove();return}ue(this,h,G.bitmap),q||(ue(this,v,G.id),ue(this,x,G.isSvg)),ne(this,E,fn).call(this)},yt=function(){ue(this,a,null),this._uiManager.enableWaiting(!1),i(this,b)&&this.div.focus()},Ft=function(){if(i(this,v)){this._uiManager.enableWaiting(!0),this._uiManager.imageManager.getFromId(i(this,v)).then(q=>ne(this,E,vt).call(this,q,!0)).finally(()=>ne(this,E,yt).call(this));return}if(i(this,w)){const q=i(this,w);ue(this,w,null),this._uiManager.enableWaiting(!0),ue(this,a,this._uiManager.imageManager.getFromUrl(q).then(V=>ne(this,E,vt).call(this,V)).finally(()=>ne(this,E,yt).call(this)));return}if(i(this,k)){const q=i(this,k);ue(this,k,null),this._uiManager.enableWaiting(!0),ue(this,a,this._uiManager.imageManager.getFromFile(q).then(V=>ne(this,E,vt).call(this,V)).finally(()=>ne(this,E,yt).call(this)));return}const G=document.createElement("input");G.type="file",G.accept=R.supportedTypesStr,ue(this,a,new Promise(q=>{G.addEventListener("change",async()=>{if(!G.files||G.files.length===0)this.remove();else{this._uiManager.enableWaiting(!0);const V=await this._uiManager.imageManager.getFromFile(G.files[0]);ne(this,E,vt).call(this,V)}q()}),G.addEventListener("cancel",()=>{this.remove(),q()})}).finally(()=>ne(this,E,yt).call(this))),G.click()},fn=function(){const{div:G}=this;let{width:q,height:V}=i(this,h);const[se,D]=this.pageDimensions,X=.75;if(this.width)q=this.width*se,V=this.height*D;else if(q>X*se||V>X*D){const u=Math.min(X*se/q,X*D/V);q*=u,V*=u}const[re,N]=this.parentDimensions;this.setDims(q*re/se,V*N/D),this._uiManager.enableWaiting(!1);const d=ue(this,b,document.createElement("canvas"));G.append(d),G.hidden=!1,ne(this,E,gn).call(this,q,V),ne(this,E,Jn).call(this),i(this,f)||(this.parent.addUndoableEditor(this),ue(this,f,!0)),this._uiManager._eventBus.dispatch("reporttelemetry",{source:this,details:{type:"editing",subtype:this.editorType,data:{action:"inserted_image"}}}),this.addAltTextButton()},Yn=function(G,q){var X;const[V,se]=this.parentDimensions;this.width=G/V,this.height=q/se,this.setDims(G,q),(X=this._initialOptions)!=null&&X.isCentered?this.center():this.fixAndSetPosition(),this._initialOptions=null,i(this,P)!==null&&clearTimeout(i(this,P)),ue(this,P,setTimeout(()=>{ue(this,P,null),ne(this,E,gn).call(this,G,q)},200))},Kn=function(G,q){const{width:V,height:se}=i(this,h);let D=V,X=se,re=i(this,h);for(;D>2*G||X>2*q;){const N=D,d=X;D>2*G&&(D=D>=16384?Math.floor(D/2)-1:Math.ceil(D/2)),X>2*q&&(X=X>=16384?Math.floor(X/2)-1:Math.ceil(X/2));const u=new OffscreenCanvas(D,X);u.getContext("2d").drawImage(re,0,0,N,d,0,0,D,X),re=u.transferToImageBitmap()}return re},gn=function(G,q){G=Math.ceil(G),q=Math.ceil(q);const V=i(this,b);if(!V||V.width===G&&V.height===q)return;V.width=G,V.height=q;const se=i(this,x)?i(this,h):ne(this,E,Kn).call(this,G,q),D=V.getContext("2d");D.filter=this._uiManager.hcmFilter,D.drawImage(se,0,0,se.width,se.height,0,0,G,q)},Ot=function(G){if(G){if(i(this,x)){const se=this._uiManager.imageManager.getSvgUrl(i(this,v));if(se)return se}const q=document.createElement("canvas");return{width:q.width,height:q.height}=i(this,h),q.getContext("2d").drawImage(i(this,h),0,0),q.toDataURL()}if(i(this,x)){const[q,V]=this.pageDimensions,se=Math.round(this.width*q*y.PixelsPerInch.PDF_TO_CSS_UNITS),D=Math.round(this.height*V*y.PixelsPerInch.PDF_TO_CSS_UNITS),X=new OffscreenCanvas(se,D);return X.getContext("2d").drawImage(i(this,h),0,0,i(this,h).width,i(this,h).height,0,0,se,D),X.transferToImageBitmap()}return structuredClone(i(this,h))},Jn=function(){ue(this,A,new ResizeObserver(G=>{const q=G[0].contentRect;q.width&&q.height&&ne(this,E,Yn).call(this,q.width,q.height)})),i(this,A).observe(this.div)},Qe(R,"_type","stamp");let O=R;e.StampEditor=O}],__webpack_module_cache__={};function __w_pdfjs_require__(t){var e=__webpack_module_cache__[t];if(e!==void 0)return e.exports;var s=__webpack_module_cache__[t]={exports:{}};return __webpack_modules__[t](s,s.exports,__w_pdfjs_require__),s.exports}var __webpack_exports__={};return(()=>{var t=__webpack_exports__;Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"AbortException",{enumerable:!0,get:function(){return e.AbortException}}),Object.defineProperty(t,"AnnotationEditorLayer",{enumerable:!0,get:function(){return y.AnnotationEditorLayer}}),Object.defineProperty(t,"AnnotationEditorParamsType",{enumerable:!0,get:function(){return e.AnnotationEditorParamsType}}),Object.defineProperty(t,"AnnotationEditorType",{enumerable:!0,get:function(){return e.AnnotationEditorType}}),Object.defineProperty(t,"AnnotationEditorUIManager",{enumerable:!0,get:function(){return C.AnnotationEditorUIManager}}),Object.defineProperty(t,"AnnotationLayer",{enumerable:!0,get:function(){return O.AnnotationLayer}}),Object.defineProperty(t,"AnnotationMode",{enumerable:!0,get:function(){return e.AnnotationMode}}),Object.defineProperty(t,"CMapCompressionType",{enumerable:!0,get:function(){return e.CMapCompressionType}}),Object.defineProperty(t,"DOMSVGFactory",{enumerable:!0,get:function(){return n.DOMSVGFactory}}),Object.defineProperty(t,"FeatureTest",{enumerable:!0,get:function(){return e.FeatureTest}}),Object.defineProperty(t,"GlobalWorkerOptions",{enumerable:!0,get:function(){return h.GlobalWorkerOptions}}),Object.defineProperty(t,"ImageKind",{enumerable:!0,get:function(){return e.ImageKind}}),Object.defineProperty(t,"InvalidPDFException",{enumerable:!0,get:function(){return e.InvalidPDFException}}),Object.defineProperty(t,"MissingPDFException",{enumerable:!0,get:function(){return e.MissingPDFException}}),Object.defineProperty(t,"OPS",{enumerable:!0,get:function(){return e.OPS}}),Object.defineProperty(t,"PDFDataRangeTransport",{enumerable:!0,get:function(){return s.PDFDataRangeTransport}}),Object.defineProperty(t,"PDFDateString",{enumerable:!0,get:function(){return n.PDFDateString}}),Object.defineProperty(t,"PDFWorker",{enumerable:!0,get:function(){return s.PDFWorker}}),Object.defineProperty(t,"PasswordResponses",{enumerable:!0,get:function(){return e.PasswordResponses}}),Object.defineProperty(t,"PermissionFlag",{enumerable:!0,get:function(){return e.PermissionFlag}}),Object.defineProperty(t,"PixelsPerInch",{enumerable:!0,get:function(){return n.PixelsPerInch}}),Object.defineProperty(t,"PromiseCapability",{enumerable:!0,get:function(){return e.PromiseCapability}}),Object.defineProperty(t,"RenderingCancelledException",{enumerable:!0,get:function(){return n.RenderingCancelledException}}),Object.defineProperty(t,"SVGGraphics",{enumerable:!0,get:function(){return s.SVGGraphics}}),Object.defineProperty(t,"UnexpectedResponseException",{enumerable:!0,get:function(){return e.UnexpectedResponseException}}),Object.defineProperty(t,"Util",{enumerable:!0,get:function(){return e.Util}}),Object.defineProperty(t,"VerbosityLevel",{enumerable:!0,get:function(){return e.VerbosityLevel}}),Object.defineProperty(t,"XfaLayer",{enumerable:!0,get:function(){return v.XfaLayer}}),Object.defineProperty(t,"build",{enumerable:!0,get:function(){return s.build}}),Object.defineProperty(t,"createValidAbsoluteUrl",{enumerable:!0,get:function(){return e.createValidAbsoluteUrl}}),Object.defineProperty(t,"getDocument",{enumerable:!0,get:function(){return s.getDocument}}),Object.defineProperty(t,"getFilenameFromUrl",{enumerable:!0,get:function(){return n.getFilenameFromUrl}}),Object.defineProperty(t,"getPdfFilenameFromUrl",{enumerable:!0,get:function(){return n.getPdfFilenameFromUrl}}),Object.defineProperty(t,"getXfaPageViewport",{enumerable:!0,get:function(){return n.getXfaPageViewport}}),Object.defineProperty(t,"isDataScheme",{enumerable:!0,get:function(){return n.isDataScheme}}),Object.defineProperty(t,"isPdfFile",{enumerable:!0,get:function(){return n.isPdfFile}}),Object.defineProperty(t,"loadScript",{enumerable:!0,get:function(){return n.loadScript}}),Object.defineProperty(t,"noContextMenu",{enumerable:!0,get:function(){return n.noContextMenu}}),Object.defineProperty(t,"normalizeUnicode",{enumerable:!0,get:function(){return e.normalizeUnicode}}),Object.defineProperty(t,"renderTextLayer",{enumerable:!0,get:function(){return r.renderTextLayer}}),Object.defineProperty(t,"setLayerDimensions",{enumerable:!0,get:function(){return n.setLayerDimensions}}),Object.defineProperty(t,"shadow",{enumerable:!0,get:function(){return e.shadow}}),Object.defineProperty(t,"updateTextLayer",{enumerable:!0,get:function(){return r.updateTextLayer}}),Object.defineProperty(t,"version",{enumerable:!0,get:function(){return s.version}});var e=__w_pdfjs_require__(1),s=__w_pdfjs_require__(2),n=__w_pdfjs_require__(6),r=__w_pdfjs_require__(26),y=__w_pdfjs_require__(27),C=__w_pdfjs_require__(5),O=__w_pdfjs_require__(29),h=__w_pdfjs_require__(14),v=__w_pdfjs_require__(32)})(),__webpack_exports__})())})(pdf$1);var pdfExports=pdf$1.exports;const pdf=getDefaultExportFromCjs(pdfExports),pdfjsModule=_mergeNamespaces({__proto__:null,default:pdf},[pdfExports]),pdfjs="default"in pdfjsModule?pdf:pdfjsModule;var __spreadArray=function(t,e,s){if(s||arguments.length===2)for(var n=0,r=e.length,y;n<r;n++)(y||!(n in e))&&(y||(y=Array.prototype.slice.call(e,0,n)),y[n]=e[n]);return t.concat(y||Array.prototype.slice.call(e))},clipboardEvents=["onCopy","onCut","onPaste"],compositionEvents=["onCompositionEnd","onCompositionStart","onCompositionUpdate"],focusEvents=["onFocus","onBlur"],formEvents=["onInput","onInvalid","onReset","onSubmit"],imageEvents=["onLoad","onError"],keyboardEvents=["onKeyDown","onKeyPress","onKeyUp"],mediaEvents=["onAbort","onCanPlay","onCanPlayThrough","onDurationChange","onEmptied","onEncrypted","onEnded","onError","onLoadedData","onLoadedMetadata","onLoadStart","onPause","onPlay","onPlaying","onProgress","onRateChange","onSeeked","onSeeking","onStalled","onSuspend","onTimeUpdate","onVolumeChange","onWaiting"],mouseEvents=["onClick","onContextMenu","onDoubleClick","onMouseDown","onMouseEnter","onMouseLeave","onMouseMove","onMouseOut","onMouseOver","onMouseUp"],dragEvents=["onDrag","onDragEnd","onDragEnter","onDragExit","onDragLeave","onDragOver","onDragStart","onDrop"],selectionEvents=["onSelect"],touchEvents=["onTouchCancel","onTouchEnd","onTouchMove","onTouchStart"],pointerEvents=["onPointerDown","onPointerMove","onPointerUp","onPointerCancel","onGotPointerCapture","onLostPointerCapture","onPointerEnter","onPointerLeave","onPointerOver","onPointerOut"],uiEvents=["onScroll"],wheelEvents=["onWheel"],animationEvents=["onAnimationStart","onAnimationEnd","onAnimationIteration"],transitionEvents=["onTransitionEnd"],otherEvents=["onToggle"],changeEvents=["onChange"],allEvents=__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray([],clipboardEvents,!0),compositionEvents,!0),focusEvents,!0),formEvents,!0),imageEvents,!0),keyboardEvents,!0),mediaEvents,!0),mouseEvents,!0),dragEvents,!0),selectionEvents,!0),touchEvents,!0),pointerEvents,!0),uiEvents,!0),wheelEvents,!0),animationEvents,!0),transitionEvents,!0),changeEvents,!0),otherEvents,!0);function makeEventProps(t,e){var s={};return allEvents.forEach(function(n){var r=t[n];r&&(e?s[n]=function(y){return r(y,e(n))}:s[n]=r)}),s}function makeCancellablePromise(t){var e=!1,s=new Promise(function(n,r){t.then(function(y){return!e&&n(y)}).catch(function(y){return!e&&r(y)})});return{promise:s,cancel:function(){e=!0}}}var prefix="Invariant failed";function invariant(t,e){if(!t)throw new Error(prefix)}var warning=function(){},warning_1=warning;const warning$1=getDefaultExportFromCjs(warning_1);var has=Object.prototype.hasOwnProperty;function find(t,e,s){for(s of t.keys())if(dequal(s,e))return s}function dequal(t,e){var s,n,r;if(t===e)return!0;if(t&&e&&(s=t.constructor)===e.constructor){if(s===Date)return t.getTime()===e.getTime();if(s===RegExp)return t.toString()===e.toString();if(s===Array){if((n=t.length)===e.length)for(;n--&&dequal(t[n],e[n]););return n===-1}if(s===Set){if(t.size!==e.size)return!1;for(n of t)if(r=n,r&&typeof r=="object"&&(r=find(e,r),!r)||!e.has(r))return!1;return!0}if(s===Map){if(t.size!==e.size)return!1;for(n of t)if(r=n[0],r&&typeof r=="object"&&(r=find(e,r),!r)||!dequal(n[1],e.get(r)))return!1;return!0}if(s===ArrayBuffer)t=new Uint8Array(t),e=new Uint8Array(e);else if(s===DataView){if((n=t.byteLength)===e.byteLength)for(;n--&&t.getInt8(n)===e.getInt8(n););return n===-1}if(ArrayBuffer.isView(t)){if((n=t.byteLength)===e.byteLength)for(;n--&&t[n]===e[n];);return n===-1}if(!s||typeof t=="object"){n=0;for(s in t)if(has.call(t,s)&&++n&&!has.call(e,s)||!(s in e)||!dequal(t[s],e[s]))return!1;return Object.keys(e).length===n}}return t!==t&&e!==e}const DocumentContext=reactExports.createContext(null);function Message({children:t,type:e}){return React$1.createElement("div",{className:`react-pdf__message react-pdf__message--${e}`},t)}const DEFAULT_LINK_REL="noopener noreferrer nofollow";class LinkService{constructor(){this.externalLinkEnabled=!0,this.externalLinkRel=void 0,this.externalLinkTarget=void 0,this.isInPresentationMode=!1,this.pdfDocument=void 0,this.pdfViewer=void 0}setDocument(e){this.pdfDocument=e}setViewer(e){this.pdfViewer=e}setExternalLinkRel(e){this.externalLinkRel=e}setExternalLinkTarget(e){this.externalLinkTarget=e}setHistory(){}get pagesCount(){return this.pdfDocument?this.pdfDocument.numPages:0}get page(){return invariant(this.pdfViewer),this.pdfViewer.currentPageNumber||0}set page(e){invariant(this.pdfViewer),this.pdfViewer.currentPageNumber=e}get rotation(){return 0}set rotation(e){}goToDestination(e){return new Promise(s=>{invariant(this.pdfDocument),invariant(e),typeof e=="string"?this.pdfDocument.getDestination(e).then(s):Array.isArray(e)?s(e):e.then(s)}).then(s=>{invariant(Array.isArray(s));const n=s[0];new Promise(r=>{invariant(this.pdfDocument),n instanceof Object?this.pdfDocument.getPageIndex(n).then(y=>{r(y)}).catch(()=>{invariant(!1)}):typeof n=="number"?r(n):invariant(!1)}).then(r=>{const y=r+1;invariant(this.pdfViewer),invariant(y>=1&&y<=this.pagesCount),this.pdfViewer.scrollPageIntoView({dest:s,pageIndex:r,pageNumber:y})})})}navigateTo(e){this.goToDestination(e)}goToPage(e){const s=e-1;invariant(this.pdfViewer),invariant(e>=1&&e<=this.pagesCount),this.pdfViewer.scrollPageIntoView({pageIndex:s,pageNumber:e})}addLinkAttributes(e,s,n){e.href=s,e.rel=this.externalLinkRel||DEFAULT_LINK_REL,e.target=n?"_blank":this.externalLinkTarget||""}getDestinationHash(){return"#"}getAnchorUrl(){return"#"}setHash(){}executeNamedAction(){}cachePageRef(){}isPageVisible(){return!0}isPageCached(){return!0}executeSetOCGState(){}}const PasswordResponses={NEED_PASSWORD:1,INCORRECT_PASSWORD:2},isBrowser=typeof document<"u",isLocalFileSystem=isBrowser&&window.location.protocol==="file:";function isDefined(t){return typeof t<"u"}function isProvided(t){return isDefined(t)&&t!==null}function isString(t){return typeof t=="string"}function isArrayBuffer(t){return t instanceof ArrayBuffer}function isBlob(t){return invariant(isBrowser),t instanceof Blob}function isDataURI(t){return isString(t)&&/^data:/.test(t)}function dataURItoByteString(t){invariant(isDataURI(t));const[e="",s=""]=t.split(",");return e.split(";").indexOf("base64")!==-1?atob(s):unescape(s)}function getDevicePixelRatio(){return isBrowser&&window.devicePixelRatio||1}const allowFileAccessFromFilesTip="On Chromium based browsers, you can use --allow-file-access-from-files flag for debugging purposes.";function displayCORSWarning(){warning$1(!isLocalFileSystem,`Loading PDF as base64 strings/URLs may not work on protocols other than HTTP/HTTPS. ${allowFileAccessFromFilesTip}`)}function displayWorkerWarning(){warning$1(!isLocalFileSystem,`Loading PDF.js worker may not work on protocols other than HTTP/HTTPS. ${allowFileAccessFromFilesTip}`)}function cancelRunningTask(t){t&&t.cancel&&t.cancel()}function makePageCallback(t,e){return Object.defineProperty(t,"width",{get(){return this.view[2]*e},configurable:!0}),Object.defineProperty(t,"height",{get(){return this.view[3]*e},configurable:!0}),Object.defineProperty(t,"originalWidth",{get(){return this.view[2]},configurable:!0}),Object.defineProperty(t,"originalHeight",{get(){return this.view[3]},configurable:!0}),t}function isCancelException(t){return t.name==="RenderingCancelledException"}function loadFromFile(t){return new Promise((e,s)=>{const n=new FileReader;n.onload=()=>{if(!n.result)return s(new Error("Error while reading a file."));e(n.result)},n.onerror=r=>{if(!r.target)return s(new Error("Error while reading a file."));const{error:y}=r.target;if(!y)return s(new Error("Error while reading a file."));switch(y.code){case y.NOT_FOUND_ERR:return s(new Error("Error while reading a file: File not found."));case y.SECURITY_ERR:return s(new Error("Error while reading a file: Security error."));case y.ABORT_ERR:return s(new Error("Error while reading a file: Aborted."));default:return s(new Error("Error while reading a file."))}},n.readAsArrayBuffer(t)})}function reducer(t,e){switch(e.type){case"RESOLVE":return{value:e.value,error:void 0};case"REJECT":return{value:!1,error:e.error};case"RESET":return{value:void 0,error:void 0};default:return t}}function useResolver(){return reactExports.useReducer(reducer,{value:void 0,error:void 0})}const{PDFDataRangeTransport:PDFDataRangeTransport$1}=pdfjs,eventProps=(()=>{const t={};return allEvents.forEach(e=>{t[e]=PropTypes.func}),t})(),isTypedArray=PropTypes.oneOfType([PropTypes.instanceOf(Int8Array),PropTypes.instanceOf(Uint8Array),PropTypes.instanceOf(Uint8ClampedArray),PropTypes.instanceOf(Int16Array),PropTypes.instanceOf(Uint16Array),PropTypes.instanceOf(Int32Array),PropTypes.instanceOf(Uint32Array),PropTypes.instanceOf(Float32Array),PropTypes.instanceOf(Float64Array)]),fileTypes=[PropTypes.string,PropTypes.instanceOf(ArrayBuffer),PropTypes.shape({data:PropTypes.oneOfType([PropTypes.string,PropTypes.instanceOf(ArrayBuffer),PropTypes.arrayOf(PropTypes.number.isRequired),isTypedArray]).isRequired}),PropTypes.shape({range:PropTypes.instanceOf(PDFDataRangeTransport$1).isRequired}),PropTypes.shape({url:PropTypes.string.isRequired})];typeof Blob<"u"&&fileTypes.push(PropTypes.instanceOf(Blob));const isClassName=PropTypes.oneOfType([PropTypes.string,PropTypes.arrayOf(PropTypes.string)]),isFile=PropTypes.oneOfType(fileTypes);PropTypes.instanceOf(LinkService);PropTypes.oneOf(["_self","_blank","_parent","_top"]);PropTypes.shape({commonObjs:PropTypes.shape({}).isRequired,getAnnotations:PropTypes.func.isRequired,getTextContent:PropTypes.func.isRequired,getViewport:PropTypes.func.isRequired,render:PropTypes.func.isRequired});const isPageIndex=function t(e,s,n){const{[s]:r,pageNumber:y,pdf:C}=e;if(!isDefined(C))return null;if(isDefined(r)){if(typeof r!="number")return new Error(`\`${s}\` of type \`${typeof r}\` supplied to \`${n}\`, expected \`number\`.`);if(r<0)return new Error(`Expected \`${s}\` to be greater or equal to 0.`);const{numPages:O}=C;if(r+1>O)return new Error(`Expected \`${s}\` to be less or equal to ${O-1}.`)}else if(!isDefined(y))return new Error(`\`${s}\` not supplied. Either pageIndex or pageNumber must be supplied to \`${n}\`.`);return null},isPageNumber=function t(e,s,n){const{[s]:r,pageIndex:y,pdf:C}=e;if(!isDefined(C))return null;if(isDefined(r)){if(typeof r!="number")return new Error(`\`${s}\` of type \`${typeof r}\` supplied to \`${n}\`, expected \`number\`.`);if(r<1)return new Error(`Expected \`${s}\` to be greater or equal to 1.`);const{numPages:O}=C;if(r>O)return new Error(`Expected \`${s}\` to be less or equal to ${O}.`)}else if(!isDefined(y))return new Error(`\`${s}\` not supplied. Either pageIndex or pageNumber must be supplied to \`${n}\`.`);return null},isPdf=PropTypes.oneOfType([PropTypes.any,PropTypes.oneOf([!1])]),isRef=PropTypes.oneOfType([PropTypes.func,PropTypes.exact({current:PropTypes.any})]),isRenderMode=PropTypes.oneOf(["canvas","custom","none","svg"]),isRotate=PropTypes.oneOf([0,90,180,270]);var __awaiter=function(t,e,s,n){function r(y){return y instanceof s?y:new s(function(C){C(y)})}return new(s||(s=Promise))(function(y,C){function O(a){try{v(n.next(a))}catch(w){C(w)}}function h(a){try{v(n.throw(a))}catch(w){C(w)}}function v(a){a.done?y(a.value):r(a.value).then(O,h)}v((n=n.apply(t,e||[])).next())})},__rest$1=function(t,e){var s={};for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&e.indexOf(n)<0&&(s[n]=t[n]);if(t!=null&&typeof Object.getOwnPropertySymbols=="function")for(var r=0,n=Object.getOwnPropertySymbols(t);r<n.length;r++)e.indexOf(n[r])<0&&Object.prototype.propertyIsEnumerable.call(t,n[r])&&(s[n[r]]=t[n[r]]);return s};const{PDFDataRangeTransport}=pdfjs,defaultOnPassword=(t,e)=>{switch(e){case PasswordResponses.NEED_PASSWORD:{const s=prompt("Enter the password to open this PDF file.");t(s);break}case PasswordResponses.INCORRECT_PASSWORD:{const s=prompt("Invalid password. Please try again.");t(s);break}}};function isParameterObject(t){return typeof t=="object"&&t!==null&&("data"in t||"range"in t||"url"in t)}const Document=reactExports.forwardRef(function t(e,s){var{children:n,className:r,error:y="Failed to load PDF file.",externalLinkRel:C,externalLinkTarget:O,file:h,inputRef:v,imageResourcesPath:a,loading:w="Loading PDF…",noData:k="No PDF file specified.",onItemClick:b,onLoadError:A,onLoadProgress:P,onLoadSuccess:x,onPassword:f=defaultOnPassword,onSourceError:E,onSourceSuccess:F,options:S,renderMode:o,rotate:p}=e,l=__rest$1(e,["children","className","error","externalLinkRel","externalLinkTarget","file","inputRef","imageResourcesPath","loading","noData","onItemClick","onLoadError","onLoadProgress","onLoadSuccess","onPassword","onSourceError","onSourceSuccess","options","renderMode","rotate"]);const[g,m]=useResolver(),{value:L,error:c}=g,[R,I]=useResolver(),{value:Q,error:G}=R,q=reactExports.useRef(new LinkService),V=reactExports.useRef([]),se=reactExports.useRef(),D=reactExports.useRef();reactExports.useEffect(()=>{h&&h!==se.current&&isParameterObject(h)&&(warning$1(!dequal(h,se.current),`File prop passed to <Document /> changed, but it's equal to previous one. This might result in unnecessary reloads. Consider memoizing the value passed to "file" prop.`),se.current=h)},[h]),reactExports.useEffect(()=>{S&&S!==D.current&&(warning$1(!dequal(S,D.current),`Options prop passed to <Document /> changed, but it's equal to previous one. This might result in unnecessary reloads. Consider memoizing the value passed to "options" prop.`),D.current=S)},[S]);const X=reactExports.useRef({scrollPageIntoView:Z=>{const{dest:ee,pageNumber:M,pageIndex:H=M-1}=Z;if(b){b({dest:ee,pageIndex:H,pageNumber:M});return}const J=V.current[H];if(J){J.scrollIntoView();return}warning$1(!1,`An internal link leading to page ${M} was clicked, but neither <Document> was provided with onItemClick nor it was able to find the page within itself. Either provide onItemClick to <Document> and handle navigating by yourself or ensure that all pages are rendered within <Document>.`)}});reactExports.useImperativeHandle(s,()=>({linkService:q,pages:V,viewer:X}),[]);function re(){F&&F()}function N(){c&&(warning$1(!1,c.toString()),E&&E(c))}function d(){m({type:"RESET"})}reactExports.useEffect(d,[h,m]);const u=reactExports.useCallback(()=>__awaiter(this,void 0,void 0,function*(){if(!h)return null;if(typeof h=="string")return isDataURI(h)?{data:dataURItoByteString(h)}:(displayCORSWarning(),{url:h});if(h instanceof PDFDataRangeTransport)return{range:h};if(isArrayBuffer(h))return{data:h};if(isBrowser&&isBlob(h))return{data:yield loadFromFile(h)};if(invariant(typeof h=="object"),invariant(isParameterObject(h)),"url"in h&&typeof h.url=="string"){if(isDataURI(h.url)){const{url:Z}=h,ee=__rest$1(h,["url"]),M=dataURItoByteString(Z);return Object.assign({data:M},ee)}displayCORSWarning()}return h}),[h]);reactExports.useEffect(()=>{const Z=makeCancellablePromise(u());return Z.promise.then(ee=>{m({type:"RESOLVE",value:ee})}).catch(ee=>{m({type:"REJECT",error:ee})}),()=>{cancelRunningTask(Z)}},[u,m]),reactExports.useEffect(()=>{if(!(typeof L>"u")){if(L===!1){N();return}re()}},[L]);function T(){Q&&(x&&x(Q),V.current=new Array(Q.numPages),q.current.setDocument(Q))}function $(){G&&(warning$1(!1,G.toString()),A&&A(G))}function U(){I({type:"RESET"})}reactExports.useEffect(U,[I,L]);function B(){if(!L)return;const Z=Object.assign(Object.assign({},S),{isEvalSupported:!1}),ee=Object.assign(Object.assign({},L),Z),M=pdfjs.getDocument(ee);P&&(M.onProgress=P),f&&(M.onPassword=f);const H=M;return H.promise.then(J=>{I({type:"RESOLVE",value:J})}).catch(J=>{H.destroyed||I({type:"REJECT",error:J})}),()=>{H.destroy()}}reactExports.useEffect(B,[S,I,L]),reactExports.useEffect(()=>{if(!(typeof Q>"u")){if(Q===!1){$();return}T()}},[Q]);function Y(){q.current.setViewer(X.current),q.current.setExternalLinkRel(C),q.current.setExternalLinkTarget(O)}reactExports.useEffect(Y,[C,O]);function ie(Z,ee){V.current[Z]=ee}function le(Z){delete V.current[Z]}const fe=reactExports.useMemo(()=>({imageResourcesPath:a,linkService:q.current,onItemClick:b,pdf:Q,registerPage:ie,renderMode:o,rotate:p,unregisterPage:le}),[a,b,Q,o,p]),be=reactExports.useMemo(()=>makeEventProps(l,()=>Q),[l,Q]);function me(){return React$1.createElement(DocumentContext.Provider,{value:fe},n)}function ve(){return h?Q==null?React$1.createElement(Message,{type:"loading"},typeof w=="function"?w():w):Q===!1?React$1.createElement(Message,{type:"error"},typeof y=="function"?y():y):me():React$1.createElement(Message,{type:"no-data"},typeof k=="function"?k():k)}return React$1.createElement("div",Object.assign({className:clsx("react-pdf__Document",r),ref:v,style:{"--scale-factor":"1"}},be),ve())}),isFunctionOrNode$1=PropTypes.oneOfType([PropTypes.func,PropTypes.node]);Document.propTypes=Object.assign(Object.assign({},eventProps),{children:PropTypes.node,className:isClassName,error:isFunctionOrNode$1,externalLinkRel:PropTypes.string,externalLinkTarget:PropTypes.oneOf(["_self","_blank","_parent","_top"]),file:isFile,imageResourcesPath:PropTypes.string,inputRef:isRef,loading:isFunctionOrNode$1,noData:isFunctionOrNode$1,onItemClick:PropTypes.func,onLoadError:PropTypes.func,onLoadProgress:PropTypes.func,onLoadSuccess:PropTypes.func,onPassword:PropTypes.func,onSourceError:PropTypes.func,onSourceSuccess:PropTypes.func,options:PropTypes.shape({canvasFactory:PropTypes.any,canvasMaxAreaInBytes:PropTypes.number,cMapPacked:PropTypes.bool,CMapReaderFactory:PropTypes.any,cMapUrl:PropTypes.string,disableAutoFetch:PropTypes.bool,disableFontFace:PropTypes.bool,disableRange:PropTypes.bool,disableStream:PropTypes.bool,docBaseUrl:PropTypes.string,enableXfa:PropTypes.bool,filterFactory:PropTypes.any,fontExtraProperties:PropTypes.bool,httpHeaders:PropTypes.object,isEvalSupported:PropTypes.bool,isOffscreenCanvasSupported:PropTypes.bool,length:PropTypes.number,maxImageSize:PropTypes.number,ownerDocument:PropTypes.any,password:PropTypes.string,pdfBug:PropTypes.bool,rangeChunkSize:PropTypes.number,StandardFontDataFactory:PropTypes.any,standardFontDataUrl:PropTypes.string,stopAtErrors:PropTypes.bool,useSystemFonts:PropTypes.bool,useWorkerFetch:PropTypes.bool,verbosity:PropTypes.number,withCredentials:PropTypes.bool,worker:PropTypes.any}),rotate:PropTypes.number});function useDocumentContext(){return reactExports.useContext(DocumentContext)}function mergeRefs(){for(var t=[],e=0;e<arguments.length;e++)t[e]=arguments[e];var s=t.filter(Boolean);if(s.length<=1){var n=s[0];return n||null}return function(y){s.forEach(function(C){typeof C=="function"?C(y):C&&(C.current=y)})}}const PageContext=reactExports.createContext(null),PDF_ROLE_TO_HTML_ROLE={Document:null,DocumentFragment:null,Part:"group",Sect:"group",Div:"group",Aside:"note",NonStruct:"none",P:null,H:"heading",Title:null,FENote:"note",Sub:"group",Lbl:null,Span:null,Em:null,Strong:null,Link:"link",Annot:"note",Form:"form",Ruby:null,RB:null,RT:null,RP:null,Warichu:null,WT:null,WP:null,L:"list",LI:"listitem",LBody:null,Table:"table",TR:"row",TH:"columnheader",TD:"cell",THead:"columnheader",TBody:null,TFoot:null,Caption:null,Figure:"figure",Formula:null,Artifact:null},HEADING_PATTERN=/^H(\d+)$/;function isPdfRole(t){return t in PDF_ROLE_TO_HTML_ROLE}function isStructTreeNode(t){return"children"in t}function isStructTreeNodeWithOnlyContentChild(t){return isStructTreeNode(t)?t.children.length===1&&0 in t.children&&"id"in t.children[0]:!1}function getRoleAttributes(t){const e={};if(isStructTreeNode(t)){const{role:s}=t,n=s.match(HEADING_PATTERN);if(n)e.role="heading",e["aria-level"]=Number(n[1]);else if(isPdfRole(s)){const r=PDF_ROLE_TO_HTML_ROLE[s];r&&(e.role=r)}}return e}function getBaseAttributes(t){const e={};if(isStructTreeNode(t)){if(t.alt!==void 0&&(e["aria-label"]=t.alt),t.lang!==void 0&&(e.lang=t.lang),isStructTreeNodeWithOnlyContentChild(t)){const[s]=t.children;if(s){const n=getBaseAttributes(s);return Object.assign(Object.assign({},e),n)}}}else"id"in t&&(e["aria-owns"]=t.id);return e}function getAttributes(t){return t?Object.assign(Object.assign({},getRoleAttributes(t)),getBaseAttributes(t)):null}function StructTreeItem({className:t,node:e}){const s=reactExports.useMemo(()=>getAttributes(e),[e]),n=reactExports.useMemo(()=>!isStructTreeNode(e)||isStructTreeNodeWithOnlyContentChild(e)?null:e.children.map((r,y)=>React$1.createElement(StructTreeItem,{key:y,node:r})),[e]);return React$1.createElement("span",Object.assign({className:t},s),n)}function usePageContext(){return reactExports.useContext(PageContext)}function StructTree(){const t=usePageContext();invariant(t);const{onGetStructTreeError:e,onGetStructTreeSuccess:s}=t,[n,r]=useResolver(),{value:y,error:C}=n,{customTextRenderer:O,page:h}=t;function v(){y&&s&&s(y)}function a(){C&&(warning$1(!1,C.toString()),e&&e(C))}function w(){r({type:"RESET"})}reactExports.useEffect(w,[r,h]);function k(){if(O||!h)return;const b=makeCancellablePromise(h.getStructTree()),A=b;return b.promise.then(P=>{r({type:"RESOLVE",value:P})}).catch(P=>{r({type:"REJECT",error:P})}),()=>cancelRunningTask(A)}return reactExports.useEffect(k,[O,h,r]),reactExports.useEffect(()=>{if(y!==void 0){if(y===!1){a();return}v()}},[y]),y?React$1.createElement(StructTreeItem,{className:"react-pdf__Page__structTree structTree",node:y}):null}const ANNOTATION_MODE=pdfjs.AnnotationMode;function PageCanvas(t){const e=usePageContext();invariant(e);const s=Object.assign(Object.assign({},e),t),{_className:n,canvasBackground:r,devicePixelRatio:y=getDevicePixelRatio(),onRenderError:C,onRenderSuccess:O,page:h,renderForms:v,renderTextLayer:a,rotate:w,scale:k}=s,{canvasRef:b}=t;invariant(h);const A=reactExports.useRef(null);function P(){h&&O&&O(makePageCallback(h,k))}function x(o){isCancelException(o)||(warning$1(!1,o.toString()),C&&C(o))}const f=reactExports.useMemo(()=>h.getViewport({scale:k*y,rotation:w}),[y,h,w,k]),E=reactExports.useMemo(()=>h.getViewport({scale:k,rotation:w}),[h,w,k]);function F(){if(!h)return;h.cleanup();const{current:o}=A;if(!o)return;o.width=f.width,o.height=f.height,o.style.width=`${Math.floor(E.width)}px`,o.style.height=`${Math.floor(E.height)}px`,o.style.visibility="hidden";const p={annotationMode:v?ANNOTATION_MODE.ENABLE_FORMS:ANNOTATION_MODE.ENABLE,canvasContext:o.getContext("2d",{alpha:!1}),viewport:f};r&&(p.background=r);const l=h.render(p),g=l;return l.promise.then(()=>{o.style.visibility="",P()}).catch(x),()=>cancelRunningTask(g)}reactExports.useEffect(F,[r,A,y,h,v,f,E]);const S=reactExports.useCallback(()=>{const{current:o}=A;o&&(o.width=0,o.height=0)},[A]);return reactExports.useEffect(()=>S,[S]),React$1.createElement("canvas",{className:`${n}__canvas`,dir:"ltr",ref:mergeRefs(b,A),style:{display:"block",userSelect:"none"}},a?React$1.createElement(StructTree,null):null)}function PageSVG(){const t=usePageContext();invariant(t);const{_className:e,onRenderSuccess:s,onRenderError:n,page:r,rotate:y,scale:C}=t;invariant(r);const[O,h]=useResolver(),{value:v,error:a}=O;function w(){r&&s&&s(makePageCallback(r,C))}function k(){a&&(isCancelException(a)||(warning$1(!1,a.toString()),n&&n(a)))}const b=reactExports.useMemo(()=>r.getViewport({scale:C,rotation:y}),[r,y,C]);function A(){h({type:"RESET"})}reactExports.useEffect(A,[r,h,b]);function P(){if(!r)return;const F=makeCancellablePromise(r.getOperatorList());return F.promise.then(S=>{new pdfjs.SVGGraphics(r.commonObjs,r.objs).getSVG(S,b).then(p=>{if(!(p instanceof SVGElement))throw new Error("getSVG returned unexpected result.");h({type:"RESOLVE",value:p})}).catch(p=>{h({type:"REJECT",error:p})})}).catch(S=>{h({type:"REJECT",error:S})}),()=>cancelRunningTask(F)}reactExports.useEffect(P,[r,h,b]),reactExports.useEffect(()=>{if(v!==void 0){if(v===!1){k();return}w()}},[v]);function x(F){if(!F||!v)return;F.firstElementChild||F.appendChild(v);const{width:S,height:o}=b;v.setAttribute("width",`${S}`),v.setAttribute("height",`${o}`)}const{width:f,height:E}=b;return React$1.createElement("div",{className:`${e}__svg`,ref:F=>x(F),style:{display:"block",backgroundColor:"white",overflow:"hidden",width:f,height:E,userSelect:"none"}})}function isTextItem(t){return"str"in t}function TextLayer(){const t=usePageContext();invariant(t);const{customTextRenderer:e,onGetTextError:s,onGetTextSuccess:n,onRenderTextLayerError:r,onRenderTextLayerSuccess:y,page:C,pageIndex:O,pageNumber:h,rotate:v,scale:a}=t;invariant(C);const[w,k]=useResolver(),{value:b,error:A}=w,P=reactExports.useRef(null),x=reactExports.useRef();warning$1(parseInt(window.getComputedStyle(document.body).getPropertyValue("--react-pdf-text-layer"),10)===1,"TextLayer styles not found. Read more: https://github.com/wojtekmaj/react-pdf#support-for-text-layer");function f(){b&&n&&n(b)}function E(){A&&(warning$1(!1,A.toString()),s&&s(A))}function F(){k({type:"RESET"})}reactExports.useEffect(F,[C,k]);function S(){if(!C)return;const c=makeCancellablePromise(C.getTextContent()),R=c;return c.promise.then(I=>{k({type:"RESOLVE",value:I})}).catch(I=>{k({type:"REJECT",error:I})}),()=>cancelRunningTask(R)}reactExports.useEffect(S,[C,k]),reactExports.useEffect(()=>{if(b!==void 0){if(b===!1){E();return}f()}},[b]);const o=reactExports.useCallback(()=>{y&&y()},[y]),p=reactExports.useCallback(c=>{warning$1(!1,c.toString()),r&&r(c)},[r]);function l(){const c=x.current;c&&c.classList.add("active")}function g(){const c=x.current;c&&c.classList.remove("active")}const m=reactExports.useMemo(()=>C.getViewport({scale:a,rotation:v}),[C,v,a]);function L(){if(!C||!b)return;const{current:c}=P;if(!c)return;c.innerHTML="";const R=C.streamTextContent({includeMarkedContent:!0}),I={container:c,textContentSource:R,viewport:m},Q=pdfjs.renderTextLayer(I),G=Q;return Q.promise.then(()=>{const q=document.createElement("div");q.className="endOfContent",c.append(q),x.current=q;const V=c.querySelectorAll('[role="presentation"]');if(e){let se=0;b.items.forEach((D,X)=>{if(!isTextItem(D))return;const re=V[se];if(!re)return;const N=e(Object.assign({pageIndex:O,pageNumber:h,itemIndex:X},D));re.innerHTML=N,se+=D.str&&D.hasEOL?2:1})}o()}).catch(p),()=>cancelRunningTask(G)}return reactExports.useLayoutEffect(L,[e,p,o,C,O,h,b,m]),React$1.createElement("div",{className:clsx("react-pdf__Page__textContent","textLayer"),onMouseUp:g,onMouseDown:l,ref:P})}function AnnotationLayer(){const t=useDocumentContext(),e=usePageContext();invariant(e);const s=Object.assign(Object.assign({},t),e),{imageResourcesPath:n,linkService:r,onGetAnnotationsError:y,onGetAnnotationsSuccess:C,onRenderAnnotationLayerError:O,onRenderAnnotationLayerSuccess:h,page:v,pdf:a,renderForms:w,rotate:k,scale:b=1}=s;invariant(a),invariant(v),invariant(r);const[A,P]=useResolver(),{value:x,error:f}=A,E=reactExports.useRef(null);warning$1(parseInt(window.getComputedStyle(document.body).getPropertyValue("--react-pdf-annotation-layer"),10)===1,"AnnotationLayer styles not found. Read more: https://github.com/wojtekmaj/react-pdf#support-for-annotations");function F(){x&&C&&C(x)}function S(){f&&(warning$1(!1,f.toString()),y&&y(f))}function o(){P({type:"RESET"})}reactExports.useEffect(o,[P,v]);function p(){if(!v)return;const c=makeCancellablePromise(v.getAnnotations()),R=c;return c.promise.then(I=>{P({type:"RESOLVE",value:I})}).catch(I=>{P({type:"REJECT",error:I})}),()=>{cancelRunningTask(R)}}reactExports.useEffect(p,[P,v,w]),reactExports.useEffect(()=>{if(x!==void 0){if(x===!1){S();return}F()}},[x]);function l(){h&&h()}function g(c){warning$1(!1,`${c}`),O&&O(c)}const m=reactExports.useMemo(()=>v.getViewport({scale:b,rotation:k}),[v,k,b]);function L(){if(!a||!v||!r||!x)return;const{current:c}=E;if(!c)return;const R=m.clone({dontFlip:!0}),I={accessibilityManager:null,annotationCanvasMap:null,div:c,l10n:null,page:v,viewport:R},Q={annotations:x,annotationStorage:a.annotationStorage,div:c,downloadManager:null,imageResourcesPath:n,linkService:r,page:v,renderForms:w,viewport:R};c.innerHTML="";try{new pdfjs.AnnotationLayer(I).render(Q),l()}catch(G){g(G)}return()=>{}}return reactExports.useEffect(L,[x,n,r,v,w,m]),React$1.createElement("div",{className:clsx("react-pdf__Page__annotations","annotationLayer"),ref:E})}var __rest=function(t,e){var s={};for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&e.indexOf(n)<0&&(s[n]=t[n]);if(t!=null&&typeof Object.getOwnPropertySymbols=="function")for(var r=0,n=Object.getOwnPropertySymbols(t);r<n.length;r++)e.indexOf(n[r])<0&&Object.prototype.propertyIsEnumerable.call(t,n[r])&&(s[n[r]]=t[n[r]]);return s};const defaultScale=1,Page=function t(e){const s=useDocumentContext(),n=Object.assign(Object.assign({},s),e),{_className:r="react-pdf__Page",_enableRegisterUnregisterPage:y=!0,canvasBackground:C,canvasRef:O,children:h,className:v,customRenderer:a,customTextRenderer:w,devicePixelRatio:k,error:b="Failed to load the page.",height:A,inputRef:P,loading:x="Loading page…",noData:f="No page specified.",onGetAnnotationsError:E,onGetAnnotationsSuccess:F,onGetStructTreeError:S,onGetStructTreeSuccess:o,onGetTextError:p,onGetTextSuccess:l,onLoadError:g,onLoadSuccess:m,onRenderAnnotationLayerError:L,onRenderAnnotationLayerSuccess:c,onRenderError:R,onRenderSuccess:I,onRenderTextLayerError:Q,onRenderTextLayerSuccess:G,pageIndex:q,pageNumber:V,pdf:se,registerPage:D,renderAnnotationLayer:X=!0,renderForms:re=!1,renderMode:N="canvas",renderTextLayer:d=!0,rotate:u,scale:T=defaultScale,unregisterPage:$,width:U}=n,B=__rest(n,["_className","_enableRegisterUnregisterPage","canvasBackground","canvasRef","children","className","customRenderer","customTextRenderer","devicePixelRatio","error","height","inputRef","loading","noData","onGetAnnotationsError","onGetAnnotationsSuccess","onGetStructTreeError","onGetStructTreeSuccess","onGetTextError","onGetTextSuccess","onLoadError","onLoadSuccess","onRenderAnnotationLayerError","onRenderAnnotationLayerSuccess","onRenderError","onRenderSuccess","onRenderTextLayerError","onRenderTextLayerSuccess","pageIndex","pageNumber","pdf","registerPage","renderAnnotationLayer","renderForms","renderMode","renderTextLayer","rotate","scale","unregisterPage","width"]),[Y,ie]=useResolver(),{value:le,error:fe}=Y,be=reactExports.useRef(null);invariant(se);const me=isProvided(V)?V-1:q??null,ve=V??(isProvided(q)?q+1:null),Z=u??(le?le.rotate:null),ee=reactExports.useMemo(()=>{if(!le)return null;let Oe=1;const ze=T??defaultScale;if(U||A){const Xe=le.getViewport({scale:1,rotation:Z});U?Oe=U/Xe.width:A&&(Oe=A/Xe.height)}return ze*Oe},[A,le,Z,T,U]);function M(){return()=>{isProvided(me)&&y&&$&&$(me)}}reactExports.useEffect(M,[y,se,me,$]);function H(){if(m){if(!le||!ee)return;m(makePageCallback(le,ee))}if(y&&D){if(!isProvided(me)||!be.current)return;D(me,be.current)}}function J(){fe&&(warning$1(!1,fe.toString()),g&&g(fe))}function oe(){ie({type:"RESET"})}reactExports.useEffect(oe,[ie,se,me]);function ge(){if(!se||!ve)return;const Oe=makeCancellablePromise(se.getPage(ve)),ze=Oe;return Oe.promise.then(Xe=>{ie({type:"RESOLVE",value:Xe})}).catch(Xe=>{ie({type:"REJECT",error:Xe})}),()=>cancelRunningTask(ze)}reactExports.useEffect(ge,[ie,se,me,ve,D]),reactExports.useEffect(()=>{if(le!==void 0){if(le===!1){J();return}H()}},[le,ee]);const Ae=reactExports.useMemo(()=>le&&isProvided(me)&&ve&&isProvided(Z)&&isProvided(ee)?{_className:r,canvasBackground:C,customTextRenderer:w,devicePixelRatio:k,onGetAnnotationsError:E,onGetAnnotationsSuccess:F,onGetStructTreeError:S,onGetStructTreeSuccess:o,onGetTextError:p,onGetTextSuccess:l,onRenderAnnotationLayerError:L,onRenderAnnotationLayerSuccess:c,onRenderError:R,onRenderSuccess:I,onRenderTextLayerError:Q,onRenderTextLayerSuccess:G,page:le,pageIndex:me,pageNumber:ve,renderForms:re,renderTextLayer:d,rotate:Z,scale:ee}:null,[r,C,w,k,E,F,S,o,p,l,L,c,R,I,Q,G,le,me,ve,re,d,Z,ee]),_e=reactExports.useMemo(()=>makeEventProps(B,()=>le&&(ee?makePageCallback(le,ee):void 0)),[B,le,ee]),te=`${me}@${ee}/${Z}`,Pe=`${me}/${Z}`;function Ce(){switch(N){case"custom":return invariant(a),React$1.createElement(a,{key:`${te}_custom`});case"none":return null;case"svg":return React$1.createElement(PageSVG,{key:`${Pe}_svg`});case"canvas":default:return React$1.createElement(PageCanvas,{key:`${te}_canvas`,canvasRef:O})}}function Ue(){return d?React$1.createElement(TextLayer,{key:`${te}_text`}):null}function $e(){return X?React$1.createElement(AnnotationLayer,{key:`${te}_annotations`}):null}function He(){return React$1.createElement(PageContext.Provider,{value:Ae},Ce(),Ue(),$e(),h)}function ke(){return ve?se===null||le===void 0||le===null?React$1.createElement(Message,{type:"loading"},typeof x=="function"?x():x):se===!1||le===!1?React$1.createElement(Message,{type:"error"},typeof b=="function"?b():b):He():React$1.createElement(Message,{type:"no-data"},typeof f=="function"?f():f)}return React$1.createElement("div",Object.assign({className:clsx(r,v),"data-page-number":ve,ref:mergeRefs(P,be),style:{"--scale-factor":`${ee}`,backgroundColor:C||"white",position:"relative",minWidth:"min-content",minHeight:"min-content"}},_e),ke())},isFunctionOrNode=PropTypes.oneOfType([PropTypes.func,PropTypes.node]);Page.propTypes=Object.assign(Object.assign({},eventProps),{canvasBackground:PropTypes.string,canvasRef:isRef,children:PropTypes.node,className:isClassName,customRenderer:PropTypes.func,customTextRenderer:PropTypes.func,devicePixelRatio:PropTypes.number,error:isFunctionOrNode,height:PropTypes.number,imageResourcesPath:PropTypes.string,inputRef:isRef,loading:isFunctionOrNode,noData:isFunctionOrNode,onGetTextError:PropTypes.func,onGetTextSuccess:PropTypes.func,onLoadError:PropTypes.func,onLoadSuccess:PropTypes.func,onRenderError:PropTypes.func,onRenderSuccess:PropTypes.func,onRenderTextLayerError:PropTypes.func,onRenderTextLayerSuccess:PropTypes.func,pageIndex:isPageIndex,pageNumber:isPageNumber,pdf:isPdf,renderAnnotationLayer:PropTypes.bool,renderForms:PropTypes.bool,renderMode:isRenderMode,renderTextLayer:PropTypes.bool,rotate:isRotate,scale:PropTypes.number,width:PropTypes.number});displayWorkerWarning();pdfjs.GlobalWorkerOptions.workerSrc="pdf.worker.js";var Close={},_interopRequireDefault=interopRequireDefaultExports;Object.defineProperty(Close,"__esModule",{value:!0});var default_1=Close.default=void 0,_createSvgIcon=_interopRequireDefault(requireCreateSvgIcon()),_jsxRuntime=jsxRuntimeExports;default_1=Close.default=(0,_createSvgIcon.default)((0,_jsxRuntime.jsx)("path",{d:"M19 6.41 17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");pdfjs.GlobalWorkerOptions.workerSrc=`//cdnjs.cloudflare.com/ajax/libs/pdf.js/${pdfjs.version}/pdf.worker.min.js`;const PDFPreview=({open:t,onClose:e,pdfUrl:s,bookTitle:n})=>{const[r,y]=reactExports.useState(null),[C,O]=reactExports.useState(1),[h,v]=reactExports.useState(null),a=({numPages:b})=>{y(b),v(null)},w=b=>{v("Erreur lors du chargement du PDF"),console.error("Error loading PDF:",b)},k=b=>{O(A=>{const P=A+b;return Math.min(Math.max(1,P),r)})};return jsxRuntimeExports.jsxs(Dialog,{open:t,onClose:e,maxWidth:"md",fullWidth:!0,PaperProps:{sx:{height:"90vh",maxHeight:"90vh",display:"flex",flexDirection:"column"}},children:[jsxRuntimeExports.jsxs(Box,{sx:{display:"flex",justifyContent:"space-between",alignItems:"center",p:2,borderBottom:1,borderColor:"divider"},children:[jsxRuntimeExports.jsx(Typography,{variant:"h6",children:n}),jsxRuntimeExports.jsx(IconButton,{onClick:e,children:jsxRuntimeExports.jsx(default_1,{})})]}),jsxRuntimeExports.jsx(DialogContent,{sx:{flex:1,display:"flex",flexDirection:"column",alignItems:"center",overflow:"hidden"},children:h?jsxRuntimeExports.jsx(Typography,{color:"error",sx:{mt:2},children:h}):jsxRuntimeExports.jsxs(jsxRuntimeExports.Fragment,{children:[jsxRuntimeExports.jsx(Document,{file:s,onLoadSuccess:a,onLoadError:w,loading:jsxRuntimeExports.jsx(Typography,{children:"Chargement du PDF..."}),children:jsxRuntimeExports.jsx(Page,{pageNumber:C,width:window.innerWidth*.7,loading:jsxRuntimeExports.jsx(Typography,{children:"Chargement de la page..."})})}),jsxRuntimeExports.jsxs(Box,{sx:{mt:2,display:"flex",alignItems:"center",gap:2},children:[jsxRuntimeExports.jsx(Button,{startIcon:jsxRuntimeExports.jsx(default_1$6,{}),onClick:()=>k(-1),disabled:C<=1,children:"Précédent"}),jsxRuntimeExports.jsxs(Typography,{children:["Page ",C," sur ",r]}),jsxRuntimeExports.jsx(Button,{endIcon:jsxRuntimeExports.jsx(default_1$7,{}),onClick:()=>k(1),disabled:C>=r,children:"Suivant"})]})]})})]})},SkeletonLoader=({count:t=6})=>jsxRuntimeExports.jsx(Grid,{container:!0,spacing:3,children:[...Array(t)].map((e,s)=>jsxRuntimeExports.jsx(Grid,{item:!0,xs:12,sm:6,md:4,children:jsxRuntimeExports.jsxs(Card,{sx:{height:"100%",display:"flex",flexDirection:"column"},children:[jsxRuntimeExports.jsx(Skeleton,{variant:"rectangular",height:200,animation:"wave",sx:{m:1}}),jsxRuntimeExports.jsxs(CardContent,{sx:{flexGrow:1},children:[jsxRuntimeExports.jsx(Skeleton,{variant:"text",height:32,width:"80%",sx:{mb:1}}),jsxRuntimeExports.jsx(Skeleton,{variant:"text",height:24,width:"60%",sx:{mb:2}}),jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:24,width:"40%",sx:{mb:1}}),jsxRuntimeExports.jsx(Box,{sx:{mb:2},children:jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:32,width:"100%"})}),jsxRuntimeExports.jsxs(Box,{sx:{display:"flex",gap:1},children:[jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:32,width:"30%"}),jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:32,width:"30%"}),jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:32,width:"30%"})]})]}),jsxRuntimeExports.jsxs(CardActions,{sx:{p:2,justifyContent:"space-between"},children:[jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",width:100,height:36}),jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",width:100,height:36})]})]})},`skeleton-${s}`))}),BookGrid=({books:t,onReadBook:e,onPreviewBook:s,theme:n})=>jsxRuntimeExports.jsx(Grid,{container:!0,spacing:3,children:t.map((r,y)=>jsxRuntimeExports.jsx(Grid,{item:!0,xs:12,sm:6,md:4,children:jsxRuntimeExports.jsxs(Card,{sx:{height:"100%",display:"flex",flexDirection:"column",transition:"transform 0.2s","&:hover":{transform:(r==null?void 0:r.status)==="completed"?"translateY(-4px)":"none",boxShadow:(r==null?void 0:r.status)==="completed"?4:1}},children:[r.cover_image&&jsxRuntimeExports.jsx(CardMedia,{component:"img",height:"200",image:r.cover_image,alt:`Cover for ${r.title}`,sx:{objectFit:"contain",p:1}}),jsxRuntimeExports.jsxs(CardContent,{sx:{flexGrow:1},children:[jsxRuntimeExports.jsx(Typography,{gutterBottom:!0,variant:"h5",component:"h2",color:"text.primary",children:(r==null?void 0:r.title)||"Untitled Book"}),jsxRuntimeExports.jsxs(Typography,{variant:"body2",color:"text.secondary",gutterBottom:!0,children:["Author: ",(r==null?void 0:r.author)||"Unknown"]}),jsxRuntimeExports.jsx(BookStatus,{book:r}),jsxRuntimeExports.jsx(BookProgress,{book:r}),r.error_message&&jsxRuntimeExports.jsxs(Typography,{variant:"body2",color:"error",sx:{mt:1},children:["Error: ",r.error_message]})]}),jsxRuntimeExports.jsxs(CardActions,{sx:{padding:2,justifyContent:"space-between",backgroundColor:"background.paper",borderTop:1,borderColor:"divider"},children:[jsxRuntimeExports.jsx(Button,{variant:"outlined",size:"medium",color:"primary",startIcon:jsxRuntimeExports.jsx(default_1$3,{}),onClick:()=>s(r),disabled:(r==null?void 0:r.status)!=="completed",children:"Preview"}),jsxRuntimeExports.jsx(Button,{variant:"contained",size:"medium",color:"primary",startIcon:jsxRuntimeExports.jsx(default_1$8,{}),onClick:()=>e(r),disabled:(r==null?void 0:r.status)!=="completed",children:"Read"})]})]})},`book-${(r==null?void 0:r.id)||y}`))}),BookStatus=({book:t})=>t&&jsxRuntimeExports.jsx(Tooltip,{title:`Status: ${t.status}`,children:jsxRuntimeExports.jsx(Chip,{label:t.status,color:t.status==="completed"?"success":"default",size:"small",sx:{mb:1}})}),BookProgress=({book:t})=>t&&jsxRuntimeExports.jsxs(Stack,{direction:"row",spacing:1,sx:{mb:1},children:[jsxRuntimeExports.jsx(Tooltip,{title:"Pages",children:jsxRuntimeExports.jsx(Chip,{icon:jsxRuntimeExports.jsx(default_1$1,{}),label:`${t.current_page||0}/${t.total_pages||0} pages`,size:"small",variant:"outlined"})}),jsxRuntimeExports.jsx(Tooltip,{title:"Images",children:jsxRuntimeExports.jsx(Chip,{icon:jsxRuntimeExports.jsx(default_1$2,{}),label:`${t.processed_images||0} images`,size:"small",variant:"outlined"})}),t.processed_sections>0&&jsxRuntimeExports.jsx(Tooltip,{title:"Sections",children:jsxRuntimeExports.jsx(Chip,{label:`${t.processed_sections} sections`,size:"small",variant:"outlined"})})]}),HomePage=()=>{const[t,e]=reactExports.useState([]),[s,n]=reactExports.useState(!0),[r,y]=reactExports.useState(!1),[C,O]=reactExports.useState(null),[h,v]=reactExports.useState(""),[a,w]=reactExports.useState(!1),[k,b]=reactExports.useState(null),A=useTheme$2(),P=useMediaQuery(A.breakpoints.down("sm")),x=useNavigate();reactExports.useEffect(()=>{f();const o=setInterval(f,5e3);return()=>clearInterval(o)},[]);const f=async()=>{try{O(null);const o=await fetch("/api/books");if(!o.ok)throw new Error(`Server returned ${o.status}: ${await o.text()}`);const p=await o.json();if(!p||typeof p!="object")throw new Error("Invalid API response format");const g=(Array.isArray(p.books)?p.books:[]).map((m={})=>({id:m.id||m.filename||"",title:m.title||"Untitled Book",author:m.author||"Unknown",filename:m.filename||"",uploadDate:m.uploadDate,status:m.status||"unknown",current_page:m.current_page||0,total_pages:m.total_pages||0,processed_sections:m.processed_sections||0,processed_images:m.processed_images||0,error_message:m.error_message||null,cover_image:m.cover_image||null,...m}));e(g)}catch(o){console.error("Error fetching books:",o),O(`Failed to load books: ${o.message}`),e([])}finally{n(!1)}},E=async o=>{const p=o.target.files[0];if(!p)return;if(p.type!=="application/pdf"){O("Please select a valid PDF file");return}const l=new FormData;l.append("pdf_files",p);try{y(!0),O(null);const g=await fetch("/api/books/upload",{method:"POST",body:l});if(!g.ok){const L=await g.json();throw new Error((L==null?void 0:L.message)||`Upload failed: ${g.status}`)}const m=await g.json();v(m.message||"PDF uploaded successfully"),o.target.value="",f()}catch(g){console.error("Error uploading PDF:",g),O(g.message||"Error uploading file")}finally{y(!1)}},F=o=>{if((o==null?void 0:o.status)!=="completed"){O("This book is not ready for reading yet");return}x(`/reader/${o.filename}`)},S=o=>{if((o==null?void 0:o.status)!=="completed"){O("This book is not ready for preview yet");return}b(o),w(!0)};return jsxRuntimeExports.jsxs(Container,{maxWidth:"lg",sx:{py:4},children:[jsxRuntimeExports.jsxs(Box,{sx:{mb:4,textAlign:"center"},children:[jsxRuntimeExports.jsx(Typography,{variant:P?"h4":"h3",component:"h1",gutterBottom:!0,sx:{fontWeight:"bold",color:A.palette.secondary.main,mb:3},children:"Solo RPG AI Narrator"}),jsxRuntimeExports.jsx(ErrorBoundary,{fallbackMessage:"Error in file upload component",children:jsxRuntimeExports.jsxs(Button,{variant:"contained",component:"label",startIcon:jsxRuntimeExports.jsx(default_1$4,{}),sx:{mt:2,px:3,py:1.5,borderRadius:2},disabled:r,children:[r?"Uploading...":"Add PDF Book",jsxRuntimeExports.jsx("input",{type:"file",hidden:!0,accept:".pdf",onChange:E})]})})]}),jsxRuntimeExports.jsx(Snackbar,{open:!!h,autoHideDuration:6e3,onClose:()=>v(""),message:h}),C&&jsxRuntimeExports.jsx(Alert,{severity:"error",sx:{mb:3},onClose:()=>O(null),action:jsxRuntimeExports.jsx(Button,{color:"inherit",size:"small",onClick:f,children:"Retry"}),children:C}),s?jsxRuntimeExports.jsx(ErrorBoundary,{fallbackMessage:"Error displaying skeleton loader",children:jsxRuntimeExports.jsx(SkeletonLoader,{count:6})}):jsxRuntimeExports.jsxs(jsxRuntimeExports.Fragment,{children:[Array.isArray(t)&&t.length===0&&jsxRuntimeExports.jsxs(Box,{sx:{textAlign:"center",mt:4,p:4,backgroundColor:"background.paper",borderRadius:2,border:1,borderColor:"divider"},children:[jsxRuntimeExports.jsx(Typography,{variant:"h6",color:"text.secondary",children:"No books in library"}),jsxRuntimeExports.jsx(Typography,{variant:"body1",color:"text.secondary",sx:{mt:1},children:"Start by uploading a PDF"})]}),Array.isArray(t)&&t.length>0&&jsxRuntimeExports.jsx(ErrorBoundary,{fallbackMessage:"Error displaying book grid",children:jsxRuntimeExports.jsx(BookGrid,{books:t,onReadBook:F,onPreviewBook:S,theme:A})})]}),k&&jsxRuntimeExports.jsx(ErrorBoundary,{fallbackMessage:"Error displaying PDF preview",children:jsxRuntimeExports.jsx(PDFPreview,{open:a,onClose:()=>{w(!1),b(null)},pdfUrl:`/api/books/${k.filename}`,bookTitle:k.title})})]})};export{HomePage as default};
+`))||null;De&&this.data.comb&&(De=De.replaceAll(/\s+/g,""));const Te={userValue:Se,formattedValue:De,lastCommittedValue:null,commitKey:1,focused:!1};this.data.multiLine?(K=document.createElement("textarea"),K.textContent=De??Se,this.data.doNotScroll&&(K.style.overflowY="hidden")):(K=document.createElement("input"),K.type="text",K.setAttribute("value",De??Se),this.data.doNotScroll&&(K.style.overflowX="hidden")),this.data.hasOwnCanvas&&(K.hidden=!0),w.add(K),K.setAttribute("data-element-id",j),K.disabled=this.data.readOnly,K.name=this.data.fieldName,K.tabIndex=v,this._setRequired(K,this.data.required),Fe&&(K.maxLength=Fe),K.addEventListener("input",Le=>{W.setValue(j,{value:Le.target.value}),this.setPropertyOnSiblings(K,"value",Le.target.value,"value"),Te.formattedValue=null}),K.addEventListener("resetform",Le=>{const Ne=this.data.defaultFieldValue??"";K.value=Te.userValue=Ne,Te.formattedValue=null});let We=Le=>{const{formattedValue:Ne}=Te;Ne!=null&&(Le.target.value=Ne),Le.target.scrollLeft=0};if(this.enableScripting&&this.hasJSActions){K.addEventListener("focus",Ne=>{if(Te.focused)return;const{target:Be}=Ne;Te.userValue&&(Be.value=Te.userValue),Te.lastCommittedValue=Be.value,Te.commitKey=1,Te.focused=!0}),K.addEventListener("updatefromsandbox",Ne=>{this.showElementAndHideCanvas(Ne.target);const Be={value(Ve){Te.userValue=Ve.detail.value??"",W.setValue(j,{value:Te.userValue.toString()}),Ve.target.value=Te.userValue},formattedValue(Ve){const{formattedValue:Ke}=Ve.detail;Te.formattedValue=Ke,Ke!=null&&Ve.target!==document.activeElement&&(Ve.target.value=Ke),W.setValue(j,{formattedValue:Ke})},selRange(Ve){Ve.target.setSelectionRange(...Ve.detail.selRange)},charLimit:Ve=>{var Ze;const{charLimit:Ke}=Ve.detail,{target:Je}=Ve;if(Ke===0){Je.removeAttribute("maxLength");return}Je.setAttribute("maxLength",Ke);let tt=Te.userValue;!tt||tt.length<=Ke||(tt=tt.slice(0,Ke),Je.value=Te.userValue=tt,W.setValue(j,{value:tt}),(Ze=this.linkService.eventBus)==null||Ze.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:tt,willCommit:!0,commitKey:1,selStart:Je.selectionStart,selEnd:Je.selectionEnd}}))}};this._dispatchEventFromSandbox(Be,Ne)}),K.addEventListener("keydown",Ne=>{var Ke;Te.commitKey=1;let Be=-1;if(Ne.key==="Escape"?Be=0:Ne.key==="Enter"&&!this.data.multiLine?Be=2:Ne.key==="Tab"&&(Te.commitKey=3),Be===-1)return;const{value:Ve}=Ne.target;Te.lastCommittedValue!==Ve&&(Te.lastCommittedValue=Ve,Te.userValue=Ve,(Ke=this.linkService.eventBus)==null||Ke.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:Ve,willCommit:!0,commitKey:Be,selStart:Ne.target.selectionStart,selEnd:Ne.target.selectionEnd}}))});const Le=We;We=null,K.addEventListener("blur",Ne=>{var Ve;if(!Te.focused||!Ne.relatedTarget)return;Te.focused=!1;const{value:Be}=Ne.target;Te.userValue=Be,Te.lastCommittedValue!==Be&&((Ve=this.linkService.eventBus)==null||Ve.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:Be,willCommit:!0,commitKey:Te.commitKey,selStart:Ne.target.selectionStart,selEnd:Ne.target.selectionEnd}})),Le(Ne)}),(pe=this.data.actions)!=null&&pe.Keystroke&&K.addEventListener("beforeinput",Ne=>{var et;Te.lastCommittedValue=null;const{data:Be,target:Ve}=Ne,{value:Ke,selectionStart:Je,selectionEnd:tt}=Ve;let Ze=Je,Ye=tt;switch(Ne.inputType){case"deleteWordBackward":{const rt=Ke.substring(0,Je).match(/\w*[^\w]*$/);rt&&(Ze-=rt[0].length);break}case"deleteWordForward":{const rt=Ke.substring(Je).match(/^[^\w]*\w*/);rt&&(Ye+=rt[0].length);break}case"deleteContentBackward":Je===tt&&(Ze-=1);break;case"deleteContentForward":Je===tt&&(Ye+=1);break}Ne.preventDefault(),(et=this.linkService.eventBus)==null||et.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:Ke,change:Be||"",willCommit:!1,selStart:Ze,selEnd:Ye}})}),this._setEventListeners(K,Te,[["focus","Focus"],["blur","Blur"],["mousedown","Mouse Down"],["mouseenter","Mouse Enter"],["mouseleave","Mouse Exit"],["mouseup","Mouse Up"]],Ne=>Ne.target.value)}if(We&&K.addEventListener("blur",We),this.data.comb){const Ne=(this.data.rect[2]-this.data.rect[0])/Fe;K.classList.add("comb"),K.style.letterSpacing=`calc(${Ne}px * var(--scale-factor) - 1ch)`}}else K=document.createElement("div"),K.textContent=this.data.fieldValue,K.style.verticalAlign="middle",K.style.display="table-cell";return this._setTextStyle(K),this._setBackgroundColor(K),this._setDefaultPropertiesFromJS(K),this.container.append(K),this.container}}class F extends f{constructor(W){super(W,{isRenderable:!!W.data.hasOwnCanvas})}}class S extends f{constructor(W){super(W,{isRenderable:W.renderForms})}render(){const W=this.annotationStorage,j=this.data,K=j.id;let he=W.getValue(K,{value:j.exportValue===j.fieldValue}).value;typeof he=="string"&&(he=he!=="Off",W.setValue(K,{value:he})),this.container.classList.add("buttonWidgetAnnotation","checkBox");const pe=document.createElement("input");return w.add(pe),pe.setAttribute("data-element-id",K),pe.disabled=j.readOnly,this._setRequired(pe,this.data.required),pe.type="checkbox",pe.name=j.fieldName,he&&pe.setAttribute("checked",!0),pe.setAttribute("exportValue",j.exportValue),pe.tabIndex=v,pe.addEventListener("change",xe=>{const{name:Se,checked:Fe}=xe.target;for(const De of this._getElementsByName(Se,K)){const Te=Fe&&De.exportValue===j.exportValue;De.domElement&&(De.domElement.checked=Te),W.setValue(De.id,{value:Te})}W.setValue(K,{value:Fe})}),pe.addEventListener("resetform",xe=>{const Se=j.defaultFieldValue||"Off";xe.target.checked=Se===j.exportValue}),this.enableScripting&&this.hasJSActions&&(pe.addEventListener("updatefromsandbox",xe=>{const Se={value(Fe){Fe.target.checked=Fe.detail.value!=="Off",W.setValue(K,{value:Fe.target.checked})}};this._dispatchEventFromSandbox(Se,xe)}),this._setEventListeners(pe,null,[["change","Validate"],["change","Action"],["focus","Focus"],["blur","Blur"],["mousedown","Mouse Down"],["mouseenter","Mouse Enter"],["mouseleave","Mouse Exit"],["mouseup","Mouse Up"]],xe=>xe.target.checked)),this._setBackgroundColor(pe),this._setDefaultPropertiesFromJS(pe),this.container.append(pe),this.container}}class o extends f{constructor(W){super(W,{isRenderable:W.renderForms})}render(){this.container.classList.add("buttonWidgetAnnotation","radioButton");const W=this.annotationStorage,j=this.data,K=j.id;let he=W.getValue(K,{value:j.fieldValue===j.buttonValue}).value;typeof he=="string"&&(he=he!==j.buttonValue,W.setValue(K,{value:he}));const pe=document.createElement("input");if(w.add(pe),pe.setAttribute("data-element-id",K),pe.disabled=j.readOnly,this._setRequired(pe,this.data.required),pe.type="radio",pe.name=j.fieldName,he&&pe.setAttribute("checked",!0),pe.tabIndex=v,pe.addEventListener("change",xe=>{const{name:Se,checked:Fe}=xe.target;for(const De of this._getElementsByName(Se,K))W.setValue(De.id,{value:!1});W.setValue(K,{value:Fe})}),pe.addEventListener("resetform",xe=>{const Se=j.defaultFieldValue;xe.target.checked=Se!=null&&Se===j.buttonValue}),this.enableScripting&&this.hasJSActions){const xe=j.buttonValue;pe.addEventListener("updatefromsandbox",Se=>{const Fe={value:De=>{const Te=xe===De.detail.value;for(const We of this._getElementsByName(De.target.name)){const Le=Te&&We.id===K;We.domElement&&(We.domElement.checked=Le),W.setValue(We.id,{value:Le})}}};this._dispatchEventFromSandbox(Fe,Se)}),this._setEventListeners(pe,null,[["change","Validate"],["change","Action"],["focus","Focus"],["blur","Blur"],["mousedown","Mouse Down"],["mouseenter","Mouse Enter"],["mouseleave","Mouse Exit"],["mouseup","Mouse Up"]],Se=>Se.target.checked)}return this._setBackgroundColor(pe),this._setDefaultPropertiesFromJS(pe),this.container.append(pe),this.container}}class p extends P{constructor(W){super(W,{ignoreBorder:W.data.hasAppearance})}render(){const W=super.render();W.classList.add("buttonWidgetAnnotation","pushButton"),this.data.alternativeText&&(W.title=this.data.alternativeText);const j=W.lastChild;return this.enableScripting&&this.hasJSActions&&j&&(this._setDefaultPropertiesFromJS(j),j.addEventListener("updatefromsandbox",K=>{this._dispatchEventFromSandbox({},K)})),W}}class l extends f{constructor(W){super(W,{isRenderable:W.renderForms})}render(){this.container.classList.add("choiceWidgetAnnotation");const W=this.annotationStorage,j=this.data.id,K=W.getValue(j,{value:this.data.fieldValue}),he=document.createElement("select");w.add(he),he.setAttribute("data-element-id",j),he.disabled=this.data.readOnly,this._setRequired(he,this.data.required),he.name=this.data.fieldName,he.tabIndex=v;let pe=this.data.combo&&this.data.options.length>0;this.data.combo||(he.size=this.data.options.length,this.data.multiSelect&&(he.multiple=!0)),he.addEventListener("resetform",Te=>{const We=this.data.defaultFieldValue;for(const Le of he.options)Le.selected=Le.value===We});for(const Te of this.data.options){const We=document.createElement("option");We.textContent=Te.displayValue,We.value=Te.exportValue,K.value.includes(Te.exportValue)&&(We.setAttribute("selected",!0),pe=!1),he.append(We)}let xe=null;if(pe){const Te=document.createElement("option");Te.value=" ",Te.setAttribute("hidden",!0),Te.setAttribute("selected",!0),he.prepend(Te),xe=()=>{Te.remove(),he.removeEventListener("input",xe),xe=null},he.addEventListener("input",xe)}const Se=Te=>{const We=Te?"value":"textContent",{options:Le,multiple:Ne}=he;return Ne?Array.prototype.filter.call(Le,Be=>Be.selected).map(Be=>Be[We]):Le.selectedIndex===-1?null:Le[Le.selectedIndex][We]};let Fe=Se(!1);const De=Te=>{const We=Te.target.options;return Array.prototype.map.call(We,Le=>({displayValue:Le.textContent,exportValue:Le.value}))};return this.enableScripting&&this.hasJSActions?(he.addEventListener("updatefromsandbox",Te=>{const We={value(Le){xe==null||xe();const Ne=Le.detail.value,Be=new Set(Array.isArray(Ne)?Ne:[Ne]);for(const Ve of he.options)Ve.selected=Be.has(Ve.value);W.setValue(j,{value:Se(!0)}),Fe=Se(!1)},multipleSelection(Le){he.multiple=!0},remove(Le){const Ne=he.options,Be=Le.detail.remove;Ne[Be].selected=!1,he.remove(Be),Ne.length>0&&Array.prototype.findIndex.call(Ne,Ke=>Ke.selected)===-1&&(Ne[0].selected=!0),W.setValue(j,{value:Se(!0),items:De(Le)}),Fe=Se(!1)},clear(Le){for(;he.length!==0;)he.remove(0);W.setValue(j,{value:null,items:[]}),Fe=Se(!1)},insert(Le){const{index:Ne,displayValue:Be,exportValue:Ve}=Le.detail.insert,Ke=he.children[Ne],Je=document.createElement("option");Je.textContent=Be,Je.value=Ve,Ke?Ke.before(Je):he.append(Je),W.setValue(j,{value:Se(!0),items:De(Le)}),Fe=Se(!1)},items(Le){const{items:Ne}=Le.detail;for(;he.length!==0;)he.remove(0);for(const Be of Ne){const{displayValue:Ve,exportValue:Ke}=Be,Je=document.createElement("option");Je.textContent=Ve,Je.value=Ke,he.append(Je)}he.options.length>0&&(he.options[0].selected=!0),W.setValue(j,{value:Se(!0),items:De(Le)}),Fe=Se(!1)},indices(Le){const Ne=new Set(Le.detail.indices);for(const Be of Le.target.options)Be.selected=Ne.has(Be.index);W.setValue(j,{value:Se(!0)}),Fe=Se(!1)},editable(Le){Le.target.disabled=!Le.detail.editable}};this._dispatchEventFromSandbox(We,Te)}),he.addEventListener("input",Te=>{var Le;const We=Se(!0);W.setValue(j,{value:We}),Te.preventDefault(),(Le=this.linkService.eventBus)==null||Le.dispatch("dispatcheventinsandbox",{source:this,detail:{id:j,name:"Keystroke",value:Fe,changeEx:We,willCommit:!1,commitKey:1,keyDown:!1}})}),this._setEventListeners(he,null,[["focus","Focus"],["blur","Blur"],["mousedown","Mouse Down"],["mouseenter","Mouse Enter"],["mouseleave","Mouse Exit"],["mouseup","Mouse Up"],["input","Action"],["input","Validate"]],Te=>Te.target.value)):he.addEventListener("input",function(Te){W.setValue(j,{value:Se(!0)})}),this.data.combo&&this._setTextStyle(he),this._setBackgroundColor(he),this._setDefaultPropertiesFromJS(he),this.container.append(he),this.container}}class g extends A{constructor(W){const{data:j,elements:K}=W;super(W,{isRenderable:A._hasPopupData(j)}),this.elements=K}render(){this.container.classList.add("popupAnnotation");const W=new m({container:this.container,color:this.data.color,titleObj:this.data.titleObj,modificationDate:this.data.modificationDate,contentsObj:this.data.contentsObj,richText:this.data.richText,rect:this.data.rect,parentRect:this.data.parentRect||null,parent:this.parent,elements:this.elements,open:this.data.open}),j=[];for(const K of this.elements)K.popup=W,j.push(K.data.id),K.addHighlightArea();return this.container.setAttribute("aria-controls",j.map(K=>`${n.AnnotationPrefix}${K}`).join(",")),this.container}}class m{constructor({container:W,color:j,elements:K,titleObj:he,modificationDate:pe,contentsObj:xe,richText:Se,parent:Fe,rect:De,parentRect:Te,open:We}){ce(this,Ce);ce(this,ie,null);ce(this,le,ne(this,Ce,Dn).bind(this));ce(this,fe,ne(this,Ce,rn).bind(this));ce(this,be,ne(this,Ce,sn).bind(this));ce(this,me,ne(this,Ce,wt).bind(this));ce(this,ve,null);ce(this,Z,null);ce(this,ee,null);ce(this,M,null);ce(this,H,null);ce(this,J,null);ce(this,oe,!1);ce(this,ge,null);ce(this,Ae,null);ce(this,_e,null);ce(this,te,null);ce(this,Pe,!1);var Ne;ue(this,Z,W),ue(this,te,he),ue(this,ee,xe),ue(this,_e,Se),ue(this,H,Fe),ue(this,ve,j),ue(this,Ae,De),ue(this,J,Te),ue(this,M,K);const Le=r.PDFDateString.toDateObject(pe);Le&&ue(this,ie,Fe.l10n.get("annotation_date_string",{date:Le.toLocaleDateString(),time:Le.toLocaleTimeString()})),this.trigger=K.flatMap(Be=>Be.getElementsToTriggerPopup());for(const Be of this.trigger)Be.addEventListener("click",i(this,me)),Be.addEventListener("mouseenter",i(this,be)),Be.addEventListener("mouseleave",i(this,fe)),Be.classList.add("popupTriggerArea");for(const Be of K)(Ne=Be.container)==null||Ne.addEventListener("keydown",i(this,le));i(this,Z).hidden=!0,We&&ne(this,Ce,wt).call(this)}render(){if(i(this,ge))return;const{page:{view:W},viewport:{rawDims:{pageWidth:j,pageHeight:K,pageX:he,pageY:pe}}}=i(this,H),xe=ue(this,ge,document.createElement("div"));if(xe.className="popup",i(this,ve)){const Ze=xe.style.outlineColor=n.Util.makeHexColor(...i(this,ve));CSS.supports("background-color","color-mix(in srgb, red 30%, white)")?xe.style.backgroundColor=`color-mix(in srgb, ${Ze} 30%, white)`:xe.style.backgroundColor=n.Util.makeHexColor(...i(this,ve).map(et=>Math.floor(.7*(255-et)+et)))}const Se=document.createElement("span");Se.className="header";const Fe=document.createElement("h1");if(Se.append(Fe),{dir:Fe.dir,str:Fe.textContent}=i(this,te),xe.append(Se),i(this,ie)){const Ze=document.createElement("span");Ze.classList.add("popupDate"),i(this,ie).then(Ye=>{Ze.textContent=Ye}),Se.append(Ze)}const De=i(this,ee),Te=i(this,_e);if(Te!=null&&Te.str&&(!(De!=null&&De.str)||De.str===Te.str))h.XfaLayer.render({xfaHtml:Te.html,intent:"richText",div:xe}),xe.lastChild.classList.add("richText","popupContent");else{const Ze=this._formatContents(De);xe.append(Ze)}let We=!!i(this,J),Le=We?i(this,J):i(this,Ae);for(const Ze of i(this,M))if(!Le||n.Util.intersect(Ze.data.rect,Le)!==null){Le=Ze.data.rect,We=!0;break}const Ne=n.Util.normalizeRect([Le[0],W[3]-Le[1]+W[1],Le[2],W[3]-Le[3]+W[1]]),Ve=We?Le[2]-Le[0]+5:0,Ke=Ne[0]+Ve,Je=Ne[1],{style:tt}=i(this,Z);tt.left=`${100*(Ke-he)/j}%`,tt.top=`${100*(Je-pe)/K}%`,i(this,Z).append(xe)}_formatContents({str:W,dir:j}){const K=document.createElement("p");K.classList.add("popupContent"),K.dir=j;const he=W.split(/(?:\r\n?|\n)/);for(let pe=0,xe=he.length;pe<xe;++pe){const Se=he[pe];K.append(document.createTextNode(Se)),pe<xe-1&&K.append(document.createElement("br"))}return K}forceHide(){ue(this,Pe,this.isVisible),i(this,Pe)&&(i(this,Z).hidden=!0)}maybeShow(){i(this,Pe)&&(ue(this,Pe,!1),i(this,Z).hidden=!1)}get isVisible(){return i(this,Z).hidden===!1}}ie=new WeakMap,le=new WeakMap,fe=new WeakMap,be=new WeakMap,me=new WeakMap,ve=new WeakMap,Z=new WeakMap,ee=new WeakMap,M=new WeakMap,H=new WeakMap,J=new WeakMap,oe=new WeakMap,ge=new WeakMap,Ae=new WeakMap,_e=new WeakMap,te=new WeakMap,Pe=new WeakMap,Ce=new WeakSet,Dn=function(W){W.altKey||W.shiftKey||W.ctrlKey||W.metaKey||(W.key==="Enter"||W.key==="Escape"&&i(this,oe))&&ne(this,Ce,wt).call(this)},wt=function(){ue(this,oe,!i(this,oe)),i(this,oe)?(ne(this,Ce,sn).call(this),i(this,Z).addEventListener("click",i(this,me)),i(this,Z).addEventListener("keydown",i(this,le))):(ne(this,Ce,rn).call(this),i(this,Z).removeEventListener("click",i(this,me)),i(this,Z).removeEventListener("keydown",i(this,le)))},sn=function(){i(this,ge)||this.render(),this.isVisible?i(this,oe)&&i(this,Z).classList.add("focused"):(i(this,Z).hidden=!1,i(this,Z).style.zIndex=parseInt(i(this,Z).style.zIndex)+1e3)},rn=function(){i(this,Z).classList.remove("focused"),!(i(this,oe)||!this.isVisible)&&(i(this,Z).hidden=!0,i(this,Z).style.zIndex=parseInt(i(this,Z).style.zIndex)-1e3)};class L extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0}),this.textContent=W.data.textContent,this.textPosition=W.data.textPosition,this.annotationEditorType=n.AnnotationEditorType.FREETEXT}render(){if(this.container.classList.add("freeTextAnnotation"),this.textContent){const W=document.createElement("div");W.classList.add("annotationTextContent"),W.setAttribute("role","comment");for(const j of this.textContent){const K=document.createElement("span");K.textContent=j,W.append(K)}this.container.append(W)}return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this._editOnDoubleClick(),this.container}}e.FreeTextAnnotationElement=L;class c extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,Oe,null)}render(){this.container.classList.add("lineAnnotation");const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0),xe=ue(this,Oe,this.svgFactory.createElement("svg:line"));return xe.setAttribute("x1",j.rect[2]-j.lineCoordinates[0]),xe.setAttribute("y1",j.rect[3]-j.lineCoordinates[1]),xe.setAttribute("x2",j.rect[2]-j.lineCoordinates[2]),xe.setAttribute("y2",j.rect[3]-j.lineCoordinates[3]),xe.setAttribute("stroke-width",j.borderStyle.width||1),xe.setAttribute("stroke","transparent"),xe.setAttribute("fill","transparent"),pe.append(xe),this.container.append(pe),!j.popupRef&&this.hasPopupData&&this._createPopup(),this.container}getElementsToTriggerPopup(){return i(this,Oe)}addHighlightArea(){this.container.classList.add("highlightArea")}}Oe=new WeakMap;class R extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,ze,null)}render(){this.container.classList.add("squareAnnotation");const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0),xe=j.borderStyle.width,Se=ue(this,ze,this.svgFactory.createElement("svg:rect"));return Se.setAttribute("x",xe/2),Se.setAttribute("y",xe/2),Se.setAttribute("width",K-xe),Se.setAttribute("height",he-xe),Se.setAttribute("stroke-width",xe||1),Se.setAttribute("stroke","transparent"),Se.setAttribute("fill","transparent"),pe.append(Se),this.container.append(pe),!j.popupRef&&this.hasPopupData&&this._createPopup(),this.container}getElementsToTriggerPopup(){return i(this,ze)}addHighlightArea(){this.container.classList.add("highlightArea")}}ze=new WeakMap;class I extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,Xe,null)}render(){this.container.classList.add("circleAnnotation");const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0),xe=j.borderStyle.width,Se=ue(this,Xe,this.svgFactory.createElement("svg:ellipse"));return Se.setAttribute("cx",K/2),Se.setAttribute("cy",he/2),Se.setAttribute("rx",K/2-xe/2),Se.setAttribute("ry",he/2-xe/2),Se.setAttribute("stroke-width",xe||1),Se.setAttribute("stroke","transparent"),Se.setAttribute("fill","transparent"),pe.append(Se),this.container.append(pe),!j.popupRef&&this.hasPopupData&&this._createPopup(),this.container}getElementsToTriggerPopup(){return i(this,Xe)}addHighlightArea(){this.container.classList.add("highlightArea")}}Xe=new WeakMap;class Q extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,Ee,null);this.containerClassName="polylineAnnotation",this.svgElementName="svg:polyline"}render(){this.container.classList.add(this.containerClassName);const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0);let xe=[];for(const Fe of j.vertices){const De=Fe.x-j.rect[0],Te=j.rect[3]-Fe.y;xe.push(De+","+Te)}xe=xe.join(" ");const Se=ue(this,Ee,this.svgFactory.createElement(this.svgElementName));return Se.setAttribute("points",xe),Se.setAttribute("stroke-width",j.borderStyle.width||1),Se.setAttribute("stroke","transparent"),Se.setAttribute("fill","transparent"),pe.append(Se),this.container.append(pe),!j.popupRef&&this.hasPopupData&&this._createPopup(),this.container}getElementsToTriggerPopup(){return i(this,Ee)}addHighlightArea(){this.container.classList.add("highlightArea")}}Ee=new WeakMap;class G extends Q{constructor(W){super(W),this.containerClassName="polygonAnnotation",this.svgElementName="svg:polygon"}}class q extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0})}render(){return this.container.classList.add("caretAnnotation"),!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container}}class V extends A{constructor(j){super(j,{isRenderable:!0,ignoreBorder:!0});ce(this,ae,[]);this.containerClassName="inkAnnotation",this.svgElementName="svg:polyline",this.annotationEditorType=n.AnnotationEditorType.INK}render(){this.container.classList.add(this.containerClassName);const j=this.data,{width:K,height:he}=k(j.rect),pe=this.svgFactory.create(K,he,!0);for(const xe of j.inkLists){let Se=[];for(const De of xe){const Te=De.x-j.rect[0],We=j.rect[3]-De.y;Se.push(`${Te},${We}`)}Se=Se.join(" ");const Fe=this.svgFactory.createElement(this.svgElementName);i(this,ae).push(Fe),Fe.setAttribute("points",Se),Fe.setAttribute("stroke-width",j.borderStyle.width||1),Fe.setAttribute("stroke","transparent"),Fe.setAttribute("fill","transparent"),!j.popupRef&&this.hasPopupData&&this._createPopup(),pe.append(Fe)}return this.container.append(pe),this.container}getElementsToTriggerPopup(){return i(this,ae)}addHighlightArea(){this.container.classList.add("highlightArea")}}ae=new WeakMap,e.InkAnnotationElement=V;class se extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0,createQuadrilaterals:!0})}render(){return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.classList.add("highlightAnnotation"),this.container}}class D extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0,createQuadrilaterals:!0})}render(){return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.classList.add("underlineAnnotation"),this.container}}class X extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0,createQuadrilaterals:!0})}render(){return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.classList.add("squigglyAnnotation"),this.container}}class re extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0,createQuadrilaterals:!0})}render(){return!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container.classList.add("strikeoutAnnotation"),this.container}}class N extends A{constructor(W){super(W,{isRenderable:!0,ignoreBorder:!0})}render(){return this.container.classList.add("stampAnnotation"),!this.data.popupRef&&this.hasPopupData&&this._createPopup(),this.container}}e.StampAnnotationElement=N;class d extends A{constructor(j){var pe;super(j,{isRenderable:!0});ce(this,Me);ce(this,de,null);const{filename:K,content:he}=this.data.file;this.filename=(0,r.getFilenameFromUrl)(K,!0),this.content=he,(pe=this.linkService.eventBus)==null||pe.dispatch("fileattachmentannotation",{source:this,filename:K,content:he})}render(){this.container.classList.add("fileAttachmentAnnotation");const{container:j,data:K}=this;let he;K.hasAppearance||K.fillAlpha===0?he=document.createElement("div"):(he=document.createElement("img"),he.src=`${this.imageResourcesPath}annotation-${/paperclip/i.test(K.name)?"paperclip":"pushpin"}.svg`,K.fillAlpha&&K.fillAlpha<1&&(he.style=`filter: opacity(${Math.round(K.fillAlpha*100)}%);`)),he.addEventListener("dblclick",ne(this,Me,on).bind(this)),ue(this,de,he);const{isMac:pe}=n.FeatureTest.platform;return j.addEventListener("keydown",xe=>{xe.key==="Enter"&&(pe?xe.metaKey:xe.ctrlKey)&&ne(this,Me,on).call(this)}),!K.popupRef&&this.hasPopupData?this._createPopup():he.classList.add("popupTriggerArea"),j.append(he),j}getElementsToTriggerPopup(){return i(this,de)}addHighlightArea(){this.container.classList.add("highlightArea")}}de=new WeakMap,Me=new WeakSet,on=function(){var j;(j=this.downloadManager)==null||j.openOrDownloadData(this.container,this.content,this.filename)};class u{constructor({div:W,accessibilityManager:j,annotationCanvasMap:K,l10n:he,page:pe,viewport:xe}){ce(this,we);ce(this,Ge,null);ce(this,z,null);ce(this,ye,new Map);this.div=W,ue(this,Ge,j),ue(this,z,K),this.l10n=he,this.page=pe,this.viewport=xe,this.zIndex=0,this.l10n||(this.l10n=O.NullL10n)}async render(W){const{annotations:j}=W,K=this.div;(0,r.setLayerDimensions)(K,this.viewport);const he=new Map,pe={data:null,layer:K,linkService:W.linkService,downloadManager:W.downloadManager,imageResourcesPath:W.imageResourcesPath||"",renderForms:W.renderForms!==!1,svgFactory:new r.DOMSVGFactory,annotationStorage:W.annotationStorage||new y.AnnotationStorage,enableScripting:W.enableScripting===!0,hasJSActions:W.hasJSActions,fieldObjects:W.fieldObjects,parent:this,elements:null};for(const xe of j){if(xe.noHTML)continue;const Se=xe.annotationType===n.AnnotationType.POPUP;if(Se){const Te=he.get(xe.id);if(!Te)continue;pe.elements=Te}else{const{width:Te,height:We}=k(xe.rect);if(Te<=0||We<=0)continue}pe.data=xe;const Fe=b.create(pe);if(!Fe.isRenderable)continue;if(!Se&&xe.popupRef){const Te=he.get(xe.popupRef);Te?Te.push(Fe):he.set(xe.popupRef,[Fe])}Fe.annotationEditorType>0&&i(this,ye).set(Fe.data.id,Fe);const De=Fe.render();xe.hidden&&(De.style.visibility="hidden"),ne(this,we,Ln).call(this,De,xe.id)}ne(this,we,an).call(this),await this.l10n.translate(K)}update({viewport:W}){const j=this.div;this.viewport=W,(0,r.setLayerDimensions)(j,{rotation:W.rotation}),ne(this,we,an).call(this),j.hidden=!1}getEditableAnnotations(){return Array.from(i(this,ye).values())}getEditableAnnotation(W){return i(this,ye).get(W)}}Ge=new WeakMap,z=new WeakMap,ye=new WeakMap,we=new WeakSet,Ln=function(W,j){var he;const K=W.firstChild||W;K.id=`${n.AnnotationPrefix}${j}`,this.div.append(W),(he=i(this,Ge))==null||he.moveElementInDOM(this.div,W,K,!1)},an=function(){if(!i(this,z))return;const W=this.div;for(const[j,K]of i(this,z)){const he=W.querySelector(`[data-annotation-id="${j}"]`);if(!he)continue;const{firstChild:pe}=he;pe?pe.nodeName==="CANVAS"?pe.replaceWith(K):pe.before(K):he.append(K)}i(this,z).clear()},e.AnnotationLayer=u},(t,e)=>{Object.defineProperty(e,"__esModule",{value:!0}),e.ColorConverters=void 0;function s(y){return Math.floor(Math.max(0,Math.min(1,y))*255).toString(16).padStart(2,"0")}function n(y){return Math.max(0,Math.min(255,255*y))}class r{static CMYK_G([C,O,h,v]){return["G",1-Math.min(1,.3*C+.59*h+.11*O+v)]}static G_CMYK([C]){return["CMYK",0,0,0,1-C]}static G_RGB([C]){return["RGB",C,C,C]}static G_rgb([C]){return C=n(C),[C,C,C]}static G_HTML([C]){const O=s(C);return`#${O}${O}${O}`}static RGB_G([C,O,h]){return["G",.3*C+.59*O+.11*h]}static RGB_rgb(C){return C.map(n)}static RGB_HTML(C){return`#${C.map(s).join("")}`}static T_HTML(){return"#00000000"}static T_rgb(){return[null]}static CMYK_RGB([C,O,h,v]){return["RGB",1-Math.min(1,C+v),1-Math.min(1,h+v),1-Math.min(1,O+v)]}static CMYK_rgb([C,O,h,v]){return[n(1-Math.min(1,C+v)),n(1-Math.min(1,h+v)),n(1-Math.min(1,O+v))]}static CMYK_HTML(C){const O=this.CMYK_RGB(C).slice(1);return this.RGB_HTML(O)}static RGB_CMYK([C,O,h]){const v=1-C,a=1-O,w=1-h,k=Math.min(v,a,w);return["CMYK",v,a,w,k]}}e.ColorConverters=r},(t,e)=>{Object.defineProperty(e,"__esModule",{value:!0}),e.NullL10n=void 0,e.getL10nFallback=n;const s={of_pages:"of {{pagesCount}}",page_of_pages:"({{pageNumber}} of {{pagesCount}})",document_properties_kb:"{{size_kb}} KB ({{size_b}} bytes)",document_properties_mb:"{{size_mb}} MB ({{size_b}} bytes)",document_properties_date_string:"{{date}}, {{time}}",document_properties_page_size_unit_inches:"in",document_properties_page_size_unit_millimeters:"mm",document_properties_page_size_orientation_portrait:"portrait",document_properties_page_size_orientation_landscape:"landscape",document_properties_page_size_name_a3:"A3",document_properties_page_size_name_a4:"A4",document_properties_page_size_name_letter:"Letter",document_properties_page_size_name_legal:"Legal",document_properties_page_size_dimension_string:"{{width}} × {{height}} {{unit}} ({{orientation}})",document_properties_page_size_dimension_name_string:"{{width}} × {{height}} {{unit}} ({{name}}, {{orientation}})",document_properties_linearized_yes:"Yes",document_properties_linearized_no:"No",additional_layers:"Additional Layers",page_landmark:"Page {{page}}",thumb_page_title:"Page {{page}}",thumb_page_canvas:"Thumbnail of Page {{page}}",find_reached_top:"Reached top of document, continued from bottom",find_reached_bottom:"Reached end of document, continued from top","find_match_count[one]":"{{current}} of {{total}} match","find_match_count[other]":"{{current}} of {{total}} matches","find_match_count_limit[one]":"More than {{limit}} match","find_match_count_limit[other]":"More than {{limit}} matches",find_not_found:"Phrase not found",page_scale_width:"Page Width",page_scale_fit:"Page Fit",page_scale_auto:"Automatic Zoom",page_scale_actual:"Actual Size",page_scale_percent:"{{scale}}%",loading_error:"An error occurred while loading the PDF.",invalid_file_error:"Invalid or corrupted PDF file.",missing_file_error:"Missing PDF file.",unexpected_response_error:"Unexpected server response.",rendering_error:"An error occurred while rendering the page.",annotation_date_string:"{{date}}, {{time}}",printing_not_supported:"Warning: Printing is not fully supported by this browser.",printing_not_ready:"Warning: The PDF is not fully loaded for printing.",web_fonts_disabled:"Web fonts are disabled: unable to use embedded PDF fonts.",free_text2_default_content:"Start typing…",editor_free_text2_aria_label:"Text Editor",editor_ink2_aria_label:"Draw Editor",editor_ink_canvas_aria_label:"User-created image",editor_alt_text_button_label:"Alt text",editor_alt_text_edit_button_label:"Edit alt text",editor_alt_text_decorative_tooltip:"Marked as decorative"};s.print_progress_percent="{{progress}}%";function n(C,O){switch(C){case"find_match_count":C=`find_match_count[${O.total===1?"one":"other"}]`;break;case"find_match_count_limit":C=`find_match_count_limit[${O.limit===1?"one":"other"}]`;break}return s[C]||""}function r(C,O){return O?C.replaceAll(/\{\{\s*(\w+)\s*\}\}/g,(h,v)=>v in O?O[v]:"{{"+v+"}}"):C}const y={async getLanguage(){return"en-us"},async getDirection(){return"ltr"},async get(C,O=null,h=n(C,O)){return r(h,O)},async translate(C){}};e.NullL10n=y},(t,e,s)=>{Object.defineProperty(e,"__esModule",{value:!0}),e.XfaLayer=void 0;var n=s(25);class r{static setupStorage(C,O,h,v,a){const w=v.getValue(O,{value:null});switch(h.name){case"textarea":if(w.value!==null&&(C.textContent=w.value),a==="print")break;C.addEventListener("input",k=>{v.setValue(O,{value:k.target.value})});break;case"input":if(h.attributes.type==="radio"||h.attributes.type==="checkbox"){if(w.value===h.attributes.xfaOn?C.setAttribute("checked",!0):w.value===h.attributes.xfaOff&&C.removeAttribute("checked"),a==="print")break;C.addEventListener("change",k=>{v.setValue(O,{value:k.target.checked?k.target.getAttribute("xfaOn"):k.target.getAttribute("xfaOff")})})}else{if(w.value!==null&&C.setAttribute("value",w.value),a==="print")break;C.addEventListener("input",k=>{v.setValue(O,{value:k.target.value})})}break;case"select":if(w.value!==null){C.setAttribute("value",w.value);for(const k of h.children)k.attributes.value===w.value?k.attributes.selected=!0:k.attributes.hasOwnProperty("selected")&&delete k.attributes.selected}C.addEventListener("input",k=>{const b=k.target.options,A=b.selectedIndex===-1?"":b[b.selectedIndex].value;v.setValue(O,{value:A})});break}}static setAttributes({html:C,element:O,storage:h=null,intent:v,linkService:a}){const{attributes:w}=O,k=C instanceof HTMLAnchorElement;w.type==="radio"&&(w.name=`${w.name}-${v}`);for(const[b,A]of Object.entries(w))if(A!=null)switch(b){case"class":A.length&&C.setAttribute(b,A.join(" "));break;case"dataId":break;case"id":C.setAttribute("data-element-id",A);break;case"style":Object.assign(C.style,A);break;case"textContent":C.textContent=A;break;default:(!k||b!=="href"&&b!=="newWindow")&&C.setAttribute(b,A)}k&&a.addLinkAttributes(C,w.href,w.newWindow),h&&w.dataId&&this.setupStorage(C,w.dataId,O,h)}static render(C){var P;const O=C.annotationStorage,h=C.linkService,v=C.xfaHtml,a=C.intent||"display",w=document.createElement(v.name);v.attributes&&this.setAttributes({html:w,element:v,intent:a,linkService:h});const k=[[v,-1,w]],b=C.div;if(b.append(w),C.viewport){const x=`matrix(${C.viewport.transform.join(",")})`;b.style.transform=x}a!=="richText"&&b.setAttribute("class","xfaLayer xfaFont");const A=[];for(;k.length>0;){const[x,f,E]=k.at(-1);if(f+1===x.children.length){k.pop();continue}const F=x.children[++k.at(-1)[1]];if(F===null)continue;const{name:S}=F;if(S==="#text"){const p=document.createTextNode(F.value);A.push(p),E.append(p);continue}const o=(P=F==null?void 0:F.attributes)!=null&&P.xmlns?document.createElementNS(F.attributes.xmlns,S):document.createElement(S);if(E.append(o),F.attributes&&this.setAttributes({html:o,element:F,storage:O,intent:a,linkService:h}),F.children&&F.children.length>0)k.push([F,-1,o]);else if(F.value){const p=document.createTextNode(F.value);n.XfaText.shouldBuildText(S)&&A.push(p),o.append(p)}}for(const x of b.querySelectorAll(".xfaNonInteractive input, .xfaNonInteractive textarea"))x.setAttribute("readOnly",!0);return{textDivs:A}}static update(C){const O=`matrix(${C.viewport.transform.join(",")})`;C.div.style.transform=O,C.div.hidden=!1}}e.XfaLayer=r},(t,e,s)=>{var v,a,w,k,b,A,P,x,f,E,F,S,o,p,l,In,Nn,jn,$n,ln,Bn,cn,Un,Wn,Hn,zn,Vn,st,dn,Tt,Rt,ct,un,kt,U,Gn,hn,qn,Xn,pn,Mt,dt;Object.defineProperty(e,"__esModule",{value:!0}),e.InkEditor=void 0;var n=s(1),r=s(4),y=s(29),C=s(6),O=s(5);const ve=class ve extends r.AnnotationEditor{constructor(M){super({...M,name:"inkEditor"});ce(this,l);ce(this,v,0);ce(this,a,0);ce(this,w,this.canvasPointermove.bind(this));ce(this,k,this.canvasPointerleave.bind(this));ce(this,b,this.canvasPointerup.bind(this));ce(this,A,this.canvasPointerdown.bind(this));ce(this,P,new Path2D);ce(this,x,!1);ce(this,f,!1);ce(this,E,!1);ce(this,F,null);ce(this,S,0);ce(this,o,0);ce(this,p,null);this.color=M.color||null,this.thickness=M.thickness||null,this.opacity=M.opacity||null,this.paths=[],this.bezierPath2D=[],this.allRawPaths=[],this.currentPath=[],this.scaleFactor=1,this.translationX=this.translationY=0,this.x=0,this.y=0,this._willKeepAspectRatio=!0}static initialize(M){r.AnnotationEditor.initialize(M,{strings:["editor_ink_canvas_aria_label","editor_ink2_aria_label"]})}static updateDefaultParams(M,H){switch(M){case n.AnnotationEditorParamsType.INK_THICKNESS:ve._defaultThickness=H;break;case n.AnnotationEditorParamsType.INK_COLOR:ve._defaultColor=H;break;case n.AnnotationEditorParamsType.INK_OPACITY:ve._defaultOpacity=H/100;break}}updateParams(M,H){switch(M){case n.AnnotationEditorParamsType.INK_THICKNESS:ne(this,l,In).call(this,H);break;case n.AnnotationEditorParamsType.INK_COLOR:ne(this,l,Nn).call(this,H);break;case n.AnnotationEditorParamsType.INK_OPACITY:ne(this,l,jn).call(this,H);break}}static get defaultPropertiesToUpdate(){return[[n.AnnotationEditorParamsType.INK_THICKNESS,ve._defaultThickness],[n.AnnotationEditorParamsType.INK_COLOR,ve._defaultColor||r.AnnotationEditor._defaultLineColor],[n.AnnotationEditorParamsType.INK_OPACITY,Math.round(ve._defaultOpacity*100)]]}get propertiesToUpdate(){return[[n.AnnotationEditorParamsType.INK_THICKNESS,this.thickness||ve._defaultThickness],[n.AnnotationEditorParamsType.INK_COLOR,this.color||ve._defaultColor||r.AnnotationEditor._defaultLineColor],[n.AnnotationEditorParamsType.INK_OPACITY,Math.round(100*(this.opacity??ve._defaultOpacity))]]}rebuild(){this.parent&&(super.rebuild(),this.div!==null&&(this.canvas||(ne(this,l,Tt).call(this),ne(this,l,Rt).call(this)),this.isAttachedToDOM||(this.parent.add(this),ne(this,l,ct).call(this)),ne(this,l,dt).call(this)))}remove(){this.canvas!==null&&(this.isEmpty()||this.commit(),this.canvas.width=this.canvas.height=0,this.canvas.remove(),this.canvas=null,i(this,F).disconnect(),ue(this,F,null),super.remove())}setParent(M){!this.parent&&M?this._uiManager.removeShouldRescale(this):this.parent&&M===null&&this._uiManager.addShouldRescale(this),super.setParent(M)}onScaleChanging(){const[M,H]=this.parentDimensions,J=this.width*M,oe=this.height*H;this.setDimensions(J,oe)}enableEditMode(){i(this,x)||this.canvas===null||(super.enableEditMode(),this._isDraggable=!1,this.canvas.addEventListener("pointerdown",i(this,A)))}disableEditMode(){!this.isInEditMode()||this.canvas===null||(super.disableEditMode(),this._isDraggable=!this.isEmpty(),this.div.classList.remove("editing"),this.canvas.removeEventListener("pointerdown",i(this,A)))}onceAdded(){this._isDraggable=!this.isEmpty()}isEmpty(){return this.paths.length===0||this.paths.length===1&&this.paths[0].length===0}commit(){i(this,x)||(super.commit(),this.isEditing=!1,this.disableEditMode(),this.setInForeground(),ue(this,x,!0),this.div.classList.add("disabled"),ne(this,l,dt).call(this,!0),this.makeResizable(),this.parent.addInkEditorIfNeeded(!0),this.moveInDOM(),this.div.focus({preventScroll:!0}))}focusin(M){this._focusEventsAllowed&&(super.focusin(M),this.enableEditMode())}canvasPointerdown(M){M.button!==0||!this.isInEditMode()||i(this,x)||(this.setInForeground(),M.preventDefault(),M.type!=="mouse"&&this.div.focus(),ne(this,l,Bn).call(this,M.offsetX,M.offsetY))}canvasPointermove(M){M.preventDefault(),ne(this,l,cn).call(this,M.offsetX,M.offsetY)}canvasPointerup(M){M.preventDefault(),ne(this,l,dn).call(this,M)}canvasPointerleave(M){ne(this,l,dn).call(this,M)}get isResizable(){return!this.isEmpty()&&i(this,x)}render(){if(this.div)return this.div;let M,H;this.width&&(M=this.x,H=this.y),super.render(),r.AnnotationEditor._l10nPromise.get("editor_ink2_aria_label").then(_e=>{var te;return(te=this.div)==null?void 0:te.setAttribute("aria-label",_e)});const[J,oe,ge,Ae]=ne(this,l,$n).call(this);if(this.setAt(J,oe,0,0),this.setDims(ge,Ae),ne(this,l,Tt).call(this),this.width){const[_e,te]=this.parentDimensions;this.setAspectRatio(this.width*_e,this.height*te),this.setAt(M*_e,H*te,this.width*_e,this.height*te),ue(this,E,!0),ne(this,l,ct).call(this),this.setDims(this.width*_e,this.height*te),ne(this,l,st).call(this),this.div.classList.add("disabled")}else this.div.classList.add("editing"),this.enableEditMode();return ne(this,l,Rt).call(this),this.div}setDimensions(M,H){const J=Math.round(M),oe=Math.round(H);if(i(this,S)===J&&i(this,o)===oe)return;ue(this,S,J),ue(this,o,oe),this.canvas.style.visibility="hidden";const[ge,Ae]=this.parentDimensions;this.width=M/ge,this.height=H/Ae,this.fixAndSetPosition(),i(this,x)&&ne(this,l,un).call(this,M,H),ne(this,l,ct).call(this),ne(this,l,st).call(this),this.canvas.style.visibility="visible",this.fixDims()}static deserialize(M,H,J){var Oe,ze,Xe;if(M instanceof y.InkAnnotationElement)return null;const oe=super.deserialize(M,H,J);oe.thickness=M.thickness,oe.color=n.Util.makeHexColor(...M.color),oe.opacity=M.opacity;const[ge,Ae]=oe.pageDimensions,_e=oe.width*ge,te=oe.height*Ae,Pe=oe.parentScale,Ce=M.thickness/2;ue(oe,x,!0),ue(oe,S,Math.round(_e)),ue(oe,o,Math.round(te));const{paths:Ue,rect:$e,rotation:He}=M;for(let{bezier:Ee}of Ue){Ee=ne(Oe=ve,U,qn).call(Oe,Ee,$e,He);const ae=[];oe.paths.push(ae);let de=Pe*(Ee[0]-Ce),Me=Pe*(Ee[1]-Ce);for(let Ge=2,z=Ee.length;Ge<z;Ge+=6){const ye=Pe*(Ee[Ge]-Ce),we=Pe*(Ee[Ge+1]-Ce),Ie=Pe*(Ee[Ge+2]-Ce),je=Pe*(Ee[Ge+3]-Ce),Re=Pe*(Ee[Ge+4]-Ce),W=Pe*(Ee[Ge+5]-Ce);ae.push([[de,Me],[ye,we],[Ie,je],[Re,W]]),de=Re,Me=W}const qe=ne(this,U,Gn).call(this,ae);oe.bezierPath2D.push(qe)}const ke=ne(ze=oe,l,pn).call(ze);return ue(oe,a,Math.max(r.AnnotationEditor.MIN_SIZE,ke[2]-ke[0])),ue(oe,v,Math.max(r.AnnotationEditor.MIN_SIZE,ke[3]-ke[1])),ne(Xe=oe,l,un).call(Xe,_e,te),oe}serialize(){if(this.isEmpty())return null;const M=this.getRect(0,0),H=r.AnnotationEditor._colorManager.convert(this.ctx.strokeStyle);return{annotationType:n.AnnotationEditorType.INK,color:H,thickness:this.thickness,opacity:this.opacity,paths:ne(this,l,Xn).call(this,this.scaleFactor/this.parentScale,this.translationX,this.translationY,M),pageIndex:this.pageIndex,rect:M,rotation:this.rotation,structTreeParentId:this._structTreeParentId}}};v=new WeakMap,a=new WeakMap,w=new WeakMap,k=new WeakMap,b=new WeakMap,A=new WeakMap,P=new WeakMap,x=new WeakMap,f=new WeakMap,E=new WeakMap,F=new WeakMap,S=new WeakMap,o=new WeakMap,p=new WeakMap,l=new WeakSet,In=function(M){const H=this.thickness;this.addCommands({cmd:()=>{this.thickness=M,ne(this,l,dt).call(this)},undo:()=>{this.thickness=H,ne(this,l,dt).call(this)},mustExec:!0,type:n.AnnotationEditorParamsType.INK_THICKNESS,overwriteIfSameType:!0,keepUndo:!0})},Nn=function(M){const H=this.color;this.addCommands({cmd:()=>{this.color=M,ne(this,l,st).call(this)},undo:()=>{this.color=H,ne(this,l,st).call(this)},mustExec:!0,type:n.AnnotationEditorParamsType.INK_COLOR,overwriteIfSameType:!0,keepUndo:!0})},jn=function(M){M/=100;const H=this.opacity;this.addCommands({cmd:()=>{this.opacity=M,ne(this,l,st).call(this)},undo:()=>{this.opacity=H,ne(this,l,st).call(this)},mustExec:!0,type:n.AnnotationEditorParamsType.INK_OPACITY,overwriteIfSameType:!0,keepUndo:!0})},$n=function(){const{parentRotation:M,parentDimensions:[H,J]}=this;switch(M){case 90:return[0,J,J,H];case 180:return[H,J,H,J];case 270:return[H,0,J,H];default:return[0,0,H,J]}},ln=function(){const{ctx:M,color:H,opacity:J,thickness:oe,parentScale:ge,scaleFactor:Ae}=this;M.lineWidth=oe*ge/Ae,M.lineCap="round",M.lineJoin="round",M.miterLimit=10,M.strokeStyle=`${H}${(0,O.opacityToHex)(J)}`},Bn=function(M,H){this.canvas.addEventListener("contextmenu",C.noContextMenu),this.canvas.addEventListener("pointerleave",i(this,k)),this.canvas.addEventListener("pointermove",i(this,w)),this.canvas.addEventListener("pointerup",i(this,b)),this.canvas.removeEventListener("pointerdown",i(this,A)),this.isEditing=!0,i(this,E)||(ue(this,E,!0),ne(this,l,ct).call(this),this.thickness||(this.thickness=ve._defaultThickness),this.color||(this.color=ve._defaultColor||r.AnnotationEditor._defaultLineColor),this.opacity??(this.opacity=ve._defaultOpacity)),this.currentPath.push([M,H]),ue(this,f,!1),ne(this,l,ln).call(this),ue(this,p,()=>{ne(this,l,Hn).call(this),i(this,p)&&window.requestAnimationFrame(i(this,p))}),window.requestAnimationFrame(i(this,p))},cn=function(M,H){const[J,oe]=this.currentPath.at(-1);if(this.currentPath.length>1&&M===J&&H===oe)return;const ge=this.currentPath;let Ae=i(this,P);if(ge.push([M,H]),ue(this,f,!0),ge.length<=2){Ae.moveTo(...ge[0]),Ae.lineTo(M,H);return}ge.length===3&&(ue(this,P,Ae=new Path2D),Ae.moveTo(...ge[0])),ne(this,l,zn).call(this,Ae,...ge.at(-3),...ge.at(-2),M,H)},Un=function(){if(this.currentPath.length===0)return;const M=this.currentPath.at(-1);i(this,P).lineTo(...M)},Wn=function(M,H){ue(this,p,null),M=Math.min(Math.max(M,0),this.canvas.width),H=Math.min(Math.max(H,0),this.canvas.height),ne(this,l,cn).call(this,M,H),ne(this,l,Un).call(this);let J;if(this.currentPath.length!==1)J=ne(this,l,Vn).call(this);else{const te=[M,H];J=[[te,te.slice(),te.slice(),te]]}const oe=i(this,P),ge=this.currentPath;this.currentPath=[],ue(this,P,new Path2D);const Ae=()=>{this.allRawPaths.push(ge),this.paths.push(J),this.bezierPath2D.push(oe),this.rebuild()},_e=()=>{this.allRawPaths.pop(),this.paths.pop(),this.bezierPath2D.pop(),this.paths.length===0?this.remove():(this.canvas||(ne(this,l,Tt).call(this),ne(this,l,Rt).call(this)),ne(this,l,dt).call(this))};this.addCommands({cmd:Ae,undo:_e,mustExec:!0})},Hn=function(){if(!i(this,f))return;ue(this,f,!1);const M=Math.ceil(this.thickness*this.parentScale),H=this.currentPath.slice(-3),J=H.map(Ae=>Ae[0]),oe=H.map(Ae=>Ae[1]);Math.min(...J)-M,Math.max(...J)+M,Math.min(...oe)-M,Math.max(...oe)+M;const{ctx:ge}=this;ge.save(),ge.clearRect(0,0,this.canvas.width,this.canvas.height);for(const Ae of this.bezierPath2D)ge.stroke(Ae);ge.stroke(i(this,P)),ge.restore()},zn=function(M,H,J,oe,ge,Ae,_e){const te=(H+oe)/2,Pe=(J+ge)/2,Ce=(oe+Ae)/2,Ue=(ge+_e)/2;M.bezierCurveTo(te+2*(oe-te)/3,Pe+2*(ge-Pe)/3,Ce+2*(oe-Ce)/3,Ue+2*(ge-Ue)/3,Ce,Ue)},Vn=function(){const M=this.currentPath;if(M.length<=2)return[[M[0],M[0],M.at(-1),M.at(-1)]];const H=[];let J,[oe,ge]=M[0];for(J=1;J<M.length-2;J++){const[$e,He]=M[J],[ke,Oe]=M[J+1],ze=($e+ke)/2,Xe=(He+Oe)/2,Ee=[oe+2*($e-oe)/3,ge+2*(He-ge)/3],ae=[ze+2*($e-ze)/3,Xe+2*(He-Xe)/3];H.push([[oe,ge],Ee,ae,[ze,Xe]]),[oe,ge]=[ze,Xe]}const[Ae,_e]=M[J],[te,Pe]=M[J+1],Ce=[oe+2*(Ae-oe)/3,ge+2*(_e-ge)/3],Ue=[te+2*(Ae-te)/3,Pe+2*(_e-Pe)/3];return H.push([[oe,ge],Ce,Ue,[te,Pe]]),H},st=function(){if(this.isEmpty()){ne(this,l,kt).call(this);return}ne(this,l,ln).call(this);const{canvas:M,ctx:H}=this;H.setTransform(1,0,0,1,0,0),H.clearRect(0,0,M.width,M.height),ne(this,l,kt).call(this);for(const J of this.bezierPath2D)H.stroke(J)},dn=function(M){this.canvas.removeEventListener("pointerleave",i(this,k)),this.canvas.removeEventListener("pointermove",i(this,w)),this.canvas.removeEventListener("pointerup",i(this,b)),this.canvas.addEventListener("pointerdown",i(this,A)),setTimeout(()=>{this.canvas.removeEventListener("contextmenu",C.noContextMenu)},10),ne(this,l,Wn).call(this,M.offsetX,M.offsetY),this.addToAnnotationStorage(),this.setInBackground()},Tt=function(){this.canvas=document.createElement("canvas"),this.canvas.width=this.canvas.height=0,this.canvas.className="inkEditorCanvas",r.AnnotationEditor._l10nPromise.get("editor_ink_canvas_aria_label").then(M=>{var H;return(H=this.canvas)==null?void 0:H.setAttribute("aria-label",M)}),this.div.append(this.canvas),this.ctx=this.canvas.getContext("2d")},Rt=function(){ue(this,F,new ResizeObserver(M=>{const H=M[0].contentRect;H.width&&H.height&&this.setDimensions(H.width,H.height)})),i(this,F).observe(this.div)},ct=function(){if(!i(this,E))return;const[M,H]=this.parentDimensions;this.canvas.width=Math.ceil(this.width*M),this.canvas.height=Math.ceil(this.height*H),ne(this,l,kt).call(this)},un=function(M,H){const J=ne(this,l,Mt).call(this),oe=(M-J)/i(this,a),ge=(H-J)/i(this,v);this.scaleFactor=Math.min(oe,ge)},kt=function(){const M=ne(this,l,Mt).call(this)/2;this.ctx.setTransform(this.scaleFactor,0,0,this.scaleFactor,this.translationX*this.scaleFactor+M,this.translationY*this.scaleFactor+M)},U=new WeakSet,Gn=function(M){const H=new Path2D;for(let J=0,oe=M.length;J<oe;J++){const[ge,Ae,_e,te]=M[J];J===0&&H.moveTo(...ge),H.bezierCurveTo(Ae[0],Ae[1],_e[0],_e[1],te[0],te[1])}return H},hn=function(M,H,J){const[oe,ge,Ae,_e]=H;switch(J){case 0:for(let te=0,Pe=M.length;te<Pe;te+=2)M[te]+=oe,M[te+1]=_e-M[te+1];break;case 90:for(let te=0,Pe=M.length;te<Pe;te+=2){const Ce=M[te];M[te]=M[te+1]+oe,M[te+1]=Ce+ge}break;case 180:for(let te=0,Pe=M.length;te<Pe;te+=2)M[te]=Ae-M[te],M[te+1]+=ge;break;case 270:for(let te=0,Pe=M.length;te<Pe;te+=2){const Ce=M[te];M[te]=Ae-M[te+1],M[te+1]=_e-Ce}break;default:throw new Error("Invalid rotation")}return M},qn=function(M,H,J){const[oe,ge,Ae,_e]=H;switch(J){case 0:for(let te=0,Pe=M.length;te<Pe;te+=2)M[te]-=oe,M[te+1]=_e-M[te+1];break;case 90:for(let te=0,Pe=M.length;te<Pe;te+=2){const Ce=M[te];M[te]=M[te+1]-ge,M[te+1]=Ce-oe}break;case 180:for(let te=0,Pe=M.length;te<Pe;te+=2)M[te]=Ae-M[te],M[te+1]-=ge;break;case 270:for(let te=0,Pe=M.length;te<Pe;te+=2){const Ce=M[te];M[te]=_e-M[te+1],M[te+1]=Ae-Ce}break;default:throw new Error("Invalid rotation")}return M},Xn=function(M,H,J,oe){var Pe,Ce;const ge=[],Ae=this.thickness/2,_e=M*H+Ae,te=M*J+Ae;for(const Ue of this.paths){const $e=[],He=[];for(let ke=0,Oe=Ue.length;ke<Oe;ke++){const[ze,Xe,Ee,ae]=Ue[ke],de=M*ze[0]+_e,Me=M*ze[1]+te,qe=M*Xe[0]+_e,Ge=M*Xe[1]+te,z=M*Ee[0]+_e,ye=M*Ee[1]+te,we=M*ae[0]+_e,Ie=M*ae[1]+te;ke===0&&($e.push(de,Me),He.push(de,Me)),$e.push(qe,Ge,z,ye,we,Ie),He.push(qe,Ge),ke===Oe-1&&He.push(we,Ie)}ge.push({bezier:ne(Pe=ve,U,hn).call(Pe,$e,oe,this.rotation),points:ne(Ce=ve,U,hn).call(Ce,He,oe,this.rotation)})}return ge},pn=function(){let M=1/0,H=-1/0,J=1/0,oe=-1/0;for(const ge of this.paths)for(const[Ae,_e,te,Pe]of ge){const Ce=n.Util.bezierBoundingBox(...Ae,..._e,...te,...Pe);M=Math.min(M,Ce[0]),J=Math.min(J,Ce[1]),H=Math.max(H,Ce[2]),oe=Math.max(oe,Ce[3])}return[M,J,H,oe]},Mt=function(){return i(this,x)?Math.ceil(this.thickness*this.parentScale):0},dt=function(M=!1){if(this.isEmpty())return;if(!i(this,x)){ne(this,l,st).call(this);return}const H=ne(this,l,pn).call(this),J=ne(this,l,Mt).call(this);ue(this,a,Math.max(r.AnnotationEditor.MIN_SIZE,H[2]-H[0])),ue(this,v,Math.max(r.AnnotationEditor.MIN_SIZE,H[3]-H[1]));const oe=Math.ceil(J+i(this,a)*this.scaleFactor),ge=Math.ceil(J+i(this,v)*this.scaleFactor),[Ae,_e]=this.parentDimensions;this.width=oe/Ae,this.height=ge/_e,this.setAspectRatio(oe,ge);const te=this.translationX,Pe=this.translationY;this.translationX=-H[0],this.translationY=-H[1],ne(this,l,ct).call(this),ne(this,l,st).call(this),ue(this,S,oe),ue(this,o,ge),this.setDims(oe,ge);const Ce=M?J/this.scaleFactor/2:0;this.translate(te-this.translationX-Ce,Pe-this.translationY-Ce)},ce(ve,U),Qe(ve,"_defaultColor",null),Qe(ve,"_defaultOpacity",1),Qe(ve,"_defaultThickness",1),Qe(ve,"_type","ink");let h=ve;e.InkEditor=h},(t,e,s)=>{var h,v,a,w,k,b,A,P,x,f,E,vt,yt,Ft,fn,Yn,Kn,gn,Ot,Jn;Object.defineProperty(e,"__esModule",{value:!0}),e.StampEditor=void 0;var n=s(1),r=s(4),y=s(6),C=s(29);const R=class R extends r.AnnotationEditor{constructor(G){super({...G,name:"stampEditor"});ce(this,E);ce(this,h,null);ce(this,v,null);ce(this,a,null);ce(this,w,null);ce(this,k,null);ce(this,b,null);ce(this,A,null);ce(this,P,null);ce(this,x,!1);ce(this,f,!1);ue(this,w,G.bitmapUrl),ue(this,k,G.bitmapFile)}static initialize(G){r.AnnotationEditor.initialize(G)}static get supportedTypes(){const G=["apng","avif","bmp","gif","jpeg","png","svg+xml","webp","x-icon"];return(0,n.shadow)(this,"supportedTypes",G.map(q=>`image/${q}`))}static get supportedTypesStr(){return(0,n.shadow)(this,"supportedTypesStr",this.supportedTypes.join(","))}static isHandlingMimeForPasting(G){return this.supportedTypes.includes(G)}static paste(G,q){q.pasteEditor(n.AnnotationEditorType.STAMP,{bitmapFile:G.getAsFile()})}remove(){var G,q;i(this,v)&&(ue(this,h,null),this._uiManager.imageManager.deleteId(i(this,v)),(G=i(this,b))==null||G.remove(),ue(this,b,null),(q=i(this,A))==null||q.disconnect(),ue(this,A,null)),super.remove()}rebuild(){if(!this.parent){i(this,v)&&ne(this,E,Ft).call(this);return}super.rebuild(),this.div!==null&&(i(this,v)&&ne(this,E,Ft).call(this),this.isAttachedToDOM||this.parent.add(this))}onceAdded(){this._isDraggable=!0,this.div.focus()}isEmpty(){return!(i(this,a)||i(this,h)||i(this,w)||i(this,k))}get isResizable(){return!0}render(){if(this.div)return this.div;let G,q;if(this.width&&(G=this.x,q=this.y),super.render(),this.div.hidden=!0,i(this,h)?ne(this,E,fn).call(this):ne(this,E,Ft).call(this),this.width){const[V,se]=this.parentDimensions;this.setAt(G*V,q*se,this.width*V,this.height*se)}return this.div}static deserialize(G,q,V){if(G instanceof C.StampAnnotationElement)return null;const se=super.deserialize(G,q,V),{rect:D,bitmapUrl:X,bitmapId:re,isSvg:N,accessibilityData:d}=G;re&&V.imageManager.isValidId(re)?ue(se,v,re):ue(se,w,X),ue(se,x,N);const[u,T]=se.pageDimensions;return se.width=(D[2]-D[0])/u,se.height=(D[3]-D[1])/T,d&&(se.altTextData=d),se}serialize(G=!1,q=null){if(this.isEmpty())return null;const V={annotationType:n.AnnotationEditorType.STAMP,bitmapId:i(this,v),pageIndex:this.pageIndex,rect:this.getRect(0,0),rotation:this.rotation,isSvg:i(this,x),structTreeParentId:this._structTreeParentId};if(G)return V.bitmapUrl=ne(this,E,Ot).call(this,!0),V.accessibilityData=this.altTextData,V;const{decorative:se,altText:D}=this.altTextData;if(!se&&D&&(V.accessibilityData={type:"Figure",alt:D}),q===null)return V;q.stamps||(q.stamps=new Map);const X=i(this,x)?(V.rect[2]-V.rect[0])*(V.rect[3]-V.rect[1]):null;if(!q.stamps.has(i(this,v)))q.stamps.set(i(this,v),{area:X,serialized:V}),V.bitmap=ne(this,E,Ot).call(this,!1);else if(i(this,x)){const re=q.stamps.get(i(this,v));X>re.area&&(re.area=X,re.serialized.bitmap.close(),re.serialized.bitmap=ne(this,E,Ot).call(this,!1))}return V}};h=new WeakMap,v=new WeakMap,a=new WeakMap,w=new WeakMap,k=new WeakMap,b=new WeakMap,A=new WeakMap,P=new WeakMap,x=new WeakMap,f=new WeakMap,E=new WeakSet,vt=function(G,q=!1){if(!G){this.remove();return}ue(this,h,G.bitmap),q||(ue(this,v,G.id),ue(this,x,G.isSvg)),ne(this,E,fn).call(this)},yt=function(){ue(this,a,null),this._uiManager.enableWaiting(!1),i(this,b)&&this.div.focus()},Ft=function(){if(i(this,v)){this._uiManager.enableWaiting(!0),this._uiManager.imageManager.getFromId(i(this,v)).then(q=>ne(this,E,vt).call(this,q,!0)).finally(()=>ne(this,E,yt).call(this));return}if(i(this,w)){const q=i(this,w);ue(this,w,null),this._uiManager.enableWaiting(!0),ue(this,a,this._uiManager.imageManager.getFromUrl(q).then(V=>ne(this,E,vt).call(this,V)).finally(()=>ne(this,E,yt).call(this)));return}if(i(this,k)){const q=i(this,k);ue(this,k,null),this._uiManager.enableWaiting(!0),ue(this,a,this._uiManager.imageManager.getFromFile(q).then(V=>ne(this,E,vt).call(this,V)).finally(()=>ne(this,E,yt).call(this)));return}const G=document.createElement("input");G.type="file",G.accept=R.supportedTypesStr,ue(this,a,new Promise(q=>{G.addEventListener("change",async()=>{if(!G.files||G.files.length===0)this.remove();else{this._uiManager.enableWaiting(!0);const V=await this._uiManager.imageManager.getFromFile(G.files[0]);ne(this,E,vt).call(this,V)}q()}),G.addEventListener("cancel",()=>{this.remove(),q()})}).finally(()=>ne(this,E,yt).call(this))),G.click()},fn=function(){const{div:G}=this;let{width:q,height:V}=i(this,h);const[se,D]=this.pageDimensions,X=.75;if(this.width)q=this.width*se,V=this.height*D;else if(q>X*se||V>X*D){const u=Math.min(X*se/q,X*D/V);q*=u,V*=u}const[re,N]=this.parentDimensions;this.setDims(q*re/se,V*N/D),this._uiManager.enableWaiting(!1);const d=ue(this,b,document.createElement("canvas"));G.append(d),G.hidden=!1,ne(this,E,gn).call(this,q,V),ne(this,E,Jn).call(this),i(this,f)||(this.parent.addUndoableEditor(this),ue(this,f,!0)),this._uiManager._eventBus.dispatch("reporttelemetry",{source:this,details:{type:"editing",subtype:this.editorType,data:{action:"inserted_image"}}}),this.addAltTextButton()},Yn=function(G,q){var X;const[V,se]=this.parentDimensions;this.width=G/V,this.height=q/se,this.setDims(G,q),(X=this._initialOptions)!=null&&X.isCentered?this.center():this.fixAndSetPosition(),this._initialOptions=null,i(this,P)!==null&&clearTimeout(i(this,P)),ue(this,P,setTimeout(()=>{ue(this,P,null),ne(this,E,gn).call(this,G,q)},200))},Kn=function(G,q){const{width:V,height:se}=i(this,h);let D=V,X=se,re=i(this,h);for(;D>2*G||X>2*q;){const N=D,d=X;D>2*G&&(D=D>=16384?Math.floor(D/2)-1:Math.ceil(D/2)),X>2*q&&(X=X>=16384?Math.floor(X/2)-1:Math.ceil(X/2));const u=new OffscreenCanvas(D,X);u.getContext("2d").drawImage(re,0,0,N,d,0,0,D,X),re=u.transferToImageBitmap()}return re},gn=function(G,q){G=Math.ceil(G),q=Math.ceil(q);const V=i(this,b);if(!V||V.width===G&&V.height===q)return;V.width=G,V.height=q;const se=i(this,x)?i(this,h):ne(this,E,Kn).call(this,G,q),D=V.getContext("2d");D.filter=this._uiManager.hcmFilter,D.drawImage(se,0,0,se.width,se.height,0,0,G,q)},Ot=function(G){if(G){if(i(this,x)){const se=this._uiManager.imageManager.getSvgUrl(i(this,v));if(se)return se}const q=document.createElement("canvas");return{width:q.width,height:q.height}=i(this,h),q.getContext("2d").drawImage(i(this,h),0,0),q.toDataURL()}if(i(this,x)){const[q,V]=this.pageDimensions,se=Math.round(this.width*q*y.PixelsPerInch.PDF_TO_CSS_UNITS),D=Math.round(this.height*V*y.PixelsPerInch.PDF_TO_CSS_UNITS),X=new OffscreenCanvas(se,D);return X.getContext("2d").drawImage(i(this,h),0,0,i(this,h).width,i(this,h).height,0,0,se,D),X.transferToImageBitmap()}return structuredClone(i(this,h))},Jn=function(){ue(this,A,new ResizeObserver(G=>{const q=G[0].contentRect;q.width&&q.height&&ne(this,E,Yn).call(this,q.width,q.height)})),i(this,A).observe(this.div)},Qe(R,"_type","stamp");let O=R;e.StampEditor=O}],__webpack_module_cache__={};function __w_pdfjs_require__(t){var e=__webpack_module_cache__[t];if(e!==void 0)return e.exports;var s=__webpack_module_cache__[t]={exports:{}};return __webpack_modules__[t](s,s.exports,__w_pdfjs_require__),s.exports}var __webpack_exports__={};return(()=>{var t=__webpack_exports__;Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"AbortException",{enumerable:!0,get:function(){return e.AbortException}}),Object.defineProperty(t,"AnnotationEditorLayer",{enumerable:!0,get:function(){return y.AnnotationEditorLayer}}),Object.defineProperty(t,"AnnotationEditorParamsType",{enumerable:!0,get:function(){return e.AnnotationEditorParamsType}}),Object.defineProperty(t,"AnnotationEditorType",{enumerable:!0,get:function(){return e.AnnotationEditorType}}),Object.defineProperty(t,"AnnotationEditorUIManager",{enumerable:!0,get:function(){return C.AnnotationEditorUIManager}}),Object.defineProperty(t,"AnnotationLayer",{enumerable:!0,get:function(){return O.AnnotationLayer}}),Object.defineProperty(t,"AnnotationMode",{enumerable:!0,get:function(){return e.AnnotationMode}}),Object.defineProperty(t,"CMapCompressionType",{enumerable:!0,get:function(){return e.CMapCompressionType}}),Object.defineProperty(t,"DOMSVGFactory",{enumerable:!0,get:function(){return n.DOMSVGFactory}}),Object.defineProperty(t,"FeatureTest",{enumerable:!0,get:function(){return e.FeatureTest}}),Object.defineProperty(t,"GlobalWorkerOptions",{enumerable:!0,get:function(){return h.GlobalWorkerOptions}}),Object.defineProperty(t,"ImageKind",{enumerable:!0,get:function(){return e.ImageKind}}),Object.defineProperty(t,"InvalidPDFException",{enumerable:!0,get:function(){return e.InvalidPDFException}}),Object.defineProperty(t,"MissingPDFException",{enumerable:!0,get:function(){return e.MissingPDFException}}),Object.defineProperty(t,"OPS",{enumerable:!0,get:function(){return e.OPS}}),Object.defineProperty(t,"PDFDataRangeTransport",{enumerable:!0,get:function(){return s.PDFDataRangeTransport}}),Object.defineProperty(t,"PDFDateString",{enumerable:!0,get:function(){return n.PDFDateString}}),Object.defineProperty(t,"PDFWorker",{enumerable:!0,get:function(){return s.PDFWorker}}),Object.defineProperty(t,"PasswordResponses",{enumerable:!0,get:function(){return e.PasswordResponses}}),Object.defineProperty(t,"PermissionFlag",{enumerable:!0,get:function(){return e.PermissionFlag}}),Object.defineProperty(t,"PixelsPerInch",{enumerable:!0,get:function(){return n.PixelsPerInch}}),Object.defineProperty(t,"PromiseCapability",{enumerable:!0,get:function(){return e.PromiseCapability}}),Object.defineProperty(t,"RenderingCancelledException",{enumerable:!0,get:function(){return n.RenderingCancelledException}}),Object.defineProperty(t,"SVGGraphics",{enumerable:!0,get:function(){return s.SVGGraphics}}),Object.defineProperty(t,"UnexpectedResponseException",{enumerable:!0,get:function(){return e.UnexpectedResponseException}}),Object.defineProperty(t,"Util",{enumerable:!0,get:function(){return e.Util}}),Object.defineProperty(t,"VerbosityLevel",{enumerable:!0,get:function(){return e.VerbosityLevel}}),Object.defineProperty(t,"XfaLayer",{enumerable:!0,get:function(){return v.XfaLayer}}),Object.defineProperty(t,"build",{enumerable:!0,get:function(){return s.build}}),Object.defineProperty(t,"createValidAbsoluteUrl",{enumerable:!0,get:function(){return e.createValidAbsoluteUrl}}),Object.defineProperty(t,"getDocument",{enumerable:!0,get:function(){return s.getDocument}}),Object.defineProperty(t,"getFilenameFromUrl",{enumerable:!0,get:function(){return n.getFilenameFromUrl}}),Object.defineProperty(t,"getPdfFilenameFromUrl",{enumerable:!0,get:function(){return n.getPdfFilenameFromUrl}}),Object.defineProperty(t,"getXfaPageViewport",{enumerable:!0,get:function(){return n.getXfaPageViewport}}),Object.defineProperty(t,"isDataScheme",{enumerable:!0,get:function(){return n.isDataScheme}}),Object.defineProperty(t,"isPdfFile",{enumerable:!0,get:function(){return n.isPdfFile}}),Object.defineProperty(t,"loadScript",{enumerable:!0,get:function(){return n.loadScript}}),Object.defineProperty(t,"noContextMenu",{enumerable:!0,get:function(){return n.noContextMenu}}),Object.defineProperty(t,"normalizeUnicode",{enumerable:!0,get:function(){return e.normalizeUnicode}}),Object.defineProperty(t,"renderTextLayer",{enumerable:!0,get:function(){return r.renderTextLayer}}),Object.defineProperty(t,"setLayerDimensions",{enumerable:!0,get:function(){return n.setLayerDimensions}}),Object.defineProperty(t,"shadow",{enumerable:!0,get:function(){return e.shadow}}),Object.defineProperty(t,"updateTextLayer",{enumerable:!0,get:function(){return r.updateTextLayer}}),Object.defineProperty(t,"version",{enumerable:!0,get:function(){return s.version}});var e=__w_pdfjs_require__(1),s=__w_pdfjs_require__(2),n=__w_pdfjs_require__(6),r=__w_pdfjs_require__(26),y=__w_pdfjs_require__(27),C=__w_pdfjs_require__(5),O=__w_pdfjs_require__(29),h=__w_pdfjs_require__(14),v=__w_pdfjs_require__(32)})(),__webpack_exports__})())})(pdf$1);var pdfExports=pdf$1.exports;const pdf=getDefaultExportFromCjs(pdfExports),pdfjsModule=_mergeNamespaces({__proto__:null,default:pdf},[pdfExports]),pdfjs="default"in pdfjsModule?pdf:pdfjsModule;var __spreadArray=function(t,e,s){if(s||arguments.length===2)for(var n=0,r=e.length,y;n<r;n++)(y||!(n in e))&&(y||(y=Array.prototype.slice.call(e,0,n)),y[n]=e[n]);return t.concat(y||Array.prototype.slice.call(e))},clipboardEvents=["onCopy","onCut","onPaste"],compositionEvents=["onCompositionEnd","onCompositionStart","onCompositionUpdate"],focusEvents=["onFocus","onBlur"],formEvents=["onInput","onInvalid","onReset","onSubmit"],imageEvents=["onLoad","onError"],keyboardEvents=["onKeyDown","onKeyPress","onKeyUp"],mediaEvents=["onAbort","onCanPlay","onCanPlayThrough","onDurationChange","onEmptied","onEncrypted","onEnded","onError","onLoadedData","onLoadedMetadata","onLoadStart","onPause","onPlay","onPlaying","onProgress","onRateChange","onSeeked","onSeeking","onStalled","onSuspend","onTimeUpdate","onVolumeChange","onWaiting"],mouseEvents=["onClick","onContextMenu","onDoubleClick","onMouseDown","onMouseEnter","onMouseLeave","onMouseMove","onMouseOut","onMouseOver","onMouseUp"],dragEvents=["onDrag","onDragEnd","onDragEnter","onDragExit","onDragLeave","onDragOver","onDragStart","onDrop"],selectionEvents=["onSelect"],touchEvents=["onTouchCancel","onTouchEnd","onTouchMove","onTouchStart"],pointerEvents=["onPointerDown","onPointerMove","onPointerUp","onPointerCancel","onGotPointerCapture","onLostPointerCapture","onPointerEnter","onPointerLeave","onPointerOver","onPointerOut"],uiEvents=["onScroll"],wheelEvents=["onWheel"],animationEvents=["onAnimationStart","onAnimationEnd","onAnimationIteration"],transitionEvents=["onTransitionEnd"],otherEvents=["onToggle"],changeEvents=["onChange"],allEvents=__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray(__spreadArray([],clipboardEvents,!0),compositionEvents,!0),focusEvents,!0),formEvents,!0),imageEvents,!0),keyboardEvents,!0),mediaEvents,!0),mouseEvents,!0),dragEvents,!0),selectionEvents,!0),touchEvents,!0),pointerEvents,!0),uiEvents,!0),wheelEvents,!0),animationEvents,!0),transitionEvents,!0),changeEvents,!0),otherEvents,!0);function makeEventProps(t,e){var s={};return allEvents.forEach(function(n){var r=t[n];r&&(e?s[n]=function(y){return r(y,e(n))}:s[n]=r)}),s}function makeCancellablePromise(t){var e=!1,s=new Promise(function(n,r){t.then(function(y){return!e&&n(y)}).catch(function(y){return!e&&r(y)})});return{promise:s,cancel:function(){e=!0}}}var prefix="Invariant failed";function invariant(t,e){if(!t)throw new Error(prefix)}var warning=function(){},warning_1=warning;const warning$1=getDefaultExportFromCjs(warning_1);var has=Object.prototype.hasOwnProperty;function find(t,e,s){for(s of t.keys())if(dequal(s,e))return s}function dequal(t,e){var s,n,r;if(t===e)return!0;if(t&&e&&(s=t.constructor)===e.constructor){if(s===Date)return t.getTime()===e.getTime();if(s===RegExp)return t.toString()===e.toString();if(s===Array){if((n=t.length)===e.length)for(;n--&&dequal(t[n],e[n]););return n===-1}if(s===Set){if(t.size!==e.size)return!1;for(n of t)if(r=n,r&&typeof r=="object"&&(r=find(e,r),!r)||!e.has(r))return!1;return!0}if(s===Map){if(t.size!==e.size)return!1;for(n of t)if(r=n[0],r&&typeof r=="object"&&(r=find(e,r),!r)||!dequal(n[1],e.get(r)))return!1;return!0}if(s===ArrayBuffer)t=new Uint8Array(t),e=new Uint8Array(e);else if(s===DataView){if((n=t.byteLength)===e.byteLength)for(;n--&&t.getInt8(n)===e.getInt8(n););return n===-1}if(ArrayBuffer.isView(t)){if((n=t.byteLength)===e.byteLength)for(;n--&&t[n]===e[n];);return n===-1}if(!s||typeof t=="object"){n=0;for(s in t)if(has.call(t,s)&&++n&&!has.call(e,s)||!(s in e)||!dequal(t[s],e[s]))return!1;return Object.keys(e).length===n}}return t!==t&&e!==e}const DocumentContext=reactExports.createContext(null);function Message({children:t,type:e}){return React$1.createElement("div",{className:`react-pdf__message react-pdf__message--${e}`},t)}const DEFAULT_LINK_REL="noopener noreferrer nofollow";class LinkService{constructor(){this.externalLinkEnabled=!0,this.externalLinkRel=void 0,this.externalLinkTarget=void 0,this.isInPresentationMode=!1,this.pdfDocument=void 0,this.pdfViewer=void 0}setDocument(e){this.pdfDocument=e}setViewer(e){this.pdfViewer=e}setExternalLinkRel(e){this.externalLinkRel=e}setExternalLinkTarget(e){this.externalLinkTarget=e}setHistory(){}get pagesCount(){return this.pdfDocument?this.pdfDocument.numPages:0}get page(){return invariant(this.pdfViewer),this.pdfViewer.currentPageNumber||0}set page(e){invariant(this.pdfViewer),this.pdfViewer.currentPageNumber=e}get rotation(){return 0}set rotation(e){}goToDestination(e){return new Promise(s=>{invariant(this.pdfDocument),invariant(e),typeof e=="string"?this.pdfDocument.getDestination(e).then(s):Array.isArray(e)?s(e):e.then(s)}).then(s=>{invariant(Array.isArray(s));const n=s[0];new Promise(r=>{invariant(this.pdfDocument),n instanceof Object?this.pdfDocument.getPageIndex(n).then(y=>{r(y)}).catch(()=>{invariant(!1)}):typeof n=="number"?r(n):invariant(!1)}).then(r=>{const y=r+1;invariant(this.pdfViewer),invariant(y>=1&&y<=this.pagesCount),this.pdfViewer.scrollPageIntoView({dest:s,pageIndex:r,pageNumber:y})})})}navigateTo(e){this.goToDestination(e)}goToPage(e){const s=e-1;invariant(this.pdfViewer),invariant(e>=1&&e<=this.pagesCount),this.pdfViewer.scrollPageIntoView({pageIndex:s,pageNumber:e})}addLinkAttributes(e,s,n){e.href=s,e.rel=this.externalLinkRel||DEFAULT_LINK_REL,e.target=n?"_blank":this.externalLinkTarget||""}getDestinationHash(){return"#"}getAnchorUrl(){return"#"}setHash(){}executeNamedAction(){}cachePageRef(){}isPageVisible(){return!0}isPageCached(){return!0}executeSetOCGState(){}}const PasswordResponses={NEED_PASSWORD:1,INCORRECT_PASSWORD:2},isBrowser=typeof document<"u",isLocalFileSystem=isBrowser&&window.location.protocol==="file:";function isDefined(t){return typeof t<"u"}function isProvided(t){return isDefined(t)&&t!==null}function isString(t){return typeof t=="string"}function isArrayBuffer(t){return t instanceof ArrayBuffer}function isBlob(t){return invariant(isBrowser),t instanceof Blob}function isDataURI(t){return isString(t)&&/^data:/.test(t)}function dataURItoByteString(t){invariant(isDataURI(t));const[e="",s=""]=t.split(",");return e.split(";").indexOf("base64")!==-1?atob(s):unescape(s)}function getDevicePixelRatio(){return isBrowser&&window.devicePixelRatio||1}const allowFileAccessFromFilesTip="On Chromium based browsers, you can use --allow-file-access-from-files flag for debugging purposes.";function displayCORSWarning(){warning$1(!isLocalFileSystem,`Loading PDF as base64 strings/URLs may not work on protocols other than HTTP/HTTPS. ${allowFileAccessFromFilesTip}`)}function displayWorkerWarning(){warning$1(!isLocalFileSystem,`Loading PDF.js worker may not work on protocols other than HTTP/HTTPS. ${allowFileAccessFromFilesTip}`)}function cancelRunningTask(t){t&&t.cancel&&t.cancel()}function makePageCallback(t,e){return Object.defineProperty(t,"width",{get(){return this.view[2]*e},configurable:!0}),Object.defineProperty(t,"height",{get(){return this.view[3]*e},configurable:!0}),Object.defineProperty(t,"originalWidth",{get(){return this.view[2]},configurable:!0}),Object.defineProperty(t,"originalHeight",{get(){return this.view[3]},configurable:!0}),t}function isCancelException(t){return t.name==="RenderingCancelledException"}function loadFromFile(t){return new Promise((e,s)=>{const n=new FileReader;n.onload=()=>{if(!n.result)return s(new Error("Error while reading a file."));e(n.result)},n.onerror=r=>{if(!r.target)return s(new Error("Error while reading a file."));const{error:y}=r.target;if(!y)return s(new Error("Error while reading a file."));switch(y.code){case y.NOT_FOUND_ERR:return s(new Error("Error while reading a file: File not found."));case y.SECURITY_ERR:return s(new Error("Error while reading a file: Security error."));case y.ABORT_ERR:return s(new Error("Error while reading a file: Aborted."));default:return s(new Error("Error while reading a file."))}},n.readAsArrayBuffer(t)})}function reducer(t,e){switch(e.type){case"RESOLVE":return{value:e.value,error:void 0};case"REJECT":return{value:!1,error:e.error};case"RESET":return{value:void 0,error:void 0};default:return t}}function useResolver(){return reactExports.useReducer(reducer,{value:void 0,error:void 0})}const{PDFDataRangeTransport:PDFDataRangeTransport$1}=pdfjs,eventProps=(()=>{const t={};return allEvents.forEach(e=>{t[e]=PropTypes.func}),t})(),isTypedArray=PropTypes.oneOfType([PropTypes.instanceOf(Int8Array),PropTypes.instanceOf(Uint8Array),PropTypes.instanceOf(Uint8ClampedArray),PropTypes.instanceOf(Int16Array),PropTypes.instanceOf(Uint16Array),PropTypes.instanceOf(Int32Array),PropTypes.instanceOf(Uint32Array),PropTypes.instanceOf(Float32Array),PropTypes.instanceOf(Float64Array)]),fileTypes=[PropTypes.string,PropTypes.instanceOf(ArrayBuffer),PropTypes.shape({data:PropTypes.oneOfType([PropTypes.string,PropTypes.instanceOf(ArrayBuffer),PropTypes.arrayOf(PropTypes.number.isRequired),isTypedArray]).isRequired}),PropTypes.shape({range:PropTypes.instanceOf(PDFDataRangeTransport$1).isRequired}),PropTypes.shape({url:PropTypes.string.isRequired})];typeof Blob<"u"&&fileTypes.push(PropTypes.instanceOf(Blob));const isClassName=PropTypes.oneOfType([PropTypes.string,PropTypes.arrayOf(PropTypes.string)]),isFile=PropTypes.oneOfType(fileTypes);PropTypes.instanceOf(LinkService);PropTypes.oneOf(["_self","_blank","_parent","_top"]);PropTypes.shape({commonObjs:PropTypes.shape({}).isRequired,getAnnotations:PropTypes.func.isRequired,getTextContent:PropTypes.func.isRequired,getViewport:PropTypes.func.isRequired,render:PropTypes.func.isRequired});const isPageIndex=function t(e,s,n){const{[s]:r,pageNumber:y,pdf:C}=e;if(!isDefined(C))return null;if(isDefined(r)){if(typeof r!="number")return new Error(`\`${s}\` of type \`${typeof r}\` supplied to \`${n}\`, expected \`number\`.`);if(r<0)return new Error(`Expected \`${s}\` to be greater or equal to 0.`);const{numPages:O}=C;if(r+1>O)return new Error(`Expected \`${s}\` to be less or equal to ${O-1}.`)}else if(!isDefined(y))return new Error(`\`${s}\` not supplied. Either pageIndex or pageNumber must be supplied to \`${n}\`.`);return null},isPageNumber=function t(e,s,n){const{[s]:r,pageIndex:y,pdf:C}=e;if(!isDefined(C))return null;if(isDefined(r)){if(typeof r!="number")return new Error(`\`${s}\` of type \`${typeof r}\` supplied to \`${n}\`, expected \`number\`.`);if(r<1)return new Error(`Expected \`${s}\` to be greater or equal to 1.`);const{numPages:O}=C;if(r>O)return new Error(`Expected \`${s}\` to be less or equal to ${O}.`)}else if(!isDefined(y))return new Error(`\`${s}\` not supplied. Either pageIndex or pageNumber must be supplied to \`${n}\`.`);return null},isPdf=PropTypes.oneOfType([PropTypes.any,PropTypes.oneOf([!1])]),isRef=PropTypes.oneOfType([PropTypes.func,PropTypes.exact({current:PropTypes.any})]),isRenderMode=PropTypes.oneOf(["canvas","custom","none","svg"]),isRotate=PropTypes.oneOf([0,90,180,270]);var __awaiter=function(t,e,s,n){function r(y){return y instanceof s?y:new s(function(C){C(y)})}return new(s||(s=Promise))(function(y,C){function O(a){try{v(n.next(a))}catch(w){C(w)}}function h(a){try{v(n.throw(a))}catch(w){C(w)}}function v(a){a.done?y(a.value):r(a.value).then(O,h)}v((n=n.apply(t,e||[])).next())})},__rest$1=function(t,e){var s={};for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&e.indexOf(n)<0&&(s[n]=t[n]);if(t!=null&&typeof Object.getOwnPropertySymbols=="function")for(var r=0,n=Object.getOwnPropertySymbols(t);r<n.length;r++)e.indexOf(n[r])<0&&Object.prototype.propertyIsEnumerable.call(t,n[r])&&(s[n[r]]=t[n[r]]);return s};const{PDFDataRangeTransport}=pdfjs,defaultOnPassword=(t,e)=>{switch(e){case PasswordResponses.NEED_PASSWORD:{const s=prompt("Enter the password to open this PDF file.");t(s);break}case PasswordResponses.INCORRECT_PASSWORD:{const s=prompt("Invalid password. Please try again.");t(s);break}}};function isParameterObject(t){return typeof t=="object"&&t!==null&&("data"in t||"range"in t||"url"in t)}const Document=reactExports.forwardRef(function t(e,s){var{children:n,className:r,error:y="Failed to load PDF file.",externalLinkRel:C,externalLinkTarget:O,file:h,inputRef:v,imageResourcesPath:a,loading:w="Loading PDF…",noData:k="No PDF file specified.",onItemClick:b,onLoadError:A,onLoadProgress:P,onLoadSuccess:x,onPassword:f=defaultOnPassword,onSourceError:E,onSourceSuccess:F,options:S,renderMode:o,rotate:p}=e,l=__rest$1(e,["children","className","error","externalLinkRel","externalLinkTarget","file","inputRef","imageResourcesPath","loading","noData","onItemClick","onLoadError","onLoadProgress","onLoadSuccess","onPassword","onSourceError","onSourceSuccess","options","renderMode","rotate"]);const[g,m]=useResolver(),{value:L,error:c}=g,[R,I]=useResolver(),{value:Q,error:G}=R,q=reactExports.useRef(new LinkService),V=reactExports.useRef([]),se=reactExports.useRef(),D=reactExports.useRef();reactExports.useEffect(()=>{h&&h!==se.current&&isParameterObject(h)&&(warning$1(!dequal(h,se.current),`File prop passed to <Document /> changed, but it's equal to previous one. This might result in unnecessary reloads. Consider memoizing the value passed to "file" prop.`),se.current=h)},[h]),reactExports.useEffect(()=>{S&&S!==D.current&&(warning$1(!dequal(S,D.current),`Options prop passed to <Document /> changed, but it's equal to previous one. This might result in unnecessary reloads. Consider memoizing the value passed to "options" prop.`),D.current=S)},[S]);const X=reactExports.useRef({scrollPageIntoView:Z=>{const{dest:ee,pageNumber:M,pageIndex:H=M-1}=Z;if(b){b({dest:ee,pageIndex:H,pageNumber:M});return}const J=V.current[H];if(J){J.scrollIntoView();return}warning$1(!1,`An internal link leading to page ${M} was clicked, but neither <Document> was provided with onItemClick nor it was able to find the page within itself. Either provide onItemClick to <Document> and handle navigating by yourself or ensure that all pages are rendered within <Document>.`)}});reactExports.useImperativeHandle(s,()=>({linkService:q,pages:V,viewer:X}),[]);function re(){F&&F()}function N(){c&&(warning$1(!1,c.toString()),E&&E(c))}function d(){m({type:"RESET"})}reactExports.useEffect(d,[h,m]);const u=reactExports.useCallback(()=>__awaiter(this,void 0,void 0,function*(){if(!h)return null;if(typeof h=="string")return isDataURI(h)?{data:dataURItoByteString(h)}:(displayCORSWarning(),{url:h});if(h instanceof PDFDataRangeTransport)return{range:h};if(isArrayBuffer(h))return{data:h};if(isBrowser&&isBlob(h))return{data:yield loadFromFile(h)};if(invariant(typeof h=="object"),invariant(isParameterObject(h)),"url"in h&&typeof h.url=="string"){if(isDataURI(h.url)){const{url:Z}=h,ee=__rest$1(h,["url"]),M=dataURItoByteString(Z);return Object.assign({data:M},ee)}displayCORSWarning()}return h}),[h]);reactExports.useEffect(()=>{const Z=makeCancellablePromise(u());return Z.promise.then(ee=>{m({type:"RESOLVE",value:ee})}).catch(ee=>{m({type:"REJECT",error:ee})}),()=>{cancelRunningTask(Z)}},[u,m]),reactExports.useEffect(()=>{if(!(typeof L>"u")){if(L===!1){N();return}re()}},[L]);function T(){Q&&(x&&x(Q),V.current=new Array(Q.numPages),q.current.setDocument(Q))}function $(){G&&(warning$1(!1,G.toString()),A&&A(G))}function U(){I({type:"RESET"})}reactExports.useEffect(U,[I,L]);function B(){if(!L)return;const Z=Object.assign(Object.assign({},S),{isEvalSupported:!1}),ee=Object.assign(Object.assign({},L),Z),M=pdfjs.getDocument(ee);P&&(M.onProgress=P),f&&(M.onPassword=f);const H=M;return H.promise.then(J=>{I({type:"RESOLVE",value:J})}).catch(J=>{H.destroyed||I({type:"REJECT",error:J})}),()=>{H.destroy()}}reactExports.useEffect(B,[S,I,L]),reactExports.useEffect(()=>{if(!(typeof Q>"u")){if(Q===!1){$();return}T()}},[Q]);function Y(){q.current.setViewer(X.current),q.current.setExternalLinkRel(C),q.current.setExternalLinkTarget(O)}reactExports.useEffect(Y,[C,O]);function ie(Z,ee){V.current[Z]=ee}function le(Z){delete V.current[Z]}const fe=reactExports.useMemo(()=>({imageResourcesPath:a,linkService:q.current,onItemClick:b,pdf:Q,registerPage:ie,renderMode:o,rotate:p,unregisterPage:le}),[a,b,Q,o,p]),be=reactExports.useMemo(()=>makeEventProps(l,()=>Q),[l,Q]);function me(){return React$1.createElement(DocumentContext.Provider,{value:fe},n)}function ve(){return h?Q==null?React$1.createElement(Message,{type:"loading"},typeof w=="function"?w():w):Q===!1?React$1.createElement(Message,{type:"error"},typeof y=="function"?y():y):me():React$1.createElement(Message,{type:"no-data"},typeof k=="function"?k():k)}return React$1.createElement("div",Object.assign({className:clsx("react-pdf__Document",r),ref:v,style:{"--scale-factor":"1"}},be),ve())}),isFunctionOrNode$1=PropTypes.oneOfType([PropTypes.func,PropTypes.node]);Document.propTypes=Object.assign(Object.assign({},eventProps),{children:PropTypes.node,className:isClassName,error:isFunctionOrNode$1,externalLinkRel:PropTypes.string,externalLinkTarget:PropTypes.oneOf(["_self","_blank","_parent","_top"]),file:isFile,imageResourcesPath:PropTypes.string,inputRef:isRef,loading:isFunctionOrNode$1,noData:isFunctionOrNode$1,onItemClick:PropTypes.func,onLoadError:PropTypes.func,onLoadProgress:PropTypes.func,onLoadSuccess:PropTypes.func,onPassword:PropTypes.func,onSourceError:PropTypes.func,onSourceSuccess:PropTypes.func,options:PropTypes.shape({canvasFactory:PropTypes.any,canvasMaxAreaInBytes:PropTypes.number,cMapPacked:PropTypes.bool,CMapReaderFactory:PropTypes.any,cMapUrl:PropTypes.string,disableAutoFetch:PropTypes.bool,disableFontFace:PropTypes.bool,disableRange:PropTypes.bool,disableStream:PropTypes.bool,docBaseUrl:PropTypes.string,enableXfa:PropTypes.bool,filterFactory:PropTypes.any,fontExtraProperties:PropTypes.bool,httpHeaders:PropTypes.object,isEvalSupported:PropTypes.bool,isOffscreenCanvasSupported:PropTypes.bool,length:PropTypes.number,maxImageSize:PropTypes.number,ownerDocument:PropTypes.any,password:PropTypes.string,pdfBug:PropTypes.bool,rangeChunkSize:PropTypes.number,StandardFontDataFactory:PropTypes.any,standardFontDataUrl:PropTypes.string,stopAtErrors:PropTypes.bool,useSystemFonts:PropTypes.bool,useWorkerFetch:PropTypes.bool,verbosity:PropTypes.number,withCredentials:PropTypes.bool,worker:PropTypes.any}),rotate:PropTypes.number});function useDocumentContext(){return reactExports.useContext(DocumentContext)}function mergeRefs(){for(var t=[],e=0;e<arguments.length;e++)t[e]=arguments[e];var s=t.filter(Boolean);if(s.length<=1){var n=s[0];return n||null}return function(y){s.forEach(function(C){typeof C=="function"?C(y):C&&(C.current=y)})}}const PageContext=reactExports.createContext(null),PDF_ROLE_TO_HTML_ROLE={Document:null,DocumentFragment:null,Part:"group",Sect:"group",Div:"group",Aside:"note",NonStruct:"none",P:null,H:"heading",Title:null,FENote:"note",Sub:"group",Lbl:null,Span:null,Em:null,Strong:null,Link:"link",Annot:"note",Form:"form",Ruby:null,RB:null,RT:null,RP:null,Warichu:null,WT:null,WP:null,L:"list",LI:"listitem",LBody:null,Table:"table",TR:"row",TH:"columnheader",TD:"cell",THead:"columnheader",TBody:null,TFoot:null,Caption:null,Figure:"figure",Formula:null,Artifact:null},HEADING_PATTERN=/^H(\d+)$/;function isPdfRole(t){return t in PDF_ROLE_TO_HTML_ROLE}function isStructTreeNode(t){return"children"in t}function isStructTreeNodeWithOnlyContentChild(t){return isStructTreeNode(t)?t.children.length===1&&0 in t.children&&"id"in t.children[0]:!1}function getRoleAttributes(t){const e={};if(isStructTreeNode(t)){const{role:s}=t,n=s.match(HEADING_PATTERN);if(n)e.role="heading",e["aria-level"]=Number(n[1]);else if(isPdfRole(s)){const r=PDF_ROLE_TO_HTML_ROLE[s];r&&(e.role=r)}}return e}function getBaseAttributes(t){const e={};if(isStructTreeNode(t)){if(t.alt!==void 0&&(e["aria-label"]=t.alt),t.lang!==void 0&&(e.lang=t.lang),isStructTreeNodeWithOnlyContentChild(t)){const[s]=t.children;if(s){const n=getBaseAttributes(s);return Object.assign(Object.assign({},e),n)}}}else"id"in t&&(e["aria-owns"]=t.id);return e}function getAttributes(t){return t?Object.assign(Object.assign({},getRoleAttributes(t)),getBaseAttributes(t)):null}function StructTreeItem({className:t,node:e}){const s=reactExports.useMemo(()=>getAttributes(e),[e]),n=reactExports.useMemo(()=>!isStructTreeNode(e)||isStructTreeNodeWithOnlyContentChild(e)?null:e.children.map((r,y)=>React$1.createElement(StructTreeItem,{key:y,node:r})),[e]);return React$1.createElement("span",Object.assign({className:t},s),n)}function usePageContext(){return reactExports.useContext(PageContext)}function StructTree(){const t=usePageContext();invariant(t);const{onGetStructTreeError:e,onGetStructTreeSuccess:s}=t,[n,r]=useResolver(),{value:y,error:C}=n,{customTextRenderer:O,page:h}=t;function v(){y&&s&&s(y)}function a(){C&&(warning$1(!1,C.toString()),e&&e(C))}function w(){r({type:"RESET"})}reactExports.useEffect(w,[r,h]);function k(){if(O||!h)return;const b=makeCancellablePromise(h.getStructTree()),A=b;return b.promise.then(P=>{r({type:"RESOLVE",value:P})}).catch(P=>{r({type:"REJECT",error:P})}),()=>cancelRunningTask(A)}return reactExports.useEffect(k,[O,h,r]),reactExports.useEffect(()=>{if(y!==void 0){if(y===!1){a();return}v()}},[y]),y?React$1.createElement(StructTreeItem,{className:"react-pdf__Page__structTree structTree",node:y}):null}const ANNOTATION_MODE=pdfjs.AnnotationMode;function PageCanvas(t){const e=usePageContext();invariant(e);const s=Object.assign(Object.assign({},e),t),{_className:n,canvasBackground:r,devicePixelRatio:y=getDevicePixelRatio(),onRenderError:C,onRenderSuccess:O,page:h,renderForms:v,renderTextLayer:a,rotate:w,scale:k}=s,{canvasRef:b}=t;invariant(h);const A=reactExports.useRef(null);function P(){h&&O&&O(makePageCallback(h,k))}function x(o){isCancelException(o)||(warning$1(!1,o.toString()),C&&C(o))}const f=reactExports.useMemo(()=>h.getViewport({scale:k*y,rotation:w}),[y,h,w,k]),E=reactExports.useMemo(()=>h.getViewport({scale:k,rotation:w}),[h,w,k]);function F(){if(!h)return;h.cleanup();const{current:o}=A;if(!o)return;o.width=f.width,o.height=f.height,o.style.width=`${Math.floor(E.width)}px`,o.style.height=`${Math.floor(E.height)}px`,o.style.visibility="hidden";const p={annotationMode:v?ANNOTATION_MODE.ENABLE_FORMS:ANNOTATION_MODE.ENABLE,canvasContext:o.getContext("2d",{alpha:!1}),viewport:f};r&&(p.background=r);const l=h.render(p),g=l;return l.promise.then(()=>{o.style.visibility="",P()}).catch(x),()=>cancelRunningTask(g)}reactExports.useEffect(F,[r,A,y,h,v,f,E]);const S=reactExports.useCallback(()=>{const{current:o}=A;o&&(o.width=0,o.height=0)},[A]);return reactExports.useEffect(()=>S,[S]),React$1.createElement("canvas",{className:`${n}__canvas`,dir:"ltr",ref:mergeRefs(b,A),style:{display:"block",userSelect:"none"}},a?React$1.createElement(StructTree,null):null)}function PageSVG(){const t=usePageContext();invariant(t);const{_className:e,onRenderSuccess:s,onRenderError:n,page:r,rotate:y,scale:C}=t;invariant(r);const[O,h]=useResolver(),{value:v,error:a}=O;function w(){r&&s&&s(makePageCallback(r,C))}function k(){a&&(isCancelException(a)||(warning$1(!1,a.toString()),n&&n(a)))}const b=reactExports.useMemo(()=>r.getViewport({scale:C,rotation:y}),[r,y,C]);function A(){h({type:"RESET"})}reactExports.useEffect(A,[r,h,b]);function P(){if(!r)return;const F=makeCancellablePromise(r.getOperatorList());return F.promise.then(S=>{new pdfjs.SVGGraphics(r.commonObjs,r.objs).getSVG(S,b).then(p=>{if(!(p instanceof SVGElement))throw new Error("getSVG returned unexpected result.");h({type:"RESOLVE",value:p})}).catch(p=>{h({type:"REJECT",error:p})})}).catch(S=>{h({type:"REJECT",error:S})}),()=>cancelRunningTask(F)}reactExports.useEffect(P,[r,h,b]),reactExports.useEffect(()=>{if(v!==void 0){if(v===!1){k();return}w()}},[v]);function x(F){if(!F||!v)return;F.firstElementChild||F.appendChild(v);const{width:S,height:o}=b;v.setAttribute("width",`${S}`),v.setAttribute("height",`${o}`)}const{width:f,height:E}=b;return React$1.createElement("div",{className:`${e}__svg`,ref:F=>x(F),style:{display:"block",backgroundColor:"white",overflow:"hidden",width:f,height:E,userSelect:"none"}})}function isTextItem(t){return"str"in t}function TextLayer(){const t=usePageContext();invariant(t);const{customTextRenderer:e,onGetTextError:s,onGetTextSuccess:n,onRenderTextLayerError:r,onRenderTextLayerSuccess:y,page:C,pageIndex:O,pageNumber:h,rotate:v,scale:a}=t;invariant(C);const[w,k]=useResolver(),{value:b,error:A}=w,P=reactExports.useRef(null),x=reactExports.useRef();warning$1(parseInt(window.getComputedStyle(document.body).getPropertyValue("--react-pdf-text-layer"),10)===1,"TextLayer styles not found. Read more: https://github.com/wojtekmaj/react-pdf#support-for-text-layer");function f(){b&&n&&n(b)}function E(){A&&(warning$1(!1,A.toString()),s&&s(A))}function F(){k({type:"RESET"})}reactExports.useEffect(F,[C,k]);function S(){if(!C)return;const c=makeCancellablePromise(C.getTextContent()),R=c;return c.promise.then(I=>{k({type:"RESOLVE",value:I})}).catch(I=>{k({type:"REJECT",error:I})}),()=>cancelRunningTask(R)}reactExports.useEffect(S,[C,k]),reactExports.useEffect(()=>{if(b!==void 0){if(b===!1){E();return}f()}},[b]);const o=reactExports.useCallback(()=>{y&&y()},[y]),p=reactExports.useCallback(c=>{warning$1(!1,c.toString()),r&&r(c)},[r]);function l(){const c=x.current;c&&c.classList.add("active")}function g(){const c=x.current;c&&c.classList.remove("active")}const m=reactExports.useMemo(()=>C.getViewport({scale:a,rotation:v}),[C,v,a]);function L(){if(!C||!b)return;const{current:c}=P;if(!c)return;c.innerHTML="";const R=C.streamTextContent({includeMarkedContent:!0}),I={container:c,textContentSource:R,viewport:m},Q=pdfjs.renderTextLayer(I),G=Q;return Q.promise.then(()=>{const q=document.createElement("div");q.className="endOfContent",c.append(q),x.current=q;const V=c.querySelectorAll('[role="presentation"]');if(e){let se=0;b.items.forEach((D,X)=>{if(!isTextItem(D))return;const re=V[se];if(!re)return;const N=e(Object.assign({pageIndex:O,pageNumber:h,itemIndex:X},D));re.innerHTML=N,se+=D.str&&D.hasEOL?2:1})}o()}).catch(p),()=>cancelRunningTask(G)}return reactExports.useLayoutEffect(L,[e,p,o,C,O,h,b,m]),React$1.createElement("div",{className:clsx("react-pdf__Page__textContent","textLayer"),onMouseUp:g,onMouseDown:l,ref:P})}function AnnotationLayer(){const t=useDocumentContext(),e=usePageContext();invariant(e);const s=Object.assign(Object.assign({},t),e),{imageResourcesPath:n,linkService:r,onGetAnnotationsError:y,onGetAnnotationsSuccess:C,onRenderAnnotationLayerError:O,onRenderAnnotationLayerSuccess:h,page:v,pdf:a,renderForms:w,rotate:k,scale:b=1}=s;invariant(a),invariant(v),invariant(r);const[A,P]=useResolver(),{value:x,error:f}=A,E=reactExports.useRef(null);warning$1(parseInt(window.getComputedStyle(document.body).getPropertyValue("--react-pdf-annotation-layer"),10)===1,"AnnotationLayer styles not found. Read more: https://github.com/wojtekmaj/react-pdf#support-for-annotations");function F(){x&&C&&C(x)}function S(){f&&(warning$1(!1,f.toString()),y&&y(f))}function o(){P({type:"RESET"})}reactExports.useEffect(o,[P,v]);function p(){if(!v)return;const c=makeCancellablePromise(v.getAnnotations()),R=c;return c.promise.then(I=>{P({type:"RESOLVE",value:I})}).catch(I=>{P({type:"REJECT",error:I})}),()=>{cancelRunningTask(R)}}reactExports.useEffect(p,[P,v,w]),reactExports.useEffect(()=>{if(x!==void 0){if(x===!1){S();return}F()}},[x]);function l(){h&&h()}function g(c){warning$1(!1,`${c}`),O&&O(c)}const m=reactExports.useMemo(()=>v.getViewport({scale:b,rotation:k}),[v,k,b]);function L(){if(!a||!v||!r||!x)return;const{current:c}=E;if(!c)return;const R=m.clone({dontFlip:!0}),I={accessibilityManager:null,annotationCanvasMap:null,div:c,l10n:null,page:v,viewport:R},Q={annotations:x,annotationStorage:a.annotationStorage,div:c,downloadManager:null,imageResourcesPath:n,linkService:r,page:v,renderForms:w,viewport:R};c.innerHTML="";try{new pdfjs.AnnotationLayer(I).render(Q),l()}catch(G){g(G)}return()=>{}}return reactExports.useEffect(L,[x,n,r,v,w,m]),React$1.createElement("div",{className:clsx("react-pdf__Page__annotations","annotationLayer"),ref:E})}var __rest=function(t,e){var s={};for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&e.indexOf(n)<0&&(s[n]=t[n]);if(t!=null&&typeof Object.getOwnPropertySymbols=="function")for(var r=0,n=Object.getOwnPropertySymbols(t);r<n.length;r++)e.indexOf(n[r])<0&&Object.prototype.propertyIsEnumerable.call(t,n[r])&&(s[n[r]]=t[n[r]]);return s};const defaultScale=1,Page=function t(e){const s=useDocumentContext(),n=Object.assign(Object.assign({},s),e),{_className:r="react-pdf__Page",_enableRegisterUnregisterPage:y=!0,canvasBackground:C,canvasRef:O,children:h,className:v,customRenderer:a,customTextRenderer:w,devicePixelRatio:k,error:b="Failed to load the page.",height:A,inputRef:P,loading:x="Loading page…",noData:f="No page specified.",onGetAnnotationsError:E,onGetAnnotationsSuccess:F,onGetStructTreeError:S,onGetStructTreeSuccess:o,onGetTextError:p,onGetTextSuccess:l,onLoadError:g,onLoadSuccess:m,onRenderAnnotationLayerError:L,onRenderAnnotationLayerSuccess:c,onRenderError:R,onRenderSuccess:I,onRenderTextLayerError:Q,onRenderTextLayerSuccess:G,pageIndex:q,pageNumber:V,pdf:se,registerPage:D,renderAnnotationLayer:X=!0,renderForms:re=!1,renderMode:N="canvas",renderTextLayer:d=!0,rotate:u,scale:T=defaultScale,unregisterPage:$,width:U}=n,B=__rest(n,["_className","_enableRegisterUnregisterPage","canvasBackground","canvasRef","children","className","customRenderer","customTextRenderer","devicePixelRatio","error","height","inputRef","loading","noData","onGetAnnotationsError","onGetAnnotationsSuccess","onGetStructTreeError","onGetStructTreeSuccess","onGetTextError","onGetTextSuccess","onLoadError","onLoadSuccess","onRenderAnnotationLayerError","onRenderAnnotationLayerSuccess","onRenderError","onRenderSuccess","onRenderTextLayerError","onRenderTextLayerSuccess","pageIndex","pageNumber","pdf","registerPage","renderAnnotationLayer","renderForms","renderMode","renderTextLayer","rotate","scale","unregisterPage","width"]),[Y,ie]=useResolver(),{value:le,error:fe}=Y,be=reactExports.useRef(null);invariant(se);const me=isProvided(V)?V-1:q??null,ve=V??(isProvided(q)?q+1:null),Z=u??(le?le.rotate:null),ee=reactExports.useMemo(()=>{if(!le)return null;let Oe=1;const ze=T??defaultScale;if(U||A){const Xe=le.getViewport({scale:1,rotation:Z});U?Oe=U/Xe.width:A&&(Oe=A/Xe.height)}return ze*Oe},[A,le,Z,T,U]);function M(){return()=>{isProvided(me)&&y&&$&&$(me)}}reactExports.useEffect(M,[y,se,me,$]);function H(){if(m){if(!le||!ee)return;m(makePageCallback(le,ee))}if(y&&D){if(!isProvided(me)||!be.current)return;D(me,be.current)}}function J(){fe&&(warning$1(!1,fe.toString()),g&&g(fe))}function oe(){ie({type:"RESET"})}reactExports.useEffect(oe,[ie,se,me]);function ge(){if(!se||!ve)return;const Oe=makeCancellablePromise(se.getPage(ve)),ze=Oe;return Oe.promise.then(Xe=>{ie({type:"RESOLVE",value:Xe})}).catch(Xe=>{ie({type:"REJECT",error:Xe})}),()=>cancelRunningTask(ze)}reactExports.useEffect(ge,[ie,se,me,ve,D]),reactExports.useEffect(()=>{if(le!==void 0){if(le===!1){J();return}H()}},[le,ee]);const Ae=reactExports.useMemo(()=>le&&isProvided(me)&&ve&&isProvided(Z)&&isProvided(ee)?{_className:r,canvasBackground:C,customTextRenderer:w,devicePixelRatio:k,onGetAnnotationsError:E,onGetAnnotationsSuccess:F,onGetStructTreeError:S,onGetStructTreeSuccess:o,onGetTextError:p,onGetTextSuccess:l,onRenderAnnotationLayerError:L,onRenderAnnotationLayerSuccess:c,onRenderError:R,onRenderSuccess:I,onRenderTextLayerError:Q,onRenderTextLayerSuccess:G,page:le,pageIndex:me,pageNumber:ve,renderForms:re,renderTextLayer:d,rotate:Z,scale:ee}:null,[r,C,w,k,E,F,S,o,p,l,L,c,R,I,Q,G,le,me,ve,re,d,Z,ee]),_e=reactExports.useMemo(()=>makeEventProps(B,()=>le&&(ee?makePageCallback(le,ee):void 0)),[B,le,ee]),te=`${me}@${ee}/${Z}`,Pe=`${me}/${Z}`;function Ce(){switch(N){case"custom":return invariant(a),React$1.createElement(a,{key:`${te}_custom`});case"none":return null;case"svg":return React$1.createElement(PageSVG,{key:`${Pe}_svg`});case"canvas":default:return React$1.createElement(PageCanvas,{key:`${te}_canvas`,canvasRef:O})}}function Ue(){return d?React$1.createElement(TextLayer,{key:`${te}_text`}):null}function $e(){return X?React$1.createElement(AnnotationLayer,{key:`${te}_annotations`}):null}function He(){return React$1.createElement(PageContext.Provider,{value:Ae},Ce(),Ue(),$e(),h)}function ke(){return ve?se===null||le===void 0||le===null?React$1.createElement(Message,{type:"loading"},typeof x=="function"?x():x):se===!1||le===!1?React$1.createElement(Message,{type:"error"},typeof b=="function"?b():b):He():React$1.createElement(Message,{type:"no-data"},typeof f=="function"?f():f)}return React$1.createElement("div",Object.assign({className:clsx(r,v),"data-page-number":ve,ref:mergeRefs(P,be),style:{"--scale-factor":`${ee}`,backgroundColor:C||"white",position:"relative",minWidth:"min-content",minHeight:"min-content"}},_e),ke())},isFunctionOrNode=PropTypes.oneOfType([PropTypes.func,PropTypes.node]);Page.propTypes=Object.assign(Object.assign({},eventProps),{canvasBackground:PropTypes.string,canvasRef:isRef,children:PropTypes.node,className:isClassName,customRenderer:PropTypes.func,customTextRenderer:PropTypes.func,devicePixelRatio:PropTypes.number,error:isFunctionOrNode,height:PropTypes.number,imageResourcesPath:PropTypes.string,inputRef:isRef,loading:isFunctionOrNode,noData:isFunctionOrNode,onGetTextError:PropTypes.func,onGetTextSuccess:PropTypes.func,onLoadError:PropTypes.func,onLoadSuccess:PropTypes.func,onRenderError:PropTypes.func,onRenderSuccess:PropTypes.func,onRenderTextLayerError:PropTypes.func,onRenderTextLayerSuccess:PropTypes.func,pageIndex:isPageIndex,pageNumber:isPageNumber,pdf:isPdf,renderAnnotationLayer:PropTypes.bool,renderForms:PropTypes.bool,renderMode:isRenderMode,renderTextLayer:PropTypes.bool,rotate:isRotate,scale:PropTypes.number,width:PropTypes.number});displayWorkerWarning();pdfjs.GlobalWorkerOptions.workerSrc="pdf.worker.js";var Close={},_interopRequireDefault=interopRequireDefaultExports;Object.defineProperty(Close,"__esModule",{value:!0});var default_1=Close.default=void 0,_createSvgIcon=_interopRequireDefault(requireCreateSvgIcon()),_jsxRuntime=jsxRuntimeExports;default_1=Close.default=(0,_createSvgIcon.default)((0,_jsxRuntime.jsx)("path",{d:"M19 6.41 17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");pdfjs.GlobalWorkerOptions.workerSrc=`//cdnjs.cloudflare.com/ajax/libs/pdf.js/${pdfjs.version}/pdf.worker.min.js`;const PDFPreview=({open:t,onClose:e,pdfUrl:s,bookTitle:n})=>{const[r,y]=reactExports.useState(null),[C,O]=reactExports.useState(1),[h,v]=reactExports.useState(null),a=({numPages:b})=>{y(b),v(null)},w=b=>{v("Erreur lors du chargement du PDF"),console.error("Error loading PDF:",b)},k=b=>{O(A=>{const P=A+b;return Math.min(Math.max(1,P),r)})};return jsxRuntimeExports.jsxs(Dialog,{open:t,onClose:e,maxWidth:"md",fullWidth:!0,PaperProps:{sx:{height:"90vh",maxHeight:"90vh",display:"flex",flexDirection:"column"}},children:[jsxRuntimeExports.jsxs(Box,{sx:{display:"flex",justifyContent:"space-between",alignItems:"center",p:2,borderBottom:1,borderColor:"divider"},children:[jsxRuntimeExports.jsx(Typography,{variant:"h6",children:n}),jsxRuntimeExports.jsx(IconButton,{onClick:e,children:jsxRuntimeExports.jsx(default_1,{})})]}),jsxRuntimeExports.jsx(DialogContent,{sx:{flex:1,display:"flex",flexDirection:"column",alignItems:"center",overflow:"hidden"},children:h?jsxRuntimeExports.jsx(Typography,{color:"error",sx:{mt:2},children:h}):jsxRuntimeExports.jsxs(jsxRuntimeExports.Fragment,{children:[jsxRuntimeExports.jsx(Document,{file:s,onLoadSuccess:a,onLoadError:w,loading:jsxRuntimeExports.jsx(Typography,{children:"Chargement du PDF..."}),children:jsxRuntimeExports.jsx(Page,{pageNumber:C,width:window.innerWidth*.7,loading:jsxRuntimeExports.jsx(Typography,{children:"Chargement de la page..."})})}),jsxRuntimeExports.jsxs(Box,{sx:{mt:2,display:"flex",alignItems:"center",gap:2},children:[jsxRuntimeExports.jsx(Button,{startIcon:jsxRuntimeExports.jsx(default_1$6,{}),onClick:()=>k(-1),disabled:C<=1,children:"Précédent"}),jsxRuntimeExports.jsxs(Typography,{children:["Page ",C," sur ",r]}),jsxRuntimeExports.jsx(Button,{endIcon:jsxRuntimeExports.jsx(default_1$7,{}),onClick:()=>k(1),disabled:C>=r,children:"Suivant"})]})]})})]})},SkeletonLoader=({count:t=6})=>jsxRuntimeExports.jsx(Grid,{container:!0,spacing:3,children:[...Array(t)].map((e,s)=>jsxRuntimeExports.jsx(Grid,{item:!0,xs:12,sm:6,md:4,children:jsxRuntimeExports.jsxs(Card,{sx:{height:"100%",display:"flex",flexDirection:"column"},children:[jsxRuntimeExports.jsx(Skeleton,{variant:"rectangular",height:200,animation:"wave",sx:{m:1}}),jsxRuntimeExports.jsxs(CardContent,{sx:{flexGrow:1},children:[jsxRuntimeExports.jsx(Skeleton,{variant:"text",height:32,width:"80%",sx:{mb:1}}),jsxRuntimeExports.jsx(Skeleton,{variant:"text",height:24,width:"60%",sx:{mb:2}}),jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:24,width:"40%",sx:{mb:1}}),jsxRuntimeExports.jsx(Box,{sx:{mb:2},children:jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:32,width:"100%"})}),jsxRuntimeExports.jsxs(Box,{sx:{display:"flex",gap:1},children:[jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:32,width:"30%"}),jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:32,width:"30%"}),jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",height:32,width:"30%"})]})]}),jsxRuntimeExports.jsxs(CardActions,{sx:{p:2,justifyContent:"space-between"},children:[jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",width:100,height:36}),jsxRuntimeExports.jsx(Skeleton,{variant:"rounded",width:100,height:36})]})]})},`skeleton-${s}`))}),BookGrid=({books:t,onReadBook:e,onPreviewBook:s,theme:n})=>jsxRuntimeExports.jsx(Grid,{container:!0,spacing:3,children:t.map((r,y)=>jsxRuntimeExports.jsx(Grid,{item:!0,xs:12,sm:6,md:4,children:jsxRuntimeExports.jsxs(Card,{sx:{height:"100%",display:"flex",flexDirection:"column",transition:"transform 0.2s","&:hover":{transform:(r==null?void 0:r.status)==="completed"?"translateY(-4px)":"none",boxShadow:(r==null?void 0:r.status)==="completed"?4:1}},children:[r.cover_image&&jsxRuntimeExports.jsx(CardMedia,{component:"img",height:"200",image:r.cover_image,alt:`Cover for ${r.title}`,sx:{objectFit:"contain",p:1}}),jsxRuntimeExports.jsxs(CardContent,{sx:{flexGrow:1},children:[jsxRuntimeExports.jsx(Typography,{gutterBottom:!0,variant:"h5",component:"h2",color:"text.primary",children:(r==null?void 0:r.title)||"Untitled Book"}),jsxRuntimeExports.jsxs(Typography,{variant:"body2",color:"text.secondary",gutterBottom:!0,children:["Author: ",(r==null?void 0:r.author)||"Unknown"]}),jsxRuntimeExports.jsx(BookStatus,{book:r}),jsxRuntimeExports.jsx(BookProgress,{book:r}),r.error_message&&jsxRuntimeExports.jsxs(Typography,{variant:"body2",color:"error",sx:{mt:1},children:["Error: ",r.error_message]})]}),jsxRuntimeExports.jsxs(CardActions,{sx:{padding:2,justifyContent:"space-between",backgroundColor:"background.paper",borderTop:1,borderColor:"divider"},children:[jsxRuntimeExports.jsx(Button,{variant:"outlined",size:"medium",color:"primary",startIcon:jsxRuntimeExports.jsx(default_1$3,{}),onClick:()=>s(r),disabled:(r==null?void 0:r.status)!=="completed",children:"Preview"}),jsxRuntimeExports.jsx(Button,{variant:"contained",size:"medium",color:"primary",startIcon:jsxRuntimeExports.jsx(default_1$8,{}),onClick:()=>e(r),disabled:(r==null?void 0:r.status)!=="completed",children:"Read"})]})]})},`book-${(r==null?void 0:r.id)||y}`))}),BookStatus=({book:t})=>t&&jsxRuntimeExports.jsx(Tooltip,{title:`Status: ${t.status}`,children:jsxRuntimeExports.jsx(Chip,{label:t.status,color:t.status==="completed"?"success":"default",size:"small",sx:{mb:1}})}),BookProgress=({book:t})=>t&&jsxRuntimeExports.jsxs(Stack,{direction:"row",spacing:1,sx:{mb:1},children:[jsxRuntimeExports.jsx(Tooltip,{title:"Pages",children:jsxRuntimeExports.jsx(Chip,{icon:jsxRuntimeExports.jsx(default_1$1,{}),label:`${t.current_page||0}/${t.total_pages||0} pages`,size:"small",variant:"outlined"})}),jsxRuntimeExports.jsx(Tooltip,{title:"Images",children:jsxRuntimeExports.jsx(Chip,{icon:jsxRuntimeExports.jsx(default_1$2,{}),label:`${t.processed_images||0} images`,size:"small",variant:"outlined"})}),t.processed_sections>0&&jsxRuntimeExports.jsx(Tooltip,{title:"Sections",children:jsxRuntimeExports.jsx(Chip,{label:`${t.processed_sections} sections`,size:"small",variant:"outlined"})})]}),HomePage=()=>{const[t,e]=reactExports.useState([]),[s,n]=reactExports.useState(!0),[r,y]=reactExports.useState(!1),[C,O]=reactExports.useState(null),[h,v]=reactExports.useState(""),[a,w]=reactExports.useState(!1),[k,b]=reactExports.useState(null),A=useTheme$2(),P=useMediaQuery(A.breakpoints.down("sm")),x=useNavigate();reactExports.useEffect(()=>{f()},[]);const TERMINAL_STATUSES=["completed","failed"],processingBookIds=t.filter(o=>!TERMINAL_STATUSES.includes(o.status)).map(o=>o.id).join("|");reactExports.useEffect(()=>{if(!processingBookIds)return;const o=processingBookIds.split("|").map(p=>{const g=new EventSource(`/api/books/${encodeURIComponent(p)}/events`),c=u=>e(m=>m.map(d=>d.id===p?{...d,...u}:d));["status","page","chapter","image"].forEach(u=>g.addEventListener(u,m=>{const{status:d,...l}=JSON.parse(m.data)?.data?.progress||{};c(d&&!TERMINAL_STATUSES.includes(d)?{status:d,...l}:l)}));g.addEventListener("book",u=>{const m=JSON.parse(u.data)?.data?.book||{};c(m),TERMINAL_STATUSES.includes(m.status)&&g.close()});return g});return()=>o.forEach(p=>p.close())},[processingBookIds]);const f=async()=>{try{O(null);const o=await fetch("/api/books");if(!o.ok)throw new Error(`Server returned ${o.status}: ${await o.text()}`);const p=await o.json();if(!p||typeof p!="object")throw new Error("Invalid API response format");const g=(Array.isArray(p.books)?p.books:[]).map((m={})=>({id:m.id||m.filename||"",title:m.title||"Untitled Book",author:m.author||"Unknown",filename:m.filename||"",uploadDate:m.uploadDate,status:m.status||"unknown",current_page:m.current_page||0,total_pages:m.total_pages||0,processed_sections:m.processed_sections||0,processed_images:m.processed_images||0,error_message:m.error_message||null,cover_image:m.cover_image||null,...m}));e(g)}catch(o){console.error("Error fetching books:",o),O(`Failed to load books: ${o.message}`),e([])}finally{n(!1)}},E=async o=>{const p=o.target.files[0];if(!p)return;if(p.type!=="application/pdf"){O("Please select a valid PDF file");return}const l=new FormData;l.append("pdf_files",p);try{y(!0),O(null);const g=await fetch("/api/books/upload",{method:"POST",body:l});if(!g.ok){const L=await g.json();throw new Error((L==null?void 0:L.message)||`Upload failed: ${g.status}`)}const m=await g.json();v(m.message||"PDF uploaded successfully"),o.target.value="",f()}catch(g){console.error("Error uploading PDF:",g),O(g.message||"Error uploading file")}finally{y(!1)}},F=o=>{if((o==null?void 0:o.status)!=="completed"){O("This book is not ready for reading yet");return}x(`/reader/${o.filename}`)},S=o=>{if((o==null?void 0:o.status)!=="completed"){O("This book is not ready for preview yet");return}b(o),w(!0)};return jsxRuntimeExports.jsxs(Container,{maxWidth:"lg",sx:{py:4},children:[jsxRuntimeExports.jsxs(Box,{sx:{mb:4,textAlign:"center"},children:[jsxRuntimeExports.jsx(Typography,{variant:P?"h4":"h3",component:"h1",gutterBottom:!0,sx:{fontWeight:"bold",color:A.palette.secondary.main,mb:3},children:"Solo RPG AI Narrator"}),jsxRuntimeExports.jsx(ErrorBoundary,{fallbackMessage:"Error in file upload component",children:jsxRuntimeExports.jsxs(Button,{variant:"contained",component:"label",startIcon:jsxRuntimeExports.jsx(default_1$4,{}),sx:{mt:2,px:3,py:1.5,borderRadius:2},disabled:r,children:[r?"Uploading...":"Add PDF Book",jsxRuntimeExports.jsx("input",{type:"file",hidden:!0,accept:".pdf",onChange:E})]})})]}),jsxRuntimeExports.jsx(Snackbar,{open:!!h,autoHideDuration:6e3,onClose:()=>v(""),message:h}),C&&jsxRuntimeExports.jsx(Alert,{severity:"error",sx:{mb:3},onClose:()=>O(null),action:jsxRuntimeExports.jsx(Button,{color:"inherit",size:"small",onClick:f,children:"Retry"}),children:C}),s?jsxRuntimeExports.jsx(ErrorBoundary,{fallbackMessage:"Error displaying skeleton loader",children:jsxRuntimeExports.jsx(SkeletonLoader,{count:6})}):jsxRuntimeExports.jsxs(jsxRuntimeExports.Fragment,{children:[Array.isArray(t)&&t.length===0&&jsxRuntimeExports.jsxs(Box,{sx:{textAlign:"center",mt:4,p:4,backgroundColor:"background.paper",borderRadius:2,border:1,borderColor:"divider"},children:[jsxRuntimeExports.jsx(Typography,{variant:"h6",color:"text.secondary",children:"No books in library"}),jsxRuntimeExports.jsx(Typography,{variant:"body1",color:"text.secondary",sx:{mt:1},children:"Start by uploading a PDF"})]}),Array.isArray(t)&&t.length>0&&jsxRuntimeExports.jsx(ErrorBoundary,{fallbackMessage:"Error displaying book grid",children:jsxRuntimeExports.jsx(BookGrid,{books:t,onReadBook:F,onPreviewBook:S,theme:A})})]}),k&&jsxRuntimeExports.jsx(ErrorBoundary,{fallbackMessage:"Error displaying PDF preview",children:jsxRuntimeExports.jsx(PDFPreview,{open:a,onClose:()=>{w(!1),b(null)},pdfUrl:`/api/books/${k.filename}`,bookTitle:k.title})})]})};export{HomePage as default};
 //# sourceMappingURL=index-B4pXWyNm.js.map
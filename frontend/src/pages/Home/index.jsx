@@ -27,6 +27,8 @@ import PDFPreview from '../../components/features/books/PDFPreview';
 import ErrorBoundary from '../../components/common/ErrorBoundary';
 import SkeletonLoader from '../../components/common/SkeletonLoader';
 
+const TERMINAL_STATUSES = ['completed', 'failed'];
+
 // BookGrid Component
 const BookGrid = ({ books, onReadBook, onPreviewBook, theme }) => (
   <Grid container spacing={3}>
@@ -163,14 +165,43 @@ const HomePage = () => {
 
   useEffect(() => {
     fetchBooks(); // Initial fetch
-    
-    // Set up polling
-    const interval = setInterval(fetchBooks, 5000);
-    
-    // Cleanup
-    return () => clearInterval(interval);
   }, []);
 
+  // Books still being processed get live updates from the server instead of polling
+  const processingBookIds = books
+    .filter((book) => !TERMINAL_STATUSES.includes(book.status))
+    .map((book) => book.id)
+    .join('|');
+
+  useEffect(() => {
+    if (!processingBookIds) return undefined;
+
+    const sources = processingBookIds.split('|').map((bookId) => {
+      const source = new EventSource(`/api/books/${encodeURIComponent(bookId)}/events`);
+      const updateBook = (changes) => setBooks((previousBooks) => previousBooks.map((book) => (
+        book.id === bookId ? { ...book, ...changes } : book
+      )));
+      const handleProgress = (event) => {
+        const { status, ...progress } = JSON.parse(event.data)?.data?.progress || {};
+        // The book is finished once its final record is saved, which the 'book' event carries
+        updateBook(status && !TERMINAL_STATUSES.includes(status) ? { status, ...progress } : progress);
+      };
+      const handleBook = (event) => {
+        const book = JSON.parse(event.data)?.data?.book || {};
+        updateBook(book);
+        if (TERMINAL_STATUSES.includes(book.status)) {
+          source.close();
+        }
+      };
+      ['status', 'page', 'chapter', 'image'].forEach((type) => source.addEventListener(type, handleProgress));
+      source.addEventListener('book', handleBook);
+      return source;
+    });
+
+    // Cleanup
+    return () => sources.forEach((source) => source.close());
+  }, [processingBookIds]);
+
   const fetchBooks = async () => {
     try {
       setError(null);
@@ -1,100 +1,79 @@
 import asyncio
+import cProfile
 import os
-import json
 import logging
-from typing import List
+import time
+from typing import Callable, Optional
 from ..domain.ports import PDFProcessor, PDFRepository
-from ..domain.entities import ProcessedPDF, Section, PDFImage, ProcessingProgress, ProcessingStatus
+from ..domain.entities import ProcessedPDF, ProcessingProgress, ProcessingStatus
+from ..infrastructure import tracing
+from ..infrastructure.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
+BOOKS_PROCESSED = metrics_registry.counter("pdf_books_processed_total", "Books whose processing finished, by final status", ("status",))
+PAGES_PROCESSED = metrics_registry.counter("pdf_pages_processed_total", "Pages of successfully processed books")
+PROCESSING_SECONDS = metrics_registry.histogram(
+    "pdf_processing_duration_seconds", "Wall time to process one book", ("status",),
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0),
+)
+
 
 class PDFService:
-    def __init__(self, processor: PDFProcessor, repository: PDFRepository):
+    def __init__(self, processor: PDFProcessor, repository: PDFRepository, cprofile: Optional[bool] = None):
         self.processor = processor
         self.repository = repository
-
-    async def process_pdf(self, pdf_path: str, base_output_dir: str = "sections") -> ProcessedPDF:
+        # Also dump a cProfile of every run to metadata/profile.prof (PDF_CPROFILE=1)
+        if cprofile is None:
+            cprofile = os.environ.get("PDF_CPROFILE", "0").lower() in ("1", "true", "yes")
+        self.cprofile = cprofile
+
+    async def process_pdf(
+        self,
+        pdf_path: str,
+        base_output_dir: str = "sections",
+        progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
+        markdown_mode: Optional[str] = None,
+    ) -> ProcessedPDF:
+        profiler = cProfile.Profile() if self.cprofile else None
+        started = time.perf_counter()
+        processed_pdf = None
         try:
             logger.info(f"Starting PDF processing for: {pdf_path}")
+            if profiler:
+                profiler.enable()
 
-            # Process the PDF and get sections, images, and metadata
-            processed_pdf = await self.processor.extract_sections(pdf_path, base_output_dir)
-            metadata_dir = os.path.join(base_output_dir, processed_pdf.pdf_name, "metadata")
-            os.makedirs(metadata_dir, exist_ok=True)
-
-            # Save sections
-            await self._save_sections(processed_pdf.sections)
-
-            # Save images metadata
-            await self._save_images(processed_pdf.images)
+            with tracing.trace("process_pdf", pdf=os.path.basename(pdf_path)) as tracer:
+                # The processor persists everything: chapters, sections, images and metadata
+                with tracing.span("extract_sections"):
+                    processed_pdf = await self.processor.extract_sections(
+                        pdf_path, base_output_dir, progress_callback, markdown_mode=markdown_mode
+                    )
 
-            # Save book metadata
-            self._save_book_metadata(processed_pdf, base_output_dir)
+            metadata_dir = os.path.join(base_output_dir, processed_pdf.pdf_name, "metadata")
+            tracer.write(os.path.join(metadata_dir, "profile.json"))
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(os.path.join(metadata_dir, "profile.prof"))
 
             logger.info(f"Successfully completed processing PDF: {pdf_path}")
             return processed_pdf
         except Exception as e:
             logger.error(f"Error in PDF processing service: {e}")
-            return self._handle_error(e, pdf_path)
-
-    async def _save_sections(self, sections: List[Section]):
-        """Save each section's content."""
-        for section in sections:
-            try:
-                await self.repository.save_section(section)
-                logger.info(f"Saved section {section.number}: {section.file_path}")
-            except Exception as e:
-                logger.error(f"Failed to save section {section.number}: {e}")
-
-    async def _save_images(self, images: List[PDFImage]):
-        """Save metadata for each image."""
-        for image in images:
-            try:
-                await self.repository.save_image(image)
-                logger.info(f"Saved image metadata for {image.image_path}")
-            except Exception as e:
-                logger.error(f"Failed to save image metadata: {e}")
-
-    def _save_book_metadata(self, processed_pdf: ProcessedPDF, base_output_dir: str):
-        """Save metadata for the entire book."""
-        pdf_folder_name = processed_pdf.pdf_name
-        metadata_dir = os.path.join(base_output_dir, pdf_folder_name, "metadata")
-        os.makedirs(metadata_dir, exist_ok=True)
-
-        # Ensure status is always a string
-        processing_status = (
-            processed_pdf.progress.status.value
-            if isinstance(processed_pdf.progress.status, ProcessingStatus)
-            else processed_pdf.progress.status
-        )
-
-        book_metadata = {
-            "title": pdf_folder_name,
-            "total_sections": len(processed_pdf.sections),
-            "total_images": len(processed_pdf.images),
-            "sections": [self._serialize_section_metadata(section) for section in processed_pdf.sections],
-            "base_path": base_output_dir,
-            "processing_status": processing_status,
-            "error_message": processed_pdf.progress.error_message,
-        }
-
-        metadata_path = os.path.join(metadata_dir, "book.json")
-        try:
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(book_metadata, f, indent=2)
-            logger.info(f"Saved book metadata to {metadata_path}")
-        except Exception as e:
-            logger.error(f"Failed to save book metadata: {e}")
-
-    def _serialize_section_metadata(self, section: Section) -> dict:
-        """Helper to serialize section metadata."""
-        return {
-            "number": section.number,
-            "page_number": section.page_number,
-            "file_path": section.file_path,
-            "title": section.title,
-        }
+            processed_pdf = self._handle_error(e, pdf_path)
+            return processed_pdf
+        finally:
+            if profiler:
+                profiler.disable()
+            self._record_metrics(processed_pdf, time.perf_counter() - started)
+
+    @staticmethod
+    def _record_metrics(processed_pdf: Optional[ProcessedPDF], seconds: float) -> None:
+        status = processed_pdf.progress.status.value if processed_pdf else ProcessingStatus.FAILED.value
+        BOOKS_PROCESSED.labels(status).inc()
+        PROCESSING_SECONDS.labels(status).observe(seconds)
+        if processed_pdf and processed_pdf.progress.status == ProcessingStatus.COMPLETED:
+            PAGES_PROCESSED.inc(processed_pdf.progress.total_pages)
 
     def _handle_error(self, error: Exception, pdf_path: str) -> ProcessedPDF:
         """Handle errors during processing."""
@@ -121,3 +100,7 @@ class PDFService:
             # Handle potential event loop issues for synchronous calls
             logger.error(f"RuntimeError during synchronous processing: {e}")
             return self._handle_error(e, pdf_path)
+
+    def close(self) -> None:
+        """Release the processor's resources once the service is no longer used."""
+        self.processor.close()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from enum import Enum
 
 class ProcessingStatus(Enum):
@@ -23,6 +23,12 @@ class TextFormatting(Enum):
     CODE = "code"
 
 
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 @dataclass
 class ProcessingProgress:
     status: ProcessingStatus
@@ -41,7 +47,7 @@ class FormattedText:
 @dataclass
 class Section:
     number: int
-    content: str
+    content: Optional[str]  # None once the content has been streamed to file_path
     page_number: int
     file_path: str
     pdf_name: str
@@ -50,6 +56,13 @@ class Section:
     is_chapter: bool = False
     chapter_number: Optional[int] = None
 
+    def read_content(self) -> str:
+        """Return the section's Markdown, loading it from file_path when it is not held in memory."""
+        if self.content is not None:
+            return self.content
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            return f.read()
+
 @dataclass
 class PDFImage:
     page_number: int
@@ -58,6 +71,8 @@ class PDFImage:
     width: int
     height: int
     section_number: Optional[int] = None
+    content_hash: Optional[str] = None
+    duplicate_of: Optional[str] = None  # Path of the first copy when this image repeats one
 
 @dataclass
 class ProcessedPDF:
@@ -65,4 +80,34 @@ class ProcessedPDF:
     images: List[PDFImage]
     pdf_name: str
     base_path: str
-    progress: ProcessingProgress = field(default_factory=lambda: ProcessingProgress(status=ProcessingStatus.NOT_STARTED))
\ No newline at end of file
+    progress: ProcessingProgress = field(default_factory=lambda: ProcessingProgress(status=ProcessingStatus.NOT_STARTED))
+
+@dataclass
+class PageRender:
+    page_number: int
+    image_path: str
+    width: int
+    height: int
+    dpi: int
+    tokens: int  # estimated prompt tokens of the image
+    detail: str = "high"
+
+@dataclass
+class LLMCompletion:
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+@dataclass
+class ProcessingJob:
+    id: str
+    filename: str
+    file_path: str
+    status: JobStatus = JobStatus.QUEUED
+    # Page Markdown mode chosen at upload; None uses the processor's default
+    markdown_mode: Optional[str] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
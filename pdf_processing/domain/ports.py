@@ -1,12 +1,17 @@
 """Domain ports (interfaces) for PDF processing."""
 from typing import Protocol
-from typing import List, Optional, Protocol
-from .entities import Section, PDFImage, ProcessedPDF
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Protocol
+from .entities import Section, PDFImage, ProcessedPDF, ProcessingProgress, LLMCompletion
 
 class PDFRepository(Protocol):
     """Repository interface for PDF-related data."""
 
 
+    async def start_book(self, pdf_name: str, base_path: str) -> None:
+        """Withdraw a book's previous output before it is processed again."""
+        pass
+
+
     async def save_section(self, section: Section) -> None:
         """Save a section to storage."""
         pass
@@ -21,6 +26,11 @@ class PDFRepository(Protocol):
         """Save PDF processing metadata."""
         pass
 
+
+    async def save_progress(self, pdf_name: str, base_path: str, progress: ProcessingProgress) -> None:
+        """Save the progress of a book still being processed."""
+        pass
+
     def format_to_markdown(self, formatted_blocks):
         pass
 
@@ -29,8 +39,18 @@ class PDFProcessor(Protocol):
     """Interface for PDF processing operations."""
     
 
-    async def extract_sections(self, pdf_path: str, base_output_dir: str = "sections") -> ProcessedPDF:
-        """Extract sections from a PDF file."""
+    async def extract_sections(
+        self,
+        pdf_path: str,
+        base_output_dir: str = "sections",
+        progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
+        markdown_mode: Optional[str] = None,
+    ) -> ProcessedPDF:
+        """Extract sections from a PDF file, reporting progress as pages are processed.
+
+        markdown_mode overrides how page Markdown is produced for this book
+        ("llm", "local" or "hybrid"); None keeps the processor's default.
+        """
         pass
 
 
@@ -38,6 +58,11 @@ class PDFProcessor(Protocol):
         """Extract images from a PDF file."""
         pass
 
+
+    def close(self) -> None:
+        """Release the processor's resources, such as worker processes."""
+        pass
+
 class TextAnalyzer(Protocol):
     """Interface for text analysis operations."""
     
@@ -51,6 +76,18 @@ class TextAnalyzer(Protocol):
         """Detect text formatting type."""
         pass
 
+class LLMBackend(Protocol):
+    """Interface for the chat completion service behind the AI processor."""
+
+
+    async def complete(self, model: str, messages: List[Dict[str, Any]], temperature: float, max_tokens: int) -> LLMCompletion:
+        """Return the completion for a chat request; raise on failure."""
+        pass
+
+    def stream(self, model: str, messages: List[Dict[str, Any]], temperature: float, max_tokens: int) -> AsyncIterator[LLMCompletion]:
+        """Yield the completion's content as it is generated; token counts come on the last chunk."""
+        pass
+
 class ImageAnalyzer(Protocol):
     """Interface for image analysis operations."""
     
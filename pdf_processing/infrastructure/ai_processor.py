@@ -3,55 +3,188 @@ import asyncio
 import base64
 import os
 import re
+import time
 from typing import Optional, List, Dict, Any, Tuple
-import openai
 import logging
+from .response_cache import AIResponseCache
+from .request_scheduler import RETRYABLE_ERRORS, RequestScheduler, estimate_tokens, request_scheduler
+from .llm_backend import OpenAIBackend, create_llm_backend
+from ..domain.entities import LLMCompletion
+from ..domain.ports import LLMBackend
+from .markdown_stream import FenceStripper, MarkdownStream
+from . import tracing
+from .metrics import metrics_registry
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+MULTIMODAL_SYSTEM_PROMPT = (
+    "You are a multimodal document analyzer. Extract content in Markdown format "
+    "based on the exact text and visual layout seen in the image. "
+    "Do not wrap the Markdown output in ```markdown or any other code block delimiters. "
+    "Ensure the output directly represents the document structure without adding extra annotations."
+)
+# Several pages in one request: the answer is cut back into pages at these markers
+PAGE_MARKER = "<<<PAGE {}>>>"
+PAGE_MARKER_PATTERN = re.compile(r'^[ \t]*<<<PAGE (\d+)>>>[ \t]*$\n?', re.MULTILINE)
+PAGE_PACK_PROMPT = (
+    "The input holds several consecutive pages, each introduced by a line such as <<<PAGE 12>>> and followed by "
+    "its image when there is one. Convert every page separately, in order, and start each page's Markdown with its "
+    "marker line, copied exactly and alone on its line."
+)
+# Prompt tokens assumed for a page image whose size the caller did not estimate
+DEFAULT_IMAGE_TOKENS = 765
+LLM_CACHE_LOOKUPS = metrics_registry.counter("llm_cache_lookups_total", "AI response cache lookups", ("model", "result"))
+LLM_FIRST_CHUNK_SECONDS = metrics_registry.histogram(
+    "llm_time_to_first_chunk_seconds", "Time from sending a streamed request to its first content", ("model",)
+)
+
 class AIProcessor:
-    def __init__(self):
-        self.openai_client = openai.AsyncOpenAI()
+    def __init__(
+        self,
+        cache: Optional[AIResponseCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        backend: Optional[LLMBackend] = None,
+        streaming: Optional[bool] = None,
+    ):
+        # OpenAI unless LLM_BACKEND selects the offline mock
+        self.backend = backend or create_llm_backend()
         self.model_name = "gpt-4o"
         self.max_concurrent = 5
+        self.cache = cache if cache is not None else AIResponseCache.from_env()
+        # OpenAI calls share one scheduler so all workers pace themselves against the same quota
+        if scheduler is None:
+            scheduler = request_scheduler if isinstance(self.backend, OpenAIBackend) else RequestScheduler.unlimited()
+        self.scheduler = scheduler
+        # Batched chapter detection: prompt budget per request and the page excerpt
+        # sent for each page (chapter titles sit at the top of the page)
+        self.chapter_batch_max_tokens = 6000
+        self.chapter_batch_max_pages = 25
+        self.chapter_excerpt_chars = 1500
+        # Page Markdown is streamed as it is generated (LLM_STREAMING)
+        if streaming is None:
+            streaming = os.environ.get("LLM_STREAMING", "1").lower() not in ("0", "false", "no")
+        self.streaming = streaming
 
-    async def analyze_multimodal_page(self, page: Dict[str, any]) -> str:
-        def encode_image(image_path):
-            if image_path and os.path.exists(image_path):
-                with open(image_path, "rb") as image_file:
-                    return base64.b64encode(image_file.read()).decode('utf-8')
-            return None
+    async def _create_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+        prompt_tokens: Optional[int] = None,
+        stream: Optional[MarkdownStream] = None,
+        completion_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Run a chat completion, serving identical requests from the response cache.
+
+        prompt_tokens is the estimated prompt size reserved against the rate
+        limit; by default it is estimated from the messages' text.
+        completion_tokens is the expected answer size reserved with it, by
+        default max_tokens; the reservation is settled with the reported usage
+        once the request is done. With a
+        stream, the response is streamed and its content, without a wrapping
+        code fence, is written to the stream as it arrives; a cached response
+        is returned without being written.
+        """
+        with tracing.span("llm_request", model=model):
+            cache_key = None
+            if self.cache:
+                cache_key = AIResponseCache.make_key(model, messages, temperature, max_tokens)
+                cached_content = self.cache.get(cache_key)
+                if cached_content is not None:
+                    logger.debug(f"AI cache hit for {model}")
+                    tracing.add("cache_hits")
+                    LLM_CACHE_LOOKUPS.labels(model, "hit").inc()
+                    return cached_content
+                tracing.add("cache_misses")
+                LLM_CACHE_LOOKUPS.labels(model, "miss").inc()
+
+            completion = await self.scheduler.run(
+                model,
+                (prompt_tokens or self.estimate_tokens(json.dumps(messages, ensure_ascii=False)))
+                + min(completion_tokens or max_tokens, max_tokens),
+                (lambda: self._stream_attempt(model, messages, temperature, max_tokens, stream)) if stream
+                else (lambda: self.backend.complete(model, messages, temperature, max_tokens))
+            )
+            tracing.add("prompt_tokens", completion.prompt_tokens)
+            tracing.add("completion_tokens", completion.completion_tokens)
+        content = completion.content.strip()
+
+        if self.cache and content:
+            self.cache.set(cache_key, model, content)
+        return content
+
+    async def _stream_attempt(
+        self, model: str, messages: List[Dict[str, Any]], temperature: float, max_tokens: int, stream: MarkdownStream
+    ) -> LLMCompletion:
+        """One attempt at a streamed request; a retry starts the stream over."""
+        if stream.text:
+            stream.restart()
+        fence = FenceStripper()
+        content: List[str] = []
+        prompt_tokens = completion_tokens = 0
+        started = time.perf_counter()
+        async for chunk in self.backend.stream(model, messages, temperature, max_tokens):
+            if chunk.content:
+                if not content:
+                    LLM_FIRST_CHUNK_SECONDS.labels(model).observe(time.perf_counter() - started)
+                content.append(chunk.content)
+                stream.write(fence.feed(chunk.content))
+            prompt_tokens += chunk.prompt_tokens
+            completion_tokens += chunk.completion_tokens
+        stream.write(fence.close())
+        return LLMCompletion(content="".join(content), prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+    async def analyze_multimodal_page(self, page: Dict[str, any], stream: Optional[MarkdownStream] = None) -> str:
+        """
+        Convert a page to Markdown.
 
-        base64_image = encode_image(page.get("image_path"))
+        With a stream, the Markdown is also written to it: as it is generated
+        when streaming is on, otherwise in one piece. Either way the stream ends
+        up holding exactly the returned Markdown.
+        """
+        markdown = await self._analyze_multimodal_page(page, stream if self.streaming else None)
+        if stream is not None and stream.text != markdown:
+            # Cached, wrapped in JSON, rejected or failed: replace what was streamed
+            if stream.text:
+                stream.restart()
+            stream.write(markdown)
+        return markdown
+
+    async def _analyze_multimodal_page(self, page: Dict[str, any], stream: Optional[MarkdownStream] = None) -> str:
+        page_data = json.dumps({"text": page["text"], "page_number": page["num"]})
+        image_part, image_tokens = self._image_part(page)
+        if image_part:
+            user_content = [{"type": "text", "text": page_data}, image_part]
+        else:
+            # The text-only payload is unchanged, so earlier cached responses still apply
+            user_content = json.dumps({
+                "text": page["text"],
+                "page_number": page["num"],
+                "image_base64": None
+            })
         messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are a multimodal document analyzer. Extract content in Markdown format "
-                    "based on the exact text and visual layout seen in the image. "
-                    "Do not wrap the Markdown output in ```markdown or any other code block delimiters. "
-                    "Ensure the output directly represents the document structure without adding extra annotations."
-                ),
-            },
+            {"role": "system", "content": MULTIMODAL_SYSTEM_PROMPT},
             {
                 "role": "user",
-                "content": json.dumps({
-                    "text": page["text"],
-                    "page_number": page["num"],
-                    "image_base64": base64_image
-                })
+                "content": user_content
             }
         ]
+        # Images are billed by size, not by the length of their base64 text
+        prompt_tokens = self.estimate_tokens(MULTIMODAL_SYSTEM_PROMPT + page_data) + image_tokens if image_part else None
 
         try:
-            response = await self.openai_client.chat.completions.create(
+            raw_content = await self._create_completion(
                 model=self.model_name,
                 messages=messages,
                 temperature=0.0,
-                max_tokens=4000
+                max_tokens=4000,
+                prompt_tokens=prompt_tokens,
+                stream=stream,
+                completion_tokens=self.expected_markdown_tokens(page["text"])
             )
-            raw_content = response.choices[0].message.content.strip()
             raw_content = self._clean_wrapping_json_or_markdown(raw_content)
 
             if not raw_content:
@@ -64,10 +197,107 @@ class AIProcessor:
                 logger.warning(f"AI returned non-Markdown response for page {page['num']}: {raw_content}")
                 return ""
 
+        except RETRYABLE_ERRORS:
+            # Out of retries: fail the book rather than silently drop the page (the checkpoint keeps the rest)
+            raise
         except Exception as e:
             logger.error(f"Error in multimodal page analysis for page {page['num']}: {e}")
             return ""
 
+    async def analyze_multimodal_pages(
+        self,
+        pages: List[Dict[str, Any]],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        stream: Optional[MarkdownStream] = None,
+    ) -> Dict[int, str]:
+        """
+        Convert several consecutive pages to Markdown with one request.
+
+        Each page's text is preceded by a <<<PAGE n>>> marker that the model
+        repeats in its answer, so the answer can be cut back into pages. If the
+        markers do not come back intact, the pages are converted one by one.
+
+        Args:
+            pages (List[Dict[str, Any]]): Pages as for analyze_multimodal_page.
+            semaphore (Optional[asyncio.Semaphore]): Shared limit on in-flight requests.
+            stream (Optional[MarkdownStream]): Receives a single page's Markdown as it is generated.
+
+        Returns:
+            Dict[int, str]: Markdown per page number.
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrent)
+        if len(pages) == 1:
+            async with semaphore:
+                return {pages[0]["num"]: await self.analyze_multimodal_page(pages[0], stream)}
+
+        user_content = []
+        prompt_tokens = self.estimate_tokens(MULTIMODAL_SYSTEM_PROMPT + PAGE_PACK_PROMPT)
+        for page in pages:
+            page_text = f"{PAGE_MARKER.format(page['num'])}\n{page['text']}\n"
+            user_content.append({"type": "text", "text": page_text})
+            prompt_tokens += self.estimate_tokens(page_text)
+            image_part, image_tokens = self._image_part(page)
+            if image_part:
+                user_content.append(image_part)
+                prompt_tokens += image_tokens
+        messages = [
+            {"role": "system", "content": MULTIMODAL_SYSTEM_PROMPT + " " + PAGE_PACK_PROMPT},
+            {"role": "user", "content": user_content},
+        ]
+
+        results = None
+        try:
+            async with semaphore:
+                raw_content = await self._create_completion(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=0.0,
+                    max_tokens=4000,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=sum(self.expected_markdown_tokens(PAGE_MARKER.format(page["num"]) + page["text"]) for page in pages)
+                )
+            results = self._split_page_markers(raw_content, pages)
+        except RETRYABLE_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error in multimodal analysis of pages {pages[0]['num']}-{pages[-1]['num']}: {e}")
+
+        if results is None:
+            logger.warning(f"Page markers missing for pages {pages[0]['num']}-{pages[-1]['num']}; converting them one by one")
+            tracing.add("page_pack_fallbacks")
+            results = {}
+            for markdown in await asyncio.gather(*(self.analyze_multimodal_pages([page], semaphore) for page in pages)):
+                results.update(markdown)
+            return results
+
+        logger.info(f"Markdown extracted for pages {pages[0]['num']}-{pages[-1]['num']} in one request")
+        return results
+
+    def _split_page_markers(self, raw_content: str, pages: List[Dict[str, Any]]) -> Optional[Dict[int, str]]:
+        """Cut a packed answer at its page markers; None unless every page is there once, in order."""
+        chunks = PAGE_MARKER_PATTERN.split(self._clean_wrapping_json_or_markdown(raw_content))
+        # [text before the first marker, number, markdown, number, markdown, ...]
+        numbers = [int(number) for number in chunks[1::2]]
+        if numbers != [page["num"] for page in pages] or chunks[0].strip():
+            return None
+        return {number: self._clean_wrapping_json_or_markdown(markdown) for number, markdown in zip(numbers, chunks[2::2])}
+
+    @staticmethod
+    def _image_part(page: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], int]:
+        """The page image as a vision content part, and its estimated prompt tokens."""
+        image_path = page.get("image_path")
+        if not image_path or not os.path.exists(image_path):
+            return None, 0
+        with open(image_path, "rb") as image_file:
+            base64_image = base64.b64encode(image_file.read()).decode('utf-8')
+        # A real vision input: base64 inside the JSON text would be billed as text tokens
+        mime_type = "image/png" if image_path.lower().endswith(".png") else "image/jpeg"
+        image_part = {"type": "image_url", "image_url": {
+            "url": f"data:{mime_type};base64,{base64_image}",
+            "detail": page.get("image_detail") or "high",
+        }}
+        return image_part, page.get("image_tokens") or DEFAULT_IMAGE_TOKENS
+
     async def detect_chapter_with_ai(self, text: str) -> Tuple[bool, Optional[str]]:
         messages = [
             {
@@ -85,23 +315,144 @@ class AIProcessor:
         ]
 
         try:
-            response = await self.openai_client.chat.completions.create(
+            raw_content = await self._create_completion(
                 model="gpt-4o-mini",
                 messages=messages,
                 temperature=0.0,
                 max_tokens=100
             )
-            raw_content = response.choices[0].message.content.strip()
             raw_content = self._clean_wrapping_json_or_markdown(raw_content)
 
             if self._is_valid_json(raw_content):
                 result_json = json.loads(raw_content)
                 return result_json.get("is_chapter", False), result_json.get("chapter_title", None)
 
+            logger.warning(f"AI returned invalid JSON for chapter detection: {raw_content}")
+            return False, None
+
+        except RETRYABLE_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error detecting chapter title: {e}")
             return False, None
 
+    @classmethod
+    def expected_markdown_tokens(cls, text: str) -> int:
+        """Expected size of the Markdown for a text: the text itself plus room for the markup."""
+        return cls.estimate_tokens(text) * 5 // 4 + 100
+
+    # Shared with the page packer, so requests are planned and paced on the same numbers
+    estimate_tokens = staticmethod(estimate_tokens)
+
+    def pack_chapter_batches(self, pages: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group consecutive pages into batches that fit the chapter detection token budget."""
+        batches, current_batch, current_tokens = [], [], 0
+        for page in pages:
+            page_tokens = self.estimate_tokens(page["text"][:self.chapter_excerpt_chars]) + 10
+            if current_batch and (
+                current_tokens + page_tokens > self.chapter_batch_max_tokens
+                or len(current_batch) >= self.chapter_batch_max_pages
+            ):
+                batches.append(current_batch)
+                current_batch, current_tokens = [], 0
+            current_batch.append(page)
+            current_tokens += page_tokens
+        if current_batch:
+            batches.append(current_batch)
+        return batches
+
+    async def detect_chapters_batch(
+        self, pages: List[Dict[str, Any]], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[int, Tuple[bool, Optional[str]]]:
+        """
+        Detect chapter starts for many pages with few requests.
+
+        Args:
+            pages (List[Dict[str, Any]]): Pages with "num" and "text".
+            semaphore (Optional[asyncio.Semaphore]): Shared limit on in-flight requests.
+
+        Returns:
+            Dict[int, Tuple[bool, Optional[str]]]: (is_chapter, chapter_title) per page number.
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrent)
+        batches = self.pack_chapter_batches(pages)
+        logger.info(f"Detecting chapters for {len(pages)} pages in {len(batches)} batched requests")
+        batch_results = await asyncio.gather(*(self._classify_chapter_batch(batch, semaphore) for batch in batches))
+
+        results = {}
+        for batch_result in batch_results:
+            results.update(batch_result)
+        return results
+
+    async def _classify_chapter_batch(
+        self, batch: List[Dict[str, Any]], semaphore: asyncio.Semaphore
+    ) -> Dict[int, Tuple[bool, Optional[str]]]:
+        """Classify one batch; pages missing from the answer are re-split until they succeed."""
+        if len(batch) == 1:
+            async with semaphore:
+                return {batch[0]["num"]: await self.detect_chapter_with_ai(batch[0]["text"])}
+
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are an AI that detects chapter titles. Chapter titles often have a specific typography, "
+                    "such as being centered or using a unique style compared to regular text. "
+                    "You receive a JSON array of pages, each with 'page' (number) and 'text'. Decide for every page "
+                    "whether it starts a new chapter. Return strictly a JSON array with one object per page: "
+                    "{\"page\": number, \"is_chapter\": boolean, \"chapter_title\": string or null}."
+                )
+            },
+            {
+                "role": "user",
+                "content": json.dumps(
+                    [{"page": page["num"], "text": page["text"][:self.chapter_excerpt_chars]} for page in batch],
+                    ensure_ascii=False
+                )
+            }
+        ]
+
+        results = {}
+        try:
+            async with semaphore:
+                raw_content = await self._create_completion(
+                    model="gpt-4o-mini",
+                    messages=messages,
+                    temperature=0.0,
+                    max_tokens=40 * len(batch) + 50
+                )
+            results = self._parse_chapter_batch(self._clean_wrapping_json_or_markdown(raw_content), batch)
+        except RETRYABLE_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error detecting chapters for pages {batch[0]['num']}-{batch[-1]['num']}: {e}")
+
+        missing = [page for page in batch if page["num"] not in results]
+        if missing:
+            logger.warning(f"Re-splitting {len(missing)} page(s) missing from a chapter detection batch")
+            middle = len(missing) // 2
+            for half in (missing[:middle], missing[middle:]):
+                if half:
+                    results.update(await self._classify_chapter_batch(half, semaphore))
+        return results
+
+    @staticmethod
+    def _parse_chapter_batch(raw_content: str, batch: List[Dict[str, Any]]) -> Dict[int, Tuple[bool, Optional[str]]]:
+        try:
+            parsed = json.loads(raw_content)
+        except json.JSONDecodeError:
+            return {}
+        if isinstance(parsed, dict):
+            # Some answers wrap the array in an object, e.g. {"pages": [...]}
+            parsed = next((value for value in parsed.values() if isinstance(value, list)), [])
+
+        expected_pages = {page["num"] for page in batch}
+        results = {}
+        for item in parsed:
+            if isinstance(item, dict) and item.get("page") in expected_pages:
+                results[item["page"]] = (bool(item.get("is_chapter", False)), item.get("chapter_title"))
+        return results
+
     @staticmethod
     def _clean_wrapping_json_or_markdown(content: str) -> str:
         content = re.sub(r'^```(?:markdown|json)?\n|```$', '', content, flags=re.DOTALL).strip()
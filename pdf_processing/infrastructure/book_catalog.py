@@ -0,0 +1,181 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BookCatalog:
+    """
+    SQLite index of the book metadata shown in the gallery.
+
+    Each row mirrors the metadata dict saved for an uploaded book (the full dict
+    is kept as JSON, the columns used for sorting and filtering are indexed).
+    Query results are cached in memory and invalidated whenever the database
+    file's mtime changes, so other processes' writes are picked up too.
+    """
+
+    SORTABLE_COLUMNS = ("uploadDate", "title", "author", "status", "total_pages", "processed_sections")
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple, Any] = {}
+        self._cache_mtime: Optional[int] = None
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        # Rollback journal (not WAL) so every commit touches the database file's mtime
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS books (
+                    id TEXT PRIMARY KEY,
+                    title TEXT,
+                    author TEXT,
+                    filename TEXT,
+                    uploadDate TEXT,
+                    status TEXT,
+                    total_pages INTEGER,
+                    processed_sections INTEGER,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_books_upload_date ON books (uploadDate)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_books_status ON books (status)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_books_title ON books (title)")
+
+    def upsert(self, metadata: Dict[str, Any]) -> None:
+        """Insert or replace a book's metadata in a single transaction."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                INSERT OR REPLACE INTO books
+                    (id, title, author, filename, uploadDate, status, total_pages, processed_sections, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    metadata["id"],
+                    metadata.get("title"),
+                    metadata.get("author"),
+                    metadata.get("filename"),
+                    metadata.get("uploadDate"),
+                    metadata.get("status"),
+                    metadata.get("total_pages"),
+                    metadata.get("processed_sections"),
+                    json.dumps(metadata),
+                ),
+            )
+            self._cache.clear()
+
+    def delete(self, book_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM books WHERE id = ?", (book_id,))
+            self._cache.clear()
+
+    def get(self, book_id: str) -> Optional[Dict[str, Any]]:
+        return self._cached(("get", book_id), self._get, book_id)
+
+    def query(
+        self,
+        page: int = 1,
+        per_page: Optional[int] = None,
+        sort: str = "uploadDate",
+        order: str = "desc",
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Return one page of books and the total number of matches.
+
+        Args:
+            page (int): 1-based page number.
+            per_page (Optional[int]): Page size, or None for every match.
+            sort (str): One of SORTABLE_COLUMNS.
+            order (str): "asc" or "desc".
+            status (Optional[str]): Only books with this processing status.
+            search (Optional[str]): Case-insensitive substring of the title or filename.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The books on the page and the total count.
+        """
+        if sort not in self.SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort!r}; expected one of {', '.join(self.SORTABLE_COLUMNS)}")
+        if order.lower() not in ("asc", "desc"):
+            raise ValueError(f"Invalid sort order {order!r}")
+        key = ("query", page, per_page, sort, order.lower(), status, search)
+        return self._cached(key, self._query, page, per_page, sort, order.lower(), status, search)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def import_metadata_dir(self, metadata_dir: str) -> int:
+        """Index the per-book JSON metadata files of a directory; returns the number imported."""
+        imported = 0
+        for metadata_file in sorted(os.listdir(metadata_dir)):
+            if not metadata_file.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(metadata_dir, metadata_file), 'r') as f:
+                    metadata = json.load(f)
+                metadata.setdefault("id", os.path.splitext(metadata_file)[0])
+                self.upsert(metadata)
+                imported += 1
+            except Exception as e:
+                logger.error(f"Failed to import {metadata_file} into the book catalog: {e}")
+        logger.info(f"Imported {imported} book(s) into the catalog from {metadata_dir}")
+        return imported
+
+    def _cached(self, key: Tuple, loader, *args):
+        mtime = self._db_mtime()
+        with self._lock:
+            if mtime != self._cache_mtime:
+                self._cache.clear()
+                self._cache_mtime = mtime
+            if key in self._cache:
+                return self._cache[key]
+        result = loader(*args)
+        with self._lock:
+            if mtime == self._cache_mtime:
+                self._cache[key] = result
+        return result
+
+    def _db_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.db_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _get(self, book_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM books WHERE id = ?", (book_id,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def _query(self, page, per_page, sort, order, status, search) -> Tuple[List[Dict[str, Any]], int]:
+        conditions, params = [], []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if search:
+            conditions.append("(title LIKE ? OR filename LIKE ?)")
+            params.extend([f"%{search}%", f"%{search}%"])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        sql = f"SELECT data FROM books {where} ORDER BY {sort} {order.upper()}, id"
+        query_params = list(params)
+        if per_page:
+            sql += " LIMIT ? OFFSET ?"
+            query_params.extend([per_page, (max(page, 1) - 1) * per_page])
+
+        with self._lock:
+            total = self._connection.execute(f"SELECT COUNT(*) FROM books {where}", params).fetchone()[0]
+            rows = self._connection.execute(sql, query_params).fetchall()
+        return [json.loads(row["data"]) for row in rows], total
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import os
+from typing import BinaryIO, Optional, Tuple
+
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+# Appended text is written out in blocks of about this many bytes
+FLUSH_BYTES = 64 * 1024
+
+
+class ChapterWriter:
+    """
+    Streams chapter Markdown to disk page by page.
+
+    Page output is appended to the open chapter's file as it arrives, so
+    memory use does not grow with chapter length. Appends are buffered and
+    every file operation runs on a worker thread, so disk writes never stall
+    the event loop. A chapter is written to chapter_<n>.md.part and renamed
+    into place when it is finished, so readers never see a half-written
+    chapter. Leading and trailing whitespace of the chapter is dropped, and a
+    chapter with no content is never numbered or written, exactly as when the
+    whole chapter was buffered and stripped.
+    """
+
+    def __init__(self, histoire_dir: str, flush_bytes: int = FLUSH_BYTES):
+        self.histoire_dir = histoire_dir
+        self.flush_bytes = flush_bytes
+        self.chapter_count = 0
+        self._file: Optional[BinaryIO] = None
+        self._part_path: Optional[str] = None
+        self._opened = False
+        self._pending_whitespace = ""
+        self._buffer = bytearray()
+        # Bytes of the chapter already in the file; the rest is in the buffer
+        self._flushed = 0
+        self._bytes = 0
+
+    @property
+    def chapter_open(self) -> bool:
+        """Whether the current chapter has content that is not finished yet."""
+        return self._opened
+
+    def chapter_path(self, chapter_number: int) -> str:
+        return os.path.join(self.histoire_dir, f"chapter_{chapter_number}.md")
+
+    async def write(self, markdown: str) -> None:
+        """Append one page's Markdown to the current chapter."""
+        await self.append(markdown + "\n")
+
+    async def append(self, chunk: str) -> None:
+        """Append text to the current chapter; a page may arrive in several chunks."""
+        if not self._opened:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+            self._part_path = self.chapter_path(self.chapter_count + 1) + ".part"
+            self._opened = True
+
+        body = chunk.rstrip()
+        if not body:
+            self._pending_whitespace += chunk
+            return
+        # Whitespace is only written once more content follows it
+        data = (self._pending_whitespace + body).encode("utf-8")
+        self._buffer += data
+        self._bytes += len(data)
+        self._pending_whitespace = chunk[len(body):]
+        if len(self._buffer) >= self.flush_bytes:
+            await self._flush()
+
+    def mark(self) -> Tuple[bool, int, str]:
+        """The current position in the chapter, to roll back to with rollback()."""
+        return self._opened, self._bytes, self._pending_whitespace
+
+    async def rollback(self, mark: Tuple[bool, int, str]) -> None:
+        """Drop what was appended since mark, e.g. a page whose generation restarted."""
+        was_open, position, pending_whitespace = mark
+        if not was_open:
+            await self.abort()
+        elif position >= self._flushed:
+            del self._buffer[position - self._flushed:]
+        else:
+            self._buffer.clear()
+            await asyncio.to_thread(self._truncate, position)
+            self._flushed = position
+        self._bytes = position if was_open else 0
+        self._pending_whitespace = pending_whitespace
+
+    async def finish_chapter(self) -> Optional[str]:
+        """
+        Close the current chapter and move it into place.
+
+        Returns:
+            Optional[str]: Path of the finished chapter, or None if it had no content.
+        """
+        if not self._opened:
+            self._pending_whitespace = ""
+            return None
+
+        await self._flush()
+        self.chapter_count += 1
+        chapter_path = self.chapter_path(self.chapter_count)
+        await asyncio.to_thread(self._close_into, chapter_path)
+        tracing.add("bytes_written", self._bytes)
+        logger.debug(f"Chapter {self.chapter_count} written to {chapter_path} ({self._bytes} bytes)")
+        self._reset()
+        return chapter_path
+
+    async def abort(self) -> None:
+        """Drop the unfinished chapter, e.g. when processing fails."""
+        if not self._opened:
+            return
+        await asyncio.to_thread(self._remove_part)
+        self._reset()
+
+    async def _flush(self) -> None:
+        if not self._buffer:
+            return
+        data, self._buffer = bytes(self._buffer), bytearray()
+        await asyncio.to_thread(self._write_file, data)
+        self._flushed += len(data)
+
+    def _reset(self) -> None:
+        self._file, self._part_path, self._opened = None, None, False
+        self._pending_whitespace, self._buffer = "", bytearray()
+        self._flushed, self._bytes = 0, 0
+
+    # Blocking file operations, run on a worker thread
+
+    def _write_file(self, data: bytes) -> None:
+        if self._file is None:
+            self._file = open(self._part_path, "wb")
+        self._file.write(data)
+
+    def _truncate(self, position: int) -> None:
+        self._file.seek(position)
+        self._file.truncate()
+
+    def _close_into(self, chapter_path: str) -> None:
+        self._file.close()
+        os.replace(self._part_path, chapter_path)
+
+    def _remove_part(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        try:
+            os.remove(self._part_path)
+        except OSError as e:
+            logger.warning(f"Could not remove unfinished chapter {self._part_path}: {e}")
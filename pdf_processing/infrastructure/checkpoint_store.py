@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionCheckpoint:
+    """
+    Per-book record of finished work, so an interrupted ingestion can resume.
+
+    Stored as an append-only JSON Lines file in the book's metadata directory:
+    a header with the PDF fingerprint, one record per analyzed page (chapter
+    boundary decision and AI Markdown), and one record once images are extracted.
+    Appending keeps each checkpoint O(1) no matter how far the book has got.
+    All file I/O, including fingerprinting the PDF, runs on worker threads.
+    """
+
+    FILENAME = "checkpoint.jsonl"
+
+    def __init__(self, metadata_dir: str, pdf_path: str):
+        self.path = os.path.join(metadata_dir, self.FILENAME)
+        self.pdf_path = pdf_path
+        self.fingerprint: Optional[str] = None
+        self._append_lock = threading.Lock()
+        self.pages: Dict[int, Dict[str, Any]] = {}
+        self.images: Optional[List[Dict[str, Any]]] = None
+
+    @staticmethod
+    def _fingerprint(pdf_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    async def load(self) -> Dict[int, Dict[str, Any]]:
+        """Load a previous run's records; a checkpoint for a different PDF is discarded."""
+        return await asyncio.to_thread(self._load)
+
+    def _load(self) -> Dict[int, Dict[str, Any]]:
+        self.fingerprint = self._fingerprint(self.pdf_path)
+        self.pages, self.images = {}, None
+        if not os.path.exists(self.path):
+            self._start()
+            return self.pages
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            header = json.loads(lines[0]) if lines else {}
+            if header.get("fingerprint") != self.fingerprint:
+                logger.info("Checkpoint belongs to a different version of the PDF; starting over")
+                self._start()
+                return self.pages
+
+            for line in lines[1:]:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A write cut short by a crash; everything before it is still valid
+                    logger.warning(f"Ignoring truncated checkpoint record in {self.path}")
+                    continue
+                if record["type"] == "page":
+                    self.pages[record["page"]] = record
+                elif record["type"] == "images":
+                    self.images = record["images"]
+        except Exception as e:
+            logger.error(f"Unreadable checkpoint {self.path}, starting over: {e}")
+            self._start()
+            return self.pages
+
+        logger.info(f"Resuming from checkpoint: {len(self.pages)} page(s) already processed")
+        return self.pages
+
+    def _start(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "header", "fingerprint": self.fingerprint}) + "\n")
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        # Pages finish concurrently; one record at a time keeps lines whole
+        with self._append_lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    async def record_page(self, page_num: int, is_new_chapter: bool, markdown: str) -> None:
+        await asyncio.to_thread(self._append, {"type": "page", "page": page_num, "is_new_chapter": is_new_chapter, "markdown": markdown})
+        # Only replayed pages need their Markdown in memory; this run's pages are already in the chapter files
+        self.pages[page_num] = {"type": "page", "page": page_num, "is_new_chapter": is_new_chapter}
+
+    async def record_images(self, images: List[Dict[str, Any]]) -> None:
+        await asyncio.to_thread(self._append, {"type": "images", "images": images})
+        self.images = images
+
+    async def clear(self) -> None:
+        """Remove the checkpoint once the book is fully processed."""
+        await asyncio.to_thread(self._remove)
+
+    def _remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
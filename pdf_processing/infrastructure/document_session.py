@@ -0,0 +1,134 @@
+import asyncio
+import fitz  # PyMuPDF
+import logging
+import threading
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .parallel_extractor import ParallelPageExtractor
+
+logger = logging.getLogger(__name__)
+
+
+def _extract_lines(textpage_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten PyMuPDF's dict output into non-empty text lines with their typography."""
+    lines = []
+    for block in textpage_dict["blocks"]:
+        for line in block.get("lines", []):
+            spans = [
+                {"text": span["text"], "size": span["size"], "flags": span["flags"], "font": span["font"]}
+                for span in line["spans"]
+                if span["text"].strip()
+            ]
+            if not spans:
+                continue
+            # The line's typography is that of its longest span
+            main_span = max(spans, key=lambda span: len(span["text"]))
+            lines.append({
+                "text": "".join(span["text"] for span in spans).strip(),
+                "bbox": tuple(line["bbox"]),
+                "size": main_span["size"],
+                "bold": bool(main_span["flags"] & fitz.TEXT_FONT_BOLD) or "bold" in main_span["font"].lower(),
+                "spans": spans,
+            })
+    return lines
+
+
+def extract_page_record(page: fitz.Page) -> Dict[str, Any]:
+    """Extract text, text blocks, typed text lines and image xrefs of a page from a single text page."""
+    textpage = page.get_textpage()
+    text = page.get_text("text", textpage=textpage)
+    return {
+        "num": page.number + 1,
+        "text": text.strip() if text else "",
+        "blocks": page.get_text("blocks", textpage=textpage),
+        "lines": _extract_lines(page.get_text("dict", textpage=textpage)),
+        "width": page.rect.width,
+        "height": page.rect.height,
+        "image_xrefs": [img[0] for img in page.get_images()],
+    }
+
+
+class PDFDocumentSession:
+    """
+    Open a PDF once and share its parsed pages between the processing stages.
+
+    Page text, text blocks and image xrefs are extracted in a single PyMuPDF pass
+    (one text page per page) and handed to SectionProcessor, ImageProcessor and
+    the AI stage, instead of each stage re-parsing the file on its own.
+
+    With a ParallelPageExtractor, load_pages() splits large documents across
+    worker processes instead of parsing them on the calling thread.
+    """
+
+    def __init__(self, pdf_path: str, extractor: Optional["ParallelPageExtractor"] = None):
+        self.pdf_path = pdf_path
+        self.extractor = extractor
+        self.doc = fitz.open(pdf_path)
+        self._pages: Optional[List[Dict[str, Any]]] = None
+        # A PyMuPDF document must not be used by two threads at once
+        self._render_lock = threading.Lock()
+
+    def __enter__(self) -> "PDFDocumentSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def page_count(self) -> int:
+        return len(self.doc)
+
+    @property
+    def pages(self) -> List[Dict[str, Any]]:
+        """
+        Page records, extracted on first access.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per page with keys "num" (1-based), "text",
+            "blocks" (PyMuPDF text block tuples), "lines" (text lines with bbox, font
+            size, bold flag and spans), "width", "height" and "image_xrefs".
+        """
+        if self._pages is None:
+            self._pages = [extract_page_record(page) for page in self.doc]
+            logger.info(f"Parsed {len(self._pages)} pages from {self.pdf_path} in a single pass")
+        return self._pages
+
+    async def load_pages(self) -> List[Dict[str, Any]]:
+        """Extract the page records without blocking the event loop."""
+        if self._pages is None:
+            if self.extractor and self.extractor.should_parallelize(self.page_count):
+                self._pages = [page async for page in self.extractor.iter_pages(self.pdf_path, self.page_count)]
+                logger.info(f"Parsed {len(self._pages)} pages from {self.pdf_path} with {self.extractor.max_workers} workers")
+            else:
+                await asyncio.to_thread(lambda: self.pages)
+        return self._pages
+
+    def extract_image(self, xref: int) -> Dict[str, Any]:
+        """Return the raw image payload and metadata for an xref."""
+        return self.doc.extract_image(xref)
+
+    def render_page(self, page_number: int, zoom: float, grayscale: bool = True, jpeg_quality: int = 60) -> bytes:
+        """
+        Render a page as a JPEG image. Safe to call from worker threads.
+
+        Args:
+            page_number (int): 1-based page number.
+            zoom (float): Scale factor; 1.0 renders at 72 DPI.
+            grayscale (bool): Render a single gray channel instead of RGB.
+            jpeg_quality (int): JPEG quality from 1 to 100.
+
+        Returns:
+            bytes: The JPEG data.
+        """
+        with self._render_lock:
+            pixmap = self.doc[page_number - 1].get_pixmap(
+                matrix=fitz.Matrix(zoom, zoom),
+                colorspace=fitz.csGRAY if grayscale else fitz.csRGB,
+                alpha=False,
+            )
+            return pixmap.tobytes("jpeg", jpg_quality=jpeg_quality)
+
+    def close(self) -> None:
+        if not self.doc.is_closed:
+            self.doc.close()
@@ -1,6 +1,8 @@
+import json
 import os
 import re
-from typing import Dict
+import uuid
+from typing import Any, Dict, Union
 from ..domain.entities import Section, TextFormatting
 
 class FileSystemProcessor:
@@ -27,4 +29,41 @@ class FileSystemProcessor:
             "images_dir": images_dir,
             "metadata_dir": metadata_dir,
             "histoire_dir": histoire_dir
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def write_atomic(path: str, data: Union[str, bytes]) -> int:
+        """
+        Write a file so readers see either the old file or the complete new one.
+
+        The data goes to a temporary file in the same directory, which is then
+        renamed over the destination.
+
+        Args:
+            path (str): Destination file.
+            data (Union[str, bytes]): Content; text is encoded as UTF-8.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        directory, name = os.path.split(path)
+        # A unique name per write, so concurrent writers never share a temporary file
+        temp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temp_path, "xb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        return len(data)
+
+    @staticmethod
+    def write_json_atomic(path: str, data: Any, **dump_kwargs: Any) -> int:
+        """Serialize data as JSON and write it with write_atomic."""
+        return FileSystemProcessor.write_atomic(path, json.dumps(data, **dump_kwargs))
@@ -0,0 +1,126 @@
+import logging
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .chapter_processor import ChapterProcessor
+
+logger = logging.getLogger(__name__)
+
+
+def body_font_size(pages: List[Dict[str, Any]]) -> Optional[float]:
+    """Return the most common font size of the pages' text lines, weighted by characters (0.5pt steps)."""
+    sizes = Counter()
+    for page in pages:
+        for line in page.get("lines", []):
+            sizes[round(line["size"] * 2) / 2] += len(line["text"])
+    return sizes.most_common(1)[0][0] if sizes else None
+
+
+class HeuristicChapterDetector:
+    """
+    Local chapter start classifier based on page typography.
+
+    A page is scored from its first text line: how much larger it is than the
+    book's body text, whether it is bold, centered and near the top of the page.
+    Scores at or below `low_threshold` are confident "no", scores at or above
+    `high_threshold` are confident "yes"; only pages in between need the LLM.
+    """
+
+    def __init__(self, low_threshold: float = 0.3, high_threshold: float = 0.75):
+        self.low_threshold = low_threshold
+        self.high_threshold = high_threshold
+        self.chapter_processor = ChapterProcessor()
+        self.body_size: Optional[float] = None
+        self.decided = 0
+        self.deferred = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["HeuristicChapterDetector"]:
+        """Build the detector from CHAPTER_HEURISTIC_* environment variables, or None if disabled."""
+        if os.environ.get("CHAPTER_HEURISTIC_ENABLED", "1").lower() in ("0", "false", "no"):
+            return None
+        return cls(
+            low_threshold=float(os.environ.get("CHAPTER_HEURISTIC_LOW", 0.3)),
+            high_threshold=float(os.environ.get("CHAPTER_HEURISTIC_HIGH", 0.75)),
+        )
+
+    def calibrate(self, pages: List[Dict[str, Any]]) -> Optional[float]:
+        """Set the body text size to the most common font size (weighted by characters) of the pages."""
+        self.body_size = body_font_size(pages)
+        return self.body_size
+
+    def score(self, page: Dict[str, Any]) -> Tuple[float, Optional[str]]:
+        """
+        Score how likely a page starts a chapter.
+
+        Args:
+            page (Dict[str, Any]): Page record with "lines", "width" and "height".
+
+        Returns:
+            Tuple[float, Optional[str]]: Score between 0 and 1 and the heading text.
+        """
+        lines = sorted(page.get("lines", []), key=lambda line: (line["bbox"][1], line["bbox"][0]))
+        if not lines:
+            return 0.0, None
+
+        heading = lines[0]
+        # Standalone numbers are gamebook section headings, handled by SectionProcessor
+        section_number, _ = self.chapter_processor.detect_chapter(heading["text"])
+        if section_number is not None:
+            return 0.0, None
+
+        body_size = self.body_size or heading["size"]
+        size_ratio = heading["size"] / body_size if body_size else 1.0
+        page_width = page.get("width") or 1.0
+        page_height = page.get("height") or 1.0
+        line_center = (heading["bbox"][0] + heading["bbox"][2]) / 2
+        line_width = heading["bbox"][2] - heading["bbox"][0]
+
+        score = 0.0
+        if size_ratio >= 1.5:
+            score += 0.6
+        elif size_ratio >= 1.2:
+            score += 0.4
+        if heading["bold"]:
+            score += 0.15
+        # Justified body lines span the text column and would look centered too
+        if abs(line_center - page_width / 2) < page_width * 0.1 and line_width < page_width * 0.6:
+            score += 0.15
+        if heading["bbox"][1] < page_height * 0.4:
+            score += 0.1
+
+        # Multi-line titles share the heading's size
+        title_lines = [heading["text"]]
+        for line in lines[1:3]:
+            if abs(line["size"] - heading["size"]) > 0.5:
+                break
+            title_lines.append(line["text"])
+        return min(score, 1.0), " ".join(title_lines)
+
+    def classify(self, page: Dict[str, Any]) -> Optional[Tuple[bool, Optional[str]]]:
+        """
+        Decide locally whether a page starts a chapter.
+
+        Returns:
+            Optional[Tuple[bool, Optional[str]]]: (is_chapter, chapter_title) when confident,
+            None when the page falls in the uncertain band and needs the LLM.
+        """
+        score, title = self.score(page)
+        if score >= self.high_threshold:
+            self.decided += 1
+            return True, title
+        if score <= self.low_threshold:
+            self.decided += 1
+            return False, None
+        self.deferred += 1
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many pages were decided locally (LLM calls avoided) and how many were deferred."""
+        return {"decided": self.decided, "deferred": self.deferred}
+
+    def reset_stats(self) -> None:
+        """Start counting afresh; the detector outlives the book its counts are reported for."""
+        self.decided = 0
+        self.deferred = 0
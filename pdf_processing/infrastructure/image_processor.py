@@ -1,29 +1,100 @@
 import os
-import fitz
 import io
+import hashlib
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from PIL import Image
-import json
-from typing import List, Optional, Dict
+from typing import Any, Callable, Deque, List, Optional, Dict, Set, Tuple
 from ..domain.entities import Section, PDFImage
+from .document_session import PDFDocumentSession
+from .file_system_processor import FileSystemProcessor
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+# Formats browsers display as-is; anything else (JPX, JBIG2, ...) is converted to PNG
+WEB_IMAGE_FORMATS = {"png", "jpeg", "jpg", "gif", "webp"}
 
 class ImageProcessor:
+    def __init__(self, transcode: Optional[bool] = None, max_workers: int = 4):
+        # By default embedded images are written with their original bytes and extension;
+        # transcode=True re-encodes every image as PNG like earlier versions did.
+        if transcode is None:
+            transcode = os.environ.get("PDF_IMAGE_TRANSCODE", "0").lower() in ("1", "true", "yes")
+        self.transcode = transcode
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _transcode_to_png(image_bytes: bytes, image_path: str) -> int:
+        buffer = io.BytesIO()
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            image.save(buffer, format="PNG")
+        return FileSystemProcessor.write_atomic(image_path, buffer.getvalue())
+
+    @staticmethod
+    def _write_bytes(image_bytes: bytes, image_path: str) -> None:
+        FileSystemProcessor.write_atomic(image_path, image_bytes)
+
     def extract_images(
             self,
             doc_path: str,
             images_dir: str,
             metadata_dir: str,
             pdf_name: str,
-            sections: Optional[List[Section]] = None) -> List[PDFImage]:
-        """Extract images from the PDF with section information"""
+            sections: Optional[List[Section]] = None,
+            session: Optional[PDFDocumentSession] = None,
+            on_image: Optional[Callable[[PDFImage], None]] = None) -> List[PDFImage]:
+        """Extract images from the PDF with section information.
+
+        When a document session is given, its already-parsed pages and open
+        document are reused instead of opening the PDF again. `on_image` is
+        called after each image is written, e.g. to report progress. Images are
+        recorded in page order once their file exists; an image whose PNG
+        conversion failed is dropped, along with its repeats.
+        """
         images = []
         images_metadata = []
+        images_by_xref: Dict[int, PDFImage] = {}
+        images_by_hash: Dict[str, PDFImage] = {}
+        duplicate_count = 0
+        # (image, its metadata, the conversion writing its file if still pending), in page order
+        pending: Deque[Tuple[PDFImage, Dict[str, Any], Optional[Future]]] = deque()
+        transcodes: Dict[str, Future] = {}
+        failed_paths: Set[str] = set()
+        transcode_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-transcode")
+        owns_session = session is None
+
+        def record_written(wait: bool) -> None:
+            """Record the images at the head of the queue whose files are written."""
+            while pending:
+                image_data, metadata, transcode = pending[0]
+                if transcode is not None:
+                    if not wait and not transcode.done():
+                        return
+                    try:
+                        written = transcode.result()
+                        if image_data.duplicate_of is None:
+                            tracing.add("bytes_written", written)
+                    except Exception as e:
+                        if image_data.image_path not in failed_paths:
+                            logger.error(f"Error transcoding image {image_data.image_path}: {e}")
+                            failed_paths.add(image_data.image_path)
+                pending.popleft()
+                if image_data.image_path in failed_paths:
+                    continue
+                images.append(image_data)
+                images_metadata.append(metadata)
+                if on_image:
+                    on_image(image_data)
 
         try:
-            doc = fitz.open(doc_path)
+            if owns_session:
+                session = PDFDocumentSession(doc_path)
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                image_list = page.get_images()
+            for page_record in session.pages:
+                page_num = page_record["num"] - 1
+                image_list = page_record["image_xrefs"]
 
                 # Find corresponding section for this page
                 section_number = None
@@ -32,49 +103,86 @@ class ImageProcessor:
                         if section.page_number <= page_num + 1:
                             section_number = section.chapter_number
 
-                for img_idx, img in enumerate(image_list):
+                for img_idx, xref in enumerate(image_list):
                     try:
-                        xref = img[0]
-                        base_img = doc.extract_image(xref)
-                        image_bytes = base_img["image"]
-
-                        image = Image.open(io.BytesIO(image_bytes))
-                        width, height = image.size
-
-                        image_filename = f"page_{page_num + 1}_img_{img_idx + 1}.png"
-                        image_path = os.path.join(images_dir, image_filename)
-                        image.save(image_path)
-
-                        image_data = PDFImage(
-                            page_number=page_num + 1,
-                            image_path=image_path,
-                            pdf_name=pdf_name,
-                            width=width,
-                            height=height,
-                            section_number=section_number
-                        )
-                        images.append(image_data)
-
-                        images_metadata.append({
+                        # Each xref, and each distinct payload, is decoded and written once per book;
+                        # repeats become references to the first copy.
+                        original = images_by_xref.get(xref)
+                        if original is None:
+                            base_img = session.extract_image(xref)
+                            image_bytes = base_img["image"]
+                            content_hash = hashlib.sha256(image_bytes).hexdigest()
+                            original = images_by_hash.get(content_hash)
+
+                        if original is not None:
+                            images_by_xref[xref] = original
+                            duplicate_count += 1
+                            image_data = PDFImage(
+                                page_number=page_num + 1,
+                                image_path=original.image_path,
+                                pdf_name=pdf_name,
+                                width=original.width,
+                                height=original.height,
+                                section_number=section_number,
+                                content_hash=original.content_hash,
+                                duplicate_of=original.image_path
+                            )
+                        else:
+                            # Dimensions come from the xref metadata, no decode needed
+                            ext = base_img["ext"].lower()
+                            if self.transcode or ext not in WEB_IMAGE_FORMATS:
+                                image_filename = f"page_{page_num + 1}_img_{img_idx + 1}.png"
+                                image_path = os.path.join(images_dir, image_filename)
+                                transcodes[image_path] = transcode_pool.submit(self._transcode_to_png, image_bytes, image_path)
+                            else:
+                                image_filename = f"page_{page_num + 1}_img_{img_idx + 1}.{ext}"
+                                image_path = os.path.join(images_dir, image_filename)
+                                self._write_bytes(image_bytes, image_path)
+                                tracing.add("bytes_written", len(image_bytes))
+                            tracing.add("images")
+
+                            image_data = PDFImage(
+                                page_number=page_num + 1,
+                                image_path=image_path,
+                                pdf_name=pdf_name,
+                                width=base_img["width"],
+                                height=base_img["height"],
+                                section_number=section_number,
+                                content_hash=content_hash
+                            )
+                            images_by_xref[xref] = image_data
+                            images_by_hash[content_hash] = image_data
+
+                        pending.append((image_data, {
                             "page_number": page_num + 1,
-                            "image_path": image_path,
-                            "width": width,
-                            "height": height,
-                            "filename": image_filename,
-                            "section_number": section_number
-                        })
+                            "image_path": image_data.image_path,
+                            "width": image_data.width,
+                            "height": image_data.height,
+                            "filename": os.path.basename(image_data.image_path),
+                            "section_number": section_number,
+                            "content_hash": image_data.content_hash,
+                            "duplicate_of": os.path.basename(image_data.duplicate_of) if image_data.duplicate_of else None
+                        }, transcodes.get(image_data.image_path)))
                     except Exception as e:
-                        print(f"Error extracting image {img_idx} from page {page_num + 1}: {e}")
+                        logger.error(f"Error extracting image {img_idx} from page {page_num + 1}: {e}")
                         continue
+                record_written(wait=False)
+
+            record_written(wait=True)
 
-            doc.close()
+            if duplicate_count:
+                logger.info(f"Skipped {duplicate_count} duplicate images, stored as references")
+                tracing.add("duplicate_images", duplicate_count)
 
             # Save images metadata
             metadata_path = os.path.join(metadata_dir, "images.json")
-            with open(metadata_path, 'w') as f:
-                json.dump(images_metadata, f, indent=2)
+            FileSystemProcessor.write_json_atomic(metadata_path, images_metadata, indent=2)
 
         except Exception as e:
-            print(f"Error processing PDF for images: {e}")
+            logger.error(f"Error processing PDF for images: {e}")
+        finally:
+            transcode_pool.shutdown(wait=True)
+            if owns_session and session is not None:
+                session.close()
 
         return images
@@ -0,0 +1,251 @@
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..domain.entities import JobStatus, ProcessingJob, ProcessingProgress, ProcessingStatus
+
+logger = logging.getLogger(__name__)
+
+ProgressReporter = Callable[[ProcessingProgress], None]
+JobHandler = Callable[[ProcessingJob, ProgressReporter], Dict[str, Any]]
+
+
+class JobQueue:
+    """
+    SQLite-backed queue of PDF processing jobs served by a pool of worker threads.
+
+    Several processes may share one database. A job is claimed with a single
+    atomic UPDATE, and its owner holds a lease on it that a heartbeat renews
+    while the job runs. Jobs survive restarts: anything still queued is picked
+    up, and a running job whose lease ran out (its process died) is claimed
+    again, while jobs a live process is still running are left alone. The
+    handler runs in a worker thread, receives a reporter to publish live
+    ProcessingProgress, and returns the job result as a JSON-serialisable dict.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        handler: JobHandler,
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 60.0,
+        progress_interval: float = 1.0,
+    ):
+        self.db_path = db_path
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        # A running job whose lease is not renewed for this long is considered abandoned
+        self.lease_seconds = lease_seconds
+        # Progress updates of a job are stored at most this often; status changes always are
+        self.progress_interval = progress_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        # job id -> (time of the last stored update, status it stored)
+        self._progress_writes: Dict[str, Tuple[float, str]] = {}
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._connection = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+        self._connection.row_factory = sqlite3.Row
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress TEXT NOT NULL,
+                    result TEXT,
+                    error_message TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+            columns = {row["name"] for row in self._connection.execute("PRAGMA table_info(jobs)")}
+            if "owner" not in columns:
+                # Databases created before leases: their running jobs have no lease and count as abandoned
+                self._connection.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+                self._connection.execute("ALTER TABLE jobs ADD COLUMN lease_expires REAL")
+            if "markdown_mode" not in columns:
+                self._connection.execute("ALTER TABLE jobs ADD COLUMN markdown_mode TEXT")
+
+    def start(self) -> None:
+        """Start the worker threads and the lease heartbeat (idempotent)."""
+        with self._lock:
+            if self._threads:
+                return
+            abandoned = self._connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ? AND (lease_expires IS NULL OR lease_expires < ?)",
+                (JobStatus.RUNNING.value, time.time()),
+            ).fetchone()[0]
+            if abandoned:
+                logger.warning(f"{abandoned} job(s) interrupted by a previous shutdown will be run again")
+
+            self._stopping.clear()
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._worker_loop, name=f"pdf-job-worker-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            heartbeat = threading.Thread(target=self._heartbeat_loop, name="pdf-job-heartbeat", daemon=True)
+            heartbeat.start()
+            self._threads.append(heartbeat)
+        logger.info(f"Job queue started with {self.workers} worker(s) as {self.owner}")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, filename: str, file_path: str, markdown_mode: Optional[str] = None) -> ProcessingJob:
+        """Queue a PDF for processing, with its page Markdown mode if one was chosen, and return the new job."""
+        now = self._now()
+        job = ProcessingJob(
+            id=uuid.uuid4().hex,
+            filename=filename,
+            file_path=file_path,
+            markdown_mode=markdown_mode,
+            progress=self._serialize_progress(ProcessingProgress(status=ProcessingStatus.NOT_STARTED)),
+            created_at=now,
+            updated_at=now,
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO jobs (id, filename, file_path, markdown_mode, status, progress, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job.id, job.filename, job.file_path, job.markdown_mode, job.status.value, json.dumps(job.progress), now, now),
+            )
+        self._wakeup.set()
+        logger.info(f"Queued job {job.id} for {filename}")
+        return job
+
+    def get(self, job_id: str) -> Optional[ProcessingJob]:
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (JobStatus.QUEUED.value,)
+            ).fetchone()[0]
+
+    def update_progress(self, job_id: str, progress: ProcessingProgress) -> None:
+        """Store a job's progress; updates within progress_interval of the last stored one are skipped."""
+        now = time.monotonic()
+        last_write = self._progress_writes.get(job_id)
+        if last_write and now - last_write[0] < self.progress_interval and last_write[1] == progress.status.value:
+            return
+        self._progress_writes[job_id] = (now, progress.status.value)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET progress = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(self._serialize_progress(progress)), self._now(), job_id),
+            )
+
+    def _claim_next(self) -> Optional[ProcessingJob]:
+        """Atomically take the oldest queued or abandoned job, even against other processes."""
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                """
+                UPDATE jobs SET status = :running, owner = :owner, lease_expires = :lease, updated_at = :updated
+                WHERE id = (
+                    SELECT id FROM jobs
+                    WHERE status = :queued OR (status = :running AND (lease_expires IS NULL OR lease_expires < :now))
+                    ORDER BY created_at LIMIT 1
+                )
+                AND (status = :queued OR lease_expires IS NULL OR lease_expires < :now)
+                RETURNING *
+                """,
+                {
+                    "running": JobStatus.RUNNING.value, "queued": JobStatus.QUEUED.value, "owner": self.owner,
+                    "lease": now + self.lease_seconds, "updated": self._now(), "now": now,
+                },
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def _renew_leases(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE owner = ? AND status = ?",
+                (time.time() + self.lease_seconds, self.owner, JobStatus.RUNNING.value),
+            )
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stopping.wait(self.lease_seconds / 3):
+            try:
+                self._renew_leases()
+            except sqlite3.Error as e:
+                logger.error(f"Could not renew job leases: {e}")
+
+    def _finish(self, job_id: str, status: JobStatus, result: Optional[Dict[str, Any]] = None, error_message: Optional[str] = None) -> None:
+        self._progress_writes.pop(job_id, None)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, result = ?, error_message = ?, owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND owner = ?",
+                (status.value, json.dumps(result) if result is not None else None, error_message, self._now(), job_id, self.owner),
+            )
+
+    def _worker_loop(self) -> None:
+        while not self._stopping.is_set():
+            job = self._claim_next()
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            logger.info(f"Worker {threading.current_thread().name} processing job {job.id} ({job.filename})")
+            try:
+                result = self.handler(job, lambda progress, job_id=job.id: self.update_progress(job_id, progress))
+                self._finish(job.id, JobStatus.COMPLETED, result=result)
+                logger.info(f"Job {job.id} completed")
+            except Exception as e:
+                logger.error(f"Job {job.id} failed: {e}")
+                self._finish(job.id, JobStatus.FAILED, error_message=str(e))
+
+    @staticmethod
+    def _serialize_progress(progress: ProcessingProgress) -> Dict[str, Any]:
+        progress_data = asdict(progress)
+        progress_data["status"] = progress.status.value
+        return progress_data
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> ProcessingJob:
+        return ProcessingJob(
+            id=row["id"],
+            filename=row["filename"],
+            file_path=row["file_path"],
+            markdown_mode=row["markdown_mode"],
+            status=JobStatus(row["status"]),
+            progress=json.loads(row["progress"]),
+            result=json.loads(row["result"]) if row["result"] else None,
+            error_message=row["error_message"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat()
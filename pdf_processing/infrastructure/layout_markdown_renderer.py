@@ -0,0 +1,259 @@
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+from ..domain.entities import TextFormatting
+from .heuristic_chapter_detector import body_font_size
+from .text_format_processor import TextFormatProcessor
+
+logger = logging.getLogger(__name__)
+
+BULLET_PREFIX = re.compile(r'^[-•*·▪●◦]\s*')
+NUMBERED_PREFIX = re.compile(r'^(\d+)[.)]\s+')
+SENTENCE_END = re.compile(r'[.!?:»"”)]$')
+
+
+class LayoutMarkdownRenderer:
+    """
+    Local page-to-Markdown conversion from PyMuPDF's typography.
+
+    Uses the page record's text lines (font size, bold/italic flags, bbox)
+    instead of asking the LLM to re-format text that is already extracted:
+    lines clearly larger than the book's body text become headings, short bold
+    standalone lines become sub-headings, TextFormatProcessor's list and quote
+    classes become list items and block quotes, and the remaining lines are
+    joined into paragraphs using their vertical gaps.
+
+    Every page gets a confidence score. Layouts the rules handle poorly (side
+    by side columns or tables, fragmented form-like text, many font sizes)
+    score low, so a hybrid run can send only those pages to the LLM.
+    """
+
+    def __init__(self, text_formatter: Optional[TextFormatProcessor] = None):
+        self.text_formatter = text_formatter or TextFormatProcessor()
+        self.body_size: Optional[float] = None
+
+    def calibrate(self, pages: List[Dict[str, Any]]) -> Optional[float]:
+        """Set the body text size of the book the following pages belong to."""
+        self.body_size = body_font_size(pages)
+        return self.body_size
+
+    def render(self, page: Dict[str, Any]) -> Tuple[str, float]:
+        """
+        Render a page as Markdown.
+
+        Args:
+            page (Dict[str, Any]): Page record with "text", "lines", "width" and "height".
+
+        Returns:
+            Tuple[str, float]: The Markdown and a confidence between 0 and 1.
+        """
+        lines = [line for line in page.get("lines", []) if line["text"]]
+        if not lines:
+            # Nothing to lay out; text without line data cannot be trusted to the rules
+            return "", 0.0 if page.get("text") else 1.0
+
+        page_height = page.get("height") or 0.0
+        lines = [line for line in self._merge_rows(lines) if not self._is_page_number(line, page_height)]
+        body_size = self.body_size or self._median_size(lines)
+        formats = self.text_formatter.classify_lines([line["text"] for line in lines])
+        left_margin = min(line["bbox"][0] for line in lines) if lines else 0.0
+        column_width = max((line["bbox"][2] - left_margin for line in lines), default=0.0)
+
+        blocks: List[str] = []
+        paragraph: List[str] = []
+        list_items: List[str] = []
+        previous = None
+        previous_heading_level = 0
+
+        def flush() -> None:
+            if paragraph:
+                blocks.append(self._join_lines(paragraph))
+                paragraph.clear()
+            if list_items:
+                blocks.append("\n".join(list_items))
+                list_items.clear()
+
+        for line, format_type in zip(lines, formats):
+            text = line["text"]
+            starts_block = previous is None or self._has_gap(previous, line)
+            level = self._heading_level(line, body_size, format_type, starts_block)
+
+            if level:
+                if previous_heading_level == level and not starts_block and blocks and not paragraph and not list_items:
+                    # A heading wrapped over several lines
+                    blocks[-1] += " " + text
+                else:
+                    flush()
+                    blocks.append("#" * level + " " + text)
+                previous_heading_level = level
+            elif format_type == TextFormatting.LIST_ITEM:
+                if paragraph:
+                    flush()
+                numbered = NUMBERED_PREFIX.match(text)
+                item = f"{numbered.group(1)}. {text[numbered.end():]}" if numbered else f"- {BULLET_PREFIX.sub('', text, count=1)}"
+                list_items.append(item)
+                previous_heading_level = 0
+            elif format_type == TextFormatting.QUOTE and (text.startswith(">") or self._is_italic(line)):
+                flush()
+                blocks.append("> " + self._inline(line).lstrip("> "))
+                previous_heading_level = 0
+            else:
+                if list_items and not starts_block:
+                    # A list item wrapped over several lines
+                    list_items[-1] += " " + self._inline(line)
+                else:
+                    if list_items or previous_heading_level or (paragraph and self._ends_paragraph(previous, column_width, left_margin, starts_block)):
+                        flush()
+                    paragraph.append(self._inline(line))
+                previous_heading_level = 0
+            previous = line
+
+        flush()
+        return "\n\n".join(blocks), self._confidence(page, lines)
+
+    @staticmethod
+    def _merge_rows(lines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Join fragments of one visual line.
+
+        PyMuPDF splits justified text into a fragment per word when the word
+        spacing is wide; fragments that follow each other on the same row, a
+        few characters apart, are one line. Wider gaps (columns, table cells)
+        are kept apart.
+        """
+        merged: List[Dict[str, Any]] = []
+        for line in lines:
+            previous = merged[-1] if merged else None
+            if previous is not None:
+                x0, y0, x1, y1 = line["bbox"]
+                px0, py0, px1, py1 = previous["bbox"]
+                overlap = min(y1, py1) - max(y0, py0)
+                gap = x0 - px1
+                if overlap > 0.5 * min(y1 - y0, py1 - py0) and 0 <= gap < 3 * max(line["size"], previous["size"]):
+                    spans = line["spans"]
+                    main = line if len(line["text"]) > len(previous["text"]) else previous
+                    merged[-1] = {
+                        "text": previous["text"] + " " + line["text"],
+                        "bbox": (px0, min(y0, py0), x1, max(y1, py1)),
+                        "size": main["size"],
+                        "bold": main["bold"],
+                        "spans": previous["spans"] + [dict(spans[0], text=" " + spans[0]["text"])] + spans[1:],
+                    }
+                    continue
+            merged.append(line)
+        return merged
+
+    @staticmethod
+    def _median_size(lines: List[Dict[str, Any]]) -> float:
+        sizes = sorted(line["size"] for line in lines)
+        return sizes[len(sizes) // 2] if sizes else 0.0
+
+    @staticmethod
+    def _is_page_number(line: Dict[str, Any], page_height: float) -> bool:
+        """Running page numbers sit alone in the top or bottom margin."""
+        if not line["text"].isdigit() or not page_height:
+            return False
+        return line["bbox"][1] > page_height * 0.9 or line["bbox"][3] < page_height * 0.1
+
+    @staticmethod
+    def _has_gap(previous: Dict[str, Any], line: Dict[str, Any]) -> bool:
+        """Whether a blank line's worth of space separates two lines."""
+        line_height = max(previous["bbox"][3] - previous["bbox"][1], 1.0)
+        return line["bbox"][1] - previous["bbox"][3] > line_height * 0.6
+
+    @staticmethod
+    def _heading_level(line: Dict[str, Any], body_size: float, format_type: TextFormatting, starts_block: bool) -> int:
+        text = line["text"]
+        if len(text) > 80 or text.isdigit() or text.endswith((".", ",", ";")):
+            return 0
+        ratio = line["size"] / body_size if body_size else 1.0
+        if ratio >= 1.6:
+            return 1
+        if ratio >= 1.2:
+            return 2
+        if line["bold"] and starts_block and format_type in (TextFormatting.HEADER, TextFormatting.PARAGRAPH) and len(text.split()) <= 8:
+            return 3
+        return 0
+
+    @staticmethod
+    def _is_italic(line: Dict[str, Any]) -> bool:
+        return all(span["flags"] & fitz.TEXT_FONT_ITALIC for span in line["spans"])
+
+    @staticmethod
+    def _inline(line: Dict[str, Any]) -> str:
+        """The line's text with bold and italic spans marked up."""
+        spans = line["spans"]
+        if len(spans) == 1 and not line["bold"] and not spans[0]["flags"] & fitz.TEXT_FONT_ITALIC:
+            return line["text"]
+        parts = []
+        for span in spans:
+            text = span["text"]
+            core = text.strip()
+            if not core:
+                parts.append(text)
+                continue
+            bold = bool(span["flags"] & fitz.TEXT_FONT_BOLD) or "bold" in span["font"].lower()
+            italic = bool(span["flags"] & fitz.TEXT_FONT_ITALIC)
+            marker = "***" if bold and italic else "**" if bold else "*" if italic else ""
+            if marker:
+                lead, trail = text[:len(text) - len(text.lstrip())], text[len(text.rstrip()):]
+                text = f"{lead}{marker}{core}{marker}{trail}"
+            parts.append(text)
+        # Adjacent emphasis runs read as one
+        return "".join(parts).strip().replace("** **", " ").replace("****", "")
+
+    @staticmethod
+    def _ends_paragraph(previous: Dict[str, Any], column_width: float, left_margin: float, starts_block: bool) -> bool:
+        if starts_block:
+            return True
+        # A short line ending a sentence is the last line of its paragraph
+        previous_width = previous["bbox"][2] - left_margin
+        return bool(SENTENCE_END.search(previous["text"])) and previous_width < column_width * 0.75
+
+    @staticmethod
+    def _join_lines(lines: List[str]) -> str:
+        text = lines[0]
+        for line in lines[1:]:
+            marker = next((marker for marker in ("***", "**", "*") if text.endswith(marker) and line.startswith(marker)), None)
+            if marker:
+                text = text[:-len(marker)] + " " + line[len(marker):]  # emphasis continuing on the next line
+            elif text.endswith("-") and line[:1].islower():
+                text = text[:-1] + line  # word hyphenated across lines
+            else:
+                text += " " + line
+        return text
+
+    def _confidence(self, page: Dict[str, Any], lines: List[Dict[str, Any]]) -> float:
+        """How far the rules can be trusted on this page's layout."""
+        if not lines:
+            return 1.0
+        confidence = 1.0
+        if self.body_size is None:
+            confidence -= 0.2
+
+        # Lines side by side (columns, tables) break the top-to-bottom reading order
+        side_by_side = 0
+        ordered = sorted(lines, key=lambda line: line["bbox"][1])
+        for index, line in enumerate(ordered):
+            for other in ordered[index + 1:index + 6]:
+                if other["bbox"][1] >= line["bbox"][3]:
+                    break
+                if other["bbox"][0] >= line["bbox"][2] or other["bbox"][2] <= line["bbox"][0]:
+                    side_by_side += 1
+                    break
+        if side_by_side > max(2, len(lines) * 0.1):
+            confidence -= 0.5
+
+        # Many tiny fragments: forms, stat blocks, captions scattered around images
+        average_length = sum(len(line["text"]) for line in lines) / len(lines)
+        if len(lines) >= 8 and average_length < 15:
+            confidence -= 0.3
+
+        # Many different font sizes: decorative or complex layout
+        if len({round(line["size"]) for line in lines}) > 4:
+            confidence -= 0.2
+
+        return round(max(confidence, 0.0), 2)
@@ -0,0 +1,219 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import openai
+
+from ..domain.entities import LLMCompletion
+from ..domain.ports import LLMBackend
+
+logger = logging.getLogger(__name__)
+
+# Characters per chunk of the mock's streamed answers
+STREAM_CHUNK_CHARS = 16
+
+
+class TransientLLMError(Exception):
+    """A backend failure worth retrying (the offline stand-in for timeouts and 5xx responses)."""
+
+
+class OpenAIBackend:
+    """Chat completions from the OpenAI API."""
+
+    def __init__(self, client: Optional[openai.AsyncOpenAI] = None):
+        # Retries are the request scheduler's job, so the client itself never retries
+        self.client = client or openai.AsyncOpenAI(max_retries=0)
+
+    async def complete(self, model: str, messages: List[Dict[str, Any]], temperature: float, max_tokens: int) -> LLMCompletion:
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        usage = response.usage
+        return LLMCompletion(
+            content=response.choices[0].message.content or "",
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+        )
+
+    async def stream(self, model: str, messages: List[Dict[str, Any]], temperature: float, max_tokens: int) -> AsyncIterator[LLMCompletion]:
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        async for chunk in response:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            usage = chunk.usage
+            if content or usage:
+                yield LLMCompletion(
+                    content=content or "",
+                    prompt_tokens=usage.prompt_tokens if usage else 0,
+                    completion_tokens=usage.completion_tokens if usage else 0,
+                )
+
+
+class MockLLMBackend:
+    """
+    Offline, deterministic stand-in for the OpenAI backend.
+
+    Recognises the AI processor's prompts and answers them with rules: a page
+    starts a chapter when its first line is a short all-caps title, and page
+    Markdown is the page text with headings and list items marked up. Answers
+    can also be streamed in chunks. Latency and a transient error rate can be
+    simulated; whether a given request fails
+    depends only on the seed, the request and its attempt number, so runs are
+    reproducible however the requests interleave.
+    """
+
+    def __init__(self, latency: float = 0.0, latency_jitter: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.seed = seed
+        self._attempts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "MockLLMBackend":
+        """Build the mock from MOCK_LLM_* environment variables."""
+        return cls(
+            latency=float(os.environ.get("MOCK_LLM_LATENCY", 0.0)),
+            latency_jitter=float(os.environ.get("MOCK_LLM_LATENCY_JITTER", 0.0)),
+            error_rate=float(os.environ.get("MOCK_LLM_ERROR_RATE", 0.0)),
+            seed=int(os.environ.get("MOCK_LLM_SEED", 0)),
+        )
+
+    async def complete(self, model: str, messages: List[Dict[str, Any]], temperature: float, max_tokens: int) -> LLMCompletion:
+        rng, delay = self._attempt(model, messages)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if rng.random() < self.error_rate:
+            raise TransientLLMError(f"Simulated {model} failure")
+        return self._completion(messages)
+
+    async def stream(self, model: str, messages: List[Dict[str, Any]], temperature: float, max_tokens: int) -> AsyncIterator[LLMCompletion]:
+        """
+        Stream the same answer as complete() in small chunks.
+
+        A fifth of the latency passes before the first chunk and the rest is
+        spread over the chunks. A simulated failure can happen mid-stream,
+        after some chunks were delivered.
+        """
+        rng, delay = self._attempt(model, messages)
+        failing = rng.random() < self.error_rate
+        completion = self._completion(messages)
+        content = completion.content
+        pieces = [content[start:start + STREAM_CHUNK_CHARS] for start in range(0, len(content), STREAM_CHUNK_CHARS)]
+        fail_at = rng.randint(0, len(pieces)) if failing else None
+
+        if delay > 0:
+            await asyncio.sleep(delay * 0.2)
+        for index, piece in enumerate(pieces):
+            if index == fail_at:
+                raise TransientLLMError(f"Simulated {model} failure mid-stream")
+            if delay > 0:
+                await asyncio.sleep(delay * 0.8 / len(pieces))
+            yield LLMCompletion(content=piece)
+        if fail_at == len(pieces):
+            raise TransientLLMError(f"Simulated {model} failure mid-stream")
+        # Token usage arrives on a final chunk without content, as with the OpenAI API
+        yield LLMCompletion(content="", prompt_tokens=completion.prompt_tokens, completion_tokens=completion.completion_tokens)
+
+    def _attempt(self, model: str, messages: List[Dict[str, Any]]) -> Tuple[random.Random, float]:
+        """The random source and latency of this attempt at a request."""
+        request_key = hashlib.sha256(json.dumps([model, messages], sort_keys=True).encode("utf-8")).hexdigest()
+        with self._lock:
+            self._attempts[request_key] += 1
+            rng = random.Random(f"{self.seed}:{request_key}:{self._attempts[request_key]}")
+        return rng, self.latency + rng.uniform(-self.latency_jitter, self.latency_jitter)
+
+    def _completion(self, messages: List[Dict[str, Any]]) -> LLMCompletion:
+        prompt = self._text(messages[-1]["content"])
+        content = self._answer(prompt)
+        return LLMCompletion(
+            content=content,
+            prompt_tokens=sum(len(self._text(message["content"])) for message in messages) // 4 + 1,
+            completion_tokens=len(content) // 4 + 1,
+        )
+
+    @staticmethod
+    def _text(content: Any) -> str:
+        """The text of a message; image parts of a vision message are ignored."""
+        if isinstance(content, list):
+            return "".join(part.get("text", "") for part in content if part.get("type") == "text")
+        return content
+
+    def _answer(self, prompt: str) -> str:
+        if prompt.startswith("<<<PAGE "):
+            # Packed Markdown conversion: answer page by page behind the same markers
+            chunks = re.split(r'^<<<PAGE (\d+)>>>\n', prompt, flags=re.MULTILINE)
+            return "\n\n".join(
+                f"<<<PAGE {number}>>>\n{self._markdown(text)}" for number, text in zip(chunks[1::2], chunks[2::2])
+            )
+        if prompt.startswith("Analyze the following text:"):
+            text = prompt[len("Analyze the following text:"):].strip()
+            return json.dumps({"is_chapter": self._is_chapter(text), "chapter_title": self._title(text)})
+
+        try:
+            request = json.loads(prompt)
+        except json.JSONDecodeError:
+            return ""
+        if isinstance(request, list):
+            # Batched chapter detection
+            return json.dumps([
+                {"page": item["page"], "is_chapter": self._is_chapter(item["text"]), "chapter_title": self._title(item["text"])}
+                for item in request
+            ])
+        if isinstance(request, dict) and "text" in request:
+            return self._markdown(request["text"])
+        return ""
+
+    @staticmethod
+    def _first_line(text: str) -> str:
+        return next((line.strip() for line in text.splitlines() if line.strip()), "")
+
+    def _is_chapter(self, text: str) -> bool:
+        first_line = self._first_line(text)
+        return bool(first_line) and first_line.isupper() and len(first_line) < 60 and not first_line.isdigit()
+
+    def _title(self, text: str) -> Optional[str]:
+        return self._first_line(text) if self._is_chapter(text) else None
+
+    @staticmethod
+    def _markdown(text: str) -> str:
+        blocks = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.isupper() and len(line) < 60 and not line.isdigit():
+                blocks.append(f"## {line.title()}")
+            elif line.startswith(("•", "-", "*")):
+                blocks.append(f"- {line.lstrip('•-* ')}")
+            else:
+                blocks.append(line)
+        return "\n\n".join(blocks)
+
+
+def create_llm_backend() -> LLMBackend:
+    """Pick the backend named by LLM_BACKEND ("openai", the default, or "mock")."""
+    backend_name = os.environ.get("LLM_BACKEND", "openai").lower()
+    if backend_name == "mock":
+        logger.info("Using the offline mock LLM backend")
+        return MockLLMBackend.from_env()
+    if backend_name != "openai":
+        raise ValueError(f"Unknown LLM_BACKEND {backend_name!r}; expected 'openai' or 'mock'")
+    return OpenAIBackend()
@@ -0,0 +1,120 @@
+import asyncio
+import re
+from typing import AsyncIterator, List, Union
+
+# A restart discards everything the stream delivered before it (a retried request starts over)
+RESTART = object()
+_END = object()
+
+# An opening fence (```markdown, ```json or bare ```) with content after it, and a start that may still become one
+_FENCED_CONTENT = re.compile(r'```(?:markdown|json)?\n\s*(?=\S)')
+_HELD_TAIL = re.compile(r'[\s`]*\Z')
+_FENCE_PREFIX = re.compile(r'`{0,3}|```(?:m(?:a(?:r(?:k(?:d(?:o(?:w(?:n)?)?)?)?)?)?)?|j(?:s(?:o(?:n)?)?)?)?\s*')
+
+
+class MarkdownStream:
+    """
+    One page's Markdown as it is generated.
+
+    The producer writes chunks as they come off the LLM response, restarts
+    the stream when a failed request is retried, and closes it when the page
+    is done. The consumer iterates the stream in its own time; chunks that
+    queued up meanwhile are handed over joined, so a slow consumer gets fewer,
+    larger pieces.
+    """
+
+    def __init__(self):
+        self._queue: "asyncio.Queue[object]" = asyncio.Queue()
+        self._written: List[str] = []
+        self.closed = False
+
+    @classmethod
+    def of(cls, text: str) -> "MarkdownStream":
+        """A finished stream holding text."""
+        stream = cls()
+        stream.write(text)
+        stream.close()
+        return stream
+
+    @property
+    def text(self) -> str:
+        """Everything written since the last restart."""
+        return "".join(self._written)
+
+    def write(self, text: str) -> None:
+        if text:
+            self._written.append(text)
+            self._queue.put_nowait(text)
+
+    def restart(self) -> None:
+        self._written.clear()
+        self._queue.put_nowait(RESTART)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(_END)
+
+    async def __aiter__(self) -> AsyncIterator[Union[str, object]]:
+        """Yield text, or RESTART when what was yielded so far must be dropped."""
+        while True:
+            items = [await self._queue.get()]
+            while not self._queue.empty():
+                items.append(self._queue.get_nowait())
+
+            done = items[-1] is _END
+            if done:
+                items.pop()
+            if RESTART in items:
+                yield RESTART
+                items = items[len(items) - items[::-1].index(RESTART):]
+            if items:
+                yield "".join(items)
+            if done:
+                return
+
+
+class FenceStripper:
+    """
+    Removes a code fence wrapped around streamed Markdown, chunk by chunk.
+
+    Gives the same text as stripping the whole response, dropping a leading
+    ```markdown (or ```json, or bare ```) line and a trailing ```, and
+    stripping again. The start is held back until the opening fence can be
+    recognised, and trailing whitespace and backticks are held back until
+    more text follows them.
+    """
+
+    def __init__(self):
+        self._head = ""
+        self._started = False
+        self._held = ""
+
+    def feed(self, chunk: str) -> str:
+        """Take the next chunk; returns the text that is final already."""
+        if not self._started:
+            self._head = (self._head + chunk).lstrip()
+            fence = _FENCED_CONTENT.match(self._head)
+            if fence is None and _FENCE_PREFIX.fullmatch(self._head):
+                return ""
+            self._started = True
+            chunk = self._head[fence.end():] if fence else self._head
+            self._head = ""
+
+        text = self._held + chunk
+        held_from = _HELD_TAIL.search(text).start()
+        self._held = text[held_from:]
+        return text[:held_from]
+
+    def close(self) -> str:
+        """The remaining text once the response is complete."""
+        if not self._started:
+            # Only whitespace can follow an opening fence here, so it cannot be one
+            text = self._head.strip()
+            self._head = ""
+            return text[:-3].strip() if text.endswith("```") else text
+        tail = self._held.rstrip()
+        if tail.endswith("```"):
+            tail = tail[:-3]
+        self._held = ""
+        return tail.rstrip()
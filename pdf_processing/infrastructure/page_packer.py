@@ -0,0 +1,133 @@
+import logging
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .request_scheduler import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class PagePacker:
+    """
+    Plans the Markdown conversion requests of a book from token estimates.
+
+    A page's Markdown is about as long as its text, so the text's token count
+    stands in for the request's output size. Small consecutive pages of the
+    same chapter share one request instead of paying a full request each, and
+    pages too dense to convert within one response are split into parts that
+    are converted separately and joined again.
+    """
+
+    def __init__(self, small_page_tokens: int = 400, max_pack_tokens: int = 1500, max_pack_pages: int = 6, split_tokens: int = 2500):
+        # Pages at most this size are packed together
+        self.small_page_tokens = small_page_tokens
+        # Budget of a pack's combined text, well under the response's max_tokens
+        self.max_pack_tokens = max_pack_tokens
+        self.max_pack_pages = max_pack_pages
+        # Pages larger than this are split; below the 4000 token response limit with room for Markdown syntax
+        self.split_tokens = split_tokens
+        self.packs = 0
+        self.packed_pages = 0
+        self.split_pages = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["PagePacker"]:
+        """Build the packer from PAGE_PACK_* environment variables, or None if packing is disabled."""
+        if os.environ.get("PAGE_PACKING_ENABLED", "1").lower() in ("0", "false", "no"):
+            return None
+        return cls(
+            small_page_tokens=int(os.environ.get("PAGE_PACK_SMALL_TOKENS", 400)),
+            max_pack_tokens=int(os.environ.get("PAGE_PACK_MAX_TOKENS", 1500)),
+            max_pack_pages=int(os.environ.get("PAGE_PACK_MAX_PAGES", 6)),
+            split_tokens=int(os.environ.get("PAGE_SPLIT_TOKENS", 2500)),
+        )
+
+    # The request scheduler's estimate, so a pack is budgeted as it will be paced
+    estimate_tokens = staticmethod(estimate_tokens)
+
+    def is_small(self, page: Dict[str, Any]) -> bool:
+        return self.estimate_tokens(page["text"]) <= self.small_page_tokens
+
+    def pack(self, pages: List[Dict[str, Any]], chapter_starts: Set[int]) -> List[List[Dict[str, Any]]]:
+        """
+        Group small pages into requests.
+
+        Args:
+            pages (List[Dict[str, Any]]): Small pages, in page order.
+            chapter_starts (Set[int]): Numbers of the pages that start a chapter.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Packs of consecutive pages of one chapter, within the token budget.
+        """
+        packs: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_tokens = 0
+        for page in pages:
+            page_tokens = self.estimate_tokens(page["text"])
+            if current and (
+                page["num"] != current[-1]["num"] + 1  # a page in between is converted on its own
+                or page["num"] in chapter_starts
+                or current_tokens + page_tokens > self.max_pack_tokens
+                or len(current) >= self.max_pack_pages
+            ):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(page)
+            current_tokens += page_tokens
+        if current:
+            packs.append(current)
+
+        self.packs += sum(1 for pack in packs if len(pack) > 1)
+        self.packed_pages += sum(len(pack) for pack in packs if len(pack) > 1)
+        return packs
+
+    def split(self, text: str) -> List[str]:
+        """
+        Cut an oversized page's text into parts within the split budget.
+
+        Parts end at paragraph breaks where possible, then at line breaks; a
+        single line longer than the budget is cut at a space. Text within the
+        budget is returned whole.
+        """
+        if self.estimate_tokens(text) <= self.split_tokens:
+            return [text]
+        self.split_pages += 1
+        max_chars = self.split_tokens * 4
+
+        # (separator before the piece, piece), so joining restores the original breaks
+        pieces: List[Tuple[str, str]] = []
+        for paragraph in text.split("\n\n"):
+            if len(paragraph) <= max_chars:
+                pieces.append(("\n\n", paragraph))
+                continue
+            separator = "\n\n"
+            for line in paragraph.split("\n"):
+                while len(line) > max_chars:
+                    cut = line.rfind(" ", 0, max_chars)
+                    cut = cut if cut > 0 else max_chars
+                    pieces.append((separator, line[:cut]))
+                    line, separator = line[cut:].lstrip(), " "
+                pieces.append((separator, line))
+                separator = "\n"
+
+        parts: List[str] = []
+        current = ""
+        for separator, piece in pieces:
+            if current and len(current) + len(separator) + len(piece) > max_chars:
+                parts.append(current)
+                current = piece
+            else:
+                current = current + separator + piece if current else piece
+        if current:
+            parts.append(current)
+        return parts
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many packed requests were made, the pages they covered, and how many pages were split."""
+        return {"packs": self.packs, "packed_pages": self.packed_pages, "split_pages": self.split_pages}
+
+    def reset_stats(self) -> None:
+        """Start counting afresh for the next book."""
+        self.packs = 0
+        self.packed_pages = 0
+        self.split_pages = 0
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import math
+import os
+import shutil
+from typing import Any, Dict, Optional
+
+from ..domain.entities import PageRender
+from .document_session import PDFDocumentSession
+from .file_system_processor import FileSystemProcessor
+from .metrics import metrics_registry
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+IMAGE_DETAILS = ("low", "high")
+# High detail images are billed per 512px tile; shrinking by up to this much to drop a row or column of tiles is worth it
+TILE = 512
+TILE_SNAP_MIN_SCALE = 0.85
+PAGE_RENDERS = metrics_registry.counter("page_renders_total", "Page images sent to the LLM, by whether the render was cached", ("result",))
+PAGE_IMAGE_TOKENS = metrics_registry.counter("page_image_tokens_total", "Estimated prompt tokens of page images sent to the LLM")
+
+
+def estimate_image_tokens(width: int, height: int, detail: str = "high") -> int:
+    """
+    Prompt tokens the vision model charges for an image.
+
+    A low detail image costs a flat 85 tokens. A high detail image is scaled to
+    fit 2048x2048, then until its shortest side is at most 768px, and costs
+    170 tokens per 512px tile plus 85.
+    """
+    if detail == "low":
+        return 85
+    width, height = float(width), float(height)
+    if max(width, height) > 2048:
+        scale = 2048 / max(width, height)
+        width, height = width * scale, height * scale
+    if min(width, height) > 768:
+        scale = 768 / min(width, height)
+        width, height = width * scale, height * scale
+    tiles = math.ceil(width / TILE) * math.ceil(height / TILE)
+    return 85 + 170 * tiles
+
+
+class PageRenderer:
+    """
+    Renders pages as compact JPEG images for the multimodal model.
+
+    Each page is rendered at the smallest scale that keeps its body text
+    legible: the page's dominant font size is scaled to text_px pixels, between
+    min_dpi and max_dpi. The scale never goes past the size the API itself
+    downsamples to, so no pixel is uploaded only to be thrown away, and it is
+    nudged down when that saves a row or column of billed tiles. Renders are
+    grayscale JPEGs by default and are cached on disk per page and settings
+    until the book completes, so a resumed run does not render them again.
+
+    Page images are off unless PAGE_IMAGES_ENABLED is set: requests carrying
+    an image have different cache keys, so turning them on re-analyzes pages
+    whose responses are already cached.
+    """
+
+    def __init__(
+        self,
+        max_dpi: int = 150,
+        min_dpi: int = 50,
+        text_px: float = 14.0,
+        grayscale: bool = True,
+        jpeg_quality: int = 60,
+        detail: str = "high",
+        adaptive: bool = True,
+    ):
+        if detail not in IMAGE_DETAILS:
+            raise ValueError(f"Unknown image detail {detail!r}; expected one of {', '.join(IMAGE_DETAILS)}")
+        self.max_dpi = max_dpi
+        self.min_dpi = min(min_dpi, max_dpi)
+        self.text_px = text_px
+        self.grayscale = grayscale
+        self.jpeg_quality = jpeg_quality
+        self.detail = detail
+        self.adaptive = adaptive
+
+    @classmethod
+    def from_env(cls) -> Optional["PageRenderer"]:
+        """Build the renderer from PAGE_IMAGE_* environment variables, or None if page images are disabled."""
+        if os.environ.get("PAGE_IMAGES_ENABLED", "0").lower() in ("0", "false", "no"):
+            return None
+        return cls(
+            max_dpi=int(os.environ.get("PAGE_IMAGE_DPI", 150)),
+            min_dpi=int(os.environ.get("PAGE_IMAGE_MIN_DPI", 50)),
+            text_px=float(os.environ.get("PAGE_IMAGE_TEXT_PX", 14.0)),
+            grayscale=os.environ.get("PAGE_IMAGE_GRAYSCALE", "1").lower() not in ("0", "false", "no"),
+            jpeg_quality=int(os.environ.get("PAGE_IMAGE_JPEG_QUALITY", 60)),
+            detail=os.environ.get("PAGE_IMAGE_DETAIL", "high").lower(),
+            adaptive=os.environ.get("PAGE_IMAGE_ADAPTIVE", "1").lower() not in ("0", "false", "no"),
+        )
+
+    @staticmethod
+    def cache_dir_for(metadata_dir: str, pdf_path: str) -> str:
+        """The render cache of one version of a PDF; a replaced file gets a fresh cache."""
+        stat = os.stat(pdf_path)
+        return os.path.join(metadata_dir, "page_renders", f"{stat.st_size:x}-{stat.st_mtime_ns:x}")
+
+    @staticmethod
+    async def clear_cache(metadata_dir: str) -> None:
+        """Delete every render of a book, once its pages no longer need them."""
+        await asyncio.to_thread(shutil.rmtree, os.path.join(metadata_dir, "page_renders"), ignore_errors=True)
+
+    def dpi_for(self, page: Dict[str, Any]) -> int:
+        """The resolution a page is rendered at."""
+        width, height = page.get("width") or 612.0, page.get("height") or 792.0
+        dpi = float(self.max_dpi)
+        if self.adaptive:
+            text_size = self._text_size(page)
+            if text_size:
+                dpi = max(self.min_dpi, min(dpi, 72 * self.text_px / text_size))
+        # Pixels past what the API keeps are downsampled away on arrival
+        longest_side_px = 512 if self.detail == "low" else 2048
+        shortest_side_px = 512 if self.detail == "low" else 768
+        dpi = min(dpi, 72 * longest_side_px / max(width, height), 72 * shortest_side_px / min(width, height))
+        if self.adaptive and self.detail == "high":
+            # Just past a tile boundary: a slightly smaller image costs a whole row or column less
+            snaps = [
+                (side * dpi / 72 // TILE) * TILE / (side * dpi / 72)
+                for side in (width, height)
+                if side * dpi / 72 > TILE
+            ]
+            snaps = [scale for scale in snaps if TILE_SNAP_MIN_SCALE <= scale < 1]
+            if snaps:
+                dpi = max(dpi * min(snaps), self.min_dpi)
+        return max(int(dpi), 1)
+
+    async def render(self, session: PDFDocumentSession, page: Dict[str, Any], cache_dir: str) -> PageRender:
+        """
+        Render a page, or reuse its cached render.
+
+        Args:
+            session (PDFDocumentSession): Open document the page belongs to.
+            page (Dict[str, Any]): Page record with "num", "lines", "width" and "height".
+            cache_dir (str): Directory holding the book's page renders.
+
+        Returns:
+            PageRender: The image file, its size and its estimated token cost.
+        """
+        dpi = self.dpi_for(page)
+        zoom = dpi / 72
+        width = round((page.get("width") or 612.0) * zoom)
+        height = round((page.get("height") or 792.0) * zoom)
+        color = "gray" if self.grayscale else "rgb"
+        image_path = os.path.join(cache_dir, f"page_{page['num']:04d}_{dpi}dpi_{color}_q{self.jpeg_quality}.jpg")
+
+        if await asyncio.to_thread(os.path.exists, image_path):
+            PAGE_RENDERS.labels("cached").inc()
+        else:
+            with tracing.span("render_page", page=page["num"], dpi=dpi):
+                data = await asyncio.to_thread(session.render_page, page["num"], zoom, self.grayscale, self.jpeg_quality)
+                await asyncio.to_thread(self._save, image_path, data)
+            PAGE_RENDERS.labels("rendered").inc()
+
+        tokens = estimate_image_tokens(width, height, self.detail)
+        PAGE_IMAGE_TOKENS.inc(tokens)
+        tracing.add("image_tokens", tokens)
+        logger.debug(f"Page {page['num']} image: {width}x{height} at {dpi} DPI, about {tokens} tokens")
+        return PageRender(
+            page_number=page["num"], image_path=image_path, width=width, height=height, dpi=dpi, tokens=tokens,
+            detail=self.detail,
+        )
+
+    @staticmethod
+    def _save(image_path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(image_path), exist_ok=True)
+        FileSystemProcessor.write_atomic(image_path, data)
+
+    @staticmethod
+    def _text_size(page: Dict[str, Any]) -> Optional[float]:
+        """The font size most of the page's characters are set in."""
+        characters: Dict[float, int] = {}
+        for line in page.get("lines", []):
+            size = round(line["size"], 1)
+            characters[size] = characters.get(size, 0) + len(line["text"])
+        return max(characters, key=characters.get) if characters else None
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import fitz  # PyMuPDF
+
+from .document_session import extract_page_record
+
+logger = logging.getLogger(__name__)
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[Dict[str, Any]]:
+    """Worker entry point: open a private document and extract pages [start, stop)."""
+    doc = fitz.open(pdf_path)
+    try:
+        return [extract_page_record(doc[page_index]) for page_index in range(start, stop)]
+    finally:
+        doc.close()
+
+
+class ParallelPageExtractor:
+    """
+    Split PyMuPDF page extraction across worker processes.
+
+    Each worker opens its own fitz.Document for a contiguous page range, so the
+    work runs on every core and off the event loop thread. Results are streamed
+    back in page order as soon as the chunk holding the next page is done.
+    The pool is started on first use and its processes run until close().
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 16, min_pages: int = 64):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # Below this size the process start-up cost outweighs the gain
+        self.min_pages = min_pages
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls) -> "ParallelPageExtractor":
+        workers = os.environ.get("PDF_EXTRACTION_WORKERS")
+        return cls(
+            max_workers=int(workers) if workers else None,
+            chunk_size=int(os.environ.get("PDF_EXTRACTION_CHUNK_SIZE", 16)),
+            min_pages=int(os.environ.get("PDF_EXTRACTION_MIN_PAGES", 64)),
+        )
+
+    def should_parallelize(self, page_count: int) -> bool:
+        return self.max_workers > 1 and page_count >= self.min_pages
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers do not inherit the web server's threads and locks
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _submit_chunks(self, pdf_path: str, page_count: int) -> List[Future]:
+        executor = self._get_executor()
+        return [
+            executor.submit(_extract_page_range, pdf_path, start, min(start + self.chunk_size, page_count))
+            for start in range(0, page_count, self.chunk_size)
+        ]
+
+    def extract_pages(self, pdf_path: str, page_count: int) -> Iterator[Dict[str, Any]]:
+        """Yield page records in order, blocking until each chunk is ready."""
+        futures = self._submit_chunks(pdf_path, page_count)
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def iter_pages(self, pdf_path: str, page_count: int) -> AsyncIterator[Dict[str, Any]]:
+        """Yield page records in order without blocking the event loop."""
+        futures = self._submit_chunks(pdf_path, page_count)
+        try:
+            for future in futures:
+                for page in await asyncio.wrap_future(future):
+                    yield page
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def __enter__(self) -> "ParallelPageExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut the worker processes down; a later extraction starts a new pool."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
@@ -1,49 +1,147 @@
-import fitz  # PyMuPDF
+import asyncio
+import functools
+import hashlib
 import logging
 import os
-from typing import List, Dict
+import time
+from dataclasses import asdict
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple
 
-from ..domain.entities import Section, ProcessedPDF, ProcessingProgress, ProcessingStatus
+from ..domain.entities import Section, PDFImage, PageRender, ProcessedPDF, ProcessingProgress, ProcessingStatus
 from .ai_processor import AIProcessor
 from .section_processor import SectionProcessor
 from .file_system_processor import FileSystemProcessor
 from .image_processor import ImageProcessor
+from .document_session import PDFDocumentSession
+from .parallel_extractor import ParallelPageExtractor
+from .progress_bus import ProgressBus, content_channel
+from .checkpoint_store import IngestionCheckpoint
+from .heuristic_chapter_detector import HeuristicChapterDetector
+from .chapter_writer import ChapterWriter
+from .markdown_stream import RESTART, MarkdownStream
+from .layout_markdown_renderer import LayoutMarkdownRenderer
+from .page_renderer import PageRenderer
+from .page_packer import PagePacker
+from .metrics import metrics_registry
+from . import tracing
 from ..domain.ports import PDFProcessor, PDFRepository
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# How page Markdown is produced: by the LLM, by the local layout renderer, or
+# locally with the LLM only for pages the renderer is not confident about
+MARKDOWN_MODES = ("llm", "local", "hybrid")
+# Streamed Markdown is published at most this often per page
+CONTENT_EVENT_INTERVAL = 0.25
+PAGES_RENDERED = metrics_registry.counter("pdf_pages_rendered_total", "Pages converted to Markdown, by renderer", ("renderer",))
+
 class MuPDFProcessor(PDFProcessor):
-    def __init__(self, repository: PDFRepository):
+    def __init__(
+        self,
+        repository: PDFRepository,
+        max_concurrent: Optional[int] = None,
+        page_extractor: Optional[ParallelPageExtractor] = None,
+        progress_bus: Optional[ProgressBus] = None,
+        resume: bool = True,
+        chapter_detector: Optional[HeuristicChapterDetector] = None,
+        ai_processor: Optional[AIProcessor] = None,
+        markdown_renderer: Optional[LayoutMarkdownRenderer] = None,
+        markdown_mode: Optional[str] = None,
+        markdown_min_confidence: Optional[float] = None,
+        page_renderer: Optional[PageRenderer] = None,
+        page_packer: Optional[PagePacker] = None,
+    ):
         self.repository = repository
-        self.ai_processor = AIProcessor()
+        self.ai_processor = ai_processor or AIProcessor()
         self.file_system_processor = FileSystemProcessor()
         self.image_processor = ImageProcessor()
+        # Number of pages allowed in the AI stage at the same time
+        self.max_concurrent = max_concurrent or self.ai_processor.max_concurrent
+        # Worker pool for PyMuPDF page extraction on large documents; a pool passed in
+        # may be shared with other processors, so close() only shuts down one made here
+        self.page_extractor = page_extractor or ParallelPageExtractor.from_env()
+        self._owns_page_extractor = page_extractor is None
+        # Optional live event stream (pages, chapters, images) keyed by book folder name
+        self.progress_bus = progress_bus
+        # Checkpoint every page so an interrupted book resumes where it stopped
+        self.resume = resume
+        # Typography classifier deciding obvious chapter starts without the LLM
+        self.chapter_detector = chapter_detector if chapter_detector is not None else HeuristicChapterDetector.from_env()
+        # Local typography-based Markdown, used instead of or before the LLM (PAGE_MARKDOWN_MODE)
+        self.markdown_renderer = markdown_renderer or LayoutMarkdownRenderer()
+        self.markdown_mode = self._check_markdown_mode(markdown_mode or os.environ.get("PAGE_MARKDOWN_MODE", "llm"))
+        # Hybrid mode sends pages rendered with a lower confidence to the LLM
+        if markdown_min_confidence is None:
+            markdown_min_confidence = float(os.environ.get("PAGE_MARKDOWN_MIN_CONFIDENCE", 0.7))
+        self.markdown_min_confidence = markdown_min_confidence
+        self.markdown_stats = {"local": 0, "llm": 0}
+        # Page images sent along with the text of pages the LLM converts (PAGE_IMAGE_*)
+        self.page_renderer = page_renderer if page_renderer is not None else PageRenderer.from_env()
+        # Small pages share LLM requests and oversized ones are split (PAGE_PACK_*)
+        self.page_packer = page_packer if page_packer is not None else PagePacker.from_env()
+
+    def close(self) -> None:
+        if self._owns_page_extractor:
+            self.page_extractor.close()
+
+    @staticmethod
+    def _check_markdown_mode(markdown_mode: str) -> str:
+        markdown_mode = markdown_mode.lower()
+        if markdown_mode not in MARKDOWN_MODES:
+            raise ValueError(f"Unknown page Markdown mode {markdown_mode!r}; expected one of {', '.join(MARKDOWN_MODES)}")
+        return markdown_mode
 
-    async def extract_sections(self, pdf_path: str, base_output_dir: str = "sections") -> ProcessedPDF:
+    async def extract_sections(
+        self,
+        pdf_path: str,
+        base_output_dir: str = "sections",
+        progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
+        markdown_mode: Optional[str] = None,
+    ) -> ProcessedPDF:
         logger.info(f"Starting PDF processing for: {pdf_path}")
+        markdown_mode = self._check_markdown_mode(markdown_mode) if markdown_mode else self.markdown_mode
+        # The processor serves many books; the counters logged at the end cover this one
+        if self.chapter_detector:
+            self.chapter_detector.reset_stats()
+        if self.page_packer:
+            self.page_packer.reset_stats()
+        self.markdown_stats = {"local": 0, "llm": 0}
 
         pdf_folder_name = self.file_system_processor.get_pdf_folder_name(pdf_path)
         paths = self.file_system_processor.create_book_structure(base_output_dir, pdf_folder_name)
         histoire_dir = paths["histoire_dir"]
         images_dir = paths["images_dir"]
         metadata_dir = paths["metadata_dir"]
+        await self.repository.start_book(pdf_folder_name, base_output_dir)
 
+        session = None
+        progress_writes: List[asyncio.Task] = []
+        chapter_writer = ChapterWriter(histoire_dir)
+        progress = ProcessingProgress(status=ProcessingStatus.INITIALIZING)
         try:
-            doc = fitz.open(pdf_path)
-            progress = ProcessingProgress(status=ProcessingStatus.INITIALIZING, total_pages=len(doc))
+            # Replaces the previous run's retained content_end, so new clients wait for this run's Markdown
+            self._publish_content(pdf_folder_name, "content_start", retain=True)
+            # Parse the document once; every stage below shares this session
+            session = PDFDocumentSession(pdf_path, extractor=self.page_extractor)
+            progress.total_pages = session.page_count
+            self._report_progress(pdf_folder_name, progress, progress_callback)
             sections = []
-            content_buffer = ""
-            current_chapter_number = 0
 
-            # Extract pages with text
-            pages = SectionProcessor.extract_text_from_pdf(pdf_path)
+            # Extract pages with text, off the event loop thread
+            progress.status = ProcessingStatus.ANALYZING_STRUCTURE
+            self._report_progress(pdf_folder_name, progress, progress_callback)
+            with tracing.span("load_pages", pages=session.page_count):
+                pages = await session.load_pages()
 
-            # Find the page where section 1 starts
-            section_one_page = SectionProcessor.find_section(pages, section_number=1)
+            # Index every numbered section in one pass; section 1 ends the pre-sections
+            with tracing.span("index_sections"):
+                section_index = SectionProcessor.build_section_index(pages)
+            section_one_page = section_index.page_of(1)
             if section_one_page:
                 logger.info(f"Section 1 found on page {section_one_page}. Stopping extraction before this page.")
 
+            pages_to_analyze = []
             for page in pages:
                 page_num = page["num"]
                 page_text = page["text"]
@@ -52,49 +150,105 @@ class MuPDFProcessor(PDFProcessor):
                     logger.warning(f"Page {page_num} is empty. Skipping...")
                     continue
 
-                logger.debug(f"Processing page {page_num}")
-
                 # Stop extraction before the section 1 page
                 if section_one_page and page_num >= section_one_page:
                     logger.info(f"Stopping extraction before page {page_num} (section 1 detected).")
                     break
 
-                # Detect new chapter titles
-                is_new_chapter, chapter_title = await self.ai_processor.detect_chapter_with_ai(page_text)
-
-                if is_new_chapter:
-                    # Save current chapter content
-                    if content_buffer.strip():
-                        current_chapter_number += 1
-                        self._save_chapter(
-                            current_chapter_number, content_buffer.strip(), page_num, histoire_dir, pdf_folder_name, sections, progress
-                        )
-                    content_buffer = ""  # Reset buffer for new chapter
-
-                # Add page content to buffer
-                markdown_content = await self.ai_processor.analyze_multimodal_page({
-                    "text": page_text,
-                    "num": page_num,
-                    "image_path": None
-                })
-                if markdown_content:
-                    content_buffer += markdown_content + "\n"
-
-            # Save the final chapter content if not empty
-            if content_buffer.strip():
-                current_chapter_number += 1
-                self._save_chapter(
-                    current_chapter_number, content_buffer.strip(), page_num, histoire_dir, pdf_folder_name, sections, progress
+                pages_to_analyze.append(page)
+
+            render_page = None
+            if self.page_renderer:
+                render_page = functools.partial(
+                    self.page_renderer.render, session, cache_dir=PageRenderer.cache_dir_for(metadata_dir, pdf_path)
+                )
+
+            checkpoint = None
+            if self.resume:
+                checkpoint = IngestionCheckpoint(metadata_dir, pdf_path)
+                await checkpoint.load()
+                for page in pages_to_analyze:
+                    if page["num"] not in checkpoint.pages:
+                        break
+                    progress.current_page = page["num"]
+
+            # Pages are analyzed concurrently but consumed in page order, so chapter
+            # boundaries and numbering are identical to a serial run. Each page's
+            # Markdown goes straight to the open chapter file.
+            progress.status = ProcessingStatus.PROCESSING_PRE_SECTIONS
+            self._report_progress(pdf_folder_name, progress, progress_callback)
+            with tracing.span("analyze_pages", pages=len(pages_to_analyze)):
+                async for page, is_new_chapter, chunks in self._analyze_pages(
+                    pages_to_analyze, checkpoint, markdown_mode, render_page
+                ):
+                    if is_new_chapter:
+                        await self._finish_chapter(chapter_writer, page["num"], pdf_folder_name, sections, progress)
+
+                    # The page's Markdown is written as it is generated, and published in batches
+                    mark, page_written = chapter_writer.mark(), False
+                    unpublished, published_at = [], time.monotonic()
+                    async for chunk in chunks:
+                        if chunk is RESTART:
+                            await chapter_writer.rollback(mark)
+                            page_written = False
+                            unpublished.clear()
+                            self._publish_content(pdf_folder_name, "page_restart", page_number=page["num"])
+                            continue
+                        await chapter_writer.append(chunk)
+                        page_written = True
+                        unpublished.append(chunk)
+                        if time.monotonic() - published_at >= CONTENT_EVENT_INTERVAL:
+                            self._publish_content(pdf_folder_name, "page_chunk", page_number=page["num"], text="".join(unpublished))
+                            unpublished.clear()
+                            published_at = time.monotonic()
+                    if unpublished:
+                        self._publish_content(pdf_folder_name, "page_chunk", page_number=page["num"], text="".join(unpublished))
+                    if page_written:
+                        await chapter_writer.append("\n")
+
+                    progress.current_page = max(progress.current_page, page["num"])
+                    self._report_progress(
+                        pdf_folder_name, progress, progress_callback, "page",
+                        page_number=page["num"], is_new_chapter=is_new_chapter
+                    )
+                    # Not awaited: the repository writes it in the background, keeping only the latest
+                    progress_writes.append(asyncio.create_task(
+                        self.repository.save_progress(pdf_folder_name, base_output_dir, progress)
+                    ))
+
+            # Finish the final chapter if it has content
+            if chapter_writer.chapter_open:
+                await self._finish_chapter(chapter_writer, page_num, pdf_folder_name, sections, progress)
+
+            # Write the numbered sections straight from the index
+            progress.status = ProcessingStatus.PROCESSING_NUMBERED_SECTIONS
+            self._report_progress(pdf_folder_name, progress, progress_callback)
+            with tracing.span("write_numbered_sections", sections=len(section_index)):
+                await asyncio.to_thread(
+                    SectionProcessor.write_sections, section_index, pages, paths["sections_dir"], metadata_dir
                 )
 
             # Extract images
             logger.info("Extracting images...")
-            images = self.image_processor.extract_images(pdf_path, images_dir, metadata_dir, pdf_folder_name, sections)
-            for image in images:
-                await self.repository.save_image(image)
+            progress.status = ProcessingStatus.EXTRACTING_IMAGES
+            self._report_progress(pdf_folder_name, progress, progress_callback)
+            if checkpoint and checkpoint.images is not None:
+                logger.info("Images already extracted according to the checkpoint")
+                images = [PDFImage(**image) for image in checkpoint.images]
+            else:
+                with tracing.span("extract_images"):
+                    images = await asyncio.to_thread(
+                        self.image_processor.extract_images,
+                        pdf_path, images_dir, metadata_dir, pdf_folder_name, sections, session=session,
+                        on_image=lambda image: self._publish_image(pdf_folder_name, progress, image)
+                    )
+                if checkpoint:
+                    await checkpoint.record_images([asdict(image) for image in images])
             progress.processed_images = len(images)
 
             # Finalize processing
+            progress.status = ProcessingStatus.SAVING_METADATA
+            self._report_progress(pdf_folder_name, progress, progress_callback)
             processed_pdf = ProcessedPDF(
                 sections=sections,
                 images=images,
@@ -102,45 +256,378 @@ class MuPDFProcessor(PDFProcessor):
                 base_path=base_output_dir,
                 progress=progress,
             )
-            await self.repository.save_metadata(processed_pdf)
-
+            # The metadata describes the finished book, so it is written with its final status
             progress.status = ProcessingStatus.COMPLETED
+            progress.current_page = progress.total_pages
+            with tracing.span("save_metadata"):
+                await asyncio.gather(*progress_writes)
+                await self.repository.save_metadata(processed_pdf)
+
+            if checkpoint:
+                await checkpoint.clear()
+            if self.page_renderer:
+                await PageRenderer.clear_cache(metadata_dir)
+
+            self._report_progress(pdf_folder_name, progress, progress_callback)
             logger.info(f"PDF processing completed: {len(sections)} sections, {len(images)} images.")
+            if self.ai_processor.cache:
+                logger.info(f"AI response cache: {self.ai_processor.cache.stats()}")
+            logger.info(f"AI request scheduler: {self.ai_processor.scheduler.stats()}")
+            if self.chapter_detector:
+                logger.info(f"Chapter heuristic: {self.chapter_detector.stats()}")
+            if markdown_mode != "llm":
+                logger.info(f"Page Markdown ({markdown_mode}): {self.markdown_stats}")
+            if self.page_packer:
+                logger.info(f"Page packing: {self.page_packer.stats()}")
             return processed_pdf
 
         except Exception as e:
             logger.error(f"Error processing PDF: {e}")
             progress.status = ProcessingStatus.FAILED
             progress.error_message = str(e)
+            self._report_progress(pdf_folder_name, progress, progress_callback)
+            await asyncio.gather(*progress_writes, return_exceptions=True)
+            await self.repository.save_progress(pdf_folder_name, base_output_dir, progress)
             raise
+        finally:
+            await chapter_writer.abort()
+            # Retained, so a client connecting after the run still learns it is over
+            self._publish_content(pdf_folder_name, "content_end", retain=True)
+            if session:
+                session.close()
+
+    def _report_progress(
+        self,
+        pdf_name: str,
+        progress: ProcessingProgress,
+        progress_callback: Optional[Callable[[ProcessingProgress], None]],
+        event_type: str = "status",
+        **event_data: Any,
+    ):
+        """Hand the current progress to the caller and the progress bus; failures never stop processing."""
+        if progress_callback is not None:
+            try:
+                progress_callback(progress)
+            except Exception as e:
+                logger.error(f"Progress callback failed: {e}")
+        self._publish(pdf_name, progress, event_type, **event_data)
+
+    def _publish(self, pdf_name: str, progress: ProcessingProgress, event_type: str, **event_data: Any):
+        if self.progress_bus is None:
+            return
+        progress_data = asdict(progress)
+        progress_data["status"] = progress.status.value
+        self.progress_bus.publish(pdf_name, event_type, {"progress": progress_data, **event_data})
+
+    def _publish_content(self, pdf_name: str, event_type: str, retain: bool = False, **event_data: Any):
+        """Publish streamed Markdown on the book's content channel, so it never crowds out progress events."""
+        if self.progress_bus is None:
+            return
+        self.progress_bus.publish(content_channel(pdf_name), event_type, event_data, retain=retain)
+
+    def _publish_image(self, pdf_name: str, progress: ProcessingProgress, image: PDFImage):
+        progress.processed_images += 1
+        self._publish(
+            pdf_name, progress, "image",
+            page_number=image.page_number, image_path=image.image_path, section_number=image.section_number
+        )
+
+    async def _analyze_pages(
+        self,
+        pages: List[Dict],
+        checkpoint: Optional[IngestionCheckpoint] = None,
+        markdown_mode: str = "llm",
+        render_page: Optional[Callable[[Dict], Awaitable[PageRender]]] = None,
+    ):
+        """
+        Run the AI stage for all pages concurrently and yield results in page order.
+
+        Pages already in the checkpoint are replayed from it; newly analyzed pages
+        are appended to it as soon as their analysis finishes. Chapter detection
+        for all remaining pages runs as a few batched requests alongside the
+        Markdown conversion; pages the typography heuristic is sure about are not
+        sent at all. Outside "llm" mode, Markdown comes from the local layout
+        renderer, and in "hybrid" mode low-confidence pages go to the LLM. With a
+        page packer, small pages of one chapter share a request and oversized
+        pages are converted in parts.
+
+        Args:
+            pages (List[Dict]): Pages with their number and text.
+            checkpoint (Optional[IngestionCheckpoint]): Loaded checkpoint of a previous run.
+            markdown_mode (str): One of MARKDOWN_MODES.
+            render_page (Optional[Callable[[Dict], Awaitable[PageRender]]]): Renders the
+                image sent with a page to the LLM; without it only the text is sent.
+
+        A page's Markdown is yielded as a MarkdownStream, so it can be consumed
+        while the LLM is still generating it; the stream restarts if a request
+        is retried.
+
+        Yields:
+            Tuple[Dict, bool, MarkdownStream]: The page, whether it starts a new chapter, and its Markdown.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        if markdown_mode != "llm":
+            self.markdown_renderer.calibrate(pages)
+        unique_pages = {}
+        page_hashes = []
+        for page in pages:
+            if checkpoint and page["num"] in checkpoint.pages:
+                page_hashes.append(None)
+                continue
+            # Pages with identical text (repeated stat sheets, ornaments) share one analysis; the
+            # Markdown is still written out at every occurrence, so chapters keep their full text
+            text_hash = hashlib.sha256(page["text"].encode("utf-8")).hexdigest()
+            if text_hash in unique_pages:
+                logger.info(f"Page {page['num']} repeats an earlier page; reusing its Markdown without a new request")
+            else:
+                unique_pages[text_hash] = page
+            page_hashes.append(text_hash)
+
+        # Started first so the batched requests are first in line for the semaphore
+        chapter_task = asyncio.create_task(self._detect_chapters(pages, list(unique_pages.values()), semaphore))
+        streams = {page["num"]: MarkdownStream() for page in unique_pages.values()}
+        markdown_by_page, conversion_tasks = self._convert_pages(
+            list(unique_pages.values()), markdown_mode, chapter_task, semaphore, render_page, streams
+        )
+        tasks_by_text = {
+            text_hash: asyncio.create_task(self._analyze_page(
+                page, markdown_by_page[page["num"]], chapter_task, checkpoint, streams[page["num"]]
+            ))
+            for text_hash, page in unique_pages.items()
+        }
+        tasks = [tasks_by_text[text_hash] if text_hash else None for text_hash in page_hashes]
+        try:
+            for page, task in zip(pages, tasks):
+                if task is None:
+                    record = checkpoint.pages[page["num"]]
+                    yield page, record["is_new_chapter"], MarkdownStream.of(record["markdown"])
+                    continue
+                if page["num"] in streams:
+                    # Streamed while it is generated; the task then reports a failure, if any
+                    is_new_chapter, _ = (await asyncio.shield(chapter_task))[page["num"]]
+                    yield page, is_new_chapter, streams[page["num"]]
+                    await task
+                    continue
+                is_new_chapter, markdown_content = await task
+                if checkpoint and page["num"] not in checkpoint.pages:
+                    # A repeated page that reused another page's analysis
+                    await checkpoint.record_page(page["num"], is_new_chapter, markdown_content)
+                yield page, is_new_chapter, MarkdownStream.of(markdown_content)
+        finally:
+            chapter_task.cancel()
+            for task in [*conversion_tasks, *tasks_by_text.values()]:
+                task.cancel()
+            for future in markdown_by_page.values():
+                if future.done() and not future.cancelled():
+                    future.exception()  # retrieved, so an abandoned failure is not logged again
+                future.cancel()
+            if chapter_task.done() and not chapter_task.cancelled():
+                chapter_task.exception()
+
+    async def _detect_chapters(
+        self, book_pages: List[Dict], pages: List[Dict], semaphore: asyncio.Semaphore
+    ) -> Dict[int, Tuple[bool, Optional[str]]]:
+        """Classify pages locally where the heuristic is confident and batch the rest to the LLM."""
+        with tracing.span("chapter_detection", pages=len(pages)):
+            if not self.chapter_detector:
+                tracing.add("pages_sent_to_llm", len(pages))
+                return await self.ai_processor.detect_chapters_batch(pages, semaphore=semaphore)
+
+            self.chapter_detector.calibrate(book_pages)
+            results, uncertain_pages = {}, []
+            for page in pages:
+                decision = self.chapter_detector.classify(page)
+                if decision is None:
+                    uncertain_pages.append(page)
+                else:
+                    results[page["num"]] = decision
+            logger.info(
+                f"Chapter heuristic decided {len(results)} of {len(pages)} pages locally; "
+                f"{len(uncertain_pages)} sent to the LLM"
+            )
+            tracing.add("pages_decided_locally", len(results))
+            tracing.add("pages_sent_to_llm", len(uncertain_pages))
+            if uncertain_pages:
+                results.update(await self.ai_processor.detect_chapters_batch(uncertain_pages, semaphore=semaphore))
+            return results
+
+    def _convert_pages(
+        self,
+        pages: List[Dict],
+        markdown_mode: str,
+        chapter_task: "asyncio.Task[Dict[int, Tuple[bool, Optional[str]]]]",
+        semaphore: asyncio.Semaphore,
+        render_page: Optional[Callable[[Dict], Awaitable[PageRender]]] = None,
+        streams: Optional[Dict[int, MarkdownStream]] = None,
+    ) -> Tuple[Dict[int, "asyncio.Future[str]"], List[asyncio.Task]]:
+        """
+        Start the Markdown conversion of every page.
+
+        Pages the local renderer handles are done at once. Pages for the LLM
+        start right away, one request each (split when oversized), except small
+        pages: they wait for chapter detection and are packed with their small
+        neighbours of the same chapter. A page converted by a request of its
+        own is streamed to its entry in streams as it is generated.
+
+        Returns:
+            Tuple[Dict[int, asyncio.Future[str]], List[asyncio.Task]]: Each page's
+            pending Markdown, and the tasks producing it.
+        """
+        loop = asyncio.get_running_loop()
+        markdown_by_page = {page["num"]: loop.create_future() for page in pages}
+        single_pages, small_pages = [], []
+        for page in pages:
+            markdown = self._render_locally(page, markdown_mode)
+            if markdown is not None:
+                markdown_by_page[page["num"]].set_result(markdown)
+            elif self.page_packer and self.page_packer.is_small(page):
+                small_pages.append(page)
+            else:
+                single_pages.append(page)
+
+        tasks = [
+            asyncio.create_task(self._convert_pack([page], markdown_by_page, semaphore, render_page, streams))
+            for page in single_pages
+        ]
+        if small_pages:
+            tasks.append(asyncio.create_task(
+                self._convert_small_pages(small_pages, markdown_by_page, chapter_task, semaphore, render_page)
+            ))
+        return markdown_by_page, tasks
+
+    def _render_locally(self, page: Dict, markdown_mode: str) -> Optional[str]:
+        """The layout renderer's Markdown for the page, or None if the page goes to the LLM."""
+        if markdown_mode != "llm":
+            # A few milliseconds of CPU per page, cheap enough for the event loop
+            markdown, confidence = self.markdown_renderer.render(page)
+            if markdown_mode == "local" or confidence >= self.markdown_min_confidence:
+                renderer = "local"
+            else:
+                logger.debug(f"Page {page['num']} rendered with confidence {confidence}; sending it to the LLM")
+                markdown, renderer = None, "llm"
+        else:
+            markdown, renderer = None, "llm"
+        self.markdown_stats[renderer] += 1
+        tracing.add(f"pages_rendered_{renderer}")
+        PAGES_RENDERED.labels(renderer).inc()
+        return markdown
+
+    async def _convert_small_pages(
+        self,
+        pages: List[Dict],
+        markdown_by_page: Dict[int, "asyncio.Future[str]"],
+        chapter_task: "asyncio.Task[Dict[int, Tuple[bool, Optional[str]]]]",
+        semaphore: asyncio.Semaphore,
+        render_page: Optional[Callable[[Dict], Awaitable[PageRender]]] = None,
+    ):
+        """Pack small pages once chapter starts are known, so a pack never spans two chapters."""
+        try:
+            chapters = await asyncio.shield(chapter_task)
+        except Exception as e:
+            for page in pages:
+                markdown_by_page[page["num"]].set_exception(e)
+            return
+        chapter_starts = {page_num for page_num, (is_new_chapter, _) in chapters.items() if is_new_chapter}
+        packs = self.page_packer.pack(pages, chapter_starts)
+        logger.info(f"Converting {len(pages)} small pages with {len(packs)} requests")
+        await asyncio.gather(*(self._convert_pack(pack, markdown_by_page, semaphore, render_page) for pack in packs))
+
+    async def _convert_pack(
+        self,
+        pages: List[Dict],
+        markdown_by_page: Dict[int, "asyncio.Future[str]"],
+        semaphore: asyncio.Semaphore,
+        render_page: Optional[Callable[[Dict], Awaitable[PageRender]]] = None,
+        streams: Optional[Dict[int, MarkdownStream]] = None,
+    ):
+        """Convert one page, or a pack of pages, with the LLM and hand each page its Markdown."""
+        try:
+            with tracing.span("markdown_request", first_page=pages[0]["num"], pages=len(pages)):
+                parts = self.page_packer.split(pages[0]["text"]) if self.page_packer and len(pages) == 1 else None
+                if parts and len(parts) > 1:
+                    # Too dense for one response: convert the parts separately, text only
+                    logger.info(f"Page {pages[0]['num']} split into {len(parts)} parts for conversion")
+                    results = await asyncio.gather(*(
+                        self.ai_processor.analyze_multimodal_pages([{"text": part, "num": pages[0]["num"], "image_path": None}], semaphore)
+                        for part in parts
+                    ))
+                    markdown = {pages[0]["num"]: "\n\n".join(filter(None, (result[pages[0]["num"]] for result in results)))}
+                else:
+                    # Rendered before taking a slot, so rendering overlaps other pages' requests
+                    images = await asyncio.gather(*(render_page(page) for page in pages)) if render_page else [None] * len(pages)
+                    markdown = await self.ai_processor.analyze_multimodal_pages([
+                        {
+                            "text": page["text"],
+                            "num": page["num"],
+                            "image_path": image.image_path if image else None,
+                            "image_tokens": image.tokens if image else None,
+                            "image_detail": image.detail if image else None,
+                        }
+                        for page, image in zip(pages, images)
+                    ], semaphore, streams.get(pages[0]["num"]) if streams and len(pages) == 1 else None)
+        except Exception as e:
+            for page in pages:
+                markdown_by_page[page["num"]].set_exception(e)
+            return
+        for page in pages:
+            markdown_by_page[page["num"]].set_result(markdown.get(page["num"], ""))
+
+    async def _analyze_page(
+        self,
+        page: Dict,
+        markdown: "asyncio.Future[str]",
+        chapter_task: "asyncio.Task[Dict[int, Tuple[bool, Optional[str]]]]",
+        checkpoint: Optional[IngestionCheckpoint] = None,
+        stream: Optional[MarkdownStream] = None,
+    ) -> Tuple[bool, str]:
+        """Pair a page's Markdown with its batched chapter detection, and finish its stream."""
+        with tracing.span("page", page=page["num"]):
+            try:
+                markdown_content = await asyncio.shield(markdown)
+                if stream is not None and stream.text != markdown_content:
+                    # Converted without streaming (locally, packed or split): delivered in one piece
+                    if stream.text:
+                        stream.restart()
+                    stream.write(markdown_content)
+            finally:
+                if stream is not None:
+                    stream.close()
+
+            # Detect new chapter titles
+            is_new_chapter, _ = (await asyncio.shield(chapter_task))[page["num"]]
+        if checkpoint:
+            await checkpoint.record_page(page["num"], is_new_chapter, markdown_content)
+        return is_new_chapter, markdown_content
 
-    def _save_chapter(
-        self, chapter_number: int, content: str, page_num: int, histoire_dir: str, pdf_name: str, sections: List[Section], progress: ProcessingProgress
+    async def _finish_chapter(
+        self, chapter_writer: ChapterWriter, page_num: int, pdf_name: str, sections: List[Section], progress: ProcessingProgress
     ):
         """
-        Save chapter content to file and update metadata.
+        Close the chapter being written and record it.
 
         Args:
-            chapter_number (int): Chapter number.
-            content (str): Chapter content.
+            chapter_writer (ChapterWriter): Writer holding the open chapter.
             page_num (int): Page number.
-            histoire_dir (str): Directory for saving chapters.
             pdf_name (str): PDF file name.
             sections (List[Section]): List of sections.
             progress (ProcessingProgress): Progress tracker.
         """
-        section_file_path = os.path.join(histoire_dir, f"chapter_{chapter_number}.md")
+        section_file_path = await chapter_writer.finish_chapter()
+        if section_file_path is None:
+            return
+        chapter_number = chapter_writer.chapter_count
+        # The Markdown is already on disk; the section only points at it
         section = Section(
             number=chapter_number,
-            content=content,
+            content=None,
             page_number=page_num,
             file_path=section_file_path,
             pdf_name=pdf_name,
             is_chapter=True
         )
-        self.repository.save_section(section)
         sections.append(section)
         progress.processed_sections += 1
+        self._publish(pdf_name, progress, "chapter", chapter_number=chapter_number, file_path=section_file_path)
         logger.info(f"Chapter {chapter_number} saved.")
 
 
@@ -1,28 +1,139 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import glob
 import os
 import json
 import logging
-from typing import List
+import threading
+from typing import Any, Callable, Dict, Optional
 from ..domain.ports import PDFRepository
-from ..domain.entities import Section, PDFImage, ProcessedPDF, ProcessingStatus
+from ..domain.entities import Section, PDFImage, ProcessedPDF, ProcessingProgress, ProcessingStatus
+from .file_system_processor import FileSystemProcessor
+from . import tracing
 
 logger = logging.getLogger(__name__)
 
+
+class _PathWrites:
+    """Writes to one file: at most one running, and the latest of those queued behind it."""
+
+    __slots__ = ("writer", "future")
+
+    def __init__(self, writer: Callable[[], int]):
+        self.writer: Optional[Callable[[], int]] = writer
+        self.future: Optional[concurrent.futures.Future] = concurrent.futures.Future()
+
+
 class FileSystemPDFRepository(PDFRepository):
+    """
+    Book storage on the local file system.
+
+    File I/O runs on the repository's own thread pool, never on the event loop,
+    so disk writes do not stall the LLM requests in flight. The pool size bounds
+    how many files are written in parallel across all books being ingested.
+    Writes to the same file are applied in order, and a write still waiting
+    behind another is replaced by a newer one: rapid progress updates cost one
+    write per slot freed, not one per update.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.environ.get("PDF_REPOSITORY_IO_WORKERS", 4))
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdf-repository-io")
+        self._lock = threading.Lock()
+        self._writes: Dict[str, _PathWrites] = {}
+        self.coalesced_writes = 0
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking I/O on the repository pool; tracing counters still reach the caller's span."""
+        context = contextvars.copy_context()
+        return await asyncio.wrap_future(self._executor.submit(context.run, function, *args))
+
+    def _submit_write(self, path: str, writer: Callable[[], int]) -> "concurrent.futures.Future[int]":
+        with self._lock:
+            writes = self._writes.get(path)
+            if writes is None:
+                writes = self._writes[path] = _PathWrites(writer)
+                future = writes.future
+                self._executor.submit(self._drain, path, writes)
+            elif writes.writer is not None:
+                # Not started yet: the newer content replaces it
+                writes.writer = writer
+                future = writes.future
+                self.coalesced_writes += 1
+            else:
+                writes.writer, writes.future = writer, concurrent.futures.Future()
+                future = writes.future
+        return future
+
+    def _drain(self, path: str, writes: _PathWrites) -> None:
+        """Apply the writes queued for a path, one after another, until none is left."""
+        while True:
+            with self._lock:
+                writer, future = writes.writer, writes.future
+                if writer is None:
+                    del self._writes[path]
+                    return
+                writes.writer, writes.future = None, None
+            try:
+                future.set_result(writer())
+            except BaseException as e:
+                logger.error(f"Error writing {path}: {e}")
+                future.set_exception(e)
+
+    async def _write(self, path: str, data: Any, as_json: bool = False) -> int:
+        """Atomically write text, bytes or JSON to path from the I/O pool and return the bytes written."""
+        if as_json:
+            writer = lambda: FileSystemProcessor.write_json_atomic(path, data, ensure_ascii=False, indent=2)
+        else:
+            writer = lambda: FileSystemProcessor.write_atomic(path, data)
+        # Shielded: the write may be shared with coalesced callers, so one caller's cancellation must not cancel it
+        written = await asyncio.shield(asyncio.wrap_future(self._submit_write(path, writer)))
+        tracing.add("bytes_written", written)
+        return written
+
+    def close(self) -> None:
+        """Wait for pending writes and stop the I/O threads."""
+        self._executor.shutdown(wait=True)
+
+    async def start_book(self, pdf_name: str, base_path: str) -> None:
+        """
+        Withdraw a book's previous output before it is processed again.
+
+        book.json goes first, so the book stops counting as complete before
+        anything else changes. The previous run's chapter and section files
+        are removed too, so stale files never sit next to half-written new
+        ones; every run writes them all again. Images, the checkpoint and the
+        page render cache are kept for the new run to reuse.
+        """
+        await self._run(self._clear_book, os.path.join(base_path, pdf_name))
+
+    @staticmethod
+    def _clear_book(book_dir: str) -> None:
+        stale = [os.path.join(book_dir, 'metadata', 'book.json'), os.path.join(book_dir, 'metadata', 'sections.json')]
+        stale += glob.glob(os.path.join(book_dir, 'histoire', 'chapter_*.md*'))
+        stale += glob.glob(os.path.join(book_dir, 'sections', 'section_*.md'))
+        for path in stale:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        if len(stale) > 2:
+            logger.info(f"Removed the previous output of {book_dir} before processing it again")
+
     async def save_section(self, section: Section) -> None:
         """Save a section directly using the content from AI."""
+        if section.content is None:
+            # Streamed to its file while the book was processed; nothing left to write
+            logger.debug(f"Section {section.number} is already on disk at {section.file_path}")
+            return
         try:
-            # Ensure section directory exists
-            section_dir = os.path.dirname(section.file_path)
-            if not os.path.exists(section_dir):
-                os.makedirs(section_dir, exist_ok=True)
-                logger.info(f"Created section directory: {section_dir}")
-
             # Save the section content to a Markdown file
-            with open(section.file_path, "w", encoding="utf-8") as f:
-                if section.title:
-                    f.write(f"# {section.title}\n\n")  # Optionally prepend the title
-                f.write(section.content)  # Directly write the content
-                logger.debug(f"Section content saved to file: {section.file_path}")
+            await self._run(self._ensure_dir, os.path.dirname(section.file_path))
+            content = f"# {section.title}\n\n{section.content}" if section.title else section.content
+            await self._write(section.file_path, content)
 
             logger.info(f"Successfully saved section {section.number} to {section.file_path}")
         except Exception as e:
@@ -32,10 +143,7 @@ class FileSystemPDFRepository(PDFRepository):
     async def save_image(self, image: PDFImage) -> None:
         """Save image metadata with proper directory validation."""
         try:
-            image_dir = os.path.dirname(image.image_path)
-            if not os.path.exists(image_dir):
-                os.makedirs(image_dir, exist_ok=True)
-                logger.info(f"Created image directory: {image_dir}")
+            await self._run(self._ensure_dir, os.path.dirname(image.image_path))
             # Log the image metadata saving
             logger.debug(f"Prepared to save image metadata for {image.image_path}")
         except Exception as e:
@@ -43,7 +151,13 @@ class FileSystemPDFRepository(PDFRepository):
             raise
 
     async def save_metadata(self, processed_pdf: ProcessedPDF) -> None:
-        """Save metadata with comprehensive validation and section tracking."""
+        """
+        Write the book's metadata files: sections.json, progress.json and book.json.
+
+        This is the only place these files are written. Each is replaced
+        atomically, and book.json goes last, so a book with a book.json is
+        always complete.
+        """
         try:
             # Create metadata directory
             metadata_dir = os.path.join(
@@ -51,8 +165,7 @@ class FileSystemPDFRepository(PDFRepository):
                 processed_pdf.pdf_name,
                 'metadata'
             )
-            os.makedirs(metadata_dir, exist_ok=True)
-            logger.info(f"Created metadata directory: {metadata_dir}")
+            await self._run(self._ensure_dir, metadata_dir)
 
             # Prepare comprehensive sections metadata
             sections_metadata = [
@@ -68,36 +181,73 @@ class FileSystemPDFRepository(PDFRepository):
                 for section in processed_pdf.sections
             ]
 
-            # Save sections metadata to JSON
-            sections_metadata_path = os.path.join(metadata_dir, 'sections.json')
-            with open(sections_metadata_path, 'w', encoding='utf-8') as f:
-                json.dump({'sections': sections_metadata}, f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved sections metadata: {len(sections_metadata)} sections")
-
-            # Save progress metadata
-            progress_metadata = {
-                'status': processed_pdf.progress.status.value,
-                'current_page': processed_pdf.progress.current_page,
-                'total_pages': processed_pdf.progress.total_pages,
-                'processed_sections': processed_pdf.progress.processed_sections,
-                'processed_images': processed_pdf.progress.processed_images,
+            # Prepare progress metadata
+            progress_metadata = self._serialize_progress(processed_pdf.progress)
+
+            # Prepare book metadata
+            book_metadata = {
+                'title': processed_pdf.pdf_name,
+                'total_sections': len(processed_pdf.sections),
+                'total_images': len(processed_pdf.images),
+                'sections': [
+                    {
+                        'number': section.number,
+                        'page_number': section.page_number,
+                        'file_path': section.file_path,
+                        'title': section.title,
+                    }
+                    for section in processed_pdf.sections
+                ],
+                'base_path': processed_pdf.base_path,
+                'processing_status': processed_pdf.progress.status.value,
                 'error_message': processed_pdf.progress.error_message,
             }
 
-            progress_metadata_path = os.path.join(metadata_dir, 'progress.json')
-            with open(progress_metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(progress_metadata, f, ensure_ascii=False, indent=2)
-            logger.info("Saved progress metadata with section counts")
+            await asyncio.gather(
+                self._write(os.path.join(metadata_dir, 'sections.json'), {'sections': sections_metadata}, as_json=True),
+                self._write(os.path.join(metadata_dir, 'progress.json'), progress_metadata, as_json=True),
+            )
+            logger.info(f"Saved sections metadata: {len(sections_metadata)} sections, with progress")
+            await self._write(os.path.join(metadata_dir, 'book.json'), book_metadata, as_json=True)
+            logger.info(f"Saved book metadata to {metadata_dir}")
         except Exception as e:
             logger.error(f"Error saving metadata for {processed_pdf.pdf_name}: {e}")
             raise
 
+    async def save_progress(self, pdf_name: str, base_path: str, progress: ProcessingProgress) -> None:
+        """Record a book's progress in progress.json while it is being processed."""
+        metadata_dir = os.path.join(base_path, pdf_name, 'metadata')
+        try:
+            await self._write(os.path.join(metadata_dir, 'progress.json'), self._serialize_progress(progress), as_json=True)
+        except Exception as e:
+            # Progress is informational; losing an update never fails the book
+            logger.warning(f"Could not save progress for {pdf_name}: {e}")
+
+    @staticmethod
+    def _serialize_progress(progress: ProcessingProgress) -> Dict[str, Any]:
+        return {
+            'status': progress.status.value,
+            'current_page': progress.current_page,
+            'total_pages': progress.total_pages,
+            'processed_sections': progress.processed_sections,
+            'processed_images': progress.processed_images,
+            'error_message': progress.error_message,
+        }
+
+    @staticmethod
+    def _ensure_dir(path: str) -> None:
+        os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
     async def get_processing_status(self, pdf_name: str, base_path: str) -> dict:
         """Get processing status with proper error handling."""
         progress_path = os.path.join(base_path, pdf_name, 'metadata', 'progress.json')
         try:
-            with open(progress_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return await self._run(self._read_json, progress_path)
         except FileNotFoundError:
             logger.warning(f"Progress file not found for {pdf_name}")
             return {
@@ -0,0 +1,121 @@
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def content_channel(book_id: str) -> str:
+    """The channel carrying a book's Markdown as it is generated, kept apart from its lifecycle events."""
+    return f"{book_id}/content"
+
+
+class ProgressSubscription:
+    """A subscriber's bounded event queue; slow readers lose the oldest events, never block publishers."""
+
+    def __init__(self, bus: "ProgressBus", book_id: str, max_queue_size: int):
+        self.bus = bus
+        self.book_id = book_id
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+
+    def __enter__(self) -> "ProgressSubscription":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def put(self, event: Dict[str, Any]) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def events(self, timeout: float = 15.0) -> Iterator[Optional[Dict[str, Any]]]:
+        """Yield events as they arrive, or None after `timeout` seconds of silence (for keep-alives)."""
+        while True:
+            try:
+                yield self._queue.get(timeout=timeout)
+            except queue.Empty:
+                yield None
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+
+class ProgressBus:
+    """
+    In-memory publish/subscribe hub for book processing events.
+
+    Publishers (the PDF processor, possibly on worker threads) never wait on
+    subscribers: every subscriber has its own bounded queue. The last event of
+    each book is kept so new subscribers immediately get the current state;
+    only the max_retained most recently active books are remembered.
+    """
+
+    def __init__(self, max_queue_size: int = 256, max_retained: int = 1024):
+        self.max_queue_size = max_queue_size
+        self.max_retained = max_retained
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, List[ProgressSubscription]] = {}
+        self._latest: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sequence = itertools.count(1)
+
+    def publish(self, book_id: str, event_type: str, data: Dict[str, Any], retain: bool = True) -> None:
+        """Send an event to the book's subscribers; unless retain is False, it is also kept for new subscribers."""
+        event = {
+            "id": next(self._sequence),
+            "book_id": book_id,
+            "type": event_type,
+            "timestamp": time.time(),
+            "data": data,
+        }
+        with self._lock:
+            if retain:
+                self._latest[book_id] = event
+                self._latest.move_to_end(book_id)
+                while len(self._latest) > self.max_retained:
+                    self._latest.popitem(last=False)
+            subscribers = list(self._subscribers.get(book_id, ()))
+        for subscription in subscribers:
+            subscription.put(event)
+
+    def subscribe(self, book_id: str) -> ProgressSubscription:
+        subscription = ProgressSubscription(self, book_id, self.max_queue_size)
+        with self._lock:
+            self._subscribers.setdefault(book_id, []).append(subscription)
+            latest = self._latest.get(book_id)
+        if latest:
+            subscription.put(latest)
+        return subscription
+
+    def unsubscribe(self, subscription: ProgressSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.book_id, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._subscribers.pop(subscription.book_id, None)
+
+    def latest(self, book_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._latest.get(book_id)
+
+    def subscriber_count(self, book_id: Optional[str] = None) -> int:
+        with self._lock:
+            if book_id is not None:
+                return len(self._subscribers.get(book_id, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+progress_bus = ProgressBus()
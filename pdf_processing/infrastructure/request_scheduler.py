@@ -0,0 +1,275 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import openai
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from .llm_backend import TransientLLMError
+from .metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Requests and tokens per minute for each model (OpenAI usage tier 1); accounts on higher
+# tiers should set their own budgets with AI_RATE_LIMITS, or requests wait for no reason
+DEFAULT_LIMITS: Dict[str, Tuple[int, int]] = {
+    "gpt-4o": (500, 30000),
+    "gpt-4o-mini": (500, 200000),
+}
+FALLBACK_LIMITS = (500, 30000)
+
+# Errors worth retrying: throttling, timeouts, dropped connections and server-side failures
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    openai.ConflictError,
+    TransientLLMError,
+)
+
+LLM_REQUESTS = metrics_registry.counter("llm_requests_total", "LLM API requests by model and outcome", ("model", "outcome"))
+LLM_REQUEST_SECONDS = metrics_registry.histogram(
+    "llm_request_duration_seconds", "LLM API request latency", ("model",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0),
+)
+LLM_RETRIES = metrics_registry.counter("llm_retries_total", "LLM API requests retried, by error type", ("model", "error"))
+LLM_TOKENS = metrics_registry.counter("llm_tokens_total", "Tokens reported by the LLM API", ("model", "kind"))
+LLM_THROTTLED_SECONDS = metrics_registry.counter(
+    "llm_throttled_seconds_total", "Time requests waited for the rate budget", ("model",)
+)
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for Latin text)."""
+    return len(text) // 4 + 1
+
+
+class _ModelWindow:
+    """Requests and tokens a model has used over the last minute."""
+
+    def __init__(self, rpm: float, tpm: float):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests: Deque[List[float]] = deque()  # [start time, tokens] per request
+        self.tokens = 0
+        self.blocked_until = 0.0
+        self.warned = False
+
+    def prune(self, now: float) -> None:
+        while self.requests and self.requests[0][0] <= now - 60:
+            self.tokens -= self.requests.popleft()[1]
+
+
+class RequestScheduler:
+    """
+    Shared gate for OpenAI calls: per-model rate budgets, retries and metrics.
+
+    Each model gets a sliding one-minute window of requests (RPM) and estimated
+    tokens (TPM); a call waits until it fits in both instead of being throttled
+    by the API. Transient errors are retried with jittered exponential backoff,
+    and a Retry-After from a 429 pauses every caller of that model, not only the
+    one that got it. The scheduler is thread-safe, so a single instance can pace
+    all job workers against the account's quota.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[int, int]]] = None,
+        max_attempts: int = 6,
+        max_backoff: float = 60.0,
+        default_limits: Optional[Tuple[float, float]] = FALLBACK_LIMITS,
+    ):
+        self.limits = dict(DEFAULT_LIMITS, **(limits or {})) if default_limits else dict(limits or {})
+        self.default_limits = default_limits or (float("inf"), float("inf"))
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._windows: Dict[str, _ModelWindow] = {}
+        self._backoff = wait_random_exponential(multiplier=0.5, max=max_backoff)
+        self.metrics: Dict[str, float] = {
+            "requests": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "failures": 0,
+            "throttled_seconds": 0.0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        }
+
+    @classmethod
+    def unlimited(cls, max_attempts: int = 6, max_backoff: float = 60.0) -> "RequestScheduler":
+        """A scheduler that retries and meters but never throttles (for backends without a quota)."""
+        return cls(max_attempts=max_attempts, max_backoff=max_backoff, default_limits=None)
+
+    @classmethod
+    def from_env(cls) -> "RequestScheduler":
+        """
+        Build the scheduler from environment variables.
+
+        AI_RATE_LIMITS overrides budgets as "model=rpm/tpm" pairs separated by commas,
+        e.g. "gpt-4o=5000/800000,gpt-4o-mini=5000/4000000"; AI_MAX_ATTEMPTS sets the
+        number of tries per request.
+        """
+        limits = {}
+        for item in filter(None, os.environ.get("AI_RATE_LIMITS", "").split(",")):
+            try:
+                model, budget = item.strip().split("=")
+                rpm, tpm = budget.split("/")
+                limits[model] = (int(rpm), int(tpm))
+            except ValueError:
+                logger.error(f"Ignoring malformed AI_RATE_LIMITS entry: {item!r}")
+        return cls(limits=limits, max_attempts=int(os.environ.get("AI_MAX_ATTEMPTS", 6)))
+
+    def _window(self, model: str) -> _ModelWindow:
+        if model not in self._windows:
+            self._windows[model] = _ModelWindow(*self.limits.get(model, self.default_limits))
+        return self._windows[model]
+
+    async def acquire(self, model: str, tokens: int) -> List[float]:
+        """Wait until a request of `tokens` fits in the model's budgets and reserve it."""
+        while True:
+            with self._lock:
+                window = self._window(model)
+                now = time.monotonic()
+                window.prune(now)
+                wait = window.blocked_until - now
+                if wait <= 0:
+                    # A request larger than the whole budget still has to go through eventually
+                    tokens = min(tokens, window.tpm)
+                    if len(window.requests) < window.rpm and window.tokens + tokens <= window.tpm:
+                        reservation = [now, tokens]
+                        window.requests.append(reservation)
+                        window.tokens += tokens
+                        return reservation
+                    wait = window.requests[0][0] + 60 - now
+                    if not window.warned:
+                        window.warned = True
+                        logger.warning(
+                            f"{model} requests are waiting for the rate budget ({window.rpm:g} requests, {window.tpm:g} tokens "
+                            f"per minute); if the account allows more, raise it with AI_RATE_LIMITS"
+                        )
+                self.metrics["throttled_seconds"] += max(wait, 0.01)
+            LLM_THROTTLED_SECONDS.labels(model).inc(max(wait, 0.01))
+            await asyncio.sleep(max(wait, 0.01))
+
+    def _settle(self, model: str, reservation: List[float], used_tokens: int) -> None:
+        """Replace a reservation's estimate with the tokens the API reports."""
+        with self._lock:
+            window = self._window(model)
+            if reservation[0] > time.monotonic() - 60:
+                window.tokens += used_tokens - reservation[1]
+                reservation[1] = used_tokens
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """Seconds the API asked us to wait, from the Retry-After(-ms) headers of an error response."""
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+        headers = response.headers
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000
+            if headers.get("retry-after"):
+                return float(headers["retry-after"])
+        except ValueError:
+            pass
+        return None
+
+    def _wait(self, model: str, retry_state: RetryCallState) -> float:
+        error = retry_state.outcome.exception()
+        retry_after = self.retry_after(error)
+        if retry_after is None:
+            return self._backoff(retry_state)
+        with self._lock:
+            # Everyone using this model holds off, instead of hammering the API in turn
+            window = self._window(model)
+            window.blocked_until = max(window.blocked_until, time.monotonic() + retry_after)
+        return retry_after + self._backoff(retry_state) / 10
+
+    def _before_retry(self, model: str, retry_state: RetryCallState) -> None:
+        error = retry_state.outcome.exception()
+        with self._lock:
+            self.metrics["retries"] += 1
+            if isinstance(error, openai.RateLimitError):
+                self.metrics["rate_limited"] += 1
+        LLM_RETRIES.labels(model, type(error).__name__).inc()
+        logger.warning(
+            f"{model} request failed ({type(error).__name__}: {error}); "
+            f"retry {retry_state.attempt_number}/{self.max_attempts - 1} in {retry_state.next_action.sleep:.1f}s"
+        )
+
+    async def run(self, model: str, estimated_tokens: int, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run an API call within the model's budgets, retrying transient failures.
+
+        Args:
+            model (str): Model the call is billed to.
+            estimated_tokens (int): Prompt plus expected completion tokens; settled
+                with the usage the API reports once the call returns.
+            call (Callable[[], Awaitable[Any]]): Issues the request; called once per attempt.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            The last error once attempts are exhausted, or any non-retryable error.
+        """
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(lambda error: isinstance(error, RETRYABLE_ERRORS)),
+            wait=lambda retry_state: self._wait(model, retry_state),
+            stop=stop_after_attempt(self.max_attempts),
+            before_sleep=lambda retry_state: self._before_retry(model, retry_state),
+            reraise=True,
+        ):
+            with attempt:
+                reservation = await self.acquire(model, estimated_tokens)
+                with self._lock:
+                    self.metrics["requests"] += 1
+                started = time.perf_counter()
+                try:
+                    result = await call()
+                except Exception:
+                    LLM_REQUEST_SECONDS.labels(model).observe(time.perf_counter() - started)
+                    LLM_REQUESTS.labels(model, "error").inc()
+                    # A rejected request does not use up the token budget
+                    self._settle(model, reservation, 0)
+                    with self._lock:
+                        self.metrics["failures"] += 1
+                    raise
+                LLM_REQUEST_SECONDS.labels(model).observe(time.perf_counter() - started)
+                LLM_REQUESTS.labels(model, "success").inc()
+
+                prompt_tokens = getattr(result, "prompt_tokens", 0)
+                completion_tokens = getattr(result, "completion_tokens", 0)
+                if prompt_tokens or completion_tokens:
+                    self._settle(model, reservation, prompt_tokens + completion_tokens)
+                    with self._lock:
+                        self.metrics["prompt_tokens"] += prompt_tokens
+                        self.metrics["completion_tokens"] += completion_tokens
+                    LLM_TOKENS.labels(model, "prompt").inc(prompt_tokens)
+                    LLM_TOKENS.labels(model, "completion").inc(completion_tokens)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the counters and each model's current one-minute usage."""
+        with self._lock:
+            now = time.monotonic()
+            windows = {}
+            for model, window in self._windows.items():
+                window.prune(now)
+                windows[model] = {
+                    "requests_last_minute": len(window.requests),
+                    "tokens_last_minute": window.tokens,
+                    "rpm_limit": window.rpm,
+                    "tpm_limit": window.tpm,
+                    "blocked_for": max(window.blocked_until - now, 0.0),
+                }
+            return dict(self.metrics, models=windows)
+
+
+request_scheduler = RequestScheduler.from_env()
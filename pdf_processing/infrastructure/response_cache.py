@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "ai_responses.sqlite3")
+
+
+class AIResponseCache:
+    """
+    Content-addressed on-disk cache of AI completions, backed by SQLite.
+
+    Entries are keyed on a hash of everything that determines the answer (model,
+    messages including page text and images, temperature, max_tokens) and evicted
+    least-recently-used once the cache exceeds its entry or size budget.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, max_entries: int = 50000, max_bytes: int = 512 * 1024 * 1024):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        cache_dir = os.path.dirname(db_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+
+    @classmethod
+    def from_env(cls) -> Optional["AIResponseCache"]:
+        """Build the cache from AI_CACHE_* environment variables, or None if disabled."""
+        if os.environ.get("AI_CACHE_ENABLED", "1").lower() in ("0", "false", "no"):
+            return None
+        try:
+            return cls(
+                db_path=os.environ.get("AI_CACHE_PATH", DEFAULT_CACHE_PATH),
+                max_entries=int(os.environ.get("AI_CACHE_MAX_ENTRIES", 50000)),
+                max_bytes=int(os.environ.get("AI_CACHE_MAX_BYTES", 512 * 1024 * 1024)),
+            )
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.error(f"AI response cache disabled: {e}")
+            return None
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, Any]], temperature: float, max_tokens: int) -> str:
+        """Hash the request parameters that determine a completion."""
+        payload = json.dumps(
+            {"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for a key, or None on a miss."""
+        with self._lock:
+            row = self._connection.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            with self._connection:
+                self._connection.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, model: str, content: str) -> None:
+        """Store a completion and evict the least recently used entries over budget."""
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, model, content, size, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, content, size, now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        count, total_size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total_size <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if count <= self.max_entries and total_size <= self.max_bytes:
+                break
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            count -= 1
+            total_size -= size
+            evicted += 1
+        logger.debug(f"Evicted {evicted} entries from AI response cache")
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current cache footprint."""
+        with self._lock:
+            count, total_size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": count, "bytes": total_size}
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
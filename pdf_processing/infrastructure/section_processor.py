@@ -1,12 +1,57 @@
 import os
-from typing import List, Dict, Optional
-from PyPDF2 import PdfReader
+import json
+from typing import Any, List, Dict, Optional
 import logging
+from .document_session import PDFDocumentSession
+from .file_system_processor import FileSystemProcessor
+from . import tracing
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+class SectionIndex:
+    """
+    Position of every numbered section of a book, keyed by section number.
+
+    Each entry holds the page and character offset (in the page text) of the
+    section header, where its content starts, and where the next section begins,
+    so any section can be located or sliced out without scanning the book again.
+    """
+
+    FILENAME = "sections_index.json"
+
+    def __init__(self, entries: Optional[Dict[int, Dict[str, Any]]] = None):
+        self.entries = entries or {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, section_number: int) -> bool:
+        return section_number in self.entries
+
+    def get(self, section_number: int) -> Optional[Dict[str, Any]]:
+        return self.entries.get(section_number)
+
+    def page_of(self, section_number: int) -> Optional[int]:
+        """Return the page where a section starts, or None if the book has no such section."""
+        entry = self.entries.get(section_number)
+        return entry["page"] if entry else None
+
+    def save(self, path: str) -> None:
+        FileSystemProcessor.write_json_atomic(
+            path,
+            {"count": len(self.entries), "sections": {str(number): entry for number, entry in self.entries.items()}},
+            ensure_ascii=False, indent=2
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "SectionIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls({int(number): entry for number, entry in data["sections"].items()})
+
+
 class SectionProcessor:
     @staticmethod
     def find_section(pages: List[Dict[str, str]], section_number: int) -> Optional[int]:
@@ -38,6 +83,100 @@ class SectionProcessor:
         logger.info(f"Section {section_number} not found in the document.")
         return None
 
+    @staticmethod
+    def build_section_index(pages: List[Dict[str, Any]], max_gap: int = 2) -> SectionIndex:
+        """
+        Find every numbered section header (1..N) in a single pass over the pages.
+
+        A header is a line holding only a number that continues the sequence; numbers
+        that do not (stat blocks, dice tables) are ignored. Up to `max_gap` missing
+        headers are tolerated so one unreadable header does not end the scan.
+
+        Args:
+            pages (List[Dict[str, Any]]): Pages with their number and text.
+            max_gap (int): Largest jump in numbering accepted as the next header.
+
+        Returns:
+            SectionIndex: Header positions and content boundaries of every section.
+        """
+        entries: Dict[int, Dict[str, Any]] = {}
+        previous = None
+        for page in pages:
+            offset = 0
+            try:
+                for line in page["text"].splitlines(keepends=True):
+                    stripped = line.strip()
+                    expected = previous["number"] + 1 if previous else 1
+                    # isdecimal, not isdigit: superscripts such as "²" are digits int() cannot parse
+                    if stripped.isdecimal() and expected <= int(stripped) <= (expected + max_gap if previous else 1):
+                        number = int(stripped)
+                        if number != expected:
+                            logger.warning(f"Sections {expected}-{number - 1} not found before page {page['num']}")
+                        if previous:
+                            previous["end_page"], previous["end_offset"] = page["num"], offset
+                        previous = entries[number] = {
+                            "number": number,
+                            "page": page["num"],
+                            "offset": offset,
+                            "content_offset": offset + len(line),
+                            "end_page": None,
+                            "end_offset": None,
+                        }
+                    offset += len(line)
+            except Exception as e:
+                logger.error(f"Error indexing sections on page {page.get('num')}: {e}")
+
+        if previous and pages:
+            # The last section runs to the end of the book
+            previous["end_page"] = pages[-1]["num"]
+        logger.info(f"Indexed {len(entries)} numbered sections in a single pass")
+        return SectionIndex(entries)
+
+    @staticmethod
+    def section_text(section_index: SectionIndex, pages_by_num: Dict[int, Dict[str, Any]], section_number: int) -> str:
+        """Slice a section's text out of the page records using its index entry."""
+        entry = section_index.get(section_number)
+        if entry is None:
+            raise KeyError(f"Section {section_number} is not in the index")
+
+        parts = []
+        for page_num in range(entry["page"], entry["end_page"] + 1):
+            text = pages_by_num.get(page_num, {}).get("text", "")
+            start = entry["content_offset"] if page_num == entry["page"] else 0
+            stop = entry["end_offset"] if page_num == entry["end_page"] and entry["end_offset"] is not None else len(text)
+            part = text[start:stop].strip()
+            if part:
+                parts.append(part)
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def write_sections(
+        section_index: SectionIndex, pages: List[Dict[str, Any]], sections_dir: str, metadata_dir: str
+    ) -> int:
+        """
+        Write each numbered section to sections_dir/section_<n>.md and save the index.
+
+        Args:
+            section_index (SectionIndex): Index built by build_section_index.
+            pages (List[Dict[str, Any]]): Pages with their number and text.
+            sections_dir (str): Directory for the section files.
+            metadata_dir (str): Directory for sections_index.json.
+
+        Returns:
+            int: Number of sections written.
+        """
+        os.makedirs(sections_dir, exist_ok=True)
+        pages_by_num = {page["num"]: page for page in pages}
+        for number, entry in section_index.entries.items():
+            file_name = f"section_{number}.md"
+            content = f"# {number}\n\n{SectionProcessor.section_text(section_index, pages_by_num, number)}\n"
+            entry["file"] = file_name
+            tracing.add("bytes_written", FileSystemProcessor.write_atomic(os.path.join(sections_dir, file_name), content))
+
+        section_index.save(os.path.join(metadata_dir, SectionIndex.FILENAME))
+        logger.info(f"Wrote {len(section_index)} numbered sections to {sections_dir}")
+        return len(section_index)
+
     @staticmethod
     def extract_text_from_pdf(pdf_path: str) -> List[Dict[str, str]]:
         """
@@ -51,10 +190,8 @@ class SectionProcessor:
         """
         pages = []
         try:
-            reader = PdfReader(pdf_path)
-            for i, page in enumerate(reader.pages, start=1):
-                text = page.extract_text()
-                pages.append({"num": i, "text": text.strip() if text else ""})
+            with PDFDocumentSession(pdf_path) as session:
+                pages = [{"num": page["num"], "text": page["text"]} for page in session.pages]
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
 
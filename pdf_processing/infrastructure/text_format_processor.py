@@ -1,6 +1,16 @@
 import re
 from ..domain.entities import TextFormatting, FormattedText
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional
+
+# Compiled once; alternatives that used to be separate re.match calls are combined
+HORIZONTAL_RULE = re.compile(r'^[-—=*]{3,}$')
+# Centered-text indicators: horizontal rules and author attributions
+CENTERED_MARKER = re.compile(r'^(?:[-—=]{3,}|(?:by|written by|translated by)\s+[A-Z][a-zA-Z\s.]+)$', re.I)
+SHORT_SENTENCE = re.compile(r'^[A-Z][^.!?]*(?:[.!?]|\s)*$')
+LIST_ITEM = re.compile(r'^\s*[-•*]\s+|^\s*\d+\.\s+.+')
+BULLET = re.compile(r'^\s*[-•*]\s+')
+NUMBERED = re.compile(r'^\s*\d+\.\s+')
+
 
 class TextFormatProcessor:
     def __init__(self):
@@ -8,6 +18,8 @@ class TextFormatProcessor:
             r'^[A-Z][^a-z]{0,2}[A-Z].*$',  # All caps or nearly all caps
             r'^[A-Z][a-zA-Z\s]{0,50}$',  # Title case, not too long
         ]
+        # One regex trying every header pattern, instead of a re.match per pattern
+        self.header_regex = re.compile("|".join(f"(?:{pattern})" for pattern in self.header_patterns))
 
     def is_centered_text(self, text: str, line_spacing: float = None) -> bool:
         text = text.strip()
@@ -18,19 +30,16 @@ class TextFormatProcessor:
         if len(text) > 100:
             return False
 
-        # Check for common centered text indicators
-        indicators = [
-            text.isupper(),  # All uppercase
-            text.istitle() and len(text.split()) <= 7,  # Short title case phrases
-            text.startswith('    ') or text.startswith('\t'),  # Indentation
-            text.startswith('*') and text.endswith('*'),  # Asterisk wrapping
-            bool(re.match(r'^[-—=]{3,}$', text)),  # Horizontal rules
-            bool(re.match(r'^[A-Z][^.!?]*(?:[.!?]|\s)*$', text) and len(text) < 60),  # Short complete sentence
-            bool(re.match(r'^(?:by|written by|translated by)\s+[A-Z][a-zA-Z\s.]+$', text, re.I)),  # Author attribution
-            bool(re.match(r'^[A-Z\s]+$', text) and len(text) < 50)  # All caps short text
-        ]
-
-        return any(indicators)
+        # Centered text indicators, cheapest first; the first hit decides.
+        # All-caps short text is covered by isupper(), and indentation cannot
+        # survive the strip above, so neither needs its own check.
+        return (
+            text.isupper()  # All uppercase
+            or (text.istitle() and len(text.split()) <= 7)  # Short title case phrases
+            or (text.startswith('*') and text.endswith('*'))  # Asterisk wrapping
+            or (len(text) < 60 and SHORT_SENTENCE.match(text) is not None)  # Short complete sentence
+            or CENTERED_MARKER.match(text) is not None  # Horizontal rules, author attribution
+        )
 
     def detect_format_type(self, text: str) -> TextFormatting:
         """Detect the format type of a text block without AI assistance."""
@@ -47,11 +56,11 @@ class TextFormatProcessor:
         }
 
         # Detect if it's a list item
-        if re.match(r'^\s*[-•*]\s+', text):
+        if BULLET.match(text):
             metadata["list_type"] = "bullet"
-        elif re.match(r'^\s*\d+\.\s+', text):
+        elif NUMBERED.match(text):
             metadata["list_type"] = "numbered"
-        
+
         return metadata
 
     def detect_formatting(self, text: str, is_pre_section: bool = False) -> TextFormatting:
@@ -61,7 +70,7 @@ class TextFormatProcessor:
             return TextFormatting.PARAGRAPH
 
         # Check for horizontal rules
-        if re.match(r'^[-—=*]{3,}$', text):
+        if HORIZONTAL_RULE.match(text):
             return TextFormatting.HEADER
 
         # Enhanced centered text detection for pre-sections
@@ -72,67 +81,101 @@ class TextFormatProcessor:
             return TextFormatting.SUBHEADER
 
         # Check for headers
-        if any(re.match(pattern, text) for pattern in self.header_patterns):
+        if self.header_regex.match(text):
             return TextFormatting.HEADER
 
         # Check for list items
-        if re.match(r'^\s*[-•*]\s+', text) or re.match(r'^\s*\d+\.\s+.+', text):
+        if LIST_ITEM.match(text):
             return TextFormatting.LIST_ITEM
 
-        # Check for code blocks
-        if text.startswith('    ') or text.startswith('\t'):
-            return TextFormatting.CODE
-
         # Check for quotes
         if text.startswith('>') or (text.startswith('"') and text.endswith('"')):
             return TextFormatting.QUOTE
 
         return TextFormatting.PARAGRAPH
 
+    def classify_lines(self, lines: Iterable[str], is_pre_section: bool = False) -> List[TextFormatting]:
+        """
+        Classify many lines at once, e.g. every line of a page or a book.
+
+        Gives the same result as calling detect_formatting on each line. Lines
+        that repeat (running headers, ornaments, stat blocks) are classified once.
+
+        Args:
+            lines (Iterable[str]): Lines to classify.
+            is_pre_section (bool): Apply the pre-section centered text rules.
+
+        Returns:
+            List[TextFormatting]: The format of each line, in order.
+        """
+        detect = self.detect_formatting
+        known: Dict[str, TextFormatting] = {}
+        formats = []
+        append = formats.append
+        for line in lines:
+            format_type = known.get(line)
+            if format_type is None:
+                format_type = known[line] = detect(line, is_pre_section)
+            append(format_type)
+        return formats
+
     def process_text_block(self, text: str, is_pre_section: bool = False) -> List[FormattedText]:
+        lines = [line.strip() for line in text.splitlines()]
+        formats = self.classify_lines([line for line in lines if line], is_pre_section)
+        return self._group_lines(lines, iter(formats))
+
+    def process_text_blocks(self, texts: Iterable[str], is_pre_section: bool = False) -> List[List[FormattedText]]:
+        """
+        Format many text blocks (pages, a whole book) in one call.
+
+        All lines are classified in a single classify_lines pass, so repeated
+        lines across blocks are only classified once.
+
+        Args:
+            texts (Iterable[str]): Text blocks, e.g. the text of each page.
+            is_pre_section (bool): Apply the pre-section centered text rules.
+
+        Returns:
+            List[List[FormattedText]]: process_text_block's result for each block.
+        """
+        blocks = [[line.strip() for line in text.splitlines()] for text in texts]
+        formats = iter(self.classify_lines((line for lines in blocks for line in lines if line), is_pre_section))
+        return [self._group_lines(lines, formats) for lines in blocks]
+
+    def _group_lines(self, lines: List[str], formats: Iterable[TextFormatting]) -> List[FormattedText]:
+        """Group stripped lines and their formats into blocks; blank lines and headers start new blocks."""
         formatted_texts = []
-        current_format = None
-        current_text = []
+        current_format: Optional[TextFormatting] = None
+        current_text: List[str] = []
 
-        for line in text.splitlines():
-            line = line.strip()
+        for line in lines:
             if not line:
                 if current_text:
-                    formatted_texts.append(
-                        FormattedText(
-                            text="\n".join(current_text),
-                            format_type=current_format or TextFormatting.PARAGRAPH,
-                            metadata=self.analyze_formatting("\n".join(current_text))
-                        )
-                    )
+                    formatted_texts.append(self._formatted_text(current_text, current_format))
                     current_text = []
                     current_format = None
                 continue
 
-            format_type = self.detect_formatting(line, is_pre_section)
+            format_type = next(formats)
 
             # Always start a new block for headers and subheaders
-            if format_type != current_format or format_type in [TextFormatting.HEADER, TextFormatting.SUBHEADER]:
+            if format_type != current_format or format_type in (TextFormatting.HEADER, TextFormatting.SUBHEADER):
                 if current_text:
-                    formatted_texts.append(
-                        FormattedText(
-                            text="\n".join(current_text),
-                            format_type=current_format or TextFormatting.PARAGRAPH,
-                            metadata=self.analyze_formatting("\n".join(current_text))
-                        )
-                    )
+                    formatted_texts.append(self._formatted_text(current_text, current_format))
                     current_text = []
                 current_format = format_type
 
             current_text.append(line)
 
         if current_text:
-            formatted_texts.append(
-                FormattedText(
-                    text="\n".join(current_text),
-                    format_type=current_format or TextFormatting.PARAGRAPH,
-                    metadata=self.analyze_formatting("\n".join(current_text))
-                )
-            )
+            formatted_texts.append(self._formatted_text(current_text, current_format))
 
         return formatted_texts
+
+    def _formatted_text(self, lines: List[str], format_type: Optional[TextFormatting]) -> FormattedText:
+        text = "\n".join(lines)  # joined once, shared by the block and its metadata
+        return FormattedText(
+            text=text,
+            format_type=format_type or TextFormatting.PARAGRAPH,
+            metadata=self.analyze_formatting(text)
+        )
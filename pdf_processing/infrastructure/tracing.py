@@ -0,0 +1,122 @@
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .file_system_processor import FileSystemProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """A timed step of the ingestion, with its own counters and child steps."""
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.counters: Dict[str, float] = {}
+        self.children: List["Span"] = []
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"name": self.name, "seconds": round(self.duration, 6)}
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.counters:
+            data["counters"] = self.counters
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Collects the span tree of one book's ingestion.
+
+    The current span lives in a context variable, so asyncio tasks and
+    asyncio.to_thread calls started inside a span report to it without any
+    tracer being passed around. Code running outside a trace pays almost
+    nothing: span() and add() are no-ops when no span is current.
+    """
+
+    def __init__(self, name: str, **attributes: Any):
+        self._lock = threading.Lock()
+        self.root = Span(self, name, attributes)
+
+    def finish(self) -> None:
+        self.root.end = time.perf_counter()
+
+    def stages(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate spans by name: how often each ran, total seconds and summed counters."""
+        stages: Dict[str, Dict[str, Any]] = {}
+        pending = [self.root]
+        for span in pending:  # breadth first, so stages appear in pipeline order
+            stage = stages.setdefault(span.name, {"count": 0, "seconds": 0.0, "counters": {}})
+            stage["count"] += 1
+            stage["seconds"] = round(stage["seconds"] + span.duration, 6)
+            for counter, value in span.counters.items():
+                stage["counters"][counter] = stage["counters"].get(counter, 0) + value
+            pending.extend(span.children)
+        return stages
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "total_seconds": round(self.root.duration, 6),
+            "stages": self.stages(),
+            "trace": self.root.to_dict(),
+        }
+
+    def write(self, path: str) -> None:
+        FileSystemProcessor.write_json_atomic(path, self.report(), ensure_ascii=False, indent=2)
+        logger.info(f"Wrote ingestion profile to {path}")
+
+
+@contextmanager
+def trace(name: str, **attributes: Any) -> Iterator[Tracer]:
+    """Start a new trace; spans opened inside it (in this task and its children) are recorded."""
+    tracer = Tracer(name, **attributes)
+    token = _current_span.set(tracer.root)
+    try:
+        yield tracer
+    finally:
+        tracer.finish()
+        _current_span.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time a step as a child of the current span; does nothing outside a trace."""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    current = Span(parent.tracer, name, attributes)
+    with parent.tracer._lock:
+        parent.children.append(current)
+    token = _current_span.set(current)
+    try:
+        yield current
+    finally:
+        current.end = time.perf_counter()
+        _current_span.reset(token)
+
+
+def add(counter: str, value: float = 1) -> None:
+    """Add to a counter (tokens, bytes written, cache hits...) of the current span."""
+    current = _current_span.get()
+    if current is None:
+        return
+    with current.tracer._lock:
+        current.counters[counter] = current.counters.get(counter, 0) + value
@@ -0,0 +1,141 @@
+import unittest
+import os
+import io
+import asyncio
+import json
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+from pdf_processing.domain.entities import ProcessingJob
+from pdf_processing.infrastructure.progress_bus import content_channel
+
+
+class TestBookEventStreams(unittest.TestCase):
+    """The Server-Sent Events endpoints, against the app's in-memory progress bus."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.mkdtemp()
+        env = {
+            "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY") or "unused",
+            "PDF_JOBS_DB": os.path.join(cls.work_dir, "jobs.sqlite3"),
+            "BOOK_CATALOG_DB": os.path.join(cls.work_dir, "catalog.sqlite3"),
+            "PDF_JOB_WORKERS": "0",
+            "AI_CACHE_ENABLED": "0",
+        }
+        with mock.patch.dict(os.environ, env):
+            import app
+        cls.app = app
+        cls.client = app.app.test_client()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.job_queue.stop(timeout=5)
+        shutil.rmtree(cls.work_dir)
+
+    def setUp(self):
+        metadata_dir = tempfile.mkdtemp(dir=self.work_dir)
+        patcher = mock.patch.object(self.app, "METADATA_FOLDER", metadata_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def stream(self, url, channel, publish):
+        """Read an event stream to its end while `publish` runs once the request has subscribed."""
+        def publish_when_subscribed():
+            deadline = time.time() + 5
+            while self.app.progress_bus.subscriber_count(channel) == 0 and time.time() < deadline:
+                time.sleep(0.005)
+            publish()
+
+        publisher = threading.Thread(target=publish_when_subscribed)
+        publisher.start()
+        response = self.client.get(url)
+        body = response.get_data(as_text=True)
+        publisher.join()
+        self.assertEqual(response.mimetype, "text/event-stream")
+        return [json.loads(line[len("data: "):]) for line in body.splitlines() if line.startswith("data: ")]
+
+    def test_events_end_with_the_saved_book(self):
+        book = {"id": "Stream Book.pdf", "filename": "Stream Book.pdf", "title": "Stream Book", "status": "completed"}
+
+        def publish():
+            bus = self.app.progress_bus
+            bus.publish("Stream Book", "page", {"progress": {"status": "processing_pre_sections", "current_page": 1}})
+            # The processor's own completion comes before the metadata is saved; it does not end the stream
+            bus.publish("Stream Book", "status", {"progress": {"status": "completed"}})
+            self.app.save_metadata(book["filename"], book)
+
+        events = self.stream("/api/books/Stream%20Book.pdf/events", "Stream Book", publish)
+        self.assertEqual([event["type"] for event in events], ["page", "status", "book"])
+        self.assertEqual(events[-1]["data"]["book"], book)
+        self.assertEqual(self.app.book_catalog.get(book["filename"])["status"], "completed")
+
+        # Once the book is saved, a new client gets the record and the stream ends at once
+        response = self.client.get("/api/books/Stream%20Book.pdf/events")
+        self.assertIn('"type": "book"', response.get_data(as_text=True))
+
+    def test_content_stream_ends_with_the_run(self):
+        channel = content_channel("content_book")
+
+        def publish():
+            bus = self.app.progress_bus
+            bus.publish(channel, "page_chunk", {"page_number": 1, "text": "# Title"}, retain=False)
+            bus.publish(channel, "content_end", {}, retain=False)
+
+        events = self.stream("/api/books/content_book.pdf/content/events", channel, publish)
+        self.assertEqual([event["type"] for event in events], ["page_chunk", "content_end"])
+        self.assertEqual(events[0]["data"]["text"], "# Title")
+
+    def test_content_stream_of_a_finished_run_ends_at_once(self):
+        # The run's retained end reaches a client connecting after it
+        self.app.progress_bus.publish(content_channel("ended_book"), "content_end", {})
+        body = self.client.get("/api/books/ended_book.pdf/content/events").get_data(as_text=True)
+        self.assertIn("event: content_end", body)
+
+        # So does the saved record of a finished book, when the bus has forgotten the run
+        self.app.save_metadata("saved_book.pdf", {"id": "saved_book.pdf", "filename": "saved_book.pdf", "status": "completed"})
+        body = self.client.get("/api/books/saved_book.pdf/content/events").get_data(as_text=True)
+        self.assertIn("event: content_end", body)
+        self.assertEqual(self.app.progress_bus.subscriber_count(content_channel("saved_book")), 0)
+
+    def test_a_worker_runs_its_jobs_on_one_event_loop(self):
+        loops = []
+
+        async def process(filename, file_path, service, progress_callback, markdown_mode=None):
+            loops.append(asyncio.get_running_loop())
+            return {"status": "completed"}
+
+        def run_jobs():
+            with mock.patch.object(self.app, "process_pdf_file", process), \
+                    mock.patch.object(self.app, "get_worker_service", lambda: None):
+                for index in range(2):
+                    self.app.run_pdf_job(ProcessingJob(id=str(index), filename="a.pdf", file_path="a.pdf"), lambda progress: None)
+
+        worker = threading.Thread(target=run_jobs)
+        worker.start()
+        worker.join()
+        # The OpenAI client's connections belong to the loop, so it must outlive each job
+        self.assertIs(loops[0], loops[1])
+        self.assertFalse(loops[0].is_closed())
+
+    def test_uploads_choose_the_markdown_mode(self):
+        upload_dir = tempfile.mkdtemp(dir=self.work_dir)
+        with mock.patch.object(self.app, "UPLOAD_FOLDER", upload_dir):
+            response = self.client.post("/api/books/upload", data={
+                "pdf_files": (io.BytesIO(b"%PDF-1.4"), "mode book.pdf"), "markdown_mode": "local",
+            })
+            self.assertEqual(response.status_code, 202)
+            job = response.get_json()["jobs"][0]
+            self.assertEqual(job["markdown_mode"], "local")
+            self.assertEqual(self.app.job_queue.get(job["id"]).markdown_mode, "local")
+
+            response = self.client.post("/api/books/upload", data={
+                "pdf_files": (io.BytesIO(b"%PDF-1.4"), "mode book.pdf"), "markdown_mode": "ocr",
+            })
+            self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
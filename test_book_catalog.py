@@ -0,0 +1,83 @@
+import unittest
+import os
+import json
+import shutil
+import tempfile
+from pdf_processing.infrastructure.book_catalog import BookCatalog
+
+
+def book(number, status="completed", **fields):
+    return {
+        "id": f"book_{number:02d}.pdf",
+        "filename": f"book_{number:02d}.pdf",
+        "title": f"Book {number:02d}",
+        "author": "Unknown",
+        "uploadDate": f"2024-01-{number:02d}T10:00:00",
+        "status": status,
+        **fields,
+    }
+
+
+class TestBookCatalog(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.work_dir, "catalog.sqlite3")
+        self.catalog = BookCatalog(self.db_path)
+        for number in range(1, 26):
+            self.catalog.upsert(book(number, status="failed" if number % 5 == 0 else "completed"))
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def ids(self, books):
+        return [entry["id"] for entry in books]
+
+    def test_pages_through_newest_first(self):
+        books, total = self.catalog.query(page=1, per_page=10)
+        self.assertEqual(total, 25)
+        self.assertEqual(self.ids(books), [f"book_{number:02d}.pdf" for number in range(25, 15, -1)])
+        books, total = self.catalog.query(page=3, per_page=10)
+        self.assertEqual(self.ids(books), [f"book_{number:02d}.pdf" for number in range(5, 0, -1)])
+        self.assertEqual(self.catalog.query(page=4, per_page=10), ([], 25))
+        self.assertEqual(len(self.catalog.query()[0]), 25)
+
+    def test_filters_and_sorting(self):
+        books, total = self.catalog.query(status="failed", sort="title", order="asc")
+        self.assertEqual(total, 5)
+        self.assertEqual(self.ids(books), [f"book_{number:02d}.pdf" for number in (5, 10, 15, 20, 25)])
+        books, total = self.catalog.query(search="OK 1", per_page=3)
+        self.assertEqual((total, self.ids(books)), (10, ["book_19.pdf", "book_18.pdf", "book_17.pdf"]))
+        with self.assertRaises(ValueError):
+            self.catalog.query(sort="data")
+        with self.assertRaises(ValueError):
+            self.catalog.query(order="sideways")
+
+    def test_sees_writes_from_other_processes(self):
+        self.assertEqual(self.catalog.get("book_01.pdf")["status"], "completed")
+        self.assertEqual(self.catalog.query(status="processing")[1], 0)
+
+        # Another process (another connection) updates a book; the cached answers are dropped
+        other = BookCatalog(self.db_path)
+        other.upsert(book(1, status="processing", current_page=4))
+        self.assertEqual(self.catalog.get("book_01.pdf")["current_page"], 4)
+        self.assertEqual(self.ids(self.catalog.query(status="processing")[0]), ["book_01.pdf"])
+        other.delete("book_01.pdf")
+        self.assertIsNone(self.catalog.get("book_01.pdf"))
+        self.assertEqual(self.catalog.count(), 24)
+
+    def test_imports_metadata_files(self):
+        metadata_dir = os.path.join(self.work_dir, "metadata")
+        os.makedirs(metadata_dir)
+        entry = book(30)
+        del entry["id"]
+        with open(os.path.join(metadata_dir, "book_30.pdf.json"), "w") as f:
+            json.dump(entry, f)
+        with open(os.path.join(metadata_dir, "broken.json"), "w") as f:
+            f.write("{")
+        with self.assertLogs("pdf_processing.infrastructure.book_catalog", "ERROR"):
+            self.assertEqual(self.catalog.import_metadata_dir(metadata_dir), 1)
+        self.assertEqual(self.catalog.get("book_30.pdf")["title"], "Book 30")
+
+
+if __name__ == '__main__':
+    unittest.main()
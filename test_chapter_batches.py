@@ -0,0 +1,71 @@
+import unittest
+import os
+import json
+import asyncio
+from unittest import mock
+from pdf_processing.infrastructure.ai_processor import AIProcessor
+from pdf_processing.infrastructure.llm_backend import MockLLMBackend
+from pdf_processing.infrastructure.request_scheduler import RequestScheduler
+
+
+class ForgetfulBackend(MockLLMBackend):
+    """Mock backend that leaves every third page out of batched answers, wrapped and fenced."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batch_sizes = []
+
+    def _answer(self, prompt):
+        answer = super()._answer(prompt)
+        if not prompt.startswith("["):
+            return answer
+        items = json.loads(answer)
+        self.batch_sizes.append(len(items))
+        kept = [item for item in items if len(items) < 3 or item["page"] % 3]
+        return "```json\n" + json.dumps({"pages": kept}) + "\n```"
+
+
+def page(num):
+    text = f"CHAPTER {num}\nIt begins." if num % 4 == 1 else f"Page {num} goes on with the story."
+    return {"num": num, "text": text}
+
+
+class TestChapterBatches(unittest.TestCase):
+    def setUp(self):
+        env = mock.patch.dict(os.environ, {"AI_CACHE_ENABLED": "0"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def ai_processor(self, backend):
+        ai_processor = AIProcessor(backend=backend, scheduler=RequestScheduler.unlimited())
+        ai_processor.chapter_batch_max_pages = 10
+        return ai_processor
+
+    def test_batches_respect_page_and_token_budgets(self):
+        ai_processor = self.ai_processor(MockLLMBackend())
+        pages = [page(num) for num in range(1, 31)]
+        self.assertEqual([len(batch) for batch in ai_processor.pack_chapter_batches(pages)], [10, 10, 10])
+        ai_processor.chapter_batch_max_tokens = 50
+        batches = ai_processor.pack_chapter_batches(pages)
+        self.assertEqual([item for batch in batches for item in batch], pages)
+        self.assertTrue(all(
+            len(batch) == 1 or sum(ai_processor.estimate_tokens(item["text"]) + 10 for item in batch) <= 50
+            for batch in batches
+        ))
+
+    def test_pages_missing_from_an_answer_are_asked_again(self):
+        backend = ForgetfulBackend()
+        pages = [page(num) for num in range(1, 21)]
+        results = asyncio.run(self.ai_processor(backend).detect_chapters_batch(pages))
+
+        self.assertEqual(sorted(results), list(range(1, 21)))
+        for num, (is_chapter, title) in results.items():
+            self.assertEqual(is_chapter, num % 4 == 1, num)
+            self.assertEqual(title, f"CHAPTER {num}" if num % 4 == 1 else None)
+        # Both batches of ten lose three pages, which are asked again as a pair and a single page
+        self.assertEqual(sorted(backend.batch_sizes), [2, 2, 10, 10])
+        self.assertEqual(sum(backend._attempts.values()), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import os
+import asyncio
+import shutil
+import tempfile
+from pdf_processing.infrastructure.checkpoint_store import IngestionCheckpoint
+
+
+class TestIngestionCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.pdf_path = os.path.join(self.work_dir, "book.pdf")
+        with open(self.pdf_path, "wb") as f:
+            f.write(b"%PDF-1.4 first version")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def load(self):
+        checkpoint = IngestionCheckpoint(self.work_dir, self.pdf_path)
+        asyncio.run(checkpoint.load())
+        return checkpoint
+
+    def test_records_survive_a_restart(self):
+        async def record(checkpoint):
+            await asyncio.gather(*(
+                checkpoint.record_page(page, page == 1, f"# Page {page}\n" + "text " * 2000) for page in range(1, 21)
+            ))
+            await checkpoint.record_images([{"image_path": "images/book_page10_img1.png"}])
+
+        asyncio.run(record(self.load()))
+        checkpoint = self.load()
+        self.assertEqual(sorted(checkpoint.pages), list(range(1, 21)))
+        self.assertTrue(checkpoint.pages[1]["is_new_chapter"])
+        self.assertTrue(checkpoint.pages[7]["markdown"].startswith("# Page 7\n"))
+        self.assertEqual(checkpoint.images, [{"image_path": "images/book_page10_img1.png"}])
+
+        asyncio.run(checkpoint.clear())
+        self.assertFalse(os.path.exists(checkpoint.path))
+
+    def test_truncated_record_is_ignored(self):
+        asyncio.run(self.load().record_page(1, True, "# One"))
+        with open(os.path.join(self.work_dir, IngestionCheckpoint.FILENAME), "a", encoding="utf-8") as f:
+            f.write('{"type": "page", "page": 2, "is_new')
+        with self.assertLogs("pdf_processing.infrastructure.checkpoint_store", "WARNING"):
+            checkpoint = self.load()
+        self.assertEqual(list(checkpoint.pages), [1])
+
+    def test_changed_pdf_starts_over(self):
+        asyncio.run(self.load().record_page(1, True, "# One"))
+        with open(self.pdf_path, "wb") as f:
+            f.write(b"%PDF-1.4 second version")
+        checkpoint = self.load()
+        self.assertEqual(checkpoint.pages, {})
+        self.assertEqual(self.load().pages, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
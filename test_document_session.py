@@ -0,0 +1,77 @@
+import unittest
+import os
+import asyncio
+import shutil
+import tempfile
+from unittest import mock
+from create_test_pdf import create_large_test_pdf
+from pdf_processing.application.pdf_service import PDFService
+from pdf_processing.infrastructure import document_session
+from pdf_processing.infrastructure.document_session import PDFDocumentSession
+from pdf_processing.infrastructure.parallel_extractor import ParallelPageExtractor
+from pdf_processing.infrastructure.pdf_processor import MuPDFProcessor
+from pdf_processing.infrastructure.pdf_repository import FileSystemPDFRepository
+
+
+class TestPDFDocumentSession(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.mkdtemp()
+        cls.pdf_path = create_large_test_pdf(os.path.join(cls.work_dir, "book.pdf"), pages=40)
+        with PDFDocumentSession(cls.pdf_path) as session:
+            cls.serial_pages = session.pages
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.work_dir)
+
+    def test_pages_are_parsed_once(self):
+        with mock.patch.object(document_session, "extract_page_record", wraps=document_session.extract_page_record) as extract:
+            with PDFDocumentSession(self.pdf_path) as session:
+                pages = asyncio.run(session.load_pages())
+                # Every later stage gets the same records without parsing again
+                self.assertIs(session.pages, pages)
+                self.assertIs(asyncio.run(session.load_pages()), pages)
+        self.assertEqual(extract.call_count, 40)
+        self.assertEqual([page["num"] for page in pages], list(range(1, 41)))
+        self.assertEqual(pages[9]["image_xrefs"], self.serial_pages[9]["image_xrefs"])
+        self.assertTrue(pages[9]["image_xrefs"])
+
+    def test_render_page(self):
+        with PDFDocumentSession(self.pdf_path) as session:
+            self.assertEqual(session.render_page(1, zoom=0.5)[:2], b"\xff\xd8")
+        self.assertTrue(session.doc.is_closed)
+
+    def test_process_pool_extraction_matches_a_single_pass(self):
+        extractor = ParallelPageExtractor(max_workers=2, chunk_size=7, min_pages=10)
+        self.addCleanup(extractor.close)
+        self.assertFalse(extractor.should_parallelize(9))
+        self.assertFalse(ParallelPageExtractor(max_workers=1, min_pages=1).should_parallelize(40))
+
+        self.assertEqual(list(extractor.extract_pages(self.pdf_path, 40)), self.serial_pages)
+        with mock.patch.object(document_session, "extract_page_record", side_effect=AssertionError("parsed in-process")):
+            with PDFDocumentSession(self.pdf_path, extractor=extractor) as session:
+                self.assertEqual(asyncio.run(session.load_pages()), self.serial_pages)
+
+    def test_processors_shut_down_only_their_own_pool(self):
+        with ParallelPageExtractor(max_workers=2, chunk_size=7, min_pages=10) as extractor:
+            list(extractor.extract_pages(self.pdf_path, 40))
+            executor = extractor._executor
+            processes = list(executor._processes.values())
+        self.assertIsNone(extractor._executor)
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+        shared = ParallelPageExtractor(max_workers=2)
+        self.addCleanup(shared.close)
+        shared._get_executor()
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY") or "unused", "AI_CACHE_ENABLED": "0"}):
+            MuPDFProcessor(repository=FileSystemPDFRepository(), page_extractor=shared).close()
+            owner = MuPDFProcessor(repository=FileSystemPDFRepository())
+        self.assertIsNotNone(shared._executor)
+        owner.page_extractor._get_executor()
+        PDFService(processor=owner, repository=owner.repository).close()
+        self.assertIsNone(owner.page_extractor._executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import os
+import shutil
+import tempfile
+from create_test_pdf import create_test_pdf
+from pdf_processing.infrastructure.document_session import PDFDocumentSession
+from pdf_processing.infrastructure.heuristic_chapter_detector import HeuristicChapterDetector, body_font_size
+
+WIDTH, HEIGHT = 612.0, 792.0
+
+
+def line(text, size=11.0, x0=72.0, x1=540.0, y=100.0, bold=False):
+    return {"text": text, "size": size, "bbox": (x0, y, x1, y + size), "bold": bold}
+
+
+def page(*lines):
+    return {"lines": list(lines), "width": WIDTH, "height": HEIGHT}
+
+
+BODY = line("The corridor ends in a heavy door studded with iron nails and bolts.", y=650)
+
+
+class TestHeuristicChapterDetector(unittest.TestCase):
+    def setUp(self):
+        self.detector = HeuristicChapterDetector(low_threshold=0.3, high_threshold=0.75)
+        self.detector.body_size = 11.0
+
+    def test_scores_follow_typography(self):
+        cases = [
+            # Large, bold, centered, near the top
+            (page(line("THE DARK TOWER", size=24, x0=206, x1=406, bold=True), BODY), 1.0),
+            # Large and bold, but low on the page and spanning the column
+            (page(line("THE DARK TOWER", size=17, y=500, bold=True), BODY), 0.75),
+            # Somewhat larger, at the top
+            (page(line("Interlude", size=13.5), BODY), 0.5),
+            # Body text; only its position counts
+            (page(line("More text follows."), BODY), 0.1),
+            (page(), 0.0),
+        ]
+        for case, expected in cases:
+            self.assertAlmostEqual(self.detector.score(case)[0], expected, msg=case["lines"][:1])
+
+    def test_thresholds_decide_or_defer(self):
+        title = page(line("PART ONE", size=24, x0=256, x1=356, bold=True), line("THE JOURNEY", size=24, x0=236, x1=376, y=130), BODY)
+        self.assertEqual(self.detector.classify(title), (True, "PART ONE THE JOURNEY"))
+        self.assertEqual(self.detector.classify(page(line("THE DARK TOWER", size=17, y=500, bold=True), BODY)), (True, "THE DARK TOWER"))
+        self.assertIsNone(self.detector.classify(page(line("Interlude", size=13.5), BODY)))
+        self.assertEqual(self.detector.classify(page(BODY)), (False, None))
+        # Gamebook section numbers are never chapters, however they are set
+        self.assertEqual(self.detector.classify(page(line("12", size=24, x0=296, x1=316, bold=True), BODY)), (False, None))
+        self.assertEqual(self.detector.stats(), {"decided": 4, "deferred": 1})
+
+        strict = HeuristicChapterDetector(low_threshold=0.05, high_threshold=0.9)
+        strict.body_size = 11.0
+        self.assertIsNone(strict.classify(page(line("More text follows."), BODY)))
+        self.assertIsNone(strict.classify(page(line("THE DARK TOWER", size=17, y=500, bold=True), BODY)))
+
+    def test_calibrates_on_the_book(self):
+        self.assertEqual(body_font_size([page(line("Title", size=20), line("x" * 200, size=10.9)), page(line("y" * 50, size=14))]), 11.0)
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir)
+        with PDFDocumentSession(create_test_pdf(os.path.join(work_dir, "test_book.pdf"))) as session:
+            detector = HeuristicChapterDetector()
+            self.assertEqual(detector.calibrate(session.pages), 12.0)
+            decisions = [detector.classify(pdf_page) for pdf_page in session.pages]
+        self.assertEqual(decisions[2], (True, "COMBAT RULES"))
+        self.assertEqual([decision[0] for decision in decisions], [True] * 5 + [False] * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import os
+import json
+import shutil
+import tempfile
+from unittest import mock
+from create_test_pdf import create_large_test_pdf
+from pdf_processing.infrastructure.image_processor import ImageProcessor
+
+
+class TestImageProcessor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.mkdtemp()
+        # Illustrations on pages 10, 15 and 20, then the same three again
+        cls.pdf_path = create_large_test_pdf(os.path.join(cls.work_dir, "book.pdf"), pages=40)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.work_dir)
+
+    def extract(self, name, **kwargs):
+        images_dir = os.path.join(self.work_dir, name)
+        os.makedirs(images_dir)
+        images = ImageProcessor(**kwargs).extract_images(self.pdf_path, images_dir, images_dir, "book", on_image=self.on_image)
+        with open(os.path.join(images_dir, "images.json"), encoding="utf-8") as f:
+            return images, json.load(f)
+
+    def on_image(self, image):
+        self.reported.append((image.image_path, os.path.exists(image.image_path)))
+
+    def setUp(self):
+        self.reported = []
+
+    def test_images_are_reported_once_written(self):
+        images, metadata = self.extract("transcoded", transcode=True)
+        self.assertEqual(len(images), 7)
+        self.assertEqual([path for path, _ in self.reported], [image.image_path for image in images])
+        self.assertTrue(all(exists for _, exists in self.reported))
+        self.assertEqual([entry["image_path"] for entry in metadata], [image.image_path for image in images])
+
+    def test_repeated_images_become_references(self):
+        images, metadata = self.extract("original")
+        originals = [image for image in images if image.duplicate_of is None]
+        self.assertEqual(len(originals), 3)
+        self.assertEqual(len({image.content_hash for image in originals}), 3)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.work_dir, "original"))), sorted(
+            ["images.json"] + [os.path.basename(image.image_path) for image in originals]
+        ))
+        by_path = {image.image_path: image for image in originals}
+        for image, entry in zip(images, metadata):
+            if image.duplicate_of:
+                self.assertEqual(image.content_hash, by_path[image.duplicate_of].content_hash)
+                self.assertEqual(entry["duplicate_of"], os.path.basename(image.duplicate_of))
+
+    def test_failed_transcode_is_dropped(self):
+        with mock.patch.object(ImageProcessor, "_transcode_to_png", side_effect=OSError("disk full")):
+            images, metadata = self.extract("failed", transcode=True)
+        self.assertEqual(images, [])
+        self.assertEqual(metadata, [])
+        self.assertEqual(self.reported, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
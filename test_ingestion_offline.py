@@ -0,0 +1,230 @@
+import unittest
+import os
+import json
+import shutil
+import asyncio
+import tempfile
+from unittest import mock
+from create_test_pdf import create_test_pdf
+from pdf_processing.application.pdf_service import PDFService
+from pdf_processing.domain.entities import ProcessingStatus
+from pdf_processing.infrastructure.ai_processor import AIProcessor
+from pdf_processing.infrastructure.llm_backend import MockLLMBackend, TransientLLMError
+from pdf_processing.infrastructure.page_renderer import PageRenderer
+from pdf_processing.infrastructure.pdf_processor import MuPDFProcessor
+from pdf_processing.infrastructure.pdf_repository import FileSystemPDFRepository
+from pdf_processing.infrastructure.progress_bus import ProgressBus, content_channel
+from pdf_processing.infrastructure.request_scheduler import RequestScheduler
+
+
+class CountingBackend(MockLLMBackend):
+    """Mock backend recording how many requests are in flight at once."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def stream(self, model, messages, temperature, max_tokens):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            async for chunk in super().stream(model, messages, temperature, max_tokens):
+                yield chunk
+        finally:
+            self.in_flight -= 1
+
+
+class FailingPageBackend(MockLLMBackend):
+    """Mock backend whose Markdown request for one page keeps failing."""
+
+    def __init__(self, page_text, **kwargs):
+        super().__init__(**kwargs)
+        self.page_text = page_text
+
+    async def stream(self, model, messages, temperature, max_tokens):
+        prompt = self._text(messages[-1]["content"])
+        if prompt.startswith("{") and self.page_text in prompt:
+            raise TransientLLMError("service unavailable")
+        async for chunk in super().stream(model, messages, temperature, max_tokens):
+            yield chunk
+
+
+class TestOfflineIngestion(unittest.TestCase):
+    """Run the whole ingestion pipeline against the mock LLM backend (no API key needed)."""
+
+    def setUp(self):
+        env = mock.patch.dict(os.environ, {"AI_CACHE_ENABLED": "0"})
+        env.start()
+        self.addCleanup(env.stop)
+        self.work_dir = tempfile.mkdtemp()
+        self.pdf_path = create_test_pdf(os.path.join(self.work_dir, "test_book.pdf"))
+        self.output_dir = os.path.join(self.work_dir, "sections")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def process(self, backend, markdown_mode=None, progress_bus=None, resume=False, output_dir=None):
+        repository = FileSystemPDFRepository()
+        ai_processor = AIProcessor(backend=backend, scheduler=RequestScheduler.unlimited(max_attempts=8, max_backoff=0.01))
+        self.processor = MuPDFProcessor(
+            repository=repository, resume=resume, ai_processor=ai_processor, progress_bus=progress_bus
+        )
+        service = PDFService(processor=self.processor, repository=repository)
+        return asyncio.run(service.process_pdf(self.pdf_path, output_dir or self.output_dir, markdown_mode=markdown_mode))
+
+    def test_pipeline_with_mock_backend(self):
+        processed_pdf = self.process(MockLLMBackend())
+        self.assertEqual(processed_pdf.progress.status, ProcessingStatus.COMPLETED)
+        self.assertEqual([section.page_number for section in processed_pdf.sections], [2, 3, 4, 5, 7])
+
+        book_dir = os.path.join(self.output_dir, "test_book")
+        with open(os.path.join(book_dir, "histoire", "chapter_3.md"), encoding="utf-8") as f:
+            self.assertIn("## Combat Rules", f.read())
+        with open(os.path.join(book_dir, "metadata", "sections_index.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["count"], 3)
+        with open(os.path.join(book_dir, "metadata", "book.json"), encoding="utf-8") as f:
+            book = json.load(f)
+        self.assertEqual(book["processing_status"], "completed")
+        self.assertEqual(book["total_sections"], 5)
+
+        # Chapters are streamed to disk; sections only reference their files
+        chapter = processed_pdf.sections[2]
+        self.assertIsNone(chapter.content)
+        self.assertIn("## Combat Rules", chapter.read_content())
+        self.assertFalse([name for name in os.listdir(os.path.join(book_dir, "histoire")) if name.endswith(".part")])
+
+    def test_rerun_replaces_previous_output(self):
+        histoire_dir = os.path.join(self.output_dir, "test_book", "histoire")
+        os.makedirs(histoire_dir)
+        with open(os.path.join(histoire_dir, "chapter_9.md"), "w", encoding="utf-8") as f:
+            f.write("left over from an earlier run")
+
+        processed_pdf = self.process(MockLLMBackend())
+        self.assertEqual(
+            sorted(os.listdir(histoire_dir)), sorted(os.path.basename(section.file_path) for section in processed_pdf.sections)
+        )
+
+    def test_page_renders_are_removed_when_the_book_completes(self):
+        with mock.patch.dict(os.environ, {"PAGE_IMAGES_ENABLED": "1"}), \
+                mock.patch.object(PageRenderer, "_save", side_effect=PageRenderer._save) as save:
+            processed_pdf = self.process(MockLLMBackend())
+        self.assertEqual(processed_pdf.progress.status, ProcessingStatus.COMPLETED)
+        self.assertTrue(save.called)
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir, "test_book", "metadata", "page_renders")))
+
+    def test_interrupted_book_resumes_from_its_checkpoint(self):
+        def chapters(output_dir):
+            histoire_dir = os.path.join(output_dir, "test_book", "histoire")
+            files = {}
+            for name in sorted(os.listdir(histoire_dir)):
+                with open(os.path.join(histoire_dir, name), encoding="utf-8") as f:
+                    files[name] = f.read()
+            return files
+
+        with mock.patch.dict(os.environ, {"PAGE_PACKING_ENABLED": "0"}):
+            fresh_backend = MockLLMBackend()
+            self.process(fresh_backend, output_dir=os.path.join(self.work_dir, "fresh"))
+
+            failed_pdf = self.process(FailingPageBackend("GAME RULES"), resume=True)
+            self.assertEqual(failed_pdf.progress.status, ProcessingStatus.FAILED)
+            checkpoint_path = os.path.join(self.output_dir, "test_book", "metadata", "checkpoint.jsonl")
+            with open(checkpoint_path, encoding="utf-8") as f:
+                recorded = [json.loads(line) for line in f][1:]
+            self.assertTrue(recorded)
+            self.assertNotIn(4, [record["page"] for record in recorded])
+
+            resumed_backend = MockLLMBackend()
+            processed_pdf = self.process(resumed_backend, resume=True)
+
+        self.assertEqual(processed_pdf.progress.status, ProcessingStatus.COMPLETED)
+        # Checkpointed pages are replayed, not requested again, and the book comes out the same
+        self.assertLess(sum(resumed_backend._attempts.values()), sum(fresh_backend._attempts.values()))
+        self.assertEqual(chapters(self.output_dir), chapters(os.path.join(self.work_dir, "fresh")))
+        self.assertFalse(os.path.exists(checkpoint_path))
+
+    def test_transient_errors_are_retried(self):
+        backend = MockLLMBackend(error_rate=0.3, seed=7)
+        processed_pdf = self.process(backend)
+        self.assertEqual(processed_pdf.progress.status, ProcessingStatus.COMPLETED)
+        self.assertEqual(len(processed_pdf.sections), 5)
+
+    def test_pages_are_analyzed_concurrently_in_order(self):
+        async def analyze(pages):
+            processor = MuPDFProcessor(
+                repository=FileSystemPDFRepository(), resume=False, max_concurrent=4,
+                ai_processor=AIProcessor(backend=backend, scheduler=RequestScheduler.unlimited()),
+            )
+            return [(page["num"], is_new_chapter) async for page, is_new_chapter, _ in processor._analyze_pages(pages)]
+
+        # Later pages often finish first; results still come out in page order
+        backend = CountingBackend(latency=0.03, latency_jitter=0.025, seed=3)
+        pages = [
+            {"num": num, "text": f"CHAPTER {num}\nThe story goes on." if num % 4 == 1 else f"Page {num} of the story.", "lines": []}
+            for num in range(1, 17)
+        ]
+        # Pages without typography go to the LLM for chapter detection too
+        with mock.patch.dict(os.environ, {"PAGE_PACKING_ENABLED": "0", "CHAPTER_HEURISTIC_ENABLED": "0"}):
+            results = asyncio.run(analyze(pages))
+        self.assertEqual(results, [(num, num % 4 == 1) for num in range(1, 17)])
+        self.assertEqual(backend.peak_in_flight, 4)
+
+    def test_repeated_pages_share_one_analysis(self):
+        async def analyze(pages):
+            backend = MockLLMBackend()
+            processor = MuPDFProcessor(
+                repository=FileSystemPDFRepository(), resume=False,
+                ai_processor=AIProcessor(backend=backend, scheduler=RequestScheduler.unlimited()),
+            )
+            results = []
+            async for page, _, chunks in processor._analyze_pages(pages):
+                results.append((page["num"], "".join([chunk async for chunk in chunks])))
+            return results, sum(backend._attempts.values())
+
+        pages = [{"num": num, "text": text, "lines": []} for num, text in [(1, "STATS\nSkill: 7"), (2, "The road forks.")]]
+        with mock.patch.dict(os.environ, {"PAGE_IMAGES_ENABLED": "0", "PAGE_PACKING_ENABLED": "0"}):
+            unique, unique_requests = asyncio.run(analyze(pages))
+            repeated, repeated_requests = asyncio.run(analyze(pages + [dict(pages[0], num=3)]))
+        self.assertEqual(repeated_requests, unique_requests)
+        # The repeat's Markdown is written again at its own position
+        self.assertEqual(repeated, unique + [(3, unique[0][1])])
+
+    def test_streamed_content_is_kept_off_the_progress_channel(self):
+        bus = ProgressBus()
+        with bus.subscribe("test_book") as progress, bus.subscribe(content_channel("test_book")) as content:
+            self.process(MockLLMBackend(), progress_bus=bus)
+            progress_events = list(iter(lambda: next(progress.events(timeout=0)), None))
+            content_events = list(iter(lambda: next(content.events(timeout=0)), None))
+
+        self.assertNotIn("page_chunk", {event["type"] for event in progress_events})
+        self.assertEqual(progress_events[-1]["data"]["progress"]["status"], "completed")
+        self.assertEqual((content_events[0]["type"], content_events[-1]["type"]), ("content_start", "content_end"))
+        # The end of the run is kept for clients that connect later
+        self.assertEqual(bus.latest(content_channel("test_book"))["type"], "content_end")
+        chunks = [event["data"] for event in content_events if event["type"] == "page_chunk"]
+        self.assertTrue(chunks)
+        self.assertNotIn("progress", chunks[0])
+        self.assertIn("## Combat Rules", "".join(chunk["text"] for chunk in chunks))
+
+    def test_counters_cover_one_book(self):
+        self.process(MockLLMBackend())
+        first = (self.processor.chapter_detector.stats(), self.processor.markdown_stats)
+        service = PDFService(processor=self.processor, repository=self.processor.repository)
+        asyncio.run(service.process_pdf(self.pdf_path, self.output_dir))
+        self.assertEqual((self.processor.chapter_detector.stats(), self.processor.markdown_stats), first)
+
+    def test_local_markdown_renderer(self):
+        processed_pdf = self.process(MockLLMBackend(), markdown_mode="local")
+        self.assertEqual(processed_pdf.progress.status, ProcessingStatus.COMPLETED)
+        self.assertEqual(self.processor.markdown_stats["llm"], 0)
+        self.assertGreater(self.processor.markdown_stats["local"], 0)
+
+        chapter = processed_pdf.sections[2].read_content()
+        self.assertIn("# COMBAT RULES", chapter)
+        self.assertIn("### Basic Combat", chapter)
+        with self.assertRaises(ValueError):
+            MuPDFProcessor(repository=FileSystemPDFRepository(), ai_processor=self.processor.ai_processor, markdown_mode="ocr")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pdf_processing.domain.entities import JobStatus, ProcessingProgress, ProcessingStatus
+from pdf_processing.infrastructure.job_queue import JobQueue
+
+
+def no_handler(job, report_progress):
+    raise AssertionError("workers are not started in this test")
+
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.work_dir, "jobs.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def queue(self, handler=no_handler, **kwargs):
+        return JobQueue(self.db_path, handler=handler, **kwargs)
+
+    def test_claims_in_order_and_only_once_across_processes(self):
+        first, second = self.queue(), self.queue()
+        jobs = [first.submit(f"book_{index}.pdf", f"/tmp/book_{index}.pdf") for index in range(20)]
+        self.assertEqual(first.depth(), 20)
+
+        claimed = {first.owner: [], second.owner: []}
+
+        def claim_all(queue):
+            while True:
+                job = queue._claim_next()
+                if job is None:
+                    return
+                claimed[queue.owner].append(job.id)
+
+        threads = [threading.Thread(target=claim_all, args=(queue,)) for queue in (first, second, first, second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        all_claimed = claimed[first.owner] + claimed[second.owner]
+        self.assertEqual(sorted(all_claimed), sorted(job.id for job in jobs))
+        self.assertEqual(first.depth(), 0)
+        self.assertEqual(first.get(jobs[0].id).status, JobStatus.RUNNING)
+
+    def test_only_abandoned_jobs_are_claimed_again(self):
+        live = self.queue(lease_seconds=60)
+        job = live.submit("book.pdf", "/tmp/book.pdf")
+        self.assertEqual(live._claim_next().id, job.id)
+
+        # Another process starting up leaves a job with a live lease alone
+        restarted = self.queue(lease_seconds=60)
+        self.assertIsNone(restarted._claim_next())
+
+        # Once the owner stops renewing the lease, the job is claimed again
+        with live._connection:
+            live._connection.execute("UPDATE jobs SET lease_expires = ? WHERE id = ?", (time.time() - 1, job.id))
+        reclaimed = restarted._claim_next()
+        self.assertEqual(reclaimed.id, job.id)
+
+        # The previous owner can no longer finish it
+        live._finish(job.id, JobStatus.FAILED, error_message="lost")
+        self.assertEqual(restarted.get(job.id).status, JobStatus.RUNNING)
+
+    def test_renewed_leases_keep_a_running_job(self):
+        live = self.queue(lease_seconds=60)
+        job = live.submit("book.pdf", "/tmp/book.pdf")
+        live._claim_next()
+        with live._connection:
+            live._connection.execute("UPDATE jobs SET lease_expires = ? WHERE id = ?", (time.time() + 0.01, job.id))
+        # The heartbeat extends the lease before it runs out
+        live._renew_leases()
+        time.sleep(0.02)
+        self.assertIsNone(self.queue()._claim_next())
+
+        # Until it finishes; a finished job is never claimed again
+        live._finish(job.id, JobStatus.COMPLETED, result={})
+        self.assertIsNone(self.queue()._claim_next())
+        self.assertEqual(live.get(job.id).status, JobStatus.COMPLETED)
+
+    def test_progress_updates_are_throttled(self):
+        queue = self.queue(progress_interval=60)
+        job = queue.submit("book.pdf", "/tmp/book.pdf")
+        queue.update_progress(job.id, ProcessingProgress(status=ProcessingStatus.PROCESSING_PRE_SECTIONS, current_page=1))
+        queue.update_progress(job.id, ProcessingProgress(status=ProcessingStatus.PROCESSING_PRE_SECTIONS, current_page=2))
+        self.assertEqual(queue.get(job.id).progress["current_page"], 1)
+        # A new status is always stored
+        queue.update_progress(job.id, ProcessingProgress(status=ProcessingStatus.EXTRACTING_IMAGES, current_page=3))
+        self.assertEqual(queue.get(job.id).progress["current_page"], 3)
+
+    def test_workers_run_jobs(self):
+        def handler(job, report_progress):
+            report_progress(ProcessingProgress(status=ProcessingStatus.COMPLETED, current_page=5))
+            if job.filename == "broken.pdf":
+                raise ValueError("not a PDF")
+            return {"filename": job.filename, "markdown_mode": job.markdown_mode}
+
+        queue = self.queue(handler=handler, poll_interval=0.01)
+        done = queue.submit("book.pdf", "/tmp/book.pdf", markdown_mode="local")
+        failed = queue.submit("broken.pdf", "/tmp/broken.pdf")
+        queue.start()
+        try:
+            deadline = time.time() + 5
+            while time.time() < deadline and any(
+                queue.get(job.id).status in (JobStatus.QUEUED, JobStatus.RUNNING) for job in (done, failed)
+            ):
+                time.sleep(0.01)
+        finally:
+            queue.stop(timeout=5)
+
+        self.assertEqual(queue.get(done.id).status, JobStatus.COMPLETED)
+        # The upload's options reach the handler through the stored job
+        self.assertEqual(queue.get(done.id).result, {"filename": "book.pdf", "markdown_mode": "local"})
+        self.assertEqual(queue.get(done.id).progress["current_page"], 5)
+        self.assertEqual(queue.get(failed.id).status, JobStatus.FAILED)
+        self.assertEqual(queue.get(failed.id).error_message, "not a PDF")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import fitz
+from pdf_processing.infrastructure.layout_markdown_renderer import LayoutMarkdownRenderer
+
+
+def line(text, y, size=11.0, x0=72.0, x1=540.0, bold=False, italic=False):
+    flags = (fitz.TEXT_FONT_BOLD if bold else 0) | (fitz.TEXT_FONT_ITALIC if italic else 0)
+    return {
+        "text": text, "size": size, "bbox": (x0, y, x1, y + size * 1.2), "bold": bold,
+        "spans": [{"text": text, "size": size, "flags": flags, "font": "Times"}],
+    }
+
+
+def page(*lines):
+    return {"text": "\n".join(line["text"] for line in lines), "lines": list(lines), "width": 612.0, "height": 792.0}
+
+
+class TestLayoutMarkdownRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = LayoutMarkdownRenderer()
+        self.renderer.calibrate([page(line("x" * 500, 100, size=10.8), line("Title", 80, size=20))])
+
+    def test_headings_lists_and_paragraphs(self):
+        markdown, confidence = self.renderer.render(page(
+            line("THE DARK TOWER", 72, size=20, x0=200, x1=412),
+            line("The Outer Gate", 110, size=14, x1=260),
+            line("The road climbs to a gate of black iron, watched by two guards in heavy", 140),
+            line("armour. Beyond it, the tower rises into the clouds and a cold wind blows over-", 153.2),
+            line("head.", 166.4, x1=110),
+            line("Equipment", 195, bold=True, x1=150),
+            line("• A sword and a shield", 222),
+            line("• A backpack holding provisions for", 235.2),
+            line("ten days", 248.4, x1=130),
+            line("“None shall pass,” says the guard.", 275, italic=True),
+            line("12", 760, x0=300, x1=312),
+        ))
+        self.assertEqual(markdown, "\n\n".join([
+            "# THE DARK TOWER",
+            "## The Outer Gate",
+            "The road climbs to a gate of black iron, watched by two guards in heavy armour. "
+            "Beyond it, the tower rises into the clouds and a cold wind blows overhead.",
+            "### Equipment",
+            "- A sword and a shield\n- A backpack holding provisions for ten days",
+            "*“None shall pass,” says the guard.*",
+        ]))
+        self.assertEqual(confidence, 1.0)
+
+    def test_numbered_lists_and_paragraph_breaks(self):
+        markdown, _ = self.renderer.render(page(
+            line("To fight:", 100, x1=140),
+            line("1. Roll two dice", 127),
+            line("2. Add your skill", 140.2),
+            line("The guard falls.", 167, x1=180),
+            line("You search him and find a key.", 180.2, x1=260),
+        ))
+        self.assertEqual(markdown, "To fight:\n\n1. Roll two dice\n2. Add your skill\n\nThe guard falls.\n\nYou search him and find a key.")
+
+    def test_columns_lower_the_confidence(self):
+        rows = []
+        for index in range(10):
+            rows.append(line(f"Left column text number {index}", 100 + 14 * index, x1=290))
+            rows.append(line(f"Right column text number {index}", 100 + 14 * index, x0=340))
+        _, confidence = self.renderer.render(page(*rows))
+        self.assertEqual(confidence, 0.5)
+
+        # Words a justified line was split into are still one line
+        markdown, confidence = self.renderer.render(page(
+            line("The", 100, x0=72, x1=92), line("wide", 100, x0=110, x1=135), line("spacing.", 100, x0=150, x1=200),
+        ))
+        self.assertEqual((markdown, confidence), ("The wide spacing.", 1.0))
+
+    def test_pages_without_layout(self):
+        self.assertEqual(self.renderer.render({"text": "", "lines": []}), ("", 1.0))
+        self.assertEqual(self.renderer.render({"text": "Scanned text", "lines": []}), ("", 0.0))
+        # Without a calibrated book, the rules are trusted less
+        self.assertEqual(LayoutMarkdownRenderer().render(page(line("Some text.", 100)))[1], 0.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import os
+import asyncio
+import shutil
+import tempfile
+from unittest import mock
+from pdf_processing.infrastructure.ai_processor import AIProcessor
+from pdf_processing.infrastructure.chapter_writer import ChapterWriter
+from pdf_processing.infrastructure.llm_backend import MockLLMBackend
+from pdf_processing.infrastructure.markdown_stream import RESTART, FenceStripper, MarkdownStream
+from pdf_processing.infrastructure.request_scheduler import RequestScheduler
+
+RESPONSES = [
+    "# Title\n\nSome *text*.",
+    "```markdown\n# Title\n\nBody\n```",
+    "  ```json\n\n  Body ``` \n",
+    "```\nBody```",
+    "```markdown",
+    "``` code ```",
+    "Body with ``` inside\n\n",
+    "`inline` end `",
+    "",
+]
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestMarkdownStream(unittest.TestCase):
+    def setUp(self):
+        env = mock.patch.dict(os.environ, {"AI_CACHE_ENABLED": "0"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_fence_stripper_matches_whole_response_cleanup(self):
+        for response in RESPONSES:
+            expected = AIProcessor._clean_wrapping_json_or_markdown(response.strip())
+            for size in range(1, len(response) + 2):
+                fence = FenceStripper()
+                chunks = [fence.feed(response[i:i + size]) for i in range(0, len(response), size)]
+                self.assertEqual("".join(chunks) + fence.close(), expected, (response, size))
+
+    def test_stream_coalesces_and_restarts(self):
+        async def run():
+            stream = MarkdownStream()
+            stream.write("lost")
+            stream.restart()
+            stream.write("# Page")
+            stream.write(" one")
+            stream.close()
+            return await collect(stream), stream.text
+
+        self.assertEqual(asyncio.run(run()), ([RESTART, "# Page one"], "# Page one"))
+        self.assertEqual(asyncio.run(collect(MarkdownStream.of("text"))), ["text"])
+
+    def test_page_stream_holds_returned_markdown(self):
+        async def run():
+            ai_processor = AIProcessor(
+                backend=MockLLMBackend(error_rate=0.5, seed=1),
+                scheduler=RequestScheduler.unlimited(max_attempts=20, max_backoff=0.01),
+            )
+            stream = MarkdownStream()
+            markdown = await ai_processor.analyze_multimodal_page({"text": "COMBAT RULES\nRoll two dice.", "num": 3}, stream)
+            stream.close()
+            text = ""
+            for chunk in await collect(stream):
+                text = "" if chunk is RESTART else text + chunk
+            return markdown, text
+
+        markdown, streamed = asyncio.run(run())
+        self.assertTrue(markdown)
+        self.assertEqual(streamed, markdown)
+
+    def test_chapter_writer_rollback(self):
+        async def run(flush_bytes):
+            histoire_dir = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, histoire_dir)
+            writer = ChapterWriter(histoire_dir, flush_bytes=flush_bytes)
+
+            mark = writer.mark()
+            await writer.append("discarded")
+            await writer.rollback(mark)
+            self.assertFalse(writer.chapter_open)
+            self.assertEqual(os.listdir(histoire_dir), [])
+
+            await writer.write("# One")
+            mark = writer.mark()
+            await writer.append("partial ")
+            await writer.append("text")
+            await writer.rollback(mark)
+            await writer.append("Two")
+            await writer.append("\n")
+            with open(await writer.finish_chapter(), encoding="utf-8") as f:
+                return f.read()
+
+        # Rolled back within the buffer, and past text already flushed to the file
+        for flush_bytes in (1, 1024):
+            self.assertEqual(asyncio.run(run(flush_bytes)), "# One\nTwo")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from pdf_processing.infrastructure.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge_exposition(self):
+        requests = self.registry.counter("http_requests_total", "HTTP requests", ("endpoint", "status"))
+        requests.labels("/api/books", "200").inc()
+        requests.labels("/api/books", "200").inc(2)
+        self.registry.gauge("job_queue_depth", "Queued jobs").set_function(lambda: 4)
+
+        text = self.registry.render()
+        self.assertIn("# TYPE http_requests_total counter", text)
+        self.assertIn('http_requests_total{endpoint="/api/books",status="200"} 3.0', text)
+        self.assertIn("job_queue_depth 4.0", text)
+        self.assertIs(self.registry.counter("http_requests_total", "HTTP requests", ("endpoint", "status")), requests)
+
+    def test_histogram_buckets_are_cumulative(self):
+        latency = self.registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            latency.observe(value)
+
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{le="1.0"} 3', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn("latency_seconds_count 4", text)
+
+    def test_label_values_are_escaped(self):
+        self.registry.counter("errors_total", "Errors", ("message",)).labels('bad "quote"\n').inc()
+        self.assertIn('errors_total{message="bad \\"quote\\"\\n"} 1.0', self.registry.render())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import asyncio
+from unittest import mock
+from pdf_processing.infrastructure.ai_processor import AIProcessor
+from pdf_processing.infrastructure.llm_backend import MockLLMBackend
+from pdf_processing.infrastructure.page_packer import PagePacker
+from pdf_processing.infrastructure.request_scheduler import RequestScheduler
+
+
+class MarkerDroppingBackend(MockLLMBackend):
+    """Answers packed requests without their page markers."""
+
+    def _answer(self, prompt):
+        return super()._answer(prompt).replace("<<<PAGE", "PAGE")
+
+
+def page(num, words=10):
+    return {"num": num, "text": " ".join(["word"] * words)}
+
+
+class TestPagePacker(unittest.TestCase):
+    def test_pack_keeps_chapters_and_budget(self):
+        packer = PagePacker(small_page_tokens=100, max_pack_tokens=60, max_pack_pages=3)
+        pages = [page(1), page(2), page(3), page(4), page(5), page(7), page(8), page(9, words=60)]
+        packs = packer.pack(pages, chapter_starts={3})
+        self.assertEqual([[p["num"] for p in pack] for pack in packs], [[1, 2], [3, 4, 5], [7, 8], [9]])
+        self.assertEqual(packer.stats(), {"packs": 3, "packed_pages": 7, "split_pages": 0})
+        packer.reset_stats()
+        self.assertEqual(packer.stats(), {"packs": 0, "packed_pages": 0, "split_pages": 0})
+        # Packs are planned with the estimate their requests are paced with
+        self.assertIs(PagePacker.estimate_tokens, AIProcessor.estimate_tokens)
+
+    def test_split_keeps_all_text(self):
+        packer = PagePacker(split_tokens=20)
+        text = "\n\n".join(f"Paragraph {n}\n" + "word " * 15 for n in range(6))
+        parts = packer.split(text)
+        self.assertGreater(len(parts), 1)
+        self.assertTrue(all(packer.estimate_tokens(part) <= 21 for part in parts))
+        self.assertEqual(" ".join(" ".join(parts).split()), " ".join(text.split()))
+        self.assertEqual(packer.split("short"), ["short"])
+
+
+class TestPackedConversion(unittest.TestCase):
+    def convert(self, backend, pages):
+        with mock.patch.dict(os.environ, {"AI_CACHE_ENABLED": "0"}):
+            ai_processor = AIProcessor(backend=backend, scheduler=RequestScheduler.unlimited())
+        return asyncio.run(ai_processor.analyze_multimodal_pages(pages))
+
+    def test_packed_answer_is_mapped_to_pages(self):
+        pages = [{"num": 4, "text": "COMBAT\nYou fight."}, {"num": 5, "text": "- a sword"}]
+        self.assertEqual(self.convert(MockLLMBackend(), pages), {4: "## Combat\n\nYou fight.", 5: "- a sword"})
+
+    def test_missing_markers_fall_back_to_single_pages(self):
+        pages = [{"num": 4, "text": "COMBAT\nYou fight."}, {"num": 5, "text": "- a sword"}]
+        self.assertEqual(self.convert(MarkerDroppingBackend(), pages), self.convert(MockLLMBackend(), pages))
+
+
+if __name__ == '__main__':
+    unittest.main()
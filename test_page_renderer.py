@@ -0,0 +1,50 @@
+import unittest
+import os
+import asyncio
+import shutil
+import tempfile
+from create_test_pdf import create_test_pdf
+from pdf_processing.infrastructure.document_session import PDFDocumentSession
+from pdf_processing.infrastructure.page_renderer import PageRenderer, estimate_image_tokens
+
+
+class TestPageRenderer(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.pdf_path = create_test_pdf(os.path.join(self.work_dir, "test_book.pdf"))
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def test_estimate_image_tokens(self):
+        # The vision pricing examples: 1024x1024 is 4 tiles, 2048x4096 becomes 768x1536 (6 tiles)
+        self.assertEqual(estimate_image_tokens(1024, 1024), 765)
+        self.assertEqual(estimate_image_tokens(2048, 4096), 1105)
+        self.assertEqual(estimate_image_tokens(2048, 4096, detail="low"), 85)
+
+    def test_dpi_follows_text_size(self):
+        renderer = PageRenderer(max_dpi=150, min_dpi=50, text_px=14)
+        page = {"width": 612.0, "height": 792.0, "lines": [{"text": "x" * 80, "size": 12.0}]}
+        self.assertEqual(renderer.dpi_for(page), 84)
+        # Larger type needs fewer pixels; 15pt lands just past a tile boundary and is nudged under it
+        page["lines"][0]["size"] = 15.0
+        self.assertEqual(renderer.dpi_for(page), 60)
+        self.assertEqual(PageRenderer(adaptive=False).dpi_for(page), 90)
+
+    def test_render_is_cached(self):
+        renderer = PageRenderer()
+        cache_dir = os.path.join(self.work_dir, "renders")
+        with PDFDocumentSession(self.pdf_path) as session:
+            page = session.pages[0]
+            first = asyncio.run(renderer.render(session, page, cache_dir))
+            with open(first.image_path, "rb") as f:
+                self.assertEqual(f.read(2), b"\xff\xd8")  # JPEG
+            mtime = os.path.getmtime(first.image_path)
+            second = asyncio.run(renderer.render(session, page, cache_dir))
+        self.assertEqual(second, first)
+        self.assertEqual(os.path.getmtime(second.image_path), mtime)
+        self.assertLessEqual(first.tokens, 765)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import os
+import json
+import shutil
+import asyncio
+import tempfile
+import threading
+from unittest import mock
+from pdf_processing.domain.entities import ProcessingProgress, ProcessingStatus
+from pdf_processing.infrastructure.file_system_processor import FileSystemProcessor
+from pdf_processing.infrastructure.pdf_repository import FileSystemPDFRepository
+
+
+def touch(path, content="old"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+class TestFileSystemPDFRepository(unittest.TestCase):
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp()
+        self.book_dir = os.path.join(self.base_path, "book")
+        self.repository = FileSystemPDFRepository(max_workers=2)
+
+    def tearDown(self):
+        self.repository.close()
+        shutil.rmtree(self.base_path)
+
+    def test_start_book_withdraws_previous_output(self):
+        stale = ["metadata/book.json", "metadata/sections.json", "histoire/chapter_1.md", "histoire/chapter_9.md.part", "sections/section_4.md"]
+        kept = ["metadata/checkpoint.jsonl", "metadata/progress.json", "images/page_1_img_1.png"]
+        for path in stale + kept:
+            touch(os.path.join(self.book_dir, path))
+
+        asyncio.run(self.repository.start_book("book", self.base_path))
+
+        for path in stale:
+            self.assertFalse(os.path.exists(os.path.join(self.book_dir, path)), path)
+        for path in kept:
+            self.assertTrue(os.path.exists(os.path.join(self.book_dir, path)), path)
+        # A book that was never processed is fine too
+        asyncio.run(self.repository.start_book("new_book", self.base_path))
+
+
+    def test_atomic_write_keeps_the_old_file_on_failure(self):
+        path = os.path.join(self.base_path, "book.json")
+        FileSystemProcessor.write_json_atomic(path, {"status": "completed"})
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                FileSystemProcessor.write_json_atomic(path, {"status": "processing"})
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"status": "completed"})
+        self.assertEqual(os.listdir(self.base_path), ["book.json"])
+
+    def test_concurrent_atomic_writes_never_mix(self):
+        path = os.path.join(self.base_path, "chapter.md")
+        contents = [str(index) * 200000 for index in range(8)]
+        threads = [threading.Thread(target=FileSystemProcessor.write_atomic, args=(path, content)) for content in contents]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with open(path, encoding="utf-8") as f:
+            self.assertIn(f.read(), contents)
+        self.assertEqual(os.listdir(self.base_path), ["chapter.md"])
+
+
+    def test_queued_writes_to_a_file_are_coalesced(self):
+        repository = FileSystemPDFRepository(max_workers=1)
+        self.addCleanup(repository.close)
+        started, release, applied = threading.Event(), threading.Event(), []
+
+        def writer(index):
+            def write():
+                if index == 0:
+                    started.set()
+                    release.wait(5)
+                applied.append(index)
+                return index
+            return write
+
+        futures = [repository._submit_write("progress.json", writer(0))]
+        started.wait(5)
+        # Queued behind the running write; only the newest is applied
+        futures += [repository._submit_write("progress.json", writer(index)) for index in range(1, 5)]
+        release.set()
+        self.assertEqual([future.result(5) for future in futures], [0, 4, 4, 4, 4])
+        self.assertEqual(applied, [0, 4])
+        self.assertEqual(repository.coalesced_writes, 3)
+
+    def test_progress_file_holds_the_latest_update(self):
+        async def report():
+            await asyncio.gather(*(
+                self.repository.save_progress("book", self.base_path, ProcessingProgress(
+                    status=ProcessingStatus.PROCESSING_PRE_SECTIONS, current_page=page, total_pages=50
+                ))
+                for page in range(1, 51)
+            ))
+            return await self.repository.get_processing_status("book", self.base_path)
+
+        os.makedirs(os.path.join(self.book_dir, "metadata"))
+        self.assertEqual(asyncio.run(report())["current_page"], 50)
+        self.assertEqual(os.listdir(os.path.join(self.book_dir, "metadata")), ["progress.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
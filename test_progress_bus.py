@@ -0,0 +1,45 @@
+import unittest
+from pdf_processing.infrastructure.progress_bus import ProgressBus, content_channel
+
+
+class TestProgressBus(unittest.TestCase):
+    def test_events_fan_out_to_the_book_subscribers(self):
+        bus = ProgressBus()
+        with bus.subscribe("book") as first, bus.subscribe("book") as second, bus.subscribe("other") as other:
+            bus.publish("book", "page", {"page_number": 1})
+            self.assertEqual(next(first.events(timeout=0.1))["data"], {"page_number": 1})
+            self.assertEqual(next(second.events(timeout=0.1))["data"], {"page_number": 1})
+            self.assertIsNone(next(other.events(timeout=0.01)))
+            self.assertEqual(bus.subscriber_count(), 3)
+        self.assertEqual(bus.subscriber_count(), 0)
+
+    def test_new_subscribers_get_the_latest_retained_event(self):
+        bus = ProgressBus()
+        bus.publish("book", "status", {"status": "processing_pre_sections"})
+        bus.publish(content_channel("book"), "page_chunk", {"text": "# Title"}, retain=False)
+        with bus.subscribe("book") as subscription, bus.subscribe(content_channel("book")) as content:
+            self.assertEqual(next(subscription.events(timeout=0.1))["type"], "status")
+            self.assertIsNone(next(content.events(timeout=0.01)))
+
+    def test_slow_subscribers_lose_the_oldest_events(self):
+        bus = ProgressBus(max_queue_size=3)
+        with bus.subscribe("book") as subscription:
+            for page in range(10):
+                bus.publish("book", "page", {"page_number": page})
+            events = subscription.events(timeout=0.01)
+            self.assertEqual([next(events)["data"]["page_number"] for _ in range(3)], [7, 8, 9])
+
+    def test_only_recently_active_books_are_retained(self):
+        bus = ProgressBus(max_retained=2)
+        for book_id in ("first", "second", "third"):
+            bus.publish(book_id, "status", {})
+        bus.publish("second", "status", {})
+        bus.publish("fourth", "status", {})
+        self.assertIsNone(bus.latest("first"))
+        self.assertIsNone(bus.latest("third"))
+        self.assertIsNotNone(bus.latest("second"))
+        self.assertIsNotNone(bus.latest("fourth"))
+
+
+if __name__ == '__main__':
+    unittest.main()
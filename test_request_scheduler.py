@@ -0,0 +1,105 @@
+import unittest
+import os
+import time
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+import openai
+from pdf_processing.domain.entities import LLMCompletion
+from pdf_processing.infrastructure.ai_processor import AIProcessor
+from pdf_processing.infrastructure.llm_backend import MockLLMBackend
+from pdf_processing.infrastructure.request_scheduler import RequestScheduler
+
+
+def rate_limit_error(retry_after: str) -> openai.RateLimitError:
+    response = SimpleNamespace(status_code=429, headers={"retry-after": retry_after}, request=None)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+class RecordingScheduler(RequestScheduler):
+    """Records the tokens reserved for each request."""
+
+    def __init__(self):
+        super().__init__(default_limits=None)
+        self.reserved = []
+
+    async def run(self, model, estimated_tokens, call):
+        self.reserved.append(estimated_tokens)
+        return await super().run(model, estimated_tokens, call)
+
+
+class TestRequestScheduler(unittest.TestCase):
+    def test_retry_after_blocks_every_caller_of_the_model(self):
+        scheduler = RequestScheduler(limits={"gpt-4o": (100, 100000)}, max_backoff=0.01)
+        started = {}
+
+        async def first_call():
+            if "first" not in started:
+                started["first"] = time.monotonic()
+                raise rate_limit_error("0.3")
+            started["retried"] = time.monotonic()
+            return LLMCompletion(content="ok")
+
+        async def second_call():
+            started["second"] = time.monotonic()
+            return LLMCompletion(content="ok")
+
+        async def run():
+            first = asyncio.create_task(scheduler.run("gpt-4o", 10, first_call))
+            await asyncio.sleep(0.05)
+            # Issued after the 429, so it waits out the Retry-After too
+            await scheduler.run("gpt-4o", 10, second_call)
+            return await first
+
+        self.assertEqual(asyncio.run(run()).content, "ok")
+        self.assertGreaterEqual(started["retried"] - started["first"], 0.3)
+        self.assertGreaterEqual(started["second"] - started["first"], 0.25)
+        self.assertEqual(scheduler.stats()["rate_limited"], 1)
+
+    def test_reservations_are_settled(self):
+        scheduler = RequestScheduler(limits={"gpt-4o": (100, 100000)}, max_attempts=1)
+
+        async def failing_call():
+            raise ValueError("bad request")
+
+        async def succeeding_call():
+            return LLMCompletion(content="ok", prompt_tokens=120, completion_tokens=30)
+
+        async def run():
+            with self.assertRaises(ValueError):
+                await scheduler.run("gpt-4o", 5000, failing_call)
+            failed_window = scheduler.stats()["models"]["gpt-4o"]
+            await scheduler.run("gpt-4o", 5000, succeeding_call)
+            return failed_window, scheduler.stats()["models"]["gpt-4o"]
+
+        failed_window, window = asyncio.run(run())
+        # A failed request gives its reservation back; a finished one keeps what it used
+        self.assertEqual(failed_window["tokens_last_minute"], 0)
+        self.assertEqual(failed_window["requests_last_minute"], 1)
+        self.assertEqual(window["tokens_last_minute"], 150)
+        self.assertEqual(scheduler.stats()["failures"], 1)
+
+    def test_requests_wait_for_the_token_budget(self):
+        scheduler = RequestScheduler(limits={"gpt-4o": (100, 1000)})
+
+        async def run():
+            await scheduler.acquire("gpt-4o", 800)
+            with self.assertLogs("pdf_processing.infrastructure.request_scheduler", "WARNING"):
+                with self.assertRaises(asyncio.TimeoutError):
+                    await asyncio.wait_for(scheduler.acquire("gpt-4o", 300), 0.05)
+            # Fits in what is left
+            await asyncio.wait_for(scheduler.acquire("gpt-4o", 200), 0.05)
+
+        asyncio.run(run())
+
+    def test_page_requests_reserve_their_expected_size(self):
+        scheduler = RecordingScheduler()
+        with mock.patch.dict(os.environ, {"AI_CACHE_ENABLED": "0"}):
+            ai_processor = AIProcessor(backend=MockLLMBackend(), scheduler=scheduler)
+        asyncio.run(ai_processor.analyze_multimodal_page({"text": "COMBAT RULES\nRoll two dice.", "num": 3}))
+        # Prompt plus a short page's Markdown, not the 4000 token response limit
+        self.assertLess(scheduler.reserved[0], 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
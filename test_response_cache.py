@@ -0,0 +1,96 @@
+import unittest
+import os
+import asyncio
+import itertools
+import shutil
+import tempfile
+from unittest import mock
+from pdf_processing.infrastructure import response_cache
+from pdf_processing.infrastructure.ai_processor import AIProcessor
+from pdf_processing.infrastructure.llm_backend import MockLLMBackend
+from pdf_processing.infrastructure.request_scheduler import RequestScheduler
+from pdf_processing.infrastructure.response_cache import AIResponseCache
+
+PAGE = {"text": "COMBAT RULES\nRoll two dice.", "num": 3}
+
+
+class TestAIResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        # Every access gets a later timestamp, so recency never ties
+        clock = mock.patch.object(response_cache, "time", **{"time.side_effect": itertools.count(1)})
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def cache(self, **kwargs):
+        cache = AIResponseCache(os.path.join(self.work_dir, "cache", "responses.sqlite3"), **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_repeated_requests_are_served_from_the_cache(self):
+        backend = MockLLMBackend()
+        cache = self.cache()
+        ai_processor = AIProcessor(backend=backend, cache=cache, scheduler=RequestScheduler.unlimited())
+        first = asyncio.run(ai_processor.analyze_multimodal_page(PAGE))
+        second = asyncio.run(ai_processor.analyze_multimodal_page(PAGE))
+        self.assertEqual(second, first)
+        self.assertEqual(sum(backend._attempts.values()), 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+        # A new cache on the same file still has the response
+        self.assertEqual(self.cache().stats()["entries"], 1)
+
+    def test_key_covers_everything_that_shapes_the_answer(self):
+        messages = [{"role": "user", "content": "Convert this page"}]
+        key = AIResponseCache.make_key("gpt-4o", messages, 0.3, 4000)
+        self.assertEqual(AIResponseCache.make_key("gpt-4o", [dict(messages[0])], 0.3, 4000), key)
+        changed = [
+            AIResponseCache.make_key("gpt-4o-mini", messages, 0.3, 4000),
+            AIResponseCache.make_key("gpt-4o", [{"role": "user", "content": "Convert this page."}], 0.3, 4000),
+            AIResponseCache.make_key("gpt-4o", messages, 0.0, 4000),
+            AIResponseCache.make_key("gpt-4o", messages, 0.3, 2000),
+            AIResponseCache.make_key("gpt-4o", [{"role": "user", "content": [
+                {"type": "text", "text": "Convert this page"},
+                {"type": "image_url", "image_url": {"url": "data:image/jpeg;base64,AAAA"}},
+            ]}], 0.3, 4000),
+        ]
+        self.assertEqual(len(set(changed) | {key}), 6)
+
+        cache = self.cache()
+        cache.set(key, "gpt-4o", "# Page")
+        self.assertEqual(cache.get(key), "# Page")
+        self.assertIsNone(cache.get(changed[1]))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = self.cache(max_entries=2)
+        cache.set("a", "gpt-4o", "first")
+        cache.set("b", "gpt-4o", "second")
+        cache.get("a")
+        cache.set("c", "gpt-4o", "third")
+        self.assertEqual(cache.get("a"), "first")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "third")
+
+    def test_size_budget_evicts_oldest_first(self):
+        cache = self.cache(max_bytes=10)
+        cache.set("a", "gpt-4o", "12345")
+        cache.set("b", "gpt-4o", "67890")
+        cache.set("c", "gpt-4o", "abc")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["bytes"], 8)
+
+    def test_disabled_from_env(self):
+        with mock.patch.dict(os.environ, {"AI_CACHE_ENABLED": "0"}):
+            self.assertIsNone(AIResponseCache.from_env())
+        with mock.patch.dict(os.environ, {"AI_CACHE_ENABLED": "1", "AI_CACHE_PATH": os.path.join(self.work_dir, "env.sqlite3")}):
+            cache = AIResponseCache.from_env()
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.db_path, os.path.join(self.work_dir, "env.sqlite3"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import os
+import shutil
+import tempfile
+from pdf_processing.infrastructure.section_processor import SectionProcessor, SectionIndex
+
+
+class TestSectionExtractor(unittest.TestCase):
+    def setUp(self):
+        self.pages = [
+            {"num": 1, "text": "INTRODUCTION\nRoll 2 dice.\n6"},
+            {"num": 2, "text": "1\nYou enter the fortress.\nTurn to 2.\n2\nA guard attacks!\nGUARD\n7"},
+            {"num": 3, "text": "The fight goes on.\n3\nYou win. Turn to 1."},
+        ]
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_index_finds_consecutive_headers_only(self):
+        index = SectionProcessor.build_section_index(self.pages)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.page_of(1), 2)
+        self.assertEqual(index.page_of(2), 2)
+        self.assertEqual(index.page_of(3), 3)
+        self.assertIsNone(index.page_of(6))
+        self.assertEqual(index.page_of(1), SectionProcessor.find_section(self.pages, 1))
+
+    def test_unparsable_digits_are_not_headers(self):
+        pages = [{"num": 1, "text": "Intro\n²\nfoo"}, {"num": 2, "text": "1\nGo"}, {"num": 3, "text": None}]
+        with self.assertLogs("pdf_processing.infrastructure.section_processor", "ERROR"):
+            index = SectionProcessor.build_section_index(pages)
+        self.assertEqual(index.page_of(1), 2)
+        self.assertEqual(len(index), 1)
+
+    def test_section_text_spans_pages(self):
+        index = SectionProcessor.build_section_index(self.pages)
+        pages_by_num = {page["num"]: page for page in self.pages}
+        self.assertEqual(SectionProcessor.section_text(index, pages_by_num, 1), "You enter the fortress.\nTurn to 2.")
+        self.assertEqual(
+            SectionProcessor.section_text(index, pages_by_num, 2), "A guard attacks!\nGUARD\n7\n\nThe fight goes on."
+        )
+        self.assertEqual(SectionProcessor.section_text(index, pages_by_num, 3), "You win. Turn to 1.")
+
+    def test_write_sections_and_reload_index(self):
+        index = SectionProcessor.build_section_index(self.pages)
+        written = SectionProcessor.write_sections(index, self.pages, os.path.join(self.output_dir, "sections"), self.output_dir)
+        self.assertEqual(written, 3)
+
+        with open(os.path.join(self.output_dir, "sections", "section_3.md"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "# 3\n\nYou win. Turn to 1.\n")
+
+        reloaded = SectionIndex.load(os.path.join(self.output_dir, SectionIndex.FILENAME))
+        self.assertEqual(reloaded.entries, index.entries)
+        self.assertEqual(reloaded.get(2)["file"], "section_2.md")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from pdf_processing.domain.entities import TextFormatting
+from pdf_processing.infrastructure.text_format_processor import TextFormatProcessor
+
+PAGE = """THE FORBIDDEN CITY
+
+You stand before the gates.
+The guard eyes you warily.
+
+- a sword
+- 3 gold pieces
+1. Test your Luck
+"Halt!" he cries.
+---
+written by Steve Jackson
+"""
+
+
+class TestTextFormatProcessor(unittest.TestCase):
+    def setUp(self):
+        self.processor = TextFormatProcessor()
+
+    def test_classify_lines_matches_detect_formatting(self):
+        lines = PAGE.splitlines() * 3
+        for is_pre_section in (False, True):
+            self.assertEqual(
+                self.processor.classify_lines(lines, is_pre_section),
+                [self.processor.detect_formatting(line, is_pre_section) for line in lines],
+            )
+
+    def test_detect_formatting(self):
+        detect = self.processor.detect_formatting
+        self.assertEqual(detect("THE FORBIDDEN CITY"), TextFormatting.HEADER)
+        self.assertEqual(detect("- a sword"), TextFormatting.LIST_ITEM)
+        self.assertEqual(detect('"Halt!" he cries."'), TextFormatting.QUOTE)
+        self.assertEqual(detect("you stand before the gates."), TextFormatting.PARAGRAPH)
+        self.assertEqual(detect("written by Steve Jackson", is_pre_section=True), TextFormatting.SUBHEADER)
+
+    def test_process_text_blocks_matches_per_block(self):
+        texts = [PAGE, "", "CHAPTER TWO\nIt was night.", PAGE]
+        self.assertEqual(
+            self.processor.process_text_blocks(texts, is_pre_section=True),
+            [self.processor.process_text_block(text, is_pre_section=True) for text in texts],
+        )
+        blocks = self.processor.process_text_block(PAGE)
+        self.assertEqual(blocks[0].text, "THE FORBIDDEN CITY")
+        self.assertEqual(blocks[0].format_type, TextFormatting.HEADER)
+        self.assertEqual(blocks[0].metadata["is_capitalized"], True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import os
+import json
+import asyncio
+import shutil
+import tempfile
+from unittest import mock
+from create_test_pdf import create_test_pdf
+from pdf_processing.application.pdf_service import PDFService
+from pdf_processing.infrastructure import tracing
+from pdf_processing.infrastructure.ai_processor import AIProcessor
+from pdf_processing.infrastructure.llm_backend import MockLLMBackend
+from pdf_processing.infrastructure.pdf_processor import MuPDFProcessor
+from pdf_processing.infrastructure.pdf_repository import FileSystemPDFRepository
+from pdf_processing.infrastructure.request_scheduler import RequestScheduler
+
+
+class TestTracing(unittest.TestCase):
+    def test_nothing_is_recorded_outside_a_trace(self):
+        with tracing.span("orphan") as span:
+            tracing.add("bytes_written", 10)
+        self.assertIsNone(span)
+
+    def test_spans_follow_tasks_and_threads(self):
+        def write_file():
+            with tracing.span("write"):
+                tracing.add("bytes_written", 100)
+
+        async def analyze(page):
+            with tracing.span("page", page=page):
+                tracing.add("prompt_tokens", 10)
+                await asyncio.to_thread(write_file)
+
+        async def run():
+            with tracing.trace("book", pdf="book.pdf") as tracer:
+                with tracing.span("analyze_pages"):
+                    await asyncio.gather(*(analyze(page) for page in range(3)))
+                tracing.add("images", 2)
+            return tracer
+
+        tracer = asyncio.run(run())
+        report = tracer.report()
+        trace = report["trace"]
+        self.assertEqual((trace["name"], trace["attributes"], trace["counters"]), ("book", {"pdf": "book.pdf"}, {"images": 2}))
+        pages = trace["children"][0]["children"]
+        self.assertEqual(sorted(page["attributes"]["page"] for page in pages), [0, 1, 2])
+        self.assertTrue(all(page["children"][0]["name"] == "write" for page in pages))
+        self.assertEqual(list(report["stages"]), ["book", "analyze_pages", "page", "write"])
+        self.assertEqual(report["stages"]["page"]["count"], 3)
+        self.assertEqual(report["stages"]["page"]["counters"], {"prompt_tokens": 30})
+        self.assertEqual(report["stages"]["write"]["counters"], {"bytes_written": 300})
+        self.assertGreaterEqual(report["total_seconds"], report["stages"]["analyze_pages"]["seconds"])
+
+    def test_ingestion_writes_a_profile(self):
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir)
+        pdf_path = create_test_pdf(os.path.join(work_dir, "test_book.pdf"))
+        output_dir = os.path.join(work_dir, "sections")
+        with mock.patch.dict(os.environ, {"AI_CACHE_ENABLED": "0", "CHAPTER_HEURISTIC_ENABLED": "0"}):
+            repository = FileSystemPDFRepository()
+            processor = MuPDFProcessor(
+                repository=repository, resume=False,
+                ai_processor=AIProcessor(backend=MockLLMBackend(), scheduler=RequestScheduler.unlimited()),
+            )
+            asyncio.run(PDFService(processor=processor, repository=repository).process_pdf(pdf_path, output_dir))
+
+        with open(os.path.join(output_dir, "test_book", "metadata", "profile.json"), encoding="utf-8") as f:
+            profile = json.load(f)
+        stages = profile["stages"]
+        for stage in ("extract_sections", "load_pages", "index_sections", "analyze_pages", "chapter_detection",
+                      "markdown_request", "llm_request", "extract_images", "save_metadata"):
+            self.assertIn(stage, stages)
+        self.assertEqual(stages["chapter_detection"]["counters"]["pages_sent_to_llm"], 5)
+        self.assertGreater(stages["llm_request"]["counters"]["prompt_tokens"], 0)
+        self.assertGreater(stages["llm_request"]["counters"]["completion_tokens"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()